@@ -0,0 +1,388 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+import polars as pl
+
+from oracle_scan import ORACLE_MAX_SAMPLE_PERCENT, ORACLE_ROWID_ALIAS, ORACLE_SAMPLE_FETCH_FACTOR, \
+    ORACLE_SAMPLE_TOP_UP_PASSES, USER_SCHEMAS_SQL, OraclePrivacyScanner
+from sampling import derive_table_seed, select_sample_rows
+
+try:
+    import aiomysql
+except ImportError:  # 비동기 MySQL 스캔을 사용하지 않는 환경
+    aiomysql = None
+
+try:
+    import oracledb  # python-oracledb 2.0+ (asyncio 지원)
+except ImportError:  # 비동기 Oracle 스캔을 사용하지 않는 환경
+    oracledb = None
+
+logger = logging.getLogger(__name__)
+
+
+def _oracle_output_type_handler(cursor, metadata):
+    # LOB 은 로케이터 대신 문자열/바이트로 바로 fetch (동기 스캐너의 _output_type_handler 와 같은 동작,
+    # 프로세스 전역인 oracledb.defaults.fetch_lobs 는 건드리지 않음)
+    if metadata.type_code in (oracledb.DB_TYPE_CLOB, oracledb.DB_TYPE_NCLOB):
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+    if metadata.type_code == oracledb.DB_TYPE_BLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG_RAW, arraysize=cursor.arraysize)
+
+
+class AsyncConnectionPools:
+    def __init__(self, pool_size: int = 4):
+        """
+        소스(호스트 + 사용자)별 비동기 연결 풀
+
+        하나의 이벤트 루프에서 여러 호스트를 동시에 스캔할 수 있도록 풀을 처음 사용할 때 만들고 공유합니다.
+        풀 크기가 호스트별 동시 조회 수의 상한입니다.
+
+        Args:
+            pool_size: 소스별 최대 연결 수
+        """
+        self.pool_size = pool_size
+        self._pools: Dict[str, asyncio.Future] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _key(scanner) -> str:
+        return f"{scanner.cache_source}|{scanner.user}"
+
+    async def get(self, scanner) -> Any:
+        """스캐너 설정에 맞는 연결 풀 (없으면 생성, 생성 중이면 완료까지 대기)"""
+        key = self._key(scanner)
+        async with self._lock:
+            pending = self._pools.get(key)
+            if pending is None:
+                # 느린 호스트의 풀 생성이 다른 호스트를 막지 않도록 잠금 밖에서 대기
+                pending = asyncio.ensure_future(self._create(scanner))
+                self._pools[key] = pending
+
+        try:
+            return await asyncio.shield(pending)
+        except Exception:
+            async with self._lock:
+                if self._pools.get(key) is pending:
+                    del self._pools[key]
+            raise
+
+    async def _create(self, scanner) -> Any:
+        if isinstance(scanner, OraclePrivacyScanner):
+            if oracledb is None:
+                raise RuntimeError("비동기 Oracle 스캔에는 python-oracledb 2.0 이상이 필요합니다 (uv sync --extra async)")
+            pool = oracledb.create_pool_async(
+                user=scanner.user,
+                password=scanner.password,
+                dsn=f"{scanner.host}:{scanner.port}/{scanner.service_name}",
+                min=1,
+                max=self.pool_size,
+                increment=1
+            )
+        else:
+            if aiomysql is None:
+                raise RuntimeError("비동기 MySQL 스캔에는 aiomysql 이 필요합니다 (uv sync --extra async)")
+            pool = await aiomysql.create_pool(
+                host=scanner.host,
+                port=scanner.port,
+                user=scanner.user,
+                password=scanner.password or '',
+                db=scanner.database,
+                minsize=1,
+                maxsize=self.pool_size,
+                autocommit=True,
+                charset='utf8mb4',
+                connect_timeout=30
+            )
+
+        logger.info(f"비동기 연결 풀 생성: {self._key(scanner)} (최대 {self.pool_size}개)")
+        return pool
+
+    async def close(self):
+        """모든 연결 풀 종료"""
+        async with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+
+        for pending in pools:
+            try:
+                pool = await pending
+            except Exception:
+                continue
+            if oracledb is not None and isinstance(pool, oracledb.AsyncConnectionPool):
+                await pool.close()
+            else:
+                pool.close()
+                await pool.wait_closed()
+
+    def stats(self) -> Dict[str, Any]:
+        return {'pool_size': self.pool_size, 'sources': sorted(self._pools)}
+
+
+class AsyncPrivacyScanner:
+    def __init__(self, scanner, pools: AsyncConnectionPools, executor: Optional[Executor] = None,
+                 max_concurrent_tables: int = 8):
+        """
+        기존 스캐너를 감싸는 asyncio 스캐너
+
+        DB 조회는 비동기 연결 풀로 수행하고, 패턴 탐지/점수 계산(scan_loaded_table)은 executor 에서 실행해
+        이벤트 루프를 막지 않습니다. 컬럼 선택, 값 잘라내기, 샘플 시드, 결과 구조는 감싼 스캐너와 같습니다.
+        (파티션별 샘플링, 작은 테이블 일괄 조회는 동기 스캐너에서만 지원)
+
+        Args:
+            scanner: PolarsPrivacyScanner 또는 OraclePrivacyScanner (연결하지 않은 상태로 사용)
+            pools: 공유 연결 풀
+            executor: 분석 executor (기본값: 이벤트 루프 기본 executor)
+            max_concurrent_tables: 스캐너 하나에서 동시에 조회할 테이블 수
+        """
+        self.scanner = scanner
+        self.pools = pools
+        self.executor = executor
+        self.max_concurrent_tables = max_concurrent_tables
+        self.is_oracle = isinstance(scanner, OraclePrivacyScanner)
+
+    async def _query(self, sql: str, params: Any = None) -> Tuple[List[tuple], List[str]]:
+        """풀에서 연결을 빌려 쿼리 실행 후 (행, 컬럼명) 반환"""
+        pool = await self.pools.get(self.scanner)
+        async with pool.acquire() as connection:
+            if self.is_oracle:
+                with connection.cursor() as cursor:
+                    cursor.outputtypehandler = _oracle_output_type_handler
+                    cursor.arraysize = min(max(self.scanner.sample_size, 100), 5000)
+                    cursor.prefetchrows = cursor.arraysize + 1
+                    await cursor.execute(sql, params or {})
+                    rows = await cursor.fetchall()
+                    return rows, [desc[0] for desc in cursor.description or []]
+
+            async with connection.cursor() as cursor:
+                await cursor.execute(sql, params)
+                rows = await cursor.fetchall()
+                return list(rows), [desc[0] for desc in cursor.description or []]
+
+    async def get_schemas(self) -> List[str]:
+        """스캔 대상 데이터베이스/스키마 목록 (시스템 스키마 제외)"""
+        if self.is_oracle:
+            rows, _ = await self._query(USER_SCHEMAS_SQL)
+            return [row[0] for row in rows]
+
+        if self.scanner.database:
+            return [self.scanner.database]
+        rows, _ = await self._query("SHOW DATABASES")
+        return [row[0] for row in rows if not self.scanner.is_system_schema(row[0])]
+
+    async def get_tables(self, schema: str) -> List[str]:
+        if self.is_oracle:
+            rows, _ = await self._query(
+                "SELECT TABLE_NAME FROM ALL_TABLES WHERE OWNER = :schema ORDER BY TABLE_NAME", {'schema': schema}
+            )
+        else:
+            rows, _ = await self._query(
+                "SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s ORDER BY TABLE_NAME",
+                (schema,)
+            )
+        return [row[0] for row in rows]
+
+    def _source(self, schema: str, table: str) -> str:
+        if self.is_oracle:
+            return f"{schema}.{table}"
+        quote = self.scanner.quote_identifier
+        return f"{quote(schema)}.{quote(table)}"
+
+    async def get_table_info(self, schema: str, table: str) -> Dict:
+        """테이블 정보 조회 (행 수, 컬럼 정보 - 동기 스캐너와 같은 형식)"""
+        rows, _ = await self._query(f"SELECT COUNT(*) FROM {self._source(schema, table)}")
+        total_rows = rows[0][0]
+
+        if self.is_oracle:
+            rows, _ = await self._query("""
+                SELECT COLUMN_NAME, DATA_TYPE, NULLABLE, DATA_LENGTH, DATA_PRECISION, DATA_SCALE
+                FROM ALL_TAB_COLUMNS
+                WHERE OWNER = :schema
+                  AND TABLE_NAME = :table
+                ORDER BY COLUMN_ID
+            """, {'schema': schema, 'table': table})
+            columns = [
+                {'name': r[0], 'type': r[1], 'nullable': r[2], 'length': r[3], 'precision': r[4], 'scale': r[5]}
+                for r in rows
+            ]
+        else:
+            # DESCRIBE 와 같은 형식 (name, type, null, key, default, extra)
+            rows, _ = await self._query("""
+                SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = %s
+                  AND TABLE_NAME = %s
+                ORDER BY ORDINAL_POSITION
+            """, (schema, table))
+            columns = [
+                {'name': r[0], 'type': r[1], 'null': r[2], 'key': r[3], 'default': r[4], 'extra': r[5]}
+                for r in rows
+            ]
+
+        return {'total_rows': total_rows, 'columns': columns}
+
+    async def _fetch_oracle_sample(self, schema: str, table: str, select_list: str,
+                                   total_rows: int) -> Tuple[List[tuple], List[str], str, Optional[Dict]]:
+        """Oracle 샘플 조회 (동기 스캐너의 _fetch_sample 과 같은 SAMPLE ... SEED + 보충 조회)"""
+        scanner = self.scanner
+        if total_rows <= scanner.sample_size:
+            rows, columns = await self._query(f"SELECT {select_list} FROM {schema}.{table}")
+            return rows, columns, "전체 데이터", None
+
+        rows, _ = await self._query(
+            "SELECT NUM_ROWS, BLOCKS FROM ALL_TABLES WHERE OWNER = :schema AND TABLE_NAME = :table",
+            {'schema': schema, 'table': table}
+        )
+        stats = {'num_rows': rows[0][0] if rows else None, 'blocks': rows[0][1] if rows else None}
+        use_block, percent = scanner.sample_plan(stats, total_rows, scanner.sample_size)
+        sample_clause = 'SAMPLE BLOCK' if use_block else 'SAMPLE'
+
+        projection = 't.*' if select_list == '*' else select_list
+        sampled: Dict[str, tuple] = {}
+        seeds = []
+        columns: List[str] = []
+
+        for attempt in range(1 + ORACLE_SAMPLE_TOP_UP_PASSES):
+            seed = derive_table_seed(scanner.sample_seed, schema, table, salt=str(attempt) if attempt else None)
+            seeds.append(seed)
+
+            rows, columns = await self._query(f"""
+                SELECT ROWIDTOCHAR(t.ROWID) AS "{ORACLE_ROWID_ALIAS}", {projection}
+                FROM {schema}.{table} {sample_clause} ({percent:.6f}) SEED ({seed}) t
+                FETCH FIRST {scanner.sample_size * ORACLE_SAMPLE_FETCH_FACTOR} ROWS ONLY
+            """)
+            for row in rows:
+                sampled.setdefault(row[0], row[1:])
+            columns = columns[1:]
+
+            if len(sampled) >= scanner.sample_size or percent >= ORACLE_MAX_SAMPLE_PERCENT:
+                break
+            percent = min(ORACLE_MAX_SAMPLE_PERCENT, percent * 2)
+
+        sample_details = {
+            'strategy': 'block' if use_block else 'row',
+            'percent': round(percent, 6),
+            'seeds': seeds,
+            'passes': len(seeds),
+            'num_rows_stat': stats['num_rows'],
+            'blocks_stat': stats['blocks']
+        }
+        rows = select_sample_rows(list(sampled.values()), scanner.sample_size, seeds[0])
+        return rows, columns, f"Oracle {sample_clause} ({percent:.4g}%)", sample_details
+
+    async def load_table_sample(self, schema: str, table: str) -> Tuple[Optional[pl.DataFrame], Dict]:
+        """테이블 샘플을 Polars DataFrame 으로 로드 (동기 스캐너의 load_table_sample 과 같은 결과 형식)"""
+        scanner = self.scanner
+        try:
+            table_info = await self.get_table_info(schema, table)
+            total_rows = table_info['total_rows']
+            if total_rows == 0:
+                return None, {'method': 'empty', 'total_rows': 0, 'sampled_rows': 0}
+
+            selected, skipped_columns = table_info['columns'], []
+            if scanner.projection_pushdown:
+                selected, skipped_columns = scanner.select_scan_columns(table_info['columns'])
+                if not selected:
+                    return None, {'method': 'no_scannable_columns', 'total_rows': total_rows, 'sampled_rows': 0,
+                                  'skipped_columns': skipped_columns}
+
+            expressions = [(col['name'], scanner.column_expression(col)) for col in selected]
+            select_list = ', '.join(expr for _, expr in expressions) or '*'
+            truncated_columns = [name for name, expr in expressions if expr != scanner.quote_identifier(name)]
+            table_seed = derive_table_seed(scanner.sample_seed, schema, table)
+
+            sample_details, binary_columns = None, None
+            if self.is_oracle:
+                rows, columns, sample_method, sample_details = await self._fetch_oracle_sample(
+                    schema, table, select_list, total_rows
+                )
+            else:
+                source = self._source(schema, table)
+                if total_rows <= scanner.sample_size:
+                    query = f"SELECT {select_list} FROM {source}"
+                    sample_method = "전체 데이터"
+                else:
+                    query = f"SELECT {select_list} FROM {source} ORDER BY RAND({table_seed}) LIMIT {scanner.sample_size}"
+                    sample_method = "랜덤 샘플링"
+                rows, columns = await self._query(query)
+
+            if not rows:
+                return None, {'method': 'no_data', 'total_rows': total_rows, 'sampled_rows': 0}
+
+            if self.is_oracle:
+                df, binary_columns = scanner.build_sample_frame(rows, columns, truncated_columns)
+            else:
+                df = pl.DataFrame(rows, schema=columns, orient='row')
+
+        except Exception as e:
+            logger.error(f"샘플 조회 실패: {schema}.{table}: {str(e)}")
+            return None, {'method': 'error', 'error': str(e)}
+
+        sampling_info = {
+            'method': sample_method,
+            'total_rows': total_rows,
+            'sampled_rows': len(rows),
+            'sampling_ratio': len(rows) / total_rows if total_rows > 0 else 0,
+            'skipped_columns': skipped_columns,
+            'truncated_columns': truncated_columns,
+            'max_value_length': scanner.max_value_length,
+            'sample_seed': scanner.sample_seed,
+            'table_seed': table_seed
+        }
+        if sample_details:
+            sampling_info['sample_details'] = sample_details
+        if binary_columns:
+            sampling_info['binary_columns'] = binary_columns
+        return df, sampling_info
+
+    async def scan_table(self, schema: str, table: str, semaphore: asyncio.Semaphore) -> Dict:
+        """테이블 스캔 (조회는 동시 조회 수 제한 안에서, 분석은 executor 에서)"""
+        async with semaphore:
+            df, sampling_info = await self.load_table_sample(schema, table)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.scanner.scan_loaded_table, schema, table, df, sampling_info
+        )
+
+    async def scan_schema(self, schema: str, semaphore: Optional[asyncio.Semaphore] = None) -> Dict:
+        """데이터베이스/스키마 전체 스캔 (테이블을 동시에 조회, 결과는 테이블 순서대로)"""
+        scanner = self.scanner
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrent_tables)
+        scan_results = scanner._new_scan_results(schema)
+        scan_results['engine'] = f"{scan_results['engine']} (asyncio)"
+
+        try:
+            tables = await self.get_tables(schema)
+            scan_results['summary']['total_tables'] = len(tables)
+
+            table_results = await asyncio.gather(
+                *(self.scan_table(schema, table, semaphore) for table in tables),
+                return_exceptions=True
+            )
+            for table, table_result in zip(tables, table_results):
+                if isinstance(table_result, Exception):
+                    logger.error(f"테이블 스캔 실패: {schema}.{table}: {table_result}")
+                    table_result = {
+                        'table': table,
+                        'sampling_info': {'method': 'error', 'error': str(table_result)},
+                        'columns': {},
+                        'privacy_score': 0,
+                        'risk_level': 'ERROR'
+                    }
+                scanner._add_table_result(scan_results, table, table_result)
+
+        except Exception as e:
+            scan_results['error'] = str(e)
+            logger.error(f"스키마 스캔 실패: {schema}: {str(e)}")
+
+        if scanner.pattern_budget.disabled:
+            scan_results['disabled_patterns'] = scanner.pattern_budget.report()
+
+        return scan_results
+
+    async def scan_all(self) -> List[Dict]:
+        """전체 데이터베이스/스키마 스캔 (스캐너 전체에서 동시 조회 수 공유)"""
+        schemas = await self.get_schemas()
+        semaphore = asyncio.Semaphore(self.max_concurrent_tables)
+        return list(await asyncio.gather(*(self.scan_schema(schema, semaphore) for schema in schemas)))
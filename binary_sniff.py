@@ -0,0 +1,60 @@
+from typing import Dict, Tuple
+
+import polars as pl
+
+# 파일 형식 시그니처 (앞부분 바이트)
+MAGIC_SIGNATURES = [
+    ('png', b'\x89PNG\r\n\x1a\n'),
+    ('jpeg', b'\xff\xd8\xff'),
+    ('gif', b'GIF8'),
+    ('pdf', b'%PDF'),
+    ('zip', b'PK\x03\x04'),  # docx/xlsx/pptx 포함
+    ('gzip', b'\x1f\x8b'),
+    ('ole2', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),  # doc/xls/ppt
+    ('tiff', b'II*\x00'),
+    ('tiff', b'MM\x00*'),
+    ('riff', b'RIFF'),  # webp/wav/avi
+    ('7z', b'7z\xbc\xaf\x27\x1c'),
+    ('rar', b'Rar!\x1a\x07'),
+    ('mp3', b'ID3'),
+]
+
+
+def sniff_expression(column: str) -> pl.Expr:
+    """Binary 컬럼 값의 형식 (알려진 파일 형식 / NUL 바이트 포함 시 binary / 그 외 text)"""
+    expr = pl.when(pl.col(column).is_null()).then(pl.lit(None, dtype=pl.Utf8))
+    for kind, signature in MAGIC_SIGNATURES:
+        expr = expr.when(pl.col(column).bin.starts_with(signature)).then(pl.lit(kind))
+    return (
+        expr.when(pl.col(column).bin.contains(b'\x00')).then(pl.lit('binary'))
+        .otherwise(pl.lit('text'))
+    )
+
+
+def decode_binary_columns(df: pl.DataFrame) -> Tuple[pl.DataFrame, Dict[str, Dict[str, int]]]:
+    """
+    Binary 컬럼을 스캔 가능한 텍스트로 변환
+
+    알려진 파일 형식이나 바이너리 데이터는 null 로 바꾸고, 텍스트로 보이는 값만 UTF-8 로 디코딩합니다.
+    컬럼별 형식 건수를 함께 반환합니다.
+    """
+    binary_columns = [name for name, dtype in df.schema.items() if dtype == pl.Binary]
+    if not binary_columns:
+        return df, {}
+
+    kinds = df.select([sniff_expression(column).alias(column) for column in binary_columns])
+    report = {}
+    for column in binary_columns:
+        counts = kinds[column].drop_nulls().value_counts()
+        report[column] = dict(sorted(zip(counts[column].to_list(), counts['count'].to_list())))
+
+    df = df.with_columns([
+        pl.when(kinds[column] == 'text')
+        .then(pl.col(column))
+        .otherwise(None)
+        .map_elements(lambda value: value.decode('utf-8', errors='replace'), return_dtype=pl.Utf8,
+                      skip_nulls=True)
+        .alias(column)
+        for column in binary_columns
+    ])
+    return df, report
@@ -0,0 +1,147 @@
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+
+import polars as pl
+
+from masking import supports_polars
+from pattern_registry import CompiledPatternSet
+from pattern_safety import PatternTimeBudget, can_match_empty
+
+logger = logging.getLogger(__name__)
+
+
+def vectorizable(pattern: str) -> bool:
+    """
+    Polars count_matches 결과가 re.findall 개수와 같은 정규식인지
+
+    Rust regex 로 컴파일되지 않는 패턴(전후방 탐색, 역참조)과 빈 문자열 일치를 다르게 세는
+    패턴은 Python 으로 처리합니다.
+    """
+    return supports_polars(pattern) and not can_match_empty(pattern)
+
+
+def _scan_python(values: List[Any], patterns: List[Tuple[int, str, Any]], budget: PatternTimeBudget,
+                 column: str, found: Dict[str, List[int]], matched_rows: List[bool]):
+    """Polars 로 처리할 수 없는 패턴을 값 단위로 스캔 (시간 예산 적용)"""
+    for row, value in enumerate(values):
+        if value is None:
+            continue
+        value = budget.truncate(str(value))
+        for position, pattern_name, pattern in patterns:
+            if budget.is_disabled(pattern_name):
+                continue
+
+            started = time.perf_counter()
+            matches = pattern.findall(value)
+            if budget.record(pattern_name, time.perf_counter() - started, len(value), column):
+                logger.warning(f"패턴 비활성화 (시간 예산 초과): {pattern_name} ({column})")
+            if matches:
+                # [첫 일치 행, 패턴 순서, 일치 개수]
+                stats = found.setdefault(pattern_name, [row, position, 0])
+                stats[2] += len(matches)
+                matched_rows[row] = True
+
+
+def scan_columns(df: pl.DataFrame, columns: List[str], pattern_set: CompiledPatternSet,
+                 budget: PatternTimeBudget) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 문자열 컬럼을 한 번에 패턴 스캔
+
+    컬럼 × 패턴 조합을 하나의 select 로 실행해 Polars 가 여러 코어에서 병렬 처리합니다.
+    결과는 컬럼 순서대로, 컬럼별 순차 스캔(scan_column_patterns)과 같은 형식과 값으로 반환합니다.
+    (privacy_matches 키 순서도 첫 일치 행 → 패턴 순서로 맞춤)
+
+    Args:
+        df: 샘플 DataFrame
+        columns: 스캔할 컬럼 (순서 유지)
+        pattern_set: 컴파일된 패턴 집합
+        budget: 패턴 시간 예산 (Python 으로 처리하는 패턴에만 적용, Rust regex 는 선형 시간)
+    """
+    active = [
+        (position, pattern_name, pattern)
+        for position, (pattern_name, pattern) in enumerate(pattern_set.items())
+        if not budget.is_disabled(pattern_name)
+    ]
+    vectorized = [item for item in active if vectorizable(item[2].pattern)]
+    fallback = [item for item in active if not vectorizable(item[2].pattern)]
+
+    def alias(column_index: int, position: int) -> str:
+        return f"{column_index}:{position}"
+
+    totals: Dict[str, int] = {}
+    firsts: Dict[str, int] = {}
+    matched: Dict[str, List[bool]] = {}
+
+    if vectorized and columns:
+        exprs = []
+        for i, column in enumerate(columns):
+            values = pl.col(column).cast(pl.Utf8).str.slice(0, budget.max_value_length)
+            for position, _, pattern in vectorized:
+                exprs.append(values.str.count_matches(pattern.pattern).alias(alias(i, position)))
+
+        counts = df.select(exprs)
+        hits = counts.select([(pl.col(name) > 0).fill_null(False) for name in counts.columns])
+
+        totals = counts.sum().row(0, named=True)
+        firsts = hits.select(pl.all().arg_max()).row(0, named=True)
+        row_hits = hits.select([
+            pl.any_horizontal([pl.col(alias(i, position)) for position, _, _ in vectorized]).alias(column)
+            for i, column in enumerate(columns)
+        ])
+        matched = {column: row_hits[column].to_list() for column in columns}
+
+    results = {}
+    for i, column in enumerate(columns):
+        series = df[column]
+        total_values = series.len() - series.null_count()
+        if total_values == 0:
+            results[column] = {'privacy_matches': {}, 'total_values': 0, 'privacy_count': 0, 'privacy_ratio': 0}
+            continue
+
+        matched_rows = matched.get(column) or [False] * series.len()
+        found: Dict[str, List[int]] = {}
+        for position, pattern_name, _ in vectorized:
+            count = totals.get(alias(i, position))
+            if count:
+                found[pattern_name] = [firsts[alias(i, position)], position, count]
+
+        if fallback:
+            _scan_python(series.to_list(), fallback, budget, column, found, matched_rows)
+
+        privacy_count = sum(matched_rows)
+        results[column] = {
+            'privacy_matches': {
+                pattern_name: stats[2]
+                for pattern_name, stats in sorted(found.items(), key=lambda item: (item[1][0], item[1][1]))
+            },
+            'total_values': total_values,
+            'privacy_count': privacy_count,
+            'privacy_ratio': privacy_count / total_values,
+        }
+
+    return results
+
+
+def partition_breakdown(df: pl.DataFrame, partitions: List[Dict[str, Any]], columns: List[str],
+                        pattern_set: CompiledPatternSet, budget: PatternTimeBudget) -> List[Dict[str, Any]]:
+    """
+    파티션별 탐지 결과
+
+    파티션 샘플은 파티션 순서대로 이어 붙여져 있으므로(sampling_info['partitions'] 의 offset / sampled_rows)
+    구간별로 다시 스캔해 어느 파티션에서 개인정보가 나왔는지 보여줍니다.
+    """
+    breakdown = []
+    for partition in partitions:
+        sampled_rows = partition.get('sampled_rows', 0)
+        entry = {'partition': partition['name'], 'sampled_rows': sampled_rows, 'privacy_columns': {}}
+        if sampled_rows and columns:
+            part_df = df.slice(partition['offset'], sampled_rows)
+            for column, result in scan_columns(part_df, columns, pattern_set, budget).items():
+                if result['privacy_matches']:
+                    entry['privacy_columns'][column] = {
+                        'privacy_matches': result['privacy_matches'],
+                        'privacy_ratio': result['privacy_ratio'],
+                    }
+        breakdown.append(entry)
+    return breakdown
@@ -5,9 +5,10 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import json
 from datetime import datetime
-import re
 from pathlib import Path
 
+from masking import mask_text
+
 # 페이지 설정
 st.set_page_config(
     page_title="개인정보 스캔 대시보드",
@@ -50,24 +51,8 @@ st.markdown("""
 
 # 데이터 마스킹 함수
 def mask_sensitive_data(text):
-    """민감한 데이터 마스킹"""
-    if not isinstance(text, str):
-        return text
-
-    # 이메일 마스킹
-    text = re.sub(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-                  lambda m: f"{m.group(1)[:2]}***@{m.group(2)}", text)
-
-    # 전화번호 마스킹
-    text = re.sub(r'(\d{2,3})-(\d{3,4})-(\d{4})', r'\1-***-\3', text)
-
-    # 주민등록번호 마스킹
-    text = re.sub(r'(\d{6})-([1-4])(\d{6})', r'\1-\2******', text)
-
-    # 카드번호 마스킹
-    text = re.sub(r'(\d{4})-(\d{4})-(\d{4})-(\d{4})', r'\1-****-****-\4', text)
-
-    return text
+    """민감한 데이터 마스킹 (스캐너와 같은 기본 마스킹 규칙)"""
+    return mask_text(text)
 
 
 # 위험도 색상 매핑
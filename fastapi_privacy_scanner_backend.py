@@ -1,12 +1,13 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any, Union
 import asyncio
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
+import re
 import os
 from enum import Enum
 import logging
@@ -16,16 +17,31 @@ import pymysql
 import cx_Oracle
 import psycopg2
 from contextlib import contextmanager
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from scan_scheduler import ScanScheduler, ScanPriority, TaskFactory
+from recurring_scans import CronExpression, RecurringScanRunner
+from pattern_registry import DEFAULT_PATTERNS, get_registry
+from pattern_safety import analyze_pattern, check_pattern_safety
+from pattern_benchmark import run_pattern_benchmark
+
+from sample_cache import SampleCache, make_source_id
+from scan_calibration import ScanCalibration
+from masking import mask_dataframe
+from async_scanner import AsyncConnectionPools, AsyncPrivacyScanner
 
 # 기존 스캐너 import (실제 구현시 분리된 모듈에서 import)
-# from polars_privacy_scanner import PolarsPrivacyScanner
-# from oracle_privacy_scanner import OraclePrivacyScanner
+from mysql_scan import PolarsPrivacyScanner
+from oracle_scan import OraclePrivacyScanner
+from postgres_scan import PostgresPrivacyScanner
 # from privacy_executive_summary import PrivacyExecutiveSummary
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="개인정보 스캔 API",
-    description="MySQL, Oracle 데이터베이스 개인정보 패턴 스캔 서비스",
+    description="MySQL, Oracle, PostgreSQL 데이터베이스 개인정보 패턴 스캔 서비스",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc"
@@ -61,6 +77,7 @@ def get_db():
 class DatabaseType(str, Enum):
     mysql = "mysql"
     oracle = "oracle"
+    postgresql = "postgresql"
 
 
 class ScanStatus(str, Enum):
@@ -82,11 +99,13 @@ class DatabaseConfig(BaseModel):
     db_type: DatabaseType
     host: str
     port: int = Field(default=3306, description="데이터베이스 포트")
-    database: Optional[str] = Field(None, description="MySQL 데이터베이스명")
+    database: Optional[str] = Field(None, description="MySQL/PostgreSQL 데이터베이스명")
     service_name: Optional[str] = Field(None, description="Oracle 서비스명")
     user: str
     password: str
     sample_size: int = Field(default=100, ge=10, le=1000, description="샘플링 크기")
+    sample_seed: Optional[int] = Field(None, ge=0, le=4294967295, description="샘플링 시드 (이전 결과의 sample_seed 를 지정하면 같은 표본 재현)")
+    regexp_pushdown: bool = Field(default=False, description="DB 에서 전체 테이블 패턴 집계 (감사용, 변환 가능한 패턴만)")
 
 
 class ScanRequest(BaseModel):
@@ -95,6 +114,7 @@ class ScanRequest(BaseModel):
     include_structure_analysis: bool = Field(default=True, description="구조 분석 포함 여부")
     include_privacy_scan: bool = Field(default=True, description="개인정보 스캔 포함 여부")
     include_executive_summary: bool = Field(default=True, description="Executive Summary 포함 여부")
+    priority: ScanPriority = Field(default=ScanPriority.normal, description="스캔 우선순위")
 
 
 class ScanJobInfo(BaseModel):
@@ -104,12 +124,17 @@ class ScanJobInfo(BaseModel):
     db_type: DatabaseType
     host: str
     database: Optional[str]
+    priority: ScanPriority = ScanPriority.normal
     created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     progress: int = Field(default=0, description="진행률 (0-100)")
     current_step: str = Field(default="", description="현재 진행 단계")
     error_message: Optional[str] = None
+    wait_time_sec: Optional[float] = Field(None, description="스케줄러 큐 대기 시간(초)")
+    run_time_sec: Optional[float] = Field(None, description="실행 시간(초)")
+    schedule_id: Optional[int] = Field(None, description="정기 스캔 스케줄 ID")
+    incremental_since: Optional[datetime] = Field(None, description="증분 스캔 기준 시각")
 
 
 class ScanResult(BaseModel):
@@ -139,6 +164,95 @@ class ScanSummary(BaseModel):
 scan_jobs: Dict[str, ScanJobInfo] = {}
 scan_results: Dict[str, ScanResult] = {}
 
+# 스캔 스케줄러 (우선순위 + 호스트별 동시 세션 제한)
+scan_scheduler = ScanScheduler(max_workers=4, max_sessions_per_host=2)
+
+# 샘플 캐시 (스캔한 샘플을 저장, 패턴 변경 시 재평가에 사용)
+# PII_SAMPLE_CACHE_PLAINTEXT=1 이면 암호화 대신 memory_map 가능한 비압축 Arrow 파일로 저장
+sample_cache = SampleCache(
+    retention_days=7,
+    encrypt=os.environ.get('PII_SAMPLE_CACHE_PLAINTEXT') != '1',
+    max_bytes=1024 * 1024 * 1024
+)
+
+# 스캔 보정 (테이블별 단계 소요 시간을 기록해 스캔 시간 예측에 사용)
+scan_calibration = ScanCalibration()
+
+# 비동기 스캐너 연결 풀 (호스트별 공유) 과 패턴 탐지용 executor
+# 하나의 이벤트 루프에서 여러 호스트의 테이블을 동시에 조회하고, CPU 작업만 스레드에서 실행
+async_scan_pools = AsyncConnectionPools(pool_size=4)
+scan_analysis_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="scan-analyze")
+
+
+@app.on_event("startup")
+async def start_scan_scheduler():
+    await scan_scheduler.start()
+
+
+@app.on_event("startup")
+async def purge_expired_samples():
+    sample_cache.purge(expired_only=True)
+
+
+@app.on_event("shutdown")
+async def stop_scan_scheduler():
+    await scan_scheduler.stop()
+
+
+@app.on_event("shutdown")
+async def close_async_scan_pools():
+    await async_scan_pools.close()
+    scan_analysis_executor.shutdown(wait=False)
+
+
+def _on_scheduled_job_start(job):
+    """스케줄러가 작업을 실제로 시작할 때 작업 상태 갱신"""
+    if job.job_id in scan_jobs:
+        scan_jobs[job.job_id].status = ScanStatus.running
+        scan_jobs[job.job_id].started_at = job.started_at
+        scan_jobs[job.job_id].wait_time_sec = job.wait_time_sec
+
+
+def _on_scheduled_job_finish(job):
+    """스케줄러 작업 종료 시 대기/실행 시간 기록"""
+    if job.job_id not in scan_jobs:
+        return
+
+    job_info = scan_jobs[job.job_id]
+    job_info.wait_time_sec = job.wait_time_sec
+    job_info.run_time_sec = job.run_time_sec
+
+    if job.error and job_info.status != ScanStatus.failed:
+        job_info.status = ScanStatus.failed
+        job_info.error_message = job.error
+
+
+async def submit_scan_job(job_id: str, config: DatabaseConfig, priority: ScanPriority = ScanPriority.normal,
+                          incremental_since: Optional[datetime] = None):
+    """
+    스캔 작업을 스케줄러에 등록
+
+    스캔은 단계별 태스크로 등록되므로 같은 우선순위의 다른 작업과 단계 단위로 번갈아 실행되고,
+    큰 작업도 단계가 끝날 때마다 호스트 세션을 양보합니다.
+    """
+    if config.db_type == DatabaseType.mysql:
+        tasks = mysql_scan_tasks(job_id, config, incremental_since)
+    elif config.db_type == DatabaseType.oracle:
+        tasks = oracle_scan_tasks(job_id, config, incremental_since)
+    elif config.db_type == DatabaseType.postgresql:
+        tasks = postgres_scan_tasks(job_id, config, incremental_since)
+    else:
+        raise ValueError(f"Invalid database type: {config.db_type}")
+
+    await scan_scheduler.submit(
+        job_id,
+        host=f"{config.host}:{config.port}",
+        tasks=tasks,
+        priority=priority,
+        on_start=_on_scheduled_job_start,
+        on_finish=_on_scheduled_job_finish,
+    )
+
 
 # 인증 함수 (간단한 예시)
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
@@ -152,7 +266,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 @app.post("/scan/database-config/{config_id}", response_model=Dict[str, str])
 async def start_scan_with_config(
     config_id: int,
-    background_tasks: BackgroundTasks,
+    priority: ScanPriority = ScanPriority.normal,
     conn: sqlite3.Connection = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -191,16 +305,13 @@ async def start_scan_with_config(
             db_type=DatabaseType.mysql,
             host=database_config.host,
             database=database_config.database,
+            priority=priority,
             created_at=datetime.now()
         )
         scan_jobs[job_id] = job_info
 
-        # Start the scan in the background
-        background_tasks.add_task(run_mysql_scan, job_id, database_config)
-
-        # Update job status
-        scan_jobs[job_id].status = ScanStatus.running
-        scan_jobs[job_id].started_at = datetime.now()
+        # 스케줄러에 등록 (호스트 세션 여유가 생기면 시작)
+        await submit_scan_job(job_id, database_config, priority)
 
         logger.info(f"MySQL 스캔 작업 시작: {job_id}, Config ID: {config_id}")
 
@@ -211,6 +322,8 @@ async def start_scan_with_config(
             "results_url": f"/results/{job_id}"
         }
 
+    except HTTPException:
+        raise
     except (sqlite3.Error, ValueError) as e:
         logger.error(f"Error starting scan with config ID {config_id}: {e}")
         raise HTTPException(status_code=500, detail=f"스캔 작업 시작 중 오류가 발생했습니다: {str(e)}")
@@ -219,77 +332,113 @@ async def start_scan_with_config(
         raise HTTPException(status_code=500, detail="내부 서버 오류가 발생했습니다")
 
 
-async def run_mysql_scan(job_id: str, config: DatabaseConfig):
-    """MySQL 스캔 실행"""
-    try:
+def _update_scan_progress(job_id: str, step: str, progress: int):
+    scan_jobs[job_id].current_step = step
+    scan_jobs[job_id].progress = progress
+
+
+def _complete_scan_job(job_id: str, label: str, state: Dict[str, Any], processing_time: str):
+    """단계별 결과를 모아 스캔 결과 저장 및 작업 완료 처리"""
+    scan_results[job_id] = ScanResult(
+        job_id=job_id,
+        status=ScanStatus.completed,
+        structure_analysis=state['structure_analysis'],
+        privacy_scan_results=state['privacy_results'],
+        executive_summary=state['executive_summary'],
+        created_at=scan_jobs[job_id].created_at,
+        completed_at=datetime.now(),
+        processing_time=processing_time
+    )
+
+    scan_jobs[job_id].status = ScanStatus.completed
+    scan_jobs[job_id].completed_at = datetime.now()
+    scan_jobs[job_id].progress = 100
+    scan_jobs[job_id].current_step = "완료"
+
+    logger.info(f"{label} 스캔 완료: {job_id}")
+
+
+def _scan_stage_tasks(job_id: str, label: str, stages: List[TaskFactory]) -> List[TaskFactory]:
+    """
+    스캔 단계를 스케줄러 태스크로 등록할 수 있게 감싸기
+
+    단계가 실패하면 작업을 실패로 표시하고 예외를 다시 발생시켜 스케줄러가 남은 단계를 건너뛰게 합니다.
+    """
+    def wrap(stage: TaskFactory) -> TaskFactory:
+        async def task():
+            try:
+                await stage()
+            except Exception as e:
+                logger.error(f"{label} 스캔 실패: {job_id}, 오류: {str(e)}")
+                scan_jobs[job_id].status = ScanStatus.failed
+                scan_jobs[job_id].error_message = str(e)
+                raise
+        return task
+
+    return [wrap(stage) for stage in stages]
+
+
+def mysql_scan_tasks(job_id: str, config: DatabaseConfig,
+                     incremental_since: Optional[datetime] = None) -> List[TaskFactory]:
+    """
+    MySQL 스캔 단계별 태스크 (incremental_since 지정 시 이후 변경된 테이블만 스캔)
+
+    단계마다 스케줄러 태스크 하나로 등록되므로 단계 사이에 다른 작업의 태스크가 실행됩니다.
+    실제 스캐너를 연결하면 개인정보 스캔 단계는 scanner.scan_table 을 테이블별 태스크로 나눠 등록합니다.
+    """
+    state: Dict[str, Any] = {}
+
+    async def connect():
         # 실제 스캐너 초기화
         # scanner = PolarsPrivacyScanner(
         #     host=config.host,
         #     user=config.user,
         #     password=config.password,
         #     database=config.database,
-        #     sample_size=config.sample_size
+        #     sample_size=config.sample_size,
+        #     sample_seed=config.sample_seed,
+        #     sample_cache=sample_cache
         # )
 
         # 진행상황 업데이트
-        scan_jobs[job_id].current_step = "데이터베이스 연결 중..."
-        scan_jobs[job_id].progress = 10
+        _update_scan_progress(job_id, "데이터베이스 연결 중...", 10)
 
         await asyncio.sleep(1)  # 시뮬레이션
 
-        # 구조 분석
-        scan_jobs[job_id].current_step = "구조 분석 중..."
-        scan_jobs[job_id].progress = 30
+    async def analyze_structure():
+        _update_scan_progress(job_id, "구조 분석 중...", 30)
 
         # structure_analysis = scanner.preview_all_databases()
-        structure_analysis = {"simulated": "structure_data"}  # 시뮬레이션
+        state['structure_analysis'] = {"simulated": "structure_data"}  # 시뮬레이션
 
         await asyncio.sleep(2)
 
-        # 개인정보 스캔
-        scan_jobs[job_id].current_step = "개인정보 패턴 스캔 중..."
-        scan_jobs[job_id].progress = 70
+    async def scan_privacy():
+        _update_scan_progress(job_id, "개인정보 패턴 스캔 중...", 70)
 
-        # privacy_results = scanner.scan_all_databases()
-        privacy_results = [{"simulated": "privacy_data"}]  # 시뮬레이션
+        # privacy_results = scanner.scan_all_databases(changed_since=incremental_since)
+        # 비동기 엔진 (전체 스캔): privacy_results = await create_async_scanner(config).scan_all()
+        state['privacy_results'] = [{"simulated": "privacy_data"}]  # 시뮬레이션
 
         await asyncio.sleep(2)
 
+    async def summarize():
         # Executive Summary 생성
-        scan_jobs[job_id].current_step = "Executive Summary 생성 중..."
-        scan_jobs[job_id].progress = 90
+        _update_scan_progress(job_id, "Executive Summary 생성 중...", 90)
 
-        executive_summary = {"simulated": "executive_summary"}  # 시뮬레이션
+        state['executive_summary'] = {"simulated": "executive_summary"}  # 시뮬레이션
 
-        # 결과 저장
-        scan_results[job_id] = ScanResult(
-            job_id=job_id,
-            status=ScanStatus.completed,
-            structure_analysis=structure_analysis,
-            privacy_scan_results=privacy_results,
-            executive_summary=executive_summary,
-            created_at=scan_jobs[job_id].created_at,
-            completed_at=datetime.now(),
-            processing_time="00:00:05"  # 시뮬레이션
-        )
+        _complete_scan_job(job_id, "MySQL", state, "00:00:05")  # 시뮬레이션
 
-        # 작업 완료 처리
-        scan_jobs[job_id].status = ScanStatus.completed
-        scan_jobs[job_id].completed_at = datetime.now()
-        scan_jobs[job_id].progress = 100
-        scan_jobs[job_id].current_step = "완료"
+    return _scan_stage_tasks(job_id, "MySQL", [connect, analyze_structure, scan_privacy, summarize])
 
-        logger.info(f"MySQL 스캔 완료: {job_id}")
 
-    except Exception as e:
-        logger.error(f"MySQL 스캔 실패: {job_id}, 오류: {str(e)}")
-        scan_jobs[job_id].status = ScanStatus.failed
-        scan_jobs[job_id].error_message = str(e)
+def oracle_scan_tasks(job_id: str, config: DatabaseConfig,
+                      incremental_since: Optional[datetime] = None) -> List[TaskFactory]:
+    """Oracle 스캔 단계별 태스크 (incremental_since 지정 시 이후 변경된 테이블만 스캔)"""
+    state: Dict[str, Any] = {}
 
-
-async def run_oracle_scan(job_id: str, config: DatabaseConfig):
-    """Oracle 스캔 실행"""
-    try:
+    async def connect():
         # 실제 스캐너 초기화
         # scanner = OraclePrivacyScanner(
         #     host=config.host,
@@ -297,46 +446,161 @@ async def run_oracle_scan(job_id: str, config: DatabaseConfig):
         #     service_name=config.service_name,
         #     user=config.user,
         #     password=config.password,
-        #     sample_size=config.sample_size
+        #     sample_size=config.sample_size,
+        #     sample_seed=config.sample_seed,
+        #     sample_cache=sample_cache
         # )
 
-        scan_jobs[job_id].current_step = "Oracle 서버 연결 중..."
-        scan_jobs[job_id].progress = 10
+        _update_scan_progress(job_id, "Oracle 서버 연결 중...", 10)
 
         await asyncio.sleep(1)
 
-        # 구조 분석
-        scan_jobs[job_id].current_step = "스키마 구조 분석 중..."
-        scan_jobs[job_id].progress = 30
+    async def analyze_structure():
+        _update_scan_progress(job_id, "스키마 구조 분석 중...", 30)
 
-        structure_analysis = {"simulated": "oracle_structure_data"}
+        state['structure_analysis'] = {"simulated": "oracle_structure_data"}
 
         await asyncio.sleep(3)
 
-        # 개인정보 스캔
-        scan_jobs[job_id].current_step = "스키마별 개인정보 스캔 중..."
-        scan_jobs[job_id].progress = 70
+    async def scan_privacy():
+        _update_scan_progress(job_id, "스키마별 개인정보 스캔 중...", 70)
 
-        privacy_results = [{"simulated": "oracle_privacy_data"}]
+        # privacy_results = scanner.scan_all_schemas(changed_since=incremental_since)
+        # 비동기 엔진 (전체 스캔): privacy_results = await create_async_scanner(config).scan_all()
+        state['privacy_results'] = [{"simulated": "oracle_privacy_data"}]
 
         await asyncio.sleep(3)
 
-        # Executive Summary
-        scan_jobs[job_id].current_step = "Executive Summary 생성 중..."
-        scan_jobs[job_id].progress = 90
+    async def summarize():
+        _update_scan_progress(job_id, "Executive Summary 생성 중...", 90)
+
+        state['executive_summary'] = {"simulated": "oracle_executive_summary"}
+
+        _complete_scan_job(job_id, "Oracle", state, "00:00:07")
+
+    return _scan_stage_tasks(job_id, "Oracle", [connect, analyze_structure, scan_privacy, summarize])
+
+
+def postgres_scan_tasks(job_id: str, config: DatabaseConfig,
+                        incremental_since: Optional[datetime] = None) -> List[TaskFactory]:
+    """PostgreSQL 스캔 단계별 태스크 (incremental_since 지정 시 이후 변경된 테이블만 스캔)"""
+    state: Dict[str, Any] = {}
+
+    async def connect():
+        # 실제 스캐너 초기화
+        # scanner = create_scanner(config)
+
+        _update_scan_progress(job_id, "PostgreSQL 서버 연결 중...", 10)
+
+        await asyncio.sleep(1)
+
+    async def analyze_structure():
+        # 구조 분석 (행 수는 pg_class 통계 기준이라 COUNT(*) 없이 수행)
+        _update_scan_progress(job_id, "스키마 구조 분석 중...", 30)
+
+        # structure_analysis = scanner.preview_all_databases()
+        state['structure_analysis'] = {"simulated": "postgres_structure_data"}
+
+        await asyncio.sleep(2)
+
+    async def scan_privacy():
+        _update_scan_progress(job_id, "스키마별 개인정보 스캔 중...", 70)
+
+        # privacy_results = scanner.scan_all_databases(changed_since=incremental_since)
+        state['privacy_results'] = [{"simulated": "postgres_privacy_data"}]
+
+        await asyncio.sleep(2)
+
+    async def summarize():
+        _update_scan_progress(job_id, "Executive Summary 생성 중...", 90)
+
+        state['executive_summary'] = {"simulated": "postgres_executive_summary"}
+
+        _complete_scan_job(job_id, "PostgreSQL", state, "00:00:05")
 
-        executive_summary = {"simulated": "oracle_executive_summary"}
+    return _scan_stage_tasks(job_id, "PostgreSQL", [connect, analyze_structure, scan_privacy, summarize])
+
+
+def create_scanner(config: DatabaseConfig):
+    """설정에 맞는 스캐너 생성 (연결은 스캔 시점에 수행)"""
+    if config.db_type == DatabaseType.mysql:
+        return PolarsPrivacyScanner(
+            host=config.host,
+            user=config.user,
+            password=config.password,
+            database=config.database,
+            sample_size=config.sample_size,
+            port=config.port,
+            sample_seed=config.sample_seed,
+            regexp_pushdown=config.regexp_pushdown,
+            pattern_registry=pattern_registry,
+            sample_cache=sample_cache,
+            calibration=scan_calibration
+        )
+    if config.db_type == DatabaseType.oracle:
+        return OraclePrivacyScanner(
+            host=config.host,
+            port=config.port,
+            service_name=config.service_name,
+            user=config.user,
+            password=config.password,
+            sample_size=config.sample_size,
+            sample_seed=config.sample_seed,
+            regexp_pushdown=config.regexp_pushdown,
+            pattern_registry=pattern_registry,
+            sample_cache=sample_cache,
+            calibration=scan_calibration
+        )
+    if config.db_type == DatabaseType.postgresql:
+        # REGEXP 집계는 MySQL/Oracle 만 지원 (regexp_pushdown 무시)
+        return PostgresPrivacyScanner(
+            host=config.host,
+            user=config.user,
+            password=config.password,
+            database=config.database or "postgres",
+            sample_size=config.sample_size,
+            port=config.port,
+            sample_seed=config.sample_seed,
+            pattern_registry=pattern_registry,
+            sample_cache=sample_cache,
+            calibration=scan_calibration
+        )
+    raise ValueError(f"Invalid database type: {config.db_type}")
+
+
+def create_async_scanner(config: DatabaseConfig, max_concurrent_tables: int = 8) -> AsyncPrivacyScanner:
+    """설정에 맞는 비동기 스캐너 생성 (공유 연결 풀 + 분석 executor 사용)"""
+    if config.db_type == DatabaseType.postgresql:
+        raise ValueError("비동기 엔진은 MySQL/Oracle 만 지원합니다")
+    return AsyncPrivacyScanner(
+        create_scanner(config),
+        async_scan_pools,
+        executor=scan_analysis_executor,
+        max_concurrent_tables=max_concurrent_tables
+    )
+
+
+async def run_reevaluate_scan(job_id: str, config: DatabaseConfig, schemas: Optional[List[str]] = None):
+    """캐시된 샘플에 현재 패턴 재적용 (원본 DB 접속 없음)"""
+    try:
+        scan_jobs[job_id].current_step = "캐시된 샘플 재평가 중..."
+        scan_jobs[job_id].progress = 10
+
+        started = time.monotonic()
+        scanner = create_scanner(config)
+
+        # 패턴 매칭은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        loop = asyncio.get_running_loop()
+        privacy_results = await loop.run_in_executor(None, scanner.reevaluate_cached_samples, schemas)
+        elapsed = time.monotonic() - started
 
-        # 결과 저장
         scan_results[job_id] = ScanResult(
             job_id=job_id,
             status=ScanStatus.completed,
-            structure_analysis=structure_analysis,
             privacy_scan_results=privacy_results,
-            executive_summary=executive_summary,
             created_at=scan_jobs[job_id].created_at,
             completed_at=datetime.now(),
-            processing_time="00:00:07"
+            processing_time=str(timedelta(seconds=round(elapsed)))
         )
 
         scan_jobs[job_id].status = ScanStatus.completed
@@ -344,10 +608,10 @@ async def run_oracle_scan(job_id: str, config: DatabaseConfig):
         scan_jobs[job_id].progress = 100
         scan_jobs[job_id].current_step = "완료"
 
-        logger.info(f"Oracle 스캔 완료: {job_id}")
+        logger.info(f"샘플 재평가 완료: {job_id}, 테이블 {sum(len(r['tables']) for r in privacy_results)}개")
 
     except Exception as e:
-        logger.error(f"Oracle 스캔 실패: {job_id}, 오류: {str(e)}")
+        logger.error(f"샘플 재평가 실패: {job_id}, 오류: {str(e)}")
         scan_jobs[job_id].status = ScanStatus.failed
         scan_jobs[job_id].error_message = str(e)
 
@@ -375,12 +639,92 @@ def init_db():
         )
     ''')
 
+    # 정기 스캔 스케줄 테이블 생성
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS scan_schedules (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            config_id INTEGER NOT NULL,
+            cron TEXT NOT NULL,
+            priority TEXT NOT NULL DEFAULT 'routine',
+            incremental INTEGER NOT NULL DEFAULT 1,
+            enabled INTEGER NOT NULL DEFAULT 1,
+            next_run_at TEXT,
+            last_run_at TEXT,
+            last_success_at TEXT,
+            last_job_id TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (config_id) REFERENCES database_configs (id)
+        )
+    ''')
+
     conn.commit()
     conn.close()
 
 # 애플리케이션 시작 시 DB 초기화
 init_db()
 
+
+async def launch_scheduled_scan(config_row: Dict[str, Any], schedule: Dict[str, Any]) -> str:
+    """정기 스캔 스케줄에 따라 스캔 작업 생성"""
+    database_config = DatabaseConfig(
+        db_type=config_row['db_type'],
+        host=config_row['host'],
+        port=config_row['port'],
+        database=config_row['database'],
+        service_name=config_row['service_name'],
+        user=config_row['user'],
+        password=config_row['password'],
+        sample_size=config_row['sample_size']
+    )
+
+    # 증분 스캔: 마지막 성공 실행 이후 변경된 테이블만 스캔
+    incremental_since = None
+    if schedule['incremental'] and schedule['last_success_at']:
+        incremental_since = datetime.fromisoformat(schedule['last_success_at'])
+
+    priority = ScanPriority(schedule['priority'])
+    job_id = str(uuid.uuid4())
+    scan_jobs[job_id] = ScanJobInfo(
+        job_id=job_id,
+        scan_name=f"Scheduled Scan for Config {config_row['id']} ({config_row['name']})",
+        status=ScanStatus.pending,
+        db_type=database_config.db_type,
+        host=database_config.host,
+        database=database_config.database or database_config.service_name,
+        priority=priority,
+        created_at=datetime.now(),
+        schedule_id=schedule['id'],
+        incremental_since=incremental_since
+    )
+
+    await submit_scan_job(job_id, database_config, priority, incremental_since)
+    return job_id
+
+
+def get_scan_job_status(job_id: str) -> Optional[str]:
+    job = scan_jobs.get(job_id)
+    return job.status.value if job else None
+
+
+# 정기 스캔 실행기 (외부 cron 없이 프로세스 내에서 실행)
+recurring_scan_runner = RecurringScanRunner(
+    'database_configs.db',
+    launch_scan=launch_scheduled_scan,
+    get_job_status=get_scan_job_status,
+    poll_interval_sec=30,
+    jitter_window_sec=900
+)
+
+
+@app.on_event("startup")
+async def start_recurring_scan_runner():
+    await recurring_scan_runner.start()
+
+
+@app.on_event("shutdown")
+async def stop_recurring_scan_runner():
+    await recurring_scan_runner.stop()
+
 # Pydantic 모델 수정
 class DatabaseConfigCreate(DatabaseConfig):
     name: str = Field(..., description="설정 이름")
@@ -414,7 +758,6 @@ async def root():
 @app.post("/scan", response_model=Dict[str, str])
 async def start_scan(
         request: ScanRequest,
-        background_tasks: BackgroundTasks,
         current_user: dict = Depends(get_current_user)
 ):
     """개인정보 스캔 작업 시작"""
@@ -428,22 +771,17 @@ async def start_scan(
         db_type=request.config.db_type,
         host=request.config.host,
         database=request.config.database or request.config.service_name,
+        priority=request.priority,
         created_at=datetime.now()
     )
 
     scan_jobs[job_id] = job_info
 
-    # 백그라운드 작업 시작
-    if request.config.db_type == DatabaseType.mysql:
-        background_tasks.add_task(run_mysql_scan, job_id, request.config)
-    elif request.config.db_type == DatabaseType.oracle:
-        background_tasks.add_task(run_oracle_scan, job_id, request.config)
+    # 스케줄러에 등록 (우선순위 / 호스트별 동시 세션 제한 적용)
+    await submit_scan_job(job_id, request.config, request.priority)
 
-    # 작업 시작 시간 업데이트
-    scan_jobs[job_id].status = ScanStatus.running
-    scan_jobs[job_id].started_at = datetime.now()
-
-    logger.info(f"스캔 작업 시작: {job_id}, DB: {request.config.db_type}, Host: {request.config.host}")
+    logger.info(f"스캔 작업 등록: {job_id}, DB: {request.config.db_type}, Host: {request.config.host}, "
+                f"우선순위: {request.priority.value}")
 
     return {
         "job_id": job_id,
@@ -475,7 +813,8 @@ async def cancel_job(job_id: str, current_user: dict = Depends(get_current_user)
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
 
     job = scan_jobs[job_id]
-    if job.status == ScanStatus.running:
+    if job.status in (ScanStatus.pending, ScanStatus.running):
+        await scan_scheduler.cancel(job_id)
         job.status = ScanStatus.failed
         job.error_message = "사용자에 의해 취소됨"
         return {"message": "작업이 취소되었습니다."}
@@ -596,7 +935,8 @@ async def get_statistics(current_user: dict = Depends(get_current_user)):
         "success_rate": (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0,
         "database_types": {
             "mysql": len([j for j in scan_jobs.values() if j.db_type == DatabaseType.mysql]),
-            "oracle": len([j for j in scan_jobs.values() if j.db_type == DatabaseType.oracle])
+            "oracle": len([j for j in scan_jobs.values() if j.db_type == DatabaseType.oracle]),
+            "postgresql": len([j for j in scan_jobs.values() if j.db_type == DatabaseType.postgresql])
         }
     }
 
@@ -825,6 +1165,7 @@ async def update_database_config(
         ))
 
         conn.commit()
+        connection_test_cache.pop(config_id, None)
 
         # 업데이트된 설정 조회
         cursor.execute('SELECT * FROM database_configs WHERE id = ?', (config_id,))
@@ -880,9 +1221,11 @@ async def delete_database_config(
         if not cursor.fetchone():
             raise HTTPException(status_code=404, detail="설정을 찾을 수 없습니다")
 
-        # 설정 삭제
+        # 설정 삭제 (연결된 정기 스캔 스케줄 포함)
+        cursor.execute('DELETE FROM scan_schedules WHERE config_id = ?', (config_id,))
         cursor.execute('DELETE FROM database_configs WHERE id = ?', (config_id,))
         conn.commit()
+        connection_test_cache.pop(config_id, None)
 
         return {"message": "설정이 삭제되었습니다"}
     except sqlite3.Error as e:
@@ -893,6 +1236,173 @@ async def delete_database_config(
         raise HTTPException(status_code=500, detail="내부 서버 오류가 발생했습니다")
 
 
+# 정기 스캔 스케줄 API
+class ScanScheduleCreate(BaseModel):
+    cron: str = Field(..., description="cron 표현식 (분 시 일 월 요일) 또는 @daily 등")
+    priority: ScanPriority = Field(default=ScanPriority.routine, description="스캔 우선순위")
+    incremental: bool = Field(default=True, description="마지막 성공 이후 변경된 테이블만 스캔")
+    enabled: bool = True
+
+
+class ScanScheduleResponse(ScanScheduleCreate):
+    id: int
+    config_id: int
+    next_run_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_success_at: Optional[datetime] = None
+    last_job_id: Optional[str] = None
+
+
+def _schedule_from_row(row) -> ScanScheduleResponse:
+    return ScanScheduleResponse(
+        id=row['id'],
+        config_id=row['config_id'],
+        cron=row['cron'],
+        priority=row['priority'],
+        incremental=bool(row['incremental']),
+        enabled=bool(row['enabled']),
+        next_run_at=row['next_run_at'],
+        last_run_at=row['last_run_at'],
+        last_success_at=row['last_success_at'],
+        last_job_id=row['last_job_id']
+    )
+
+
+def _validate_cron(cron: str):
+    """cron 표현식 검사 (문법 오류, 2월 31일처럼 일치하는 날짜가 없는 표현식은 400)"""
+    try:
+        CronExpression(cron).next_after(datetime.now())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 cron 표현식입니다: {str(e)}")
+
+
+@app.post("/database-configs/{config_id}/schedules", response_model=ScanScheduleResponse,
+          status_code=status.HTTP_201_CREATED)
+async def create_scan_schedule(
+    config_id: int,
+    schedule: ScanScheduleCreate,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """데이터베이스 설정에 정기 스캔 스케줄 추가"""
+    _validate_cron(schedule.cron)
+
+    try:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('SELECT host, port FROM database_configs WHERE id = ?', (config_id,))
+        config_row = cursor.fetchone()
+        if not config_row:
+            raise HTTPException(status_code=404, detail="설정을 찾을 수 없습니다")
+
+        next_run_at = recurring_scan_runner.next_run_for(schedule.cron, f"{config_row['host']}:{config_row['port']}")
+
+        cursor.execute('''
+            INSERT INTO scan_schedules (config_id, cron, priority, incremental, enabled, next_run_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            config_id,
+            schedule.cron,
+            schedule.priority.value,
+            int(schedule.incremental),
+            int(schedule.enabled),
+            next_run_at.isoformat()
+        ))
+        conn.commit()
+
+        cursor.execute('SELECT * FROM scan_schedules WHERE id = ?', (cursor.lastrowid,))
+        return _schedule_from_row(cursor.fetchone())
+    except sqlite3.Error as e:
+        logger.error(f"Error creating scan schedule: {e}")
+        raise HTTPException(status_code=500, detail=f"정기 스캔 스케줄 생성 중 오류가 발생했습니다: {str(e)}")
+
+
+@app.get("/schedules", response_model=List[ScanScheduleResponse])
+async def list_scan_schedules(
+    config_id: Optional[int] = None,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """정기 스캔 스케줄 목록 조회"""
+    try:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        if config_id is not None:
+            cursor.execute('SELECT * FROM scan_schedules WHERE config_id = ? ORDER BY next_run_at', (config_id,))
+        else:
+            cursor.execute('SELECT * FROM scan_schedules ORDER BY next_run_at')
+        return [_schedule_from_row(row) for row in cursor.fetchall()]
+    except sqlite3.Error as e:
+        logger.error(f"Error listing scan schedules: {e}")
+        raise HTTPException(status_code=500, detail=f"정기 스캔 스케줄 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+@app.put("/schedules/{schedule_id}", response_model=ScanScheduleResponse)
+async def update_scan_schedule(
+    schedule_id: int,
+    schedule: ScanScheduleCreate,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """정기 스캔 스케줄 수정"""
+    _validate_cron(schedule.cron)
+
+    try:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT c.host, c.port FROM scan_schedules s
+            JOIN database_configs c ON c.id = s.config_id
+            WHERE s.id = ?
+        ''', (schedule_id,))
+        config_row = cursor.fetchone()
+        if not config_row:
+            raise HTTPException(status_code=404, detail="스케줄을 찾을 수 없습니다")
+
+        next_run_at = recurring_scan_runner.next_run_for(schedule.cron, f"{config_row['host']}:{config_row['port']}")
+
+        cursor.execute('''
+            UPDATE scan_schedules
+            SET cron = ?, priority = ?, incremental = ?, enabled = ?, next_run_at = ?
+            WHERE id = ?
+        ''', (
+            schedule.cron,
+            schedule.priority.value,
+            int(schedule.incremental),
+            int(schedule.enabled),
+            next_run_at.isoformat(),
+            schedule_id
+        ))
+        conn.commit()
+
+        cursor.execute('SELECT * FROM scan_schedules WHERE id = ?', (schedule_id,))
+        return _schedule_from_row(cursor.fetchone())
+    except sqlite3.Error as e:
+        logger.error(f"Error updating scan schedule: {e}")
+        raise HTTPException(status_code=500, detail=f"정기 스캔 스케줄 수정 중 오류가 발생했습니다: {str(e)}")
+
+
+@app.delete("/schedules/{schedule_id}")
+async def delete_scan_schedule(
+    schedule_id: int,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """정기 스캔 스케줄 삭제"""
+    try:
+        cursor = conn.cursor()
+        cursor.execute('SELECT id FROM scan_schedules WHERE id = ?', (schedule_id,))
+        if not cursor.fetchone():
+            raise HTTPException(status_code=404, detail="스케줄을 찾을 수 없습니다")
+
+        cursor.execute('DELETE FROM scan_schedules WHERE id = ?', (schedule_id,))
+        conn.commit()
+        return {"message": "스케줄이 삭제되었습니다"}
+    except sqlite3.Error as e:
+        logger.error(f"Error deleting scan schedule: {e}")
+        raise HTTPException(status_code=500, detail=f"정기 스캔 스케줄 삭제 중 오류가 발생했습니다: {str(e)}")
+
+
 # 새로운 API 엔드포인트들 추가
 
 # 데이터베이스 연결 테스트 API
@@ -907,6 +1417,8 @@ async def test_database_connection(
             return await test_mysql_connection(config)
         elif config.db_type == DatabaseType.oracle:
             return await test_oracle_connection(config)
+        elif config.db_type == DatabaseType.postgresql:
+            return await test_postgres_connection(config)
         else:
             raise HTTPException(status_code=400, detail="지원되지 않는 데이터베이스 유형입니다")
     except Exception as e:
@@ -917,73 +1429,427 @@ async def test_database_connection(
             "details": str(e)
         }
 
-async def test_mysql_connection(config: DatabaseConfig):
-    """MySQL 연결 테스트"""
+# 연결 테스트 전용 스레드 풀 (응답 없는 호스트가 기본 executor를 점유하지 않도록 분리)
+CONNECTION_TEST_WORKERS = 32
+connection_test_executor = ThreadPoolExecutor(max_workers=CONNECTION_TEST_WORKERS, thread_name_prefix="conn-test")
+
+# 설정 ID별 연결 테스트 결과 캐시 {config_id: {"checked_at": monotonic, "result": {...}}}
+connection_test_cache: Dict[int, Dict[str, Any]] = {}
+
+
+class ConnectionCheckTimeout(Exception):
+    pass
+
+
+async def _run_connection_check(check, config: DatabaseConfig, timeout: int) -> Dict[str, Any]:
+    """
+    블로킹 연결 함수를 이벤트 루프 밖에서 실행 (제한 시간 초과 시 ConnectionCheckTimeout)
+
+    제한 시간은 워커 스레드에서 실제로 실행을 시작한 시점부터 계산합니다 (스레드 풀 대기 시간 제외).
+    스레드 풀이 응답 없는 확인으로 가득 차 있으면 대기도 같은 제한 시간 안에서만 하고, 넘으면 실행하지 않고 취소합니다.
+    """
+    loop = asyncio.get_running_loop()
+    started = asyncio.Event()
+
+    def run():
+        loop.call_soon_threadsafe(started.set)
+        return check(config, timeout)
+
+    future = loop.run_in_executor(connection_test_executor, run)
+    try:
+        await asyncio.wait_for(started.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        future.cancel()
+        raise ConnectionCheckTimeout(f"연결 테스트 대기 시간 초과 ({timeout}초, 실행 중인 연결 테스트가 많음)")
+    try:
+        return await asyncio.wait_for(future, timeout=timeout + 1)
+    except asyncio.TimeoutError:
+        raise ConnectionCheckTimeout(f"연결 시간 초과 ({timeout}초)")
+
+
+def _check_mysql_connection(config: DatabaseConfig, timeout: int) -> Dict[str, Any]:
+    connection = pymysql.connect(
+        host=config.host,
+        port=config.port,
+        user=config.user,
+        password=config.password,
+        database=config.database,
+        connect_timeout=timeout,
+        read_timeout=timeout,
+        write_timeout=timeout
+    )
+
     try:
-        import pymysql
-        
-        connection = pymysql.connect(
-            host=config.host,
-            port=config.port,
-            user=config.user,
-            password=config.password,
-            database=config.database,
-            connect_timeout=10
-        )
-        
         with connection.cursor() as cursor:
             cursor.execute("SELECT VERSION()")
             version = cursor.fetchone()
-            
+    finally:
         connection.close()
-        
-        return {
-            "success": True,
-            "message": "MySQL 연결 성공",
-            "database_info": {
-                "version": version[0] if version else "Unknown",
-                "host": config.host,
-                "port": config.port,
-                "database": config.database
-            }
+
+    return {
+        "success": True,
+        "message": "MySQL 연결 성공",
+        "database_info": {
+            "version": version[0] if version else "Unknown",
+            "host": config.host,
+            "port": config.port,
+            "database": config.database
         }
-    except Exception as e:
-        raise Exception(f"MySQL 연결 실패: {str(e)}")
+    }
+
+
+def _check_oracle_connection(config: DatabaseConfig, timeout: int) -> Dict[str, Any]:
+    # TCP 연결 단계부터 제한 시간을 적용하기 위해 DSN에 CONNECT_TIMEOUT 지정
+    dsn = (
+        f"(DESCRIPTION=(CONNECT_TIMEOUT={timeout})(TRANSPORT_CONNECT_TIMEOUT={timeout})(RETRY_COUNT=0)"
+        f"(ADDRESS=(PROTOCOL=TCP)(HOST={config.host})(PORT={config.port}))"
+        f"(CONNECT_DATA=(SERVICE_NAME={config.service_name})))"
+    )
+    connection = cx_Oracle.connect(
+        user=config.user,
+        password=config.password,
+        dsn=dsn
+    )
 
-async def test_oracle_connection(config: DatabaseConfig):
-    """Oracle 연결 테스트"""
     try:
-        import cx_Oracle
-        
-        dsn = cx_Oracle.makedsn(config.host, config.port, service_name=config.service_name)
-        connection = cx_Oracle.connect(
-            user=config.user,
-            password=config.password,
-            dsn=dsn
-        )
-        
+        connection.call_timeout = timeout * 1000
         with connection.cursor() as cursor:
             cursor.execute("SELECT * FROM v$version WHERE ROWNUM = 1")
             version = cursor.fetchone()
-            
+    finally:
         connection.close()
-        
-        return {
-            "success": True,
-            "message": "Oracle 연결 성공",
-            "database_info": {
-                "version": version[0] if version else "Unknown",
-                "host": config.host,
-                "port": config.port,
-                "service_name": config.service_name
-            }
+
+    return {
+        "success": True,
+        "message": "Oracle 연결 성공",
+        "database_info": {
+            "version": version[0] if version else "Unknown",
+            "host": config.host,
+            "port": config.port,
+            "service_name": config.service_name
         }
+    }
+
+
+def _check_postgres_connection(config: DatabaseConfig, timeout: int) -> Dict[str, Any]:
+    connection = psycopg2.connect(
+        host=config.host,
+        port=config.port,
+        user=config.user,
+        password=config.password,
+        dbname=config.database or "postgres",
+        connect_timeout=timeout,
+        options=f"-c statement_timeout={timeout * 1000}"
+    )
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW server_version")
+            version = cursor.fetchone()
+    finally:
+        connection.close()
+
+    return {
+        "success": True,
+        "message": "PostgreSQL 연결 성공",
+        "database_info": {
+            "version": version[0] if version else "Unknown",
+            "host": config.host,
+            "port": config.port,
+            "database": config.database or "postgres"
+        }
+    }
+
+
+async def test_mysql_connection(config: DatabaseConfig):
+    """MySQL 연결 테스트"""
+    try:
+        return await _run_connection_check(_check_mysql_connection, config, app_settings.connection_test_timeout)
+    except Exception as e:
+        raise Exception(f"MySQL 연결 실패: {str(e)}") from e
+
+async def test_oracle_connection(config: DatabaseConfig):
+    """Oracle 연결 테스트"""
+    try:
+        return await _run_connection_check(_check_oracle_connection, config, app_settings.connection_test_timeout)
+    except Exception as e:
+        raise Exception(f"Oracle 연결 실패: {str(e)}") from e
+
+async def test_postgres_connection(config: DatabaseConfig):
+    """PostgreSQL 연결 테스트"""
+    try:
+        return await _run_connection_check(_check_postgres_connection, config, app_settings.connection_test_timeout)
+    except Exception as e:
+        raise Exception(f"PostgreSQL 연결 실패: {str(e)}") from e
+
+
+async def test_saved_config_connection(row, use_cache: bool = True) -> Dict[str, Any]:
+    """저장된 설정의 연결 테스트 (TTL 동안 결과 캐시)"""
+    config_id = row[0]
+    cached = connection_test_cache.get(config_id)
+    if use_cache and cached and time.monotonic() - cached["checked_at"] < app_settings.connection_test_cache_ttl:
+        return {**cached["result"], "cached": True}
+
+    config = DatabaseConfig(
+        db_type=row[2],
+        host=row[3],
+        port=row[4],
+        database=row[5],
+        service_name=row[6],
+        user=row[7],
+        password=row[8],
+        sample_size=row[9]
+    )
+
+    started = time.monotonic()
+    timed_out = False
+    try:
+        if config.db_type == DatabaseType.mysql:
+            outcome = await test_mysql_connection(config)
+        elif config.db_type == DatabaseType.postgresql:
+            outcome = await test_postgres_connection(config)
+        else:
+            outcome = await test_oracle_connection(config)
     except Exception as e:
-        raise Exception(f"Oracle 연결 실패: {str(e)}")
+        timed_out = isinstance(e.__cause__, ConnectionCheckTimeout)
+        outcome = {"success": False, "message": f"연결 실패: {str(e)}", "details": str(e)}
+
+    result = {
+        "config_id": config_id,
+        "name": row[1],
+        "db_type": config.db_type.value,
+        "host": config.host,
+        "port": config.port,
+        "latency_ms": round((time.monotonic() - started) * 1000, 1),
+        "checked_at": datetime.now().isoformat(),
+        **outcome
+    }
+    # 시간 초과는 일시적인 부하일 수 있으므로 캐시하지 않고 다음 요청에서 다시 확인
+    if timed_out:
+        connection_test_cache.pop(config_id, None)
+    else:
+        connection_test_cache[config_id] = {"checked_at": time.monotonic(), "result": result}
+    return {**result, "cached": False}
+
+
+class BulkConnectionTestRequest(BaseModel):
+    config_ids: Optional[List[int]] = Field(None, description="테스트할 설정 ID 목록 (없으면 전체)")
+    use_cache: bool = Field(default=True, description="캐시된 결과 사용 여부")
+    concurrency: int = Field(default=20, ge=1, le=100, description="동시 테스트 수")
+
+
+@app.post("/database-configs/test-connections")
+async def test_database_configs_bulk(
+    request: BulkConnectionTestRequest,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """저장된 데이터베이스 설정 연결 일괄 테스트"""
+    try:
+        cursor = conn.cursor()
+        if request.config_ids:
+            placeholders = ",".join("?" for _ in request.config_ids)
+            cursor.execute(f"SELECT * FROM database_configs WHERE id IN ({placeholders})", request.config_ids)
+        else:
+            cursor.execute("SELECT * FROM database_configs ORDER BY id")
+        rows = [row for row in cursor.fetchall() if row[2] in [e.value for e in DatabaseType]]
+    except sqlite3.Error as e:
+        logger.error(f"Error loading database configs for connection test: {e}")
+        raise HTTPException(status_code=500, detail=f"데이터베이스 설정 조회 중 오류가 발생했습니다: {str(e)}")
+
+    # 연결 테스트 스레드 수보다 많이 동시에 시작하면 나머지는 스레드 풀에서 대기만 하므로 제한
+    semaphore = asyncio.Semaphore(min(request.concurrency, CONNECTION_TEST_WORKERS))
+
+    async def run(row):
+        async with semaphore:
+            return await test_saved_config_connection(row, request.use_cache)
+
+    results = await asyncio.gather(*(run(row) for row in rows))
+
+    return {
+        "total": len(results),
+        "success": len([r for r in results if r["success"]]),
+        "failed": len([r for r in results if not r["success"]]),
+        "cached": len([r for r in results if r["cached"]]),
+        "results": results
+    }
+
+
+@app.post("/database-configs/{config_id}/test")
+async def test_database_config(
+    config_id: int,
+    use_cache: bool = True,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """저장된 데이터베이스 설정 연결 테스트"""
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM database_configs WHERE id = ?', (config_id,))
+    row = cursor.fetchone()
+    if not row:
+        raise HTTPException(status_code=404, detail="설정을 찾을 수 없습니다")
+
+    return await test_saved_config_connection(row, use_cache)
+
+# 샘플 캐시 재평가 API
+class ReEvaluateRequest(BaseModel):
+    schemas: Optional[List[str]] = Field(None, description="재평가할 데이터베이스/스키마 (없으면 캐시된 전체)")
+    priority: ScanPriority = Field(default=ScanPriority.normal, description="작업 우선순위")
+
+
+def _config_from_row(row) -> DatabaseConfig:
+    return DatabaseConfig(
+        db_type=row[2],
+        host=row[3],
+        port=row[4],
+        database=row[5],
+        service_name=row[6],
+        user=row[7],
+        password=row[8],
+        sample_size=row[9]
+    )
+
+
+def _cache_source_for(config: DatabaseConfig) -> str:
+    if config.db_type == DatabaseType.oracle:
+        return make_source_id(config.db_type.value, config.host, config.port, config.service_name)
+    if config.db_type == DatabaseType.postgresql:
+        return make_source_id(config.db_type.value, config.host, config.port, config.database or "postgres")
+    return make_source_id(config.db_type.value, config.host, config.port)
+
+
+@app.post("/database-configs/{config_id}/re-evaluate", response_model=Dict[str, str])
+async def reevaluate_cached_samples(
+    config_id: int,
+    request: Optional[ReEvaluateRequest] = None,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """캐시된 샘플에 현재 패턴 집합을 다시 적용하는 작업 시작 (원본 DB 재질의 없음)"""
+    request = request or ReEvaluateRequest()
+
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM database_configs WHERE id = ?', (config_id,))
+    row = cursor.fetchone()
+    if not row:
+        raise HTTPException(status_code=404, detail="데이터베이스 설정을 찾을 수 없습니다")
+
+    config = _config_from_row(row)
+    cached = sample_cache.entries(_cache_source_for(config), request.schemas)
+    if not cached:
+        raise HTTPException(status_code=404, detail="재평가할 캐시된 샘플이 없습니다")
+
+    job_id = str(uuid.uuid4())
+    scan_jobs[job_id] = ScanJobInfo(
+        job_id=job_id,
+        scan_name=f"Re-evaluate Cached Samples for Config {config_id} ({row[1]})",
+        status=ScanStatus.pending,
+        db_type=config.db_type,
+        host=config.host,
+        database=config.database or config.service_name,
+        priority=request.priority,
+        created_at=datetime.now()
+    )
+
+    # 원본 DB 세션을 사용하지 않으므로 호스트별 세션 제한과 분리
+    await scan_scheduler.submit(
+        job_id,
+        host=f"sample-cache:{config.host}:{config.port}",
+        tasks=[partial(run_reevaluate_scan, job_id, config, request.schemas)],
+        priority=request.priority,
+        on_start=_on_scheduled_job_start,
+        on_finish=_on_scheduled_job_finish,
+    )
+
+    logger.info(f"샘플 재평가 작업 시작: {job_id}, Config ID: {config_id}, 테이블 {len(cached)}개")
+
+    return {
+        "job_id": job_id,
+        "message": f"캐시된 샘플 {len(cached)}개 테이블 재평가 작업이 시작되었습니다.",
+        "status_url": f"/jobs/{job_id}",
+        "results_url": f"/results/{job_id}"
+    }
+
+
+@app.get("/sample-cache")
+async def list_sample_cache(
+    config_id: Optional[int] = None,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """캐시된 샘플 목록 (값은 포함하지 않음)"""
+    source = None
+    if config_id is not None:
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM database_configs WHERE id = ?', (config_id,))
+        row = cursor.fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="데이터베이스 설정을 찾을 수 없습니다")
+        source = _cache_source_for(_config_from_row(row))
+
+    entries = sample_cache.entries(source)
+    return {
+        "retention_days": sample_cache.retention_days,
+        "cache": sample_cache.stats(),
+        "total_tables": len(entries),
+        "total_bytes": sum(e['bytes'] for e in entries),
+        "entries": [{k: v for k, v in e.items() if k != 'sampling_info'} for e in entries]
+    }
+
+
+@app.delete("/sample-cache")
+async def purge_sample_cache(
+    expired_only: bool = True,
+    current_user: dict = Depends(get_current_user)
+):
+    """보관 기간이 지난 샘플(또는 전체) 삭제"""
+    removed = sample_cache.purge(expired_only=expired_only)
+    return {"message": f"캐시된 샘플 {removed}건이 삭제되었습니다", "removed": removed}
+
+
+@app.get("/database-configs/{config_id}/masked-samples")
+async def export_masked_samples(
+    config_id: int,
+    schema: str,
+    table: str,
+    limit: int = 1000,
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """검토용 마스킹 샘플 (캐시된 샘플에 현재 패턴 집합의 마스킹 규칙 적용)"""
+    if limit < 1 or limit > 10000:
+        raise HTTPException(status_code=400, detail="limit 은 1~10000 사이여야 합니다")
+
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM database_configs WHERE id = ?', (config_id,))
+    row = cursor.fetchone()
+    if not row:
+        raise HTTPException(status_code=404, detail="데이터베이스 설정을 찾을 수 없습니다")
+
+    cached = sample_cache.get(_cache_source_for(_config_from_row(row)), schema, table)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="캐시된 샘플이 없습니다")
+    df, meta = cached
+
+    pattern_set = pattern_registry.compiled()
+    loop = asyncio.get_running_loop()
+    masked = await loop.run_in_executor(None, mask_dataframe, df.head(limit), pattern_set)
+
+    return {
+        "schema": schema,
+        "table": table,
+        "cached_at": meta['cached_at'],
+        "pattern_version": pattern_set.version,
+        "total_rows": df.height,
+        "returned_rows": masked.height,
+        "columns": masked.columns,
+        "rows": masked.to_dicts()
+    }
 
 # 개인정보 패턴 관리 API
 class PrivacyPattern(BaseModel):
     id: Optional[int] = None
+    key: Optional[str] = None  # 스캔 결과에 사용되는 패턴 키 (미지정 시 pattern_{id})
     name: str
     category: str
     pattern: str
@@ -991,12 +1857,35 @@ class PrivacyPattern(BaseModel):
     description: str
     examples: List[str]
     is_active: bool = True
+    mask_pattern: Optional[str] = None  # 마스킹 정규식 (미지정 시 일치 부분 전체를 *** 로 대체)
+    mask_replacement: Optional[str] = None  # 치환 문자열 (그룹 참조는 ${1} 형식)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-# 메모리 저장소 (실제로는 DB 사용)
-privacy_patterns: Dict[int, PrivacyPattern] = {}
-pattern_counter = 1
+# 패턴 레지스트리 (스캐너와 같은 JSON 파일을 공유, 변경 시 버전 증가)
+pattern_registry = get_registry()
+
+def list_registry_patterns() -> List[PrivacyPattern]:
+    return [PrivacyPattern(**entry) for entry in pattern_registry.list()]
+
+def _pattern_to_entry(pattern: PrivacyPattern) -> Dict[str, Any]:
+    entry = pattern.model_dump(exclude={'id', 'created_at', 'updated_at'})
+    entry['risk_level'] = pattern.risk_level.value
+    return entry
+
+async def validate_pattern_safety(pattern: str):
+    """등록 전 ReDoS 검사 (정적 분석 + 별도 프로세스 벤치마크)"""
+    loop = asyncio.get_running_loop()
+    try:
+        report = await loop.run_in_executor(None, check_pattern_safety, pattern)
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 정규식입니다: {str(e)}")
+    
+    if not report['safe']:
+        raise HTTPException(status_code=400, detail=f"안전하지 않은 정규식입니다: {'; '.join(report['reasons'])}")
+    
+    for issue in report['issues']:
+        logger.warning(f"패턴 경고: {pattern} - {issue['message']}")
 
 @app.get("/patterns", response_model=List[PrivacyPattern])
 async def list_privacy_patterns(
@@ -1006,7 +1895,7 @@ async def list_privacy_patterns(
     current_user: dict = Depends(get_current_user)
 ):
     """개인정보 패턴 목록 조회"""
-    patterns = list(privacy_patterns.values())
+    patterns = list_registry_patterns()
     
     # 필터링
     if category and category != "전체":
@@ -1020,22 +1909,34 @@ async def list_privacy_patterns(
     
     return patterns
 
+@app.get("/patterns/version")
+async def get_pattern_registry_version(current_user: dict = Depends(get_current_user)):
+    """패턴 레지스트리 버전 및 컴파일 상태 조회"""
+    compiled = pattern_registry.compiled()
+    return {
+        "version": compiled.version,
+        "path": os.path.abspath(pattern_registry.path),
+        "active_patterns": list(compiled.sources.keys()),
+        "invalid_patterns": compiled.invalid,
+        "unsafe_patterns": compiled.unsafe
+    }
+
 @app.post("/patterns", response_model=PrivacyPattern)
 async def create_privacy_pattern(
     pattern: PrivacyPattern,
     current_user: dict = Depends(get_current_user)
 ):
     """개인정보 패턴 생성"""
-    global pattern_counter
+    await validate_pattern_safety(pattern.pattern)
+    if pattern.mask_pattern:
+        await validate_pattern_safety(pattern.mask_pattern)
     
-    pattern.id = pattern_counter
-    pattern.created_at = datetime.now()
-    pattern.updated_at = datetime.now()
-    
-    privacy_patterns[pattern_counter] = pattern
-    pattern_counter += 1
+    try:
+        entry = pattern_registry.create(_pattern_to_entry(pattern))
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 정규식입니다: {str(e)}")
     
-    return pattern
+    return PrivacyPattern(**entry)
 
 @app.put("/patterns/{pattern_id}", response_model=PrivacyPattern)
 async def update_privacy_pattern(
@@ -1044,14 +1945,22 @@ async def update_privacy_pattern(
     current_user: dict = Depends(get_current_user)
 ):
     """개인정보 패턴 수정"""
-    if pattern_id not in privacy_patterns:
+    if pattern_registry.get(pattern_id) is None:
         raise HTTPException(status_code=404, detail="패턴을 찾을 수 없습니다")
     
-    pattern.id = pattern_id
-    pattern.updated_at = datetime.now()
-    privacy_patterns[pattern_id] = pattern
+    await validate_pattern_safety(pattern.pattern)
+    if pattern.mask_pattern:
+        await validate_pattern_safety(pattern.mask_pattern)
+    
+    try:
+        entry = pattern_registry.update(pattern_id, _pattern_to_entry(pattern))
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 정규식입니다: {str(e)}")
+    
+    if entry is None:
+        raise HTTPException(status_code=404, detail="패턴을 찾을 수 없습니다")
     
-    return pattern
+    return PrivacyPattern(**entry)
 
 @app.delete("/patterns/{pattern_id}")
 async def delete_privacy_pattern(
@@ -1059,71 +1968,75 @@ async def delete_privacy_pattern(
     current_user: dict = Depends(get_current_user)
 ):
     """개인정보 패턴 삭제"""
-    if pattern_id not in privacy_patterns:
+    if not pattern_registry.delete(pattern_id):
         raise HTTPException(status_code=404, detail="패턴을 찾을 수 없습니다")
     
-    del privacy_patterns[pattern_id]
     return {"message": "패턴이 삭제되었습니다"}
 
-# 기본 패턴 초기화
-def init_default_patterns():
-    """기본 개인정보 패턴 초기화"""
-    default_patterns = [
-        PrivacyPattern(
-            name="이메일 주소",
-            category="연락처",
-            pattern=r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            risk_level=RiskLevel.medium,
-            description="일반적인 이메일 주소 형식을 감지합니다",
-            examples=["user@example.com", "test.email@domain.co.kr"],
-            created_at=datetime.now()
-        ),
-        PrivacyPattern(
-            name="전화번호",
-            category="연락처",
-            pattern=r"(\+82|0)[0-9]{1,2}-?[0-9]{3,4}-?[0-9]{4}",
-            risk_level=RiskLevel.medium,
-            description="한국 전화번호 형식을 감지합니다",
-            examples=["010-1234-5678", "+82-10-1234-5678"],
-            created_at=datetime.now()
-        ),
-        PrivacyPattern(
-            name="주민등록번호",
-            category="신원정보",
-            pattern=r"[0-9]{6}-[1-4][0-9]{6}",
-            risk_level=RiskLevel.high,
-            description="한국 주민등록번호 형식을 감지합니다",
-            examples=["123456-1234567", "123456-2345678"],
-            created_at=datetime.now()
-        ),
-        PrivacyPattern(
-            name="신용카드번호",
-            category="금융정보",
-            pattern=r"\b(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|3[47][0-9]{13}|3[0-9]{13}|6(?:011|5[0-9]{2})[0-9]{12})\b",
-            risk_level=RiskLevel.high,
-            description="Visa, MasterCard, American Express 등 신용카드 번호를 감지합니다",
-            examples=["4111-1111-1111-1111", "5555-5555-5555-4444"],
-            created_at=datetime.now()
-        ),
-        PrivacyPattern(
-            name="계좌번호",
-            category="금융정보",
-            pattern=r"\b[0-9]{10,14}\b",
-            risk_level=RiskLevel.medium,
-            description="은행 계좌번호 형식을 감지합니다",
-            examples=["123-456789-01-234", "123456789012"],
-            created_at=datetime.now()
+class PatternBenchmarkRequest(BaseModel):
+    record_count: int = Field(default=1000, ge=1, le=100000, description="더미 데이터 레코드 수 (레코드당 10개 값)")
+    noise_count: int = Field(default=1000, ge=0, le=100000, description="개인정보가 없는 노이즈 값 수")
+    include_stress: bool = Field(default=False, description="역추적 스트레스 코퍼스 포함 여부")
+
+@app.post("/patterns/{pattern_id}/benchmark")
+async def benchmark_privacy_pattern(
+    pattern_id: int,
+    request: Optional[PatternBenchmarkRequest] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """패턴 성능/정확도 측정 (처리량, p99 지연, 일치율, 오탐률 및 기본 패턴 오탐률 비교)"""
+    entry = pattern_registry.get(pattern_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="패턴을 찾을 수 없습니다")
+    
+    request = request or PatternBenchmarkRequest()
+    
+    # 레지스트리 파일을 직접 수정한 위험한 패턴이 워커 스레드를 점유하지 않도록 확인
+    try:
+        safety = analyze_pattern(entry['pattern'])
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 정규식입니다: {str(e)}")
+    if not safety['safe']:
+        reasons = [issue['message'] for issue in safety['issues'] if issue['severity'] == 'danger']
+        raise HTTPException(status_code=400, detail=f"안전하지 않은 정규식입니다: {'; '.join(reasons)}")
+    
+    # 현재 레지스트리에 있는 기본 패턴을 기준으로 사용
+    default_keys = {p['key'] for p in DEFAULT_PATTERNS}
+    references = [p for p in pattern_registry.list() if p['key'] in default_keys and p.get('is_active', True)]
+    
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        None,
+        partial(
+            run_pattern_benchmark,
+            entry['pattern'],
+            record_count=request.record_count,
+            noise_count=request.noise_count,
+            include_stress=request.include_stress,
+            reference_patterns=references
         )
-    ]
+    )
     
-    for i, pattern in enumerate(default_patterns, 1):
-        pattern.id = i
-        privacy_patterns[i] = pattern
+    return {
+        "pattern_id": pattern_id,
+        "key": entry['key'],
+        "name": entry['name'],
+        "pattern": entry['pattern'],
+        "warnings": [issue['message'] for issue in safety['issues']],
+        **result
+    }
+
+# 기본 패턴 초기화
+def init_default_patterns():
+    """기본 개인정보 패턴 초기화 (레지스트리 파일이 없으면 기본 패턴으로 생성)"""
+    pattern_registry.reload_if_changed(force=True)
+    logger.info(f"패턴 레지스트리 로드: {pattern_registry.path} (v{pattern_registry.version})")
 
 # 통계 분석 API
 @app.get("/analytics/overview")
 async def get_analytics_overview(current_user: dict = Depends(get_current_user)):
     """전체 통계 개요"""
+    patterns = list_registry_patterns()
     total_jobs = len(scan_jobs)
     completed_jobs = len([j for j in scan_jobs.values() if j.status == ScanStatus.completed])
     failed_jobs = len([j for j in scan_jobs.values() if j.status == ScanStatus.failed])
@@ -1161,17 +2074,18 @@ async def get_analytics_overview(current_user: dict = Depends(get_current_user))
         "success_rate": (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0,
         "database_stats": db_stats,
         "monthly_stats": monthly_stats,
-        "active_patterns": len([p for p in privacy_patterns.values() if p.is_active]),
-        "total_patterns": len(privacy_patterns)
+        "active_patterns": len([p for p in patterns if p.is_active]),
+        "total_patterns": len(patterns)
     }
 
 @app.get("/analytics/patterns")
 async def get_pattern_analytics(current_user: dict = Depends(get_current_user)):
     """패턴별 통계"""
     pattern_stats = {}
+    patterns = list_registry_patterns()
     
     # 각 패턴별 감지 횟수 계산 (실제로는 스캔 결과에서 계산)
-    for pattern in privacy_patterns.values():
+    for pattern in patterns:
         pattern_stats[pattern.name] = {
             "category": pattern.category,
             "risk_level": pattern.risk_level.value,
@@ -1181,7 +2095,7 @@ async def get_pattern_analytics(current_user: dict = Depends(get_current_user)):
     
     return {
         "patterns": pattern_stats,
-        "categories": list(set(p.category for p in privacy_patterns.values())),
+        "categories": list(set(p.category for p in patterns)),
         "risk_levels": [level.value for level in RiskLevel]
     }
 
@@ -1191,12 +2105,18 @@ class AppSettings(BaseModel):
     api_version: str = "v1"
     api_token: str = "your-secret-token"
     connection_timeout: int = 30
+    connection_test_timeout: int = 10
+    connection_test_cache_ttl: int = 60
     auto_reconnect: bool = True
     scan_endpoint: str = "/scan"
     jobs_endpoint: str = "/jobs"
     results_endpoint: str = "/results"
     config_endpoint: str = "/database-configs"
     health_endpoint: str = "/health"
+    max_concurrent_scans: int = 4
+    max_sessions_per_host: int = 2
+    sample_cache_retention_days: int = 7
+    sample_cache_max_mb: int = 1024
 
 # 메모리 저장소 (실제로는 DB 사용)
 app_settings = AppSettings()
@@ -1214,8 +2134,21 @@ async def update_app_settings(
     """앱 설정 업데이트"""
     global app_settings
     app_settings = settings
+    await scan_scheduler.configure(
+        max_workers=settings.max_concurrent_scans,
+        max_sessions_per_host=settings.max_sessions_per_host
+    )
+    sample_cache.retention_days = settings.sample_cache_retention_days
+    sample_cache.max_bytes = settings.sample_cache_max_mb * 1024 * 1024
+    sample_cache.evict()
     return {"message": "설정이 업데이트되었습니다"}
 
+# 스케줄러 상태 API
+@app.get("/scheduler/stats")
+async def get_scheduler_stats(current_user: dict = Depends(get_current_user)):
+    """스케줄러 큐 상태 및 작업별 대기/실행 시간 통계"""
+    return scan_scheduler.stats()
+
 # 대시보드 API
 @app.get("/dashboard")
 async def get_dashboard_data(current_user: dict = Depends(get_current_user)):
@@ -1275,7 +2208,8 @@ async def batch_job_operations(
         try:
             if operation == "cancel":
                 job = scan_jobs[job_id]
-                if job.status == ScanStatus.running:
+                if job.status in (ScanStatus.pending, ScanStatus.running):
+                    await scan_scheduler.cancel(job_id)
                     job.status = ScanStatus.failed
                     job.error_message = "사용자에 의해 취소됨"
                     results.append({"job_id": job_id, "success": True, "message": "작업이 취소되었습니다"})
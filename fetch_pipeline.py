@@ -0,0 +1,102 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable
+
+# 생산자 종료 표시
+_DONE = object()
+
+
+def run_pipeline(items: Iterable[Any], fetch: Callable[[Any], Any], analyze: Callable[[Any, Any], None],
+                 depth: int = 2) -> Dict[str, Any]:
+    """
+    조회(DB I/O) 와 분석(CPU) 을 겹쳐서 실행하는 생산자/소비자 파이프라인
+
+    생산자 스레드가 fetch(item) 으로 다음 테이블 샘플을 미리 조회해 크기 depth 의 큐에 넣고,
+    호출한 스레드는 큐에서 꺼내 analyze(item, fetched) 를 실행합니다. 처리 순서는 items 순서와 같습니다.
+    depth 가 0 이면 스레드 없이 순차 실행합니다.
+
+    반환값은 단계별 소요 시간과 대기 시간(초) 입니다.
+    - fetch_stall_sec: 큐가 가득 차 분석을 기다린 시간 (분석이 병목)
+    - analyze_stall_sec: 큐가 비어 조회를 기다린 시간 (DB 가 병목)
+    """
+    stats = {
+        'depth': depth,
+        'items': 0,
+        'fetch_sec': 0.0,
+        'analyze_sec': 0.0,
+        'fetch_stall_sec': 0.0,
+        'analyze_stall_sec': 0.0,
+    }
+
+    if depth <= 0:
+        for item in items:
+            started = time.perf_counter()
+            fetched = fetch(item)
+            stats['fetch_sec'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            analyze(item, fetched)
+            stats['analyze_sec'] += time.perf_counter() - started
+            stats['items'] += 1
+        return _rounded(stats)
+
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        # 소비자가 중단되면 생산자도 멈추도록 타임아웃을 두고 대기
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                started = time.perf_counter()
+                fetched = fetch(item)
+                stats['fetch_sec'] += time.perf_counter() - started
+
+                started = time.perf_counter()
+                if not put((item, fetched, None)):
+                    return
+                stats['fetch_stall_sec'] += time.perf_counter() - started
+        except Exception as e:
+            put((None, None, e))
+            return
+        put(_DONE)
+
+    producer = threading.Thread(target=produce, name='scan-prefetch', daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            started = time.perf_counter()
+            entry = buffer.get()
+            stats['analyze_stall_sec'] += time.perf_counter() - started
+            if entry is _DONE:
+                break
+
+            item, fetched, error = entry
+            if error is not None:
+                raise error
+
+            started = time.perf_counter()
+            analyze(item, fetched)
+            stats['analyze_sec'] += time.perf_counter() - started
+            stats['items'] += 1
+    finally:
+        stop.set()
+        producer.join()
+
+    return _rounded(stats)
+
+
+def _rounded(stats: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()}
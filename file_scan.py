@@ -0,0 +1,373 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple, Optional
+
+import polars as pl
+
+from column_scan import scan_columns, vectorizable
+from pattern_registry import PatternRegistry
+from pattern_safety import MAX_VALUE_LENGTH, PatternTimeBudget
+from scan_pipeline import PrivacyScanPipeline
+
+# 확장자별 파일 형식 (.json 은 내용이 배열이면 json, 한 줄에 객체 하나면 ndjson)
+FILE_FORMATS = {
+    '.csv': 'csv',
+    '.tsv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.json': 'json',
+}
+
+# NDJSON/JSON 스키마 추론에 사용할 행 수
+FILE_INFER_SCHEMA_ROWS = 10000
+
+
+def detect_format(path: str) -> Optional[str]:
+    """확장자로 파일 형식 판별 (지원하지 않는 형식이면 None)"""
+    fmt = FILE_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt == 'json' and not _is_json_array(path):
+        return 'ndjson'
+    return fmt
+
+
+def _is_json_array(path: str) -> bool:
+    with open(path, 'rb') as f:
+        head = f.read(4096)
+    return head.lstrip(b'\xef\xbb\xbf \t\r\n')[:1] == b'['
+
+
+def open_lazy(path: str, fmt: str) -> pl.LazyFrame:
+    """
+    파일을 LazyFrame 으로 열기
+
+    CSV 는 모든 컬럼을 문자열로 읽습니다 (구분자 없는 카드/계좌 번호가 정수로 추론되어 스캔에서 빠지지 않도록).
+    JSON 배열(DummyDataGenerator.save_to_json 등)은 스트리밍 파서가 없어 한 번에 읽으므로 큰 파일은 NDJSON 을 권장합니다.
+    """
+    if fmt == 'csv':
+        separator = '\t' if path.lower().endswith('.tsv') else ','
+        return pl.scan_csv(path, separator=separator, infer_schema=False, encoding='utf8-lossy')
+    if fmt == 'parquet':
+        return pl.scan_parquet(path)
+    if fmt == 'ndjson':
+        return pl.scan_ndjson(path, infer_schema_length=FILE_INFER_SCHEMA_ROWS)
+    if fmt == 'json':
+        return pl.read_json(path, infer_schema_length=FILE_INFER_SCHEMA_ROWS).lazy()
+    raise ValueError(f"지원하지 않는 파일 형식: {fmt}")
+
+
+class FilePrivacyScanner(PrivacyScanPipeline):
+    source_name = '파일'
+    engine_name = 'Polars (streaming)'
+    namespace_label = '디렉토리'
+
+    def __init__(self, root: str, sample_size: int = 100, pattern_registry: Optional[PatternRegistry] = None,
+                 max_value_length: int = MAX_VALUE_LENGTH, recursive: bool = True,
+                 timestamp_column: Optional[str] = None):
+        """
+        파일(CSV/Parquet/NDJSON/JSON) 기반 개인정보 스캐너 (Polars 스트리밍 엔진, 점수/위험도/리포트는 PrivacyScanPipeline)
+
+        DB 스캐너와 달리 샘플링하지 않고 파일 전체를 스캔합니다. 컬럼 × 패턴 일치 개수를 하나의 lazy 집계로 만들어
+        스트리밍 엔진으로 실행하므로 파일 크기와 관계없이 메모리 사용량은 일정하고, 문자열 컬럼만 읽습니다
+        (projection pushdown). 디렉토리는 DB 의 데이터베이스, 파일은 테이블에 해당합니다.
+
+        Args:
+            root: 스캔할 디렉토리 또는 파일 경로
+            sample_size: 마스킹 예시와 Python 전용 패턴(Rust regex 로 처리할 수 없는 패턴)에 사용할 앞부분 행 수
+            pattern_registry: 개인정보 패턴 레지스트리 (기본값: 공유 레지스트리)
+            max_value_length: 값당 최대 검사 길이 (문자 수)
+            recursive: 하위 디렉토리 포함
+            timestamp_column: 증분 스캔 시 이 컬럼이 changed_since 이후인 행만 스캔 (predicate pushdown)
+        """
+        # 파일은 파티션 샘플링/미리 조회 없이 한 파일씩 스트리밍
+        super().__init__(
+            sample_size=sample_size, pattern_registry=pattern_registry,
+            cache_source=f"file://{os.path.abspath(root)}", max_value_length=max_value_length,
+            partition_sampling=False, partition_workers=1, prefetch_tables=0
+        )
+        self.root = root
+        self.recursive = recursive
+        self.timestamp_column = timestamp_column
+
+        # Python 전용 패턴에만 적용 (Rust regex 는 선형 시간)
+        self.pattern_budget = PatternTimeBudget(max_value_length=max_value_length)
+
+        print(f"📁 파일 기반 개인정보 스캐너 초기화 ({root})")
+
+    def connect(self) -> bool:
+        if not os.path.exists(self.root):
+            print(f"❌ 경로가 없습니다: {self.root}")
+            return False
+        return True
+
+    def disconnect(self):
+        pass
+
+    def list_namespaces(self) -> List[str]:
+        return [self.root]
+
+    def get_tables(self, namespace: str) -> List[str]:
+        return self.list_files()
+
+    def list_files(self) -> List[str]:
+        """스캔 대상 파일 목록 (root 기준 상대 경로, 지원하는 확장자만)"""
+        if os.path.isfile(self.root):
+            return [os.path.basename(self.root)]
+
+        files = []
+        for directory, subdirs, names in os.walk(self.root):
+            if not self.recursive:
+                subdirs.clear()
+            subdirs[:] = sorted(d for d in subdirs if not d.startswith('.'))
+            for name in names:
+                if os.path.splitext(name)[1].lower() in FILE_FORMATS:
+                    files.append(os.path.relpath(os.path.join(directory, name), self.root))
+        return sorted(files)
+
+    def file_path(self, relative_path: str) -> str:
+        if os.path.isfile(self.root):
+            return self.root
+        return os.path.join(self.root, relative_path)
+
+    def get_changed_tables(self, namespace: str, since: datetime) -> List[str]:
+        """since 이후 수정된 파일 목록 (증분 스캔용)"""
+        threshold = since.timestamp()
+        return [name for name in self.list_files() if os.path.getmtime(self.file_path(name)) >= threshold]
+
+    @staticmethod
+    def text_expression(name: str, dtype: pl.DataType) -> Optional[pl.Expr]:
+        """패턴 스캔용 문자열 표현식 (문자열로 볼 수 없는 타입이면 None)"""
+        if dtype == pl.Utf8:
+            return pl.col(name)
+        if dtype in (pl.Categorical, pl.Enum):
+            return pl.col(name).cast(pl.Utf8)
+        if isinstance(dtype, pl.Struct):
+            # 중첩 객체(NDJSON)는 JSON 문자열로 스캔
+            return pl.col(name).struct.json_encode()
+        return None
+
+    def changed_rows_predicate(self, schema: pl.Schema, since: datetime) -> Optional[pl.Expr]:
+        """timestamp_column 기준 증분 조건 (Parquet 날짜 컬럼은 row group 통계로 건너뜀)"""
+        dtype = schema.get(self.timestamp_column) if self.timestamp_column else None
+        if dtype is None:
+            return None
+        if dtype == pl.Date:
+            return pl.col(self.timestamp_column) >= since.date()
+        if isinstance(dtype, pl.Datetime):
+            if dtype.time_zone:
+                return pl.col(self.timestamp_column) >= pl.lit(since).dt.replace_time_zone(dtype.time_zone)
+            return pl.col(self.timestamp_column) >= since
+        # 문자열로 저장된 시각 (CSV 등) - 해석할 수 없는 값은 스캔 대상에 포함
+        parsed = pl.col(self.timestamp_column).cast(pl.Utf8).str.to_datetime(strict=False)
+        return parsed.is_null() | (parsed >= since)
+
+    def scan_expressions(self, columns: Dict[str, pl.Expr],
+                         patterns: List[Tuple[str, str]]) -> List[pl.Expr]:
+        """
+        컬럼별 집계 표현식 (값 개수, 패턴별 일치 개수, 하나 이상 일치한 값 개수)
+
+        일치 여부는 패턴별 일치 개수로 판정합니다 (스트리밍 엔진에서는 개수 계산이 한 번 더 실행됨).
+        """
+        exprs = []
+        for i, (name, text) in enumerate(columns.items()):
+            values = text.str.slice(0, self.max_value_length)
+            exprs.append(text.is_not_null().sum().alias(f"{i}:total"))
+            counts = [values.str.count_matches(pattern) for _, pattern in patterns]
+            for position, count in enumerate(counts):
+                exprs.append(count.sum().alias(f"{i}:{position}"))
+            if counts:
+                exprs.append(pl.any_horizontal([count > 0 for count in counts]).sum().alias(f"{i}:matched"))
+        return exprs
+
+    def scan_file(self, relative_path: str, predicate: Optional[pl.Expr] = None) -> Dict:
+        """파일 하나 전체 스캔 (집계 결과를 컬럼별 스캔 결과로 만들어 PrivacyScanPipeline.analyze_dataframe 으로 점수 계산)"""
+        path = self.file_path(relative_path)
+        fmt = detect_format(path)
+        started = time.perf_counter()
+
+        try:
+            lf = open_lazy(path, fmt)
+            if predicate is not None:
+                lf = lf.filter(predicate)
+            schema = lf.collect_schema()
+        except Exception as e:
+            print(f"    ❌ 파일 열기 오류: {str(e)}")
+            return self.analyze_dataframe(None, relative_path, {'method': 'error', 'error': str(e), 'format': fmt})
+
+        texts = {}
+        skipped_columns = []
+        for name, dtype in schema.items():
+            text = self.text_expression(name, dtype)
+            if text is None:
+                skipped_columns.append(name)
+            else:
+                texts[name] = text
+
+        pattern_set = self.pattern_registry.compiled()
+        active = [(key, pattern.pattern) for key, pattern in pattern_set.items()
+                  if not self.pattern_budget.is_disabled(key)]
+        vectorized = [(key, pattern) for key, pattern in active if vectorizable(pattern)]
+        sample_only = [key for key, pattern in active if not vectorizable(pattern)]
+
+        try:
+            # 전체 행 수 + 컬럼 × 패턴 집계를 하나의 스트리밍 쿼리로 실행 (문자열 컬럼만 읽음)
+            totals = lf.select(
+                [pl.len().alias('rows')] + self.scan_expressions(texts, vectorized)
+            ).collect(engine='streaming').row(0, named=True)
+            preview = lf.select([text.alias(name) for name, text in texts.items()]).head(self.sample_size).collect()
+        except Exception as e:
+            print(f"    ❌ 파일 스캔 오류: {str(e)}")
+            return self.analyze_dataframe(None, relative_path, {'method': 'error', 'error': str(e), 'format': fmt})
+
+        total_rows = totals['rows']
+        sampling_info = {
+            'method': '파일 전체 스캔 (streaming)',
+            'format': fmt,
+            'size_bytes': os.path.getsize(path),
+            'modified_at': datetime.fromtimestamp(os.path.getmtime(path)).isoformat(),
+            'total_rows': total_rows,
+            'sampled_rows': total_rows,
+            'sampling_ratio': 1.0 if total_rows else 0,
+            'skipped_columns': skipped_columns,
+            'max_value_length': self.max_value_length,
+            'filtered': predicate is not None,
+        }
+        if sample_only:
+            sampling_info['sample_only_patterns'] = sample_only
+
+        if total_rows == 0:
+            print(f"    ⚠️  빈 파일")
+            return self.analyze_dataframe(None, relative_path, sampling_info)
+
+        # Rust regex 로 처리할 수 없는 패턴은 앞부분 행에만 적용
+        preview_scans = scan_columns(preview, list(texts), pattern_set, self.pattern_budget) if sample_only else {}
+
+        column_scans = {}
+        for index, name in enumerate(texts):
+            privacy_matches = {
+                key: totals[f"{index}:{position}"]
+                for position, (key, _) in enumerate(vectorized)
+                if totals[f"{index}:{position}"]
+            }
+
+            total_values = totals[f"{index}:total"]
+            privacy_count = totals.get(f"{index}:matched") or 0
+            values = [str(value) for value in preview[name].drop_nulls().head(5).to_list()]
+            pattern_result = {
+                'privacy_matches': privacy_matches,
+                'total_values': total_values,
+                'privacy_count': privacy_count,
+                'privacy_ratio': privacy_count / total_values if total_values else 0,
+                'sample_values': self.mask_sample_data(values, pattern_set)
+            }
+
+            # 앞부분 행에만 적용한 패턴은 전체 파일 집계와 섞지 않고 따로 기록 (점수/위험도는 전체 파일 집계 기준)
+            if sample_only:
+                preview_scan = preview_scans.get(name, {})
+                pattern_result['sample_only_matches'] = {
+                    key: count for key, count in preview_scan.get('privacy_matches', {}).items()
+                    if key in sample_only and count
+                }
+                pattern_result['sample_only_values'] = preview_scan.get('total_values', 0)
+            column_scans[name] = pattern_result
+
+        result = self.analyze_dataframe(preview, relative_path, sampling_info, column_scans=column_scans)
+
+        # 미리보기에는 문자열 컬럼만 있으므로 파일 컬럼 순서대로 원래 타입과 제외한 컬럼을 채움
+        analyzed = result['columns']
+        result['columns'] = {}
+        for name in schema.names():
+            column_result = analyzed.get(name) or {
+                'type': None,
+                'suspicious_name': self.is_privacy_column(name),
+                'pattern_scan': None
+            }
+            column_result['type'] = str(schema[name])
+            result['columns'][name] = column_result
+
+        sampling_info['elapsed_sec'] = round(time.perf_counter() - started, 3)
+        print(f"    📊 {total_rows:,}행 전체 스캔 ({fmt}, {len(texts)}개 문자열 컬럼, {sampling_info['elapsed_sec']:.2f}s)")
+        return result
+
+    def changed_rows_filter(self, name: str, changed_since: datetime) -> Optional[pl.Expr]:
+        """증분 스캔 시 파일 안에서 스캔할 행 조건 (timestamp_column 미지정이거나 만들 수 없으면 None)"""
+        if not self.timestamp_column:
+            return None
+        try:
+            path = self.file_path(name)
+            return self.changed_rows_predicate(open_lazy(path, detect_format(path)).collect_schema(), changed_since)
+        except Exception as e:
+            print(f"    ⚠️  증분 조건 생성 실패, 전체 행 스캔: {str(e)}")
+            return None
+
+    def scan_table(self, namespace: str, table: str) -> Dict:
+        """파일 하나 전체 스캔"""
+        print(f"  📋 파일 스캔: {table}")
+        result = self.scan_file(table)
+        print(f"    ✅ 완료 (위험도: {result['risk_level']}, 점수: {result['privacy_score']})")
+        return result
+
+    def scan_namespace(self, namespace: str, changed_since: Optional[datetime] = None) -> Dict:
+        """
+        root 아래 파일 전체 스캔 (changed_since 지정 시 이후 수정된 파일만)
+
+        timestamp_column 을 지정했으면 수정된 파일 안에서도 해당 컬럼이 changed_since 이후인 행만 스캔합니다.
+        파일마다 스트리밍 집계를 실행하므로 미리 조회하지 않고 하나씩 처리합니다.
+        """
+        print(f"🔍 파일 스캔 시작: {namespace} ({self.engine_name})")
+        scan_results = self._new_scan_results(namespace)
+
+        try:
+            files = self.get_tables(namespace)
+            scan_results['summary']['total_tables'] = len(files)
+
+            if changed_since is not None:
+                files = self._select_changed_tables(namespace, files, changed_since, scan_results)
+
+            for name in files:
+                print(f"  📋 파일 스캔: {name}")
+                predicate = self.changed_rows_filter(name, changed_since) if changed_since is not None else None
+                table_result = self.scan_file(name, predicate)
+                print(f"    ✅ 완료 (위험도: {table_result['risk_level']}, 점수: {table_result['privacy_score']})")
+                self._add_table_result(scan_results, name, table_result)
+
+        except Exception as e:
+            scan_results['error'] = str(e)
+            print(f"❌ 파일 스캔 오류: {str(e)}")
+
+        if self.pattern_budget.disabled:
+            scan_results['disabled_patterns'] = self.pattern_budget.report()
+
+        return scan_results
+
+    def scan_directory(self, changed_since: Optional[datetime] = None) -> Dict:
+        """root 아래 파일 전체 스캔 (scan_namespace(root) 와 같음)"""
+        return self.scan_namespace(self.root, changed_since)
+
+def main():
+    """사용법: python file_scan.py <디렉토리 또는 파일>"""
+    root = sys.argv[1] if len(sys.argv) > 1 else '.'
+    scanner = FilePrivacyScanner(root)
+
+    result = scanner.scan_directory()
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    scan_filename = f"file_privacy_scan_{timestamp}.json"
+    with open(scan_filename, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    summary = result['summary']
+    print(f"\n📊 파일 스캔 요약:")
+    print(f"  • 스캔한 파일: {summary['scanned_tables']}/{summary['total_tables']}개")
+    print(f"  • 총 데이터 행 수: {summary['total_data_rows']:,}")
+    print(f"  • 고위험 파일 수: {summary['high_risk_tables']}")
+    print(f"  • 전체 개인정보 위험도 점수: {summary['total_privacy_score']}")
+    print(f"📄 스캔 결과: {scan_filename}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import logging
+import re
+import threading
+from typing import Dict, List, Optional
+
+import polars as pl
+
+from pattern_registry import DEFAULT_PATTERNS, CompiledPatternSet
+
+logger = logging.getLogger(__name__)
+
+# Polars 치환 문자열의 그룹 참조 ($$, ${name}, $name)
+_REPLACEMENT_TOKEN = re.compile(r'\$\$|\$\{(\w+)\}|\$(\w+)')
+
+# 마스킹 정규식별 Polars(Rust regex) 지원 여부 - 전방/후방 탐색 등은 Python 으로 처리
+_polars_support: Dict[str, bool] = {}
+_polars_support_lock = threading.Lock()
+
+_default_pattern_set: Optional[CompiledPatternSet] = None
+
+
+def to_python_replacement(replacement: str) -> str:
+    """Polars 치환 문자열(${1}) → re.sub 치환 문자열(\\g<1>)"""
+    result = []
+    position = 0
+    for match in _REPLACEMENT_TOKEN.finditer(replacement):
+        result.append(replacement[position:match.start()].replace('\\', '\\\\'))
+        group = match.group(1) or match.group(2)
+        result.append('$' if group is None else f"\\g<{group}>")
+        position = match.end()
+    result.append(replacement[position:].replace('\\', '\\\\'))
+    return ''.join(result)
+
+
+def supports_polars(pattern: str) -> bool:
+    """Polars str.replace_all 로 처리할 수 있는 정규식인지 (결과 캐시)"""
+    with _polars_support_lock:
+        supported = _polars_support.get(pattern)
+    if supported is not None:
+        return supported
+
+    try:
+        pl.Series([''], dtype=pl.Utf8).str.replace_all(pattern, '')
+        supported = True
+    except pl.exceptions.PolarsError:
+        supported = False
+        logger.info(f"Polars 미지원 마스킹 정규식 (Python 으로 처리): {pattern}")
+
+    with _polars_support_lock:
+        _polars_support[pattern] = supported
+    return supported
+
+
+def default_pattern_set() -> CompiledPatternSet:
+    """레지스트리 없이 사용할 기본 패턴 집합 (대시보드 등)"""
+    global _default_pattern_set
+    if _default_pattern_set is None:
+        _default_pattern_set = CompiledPatternSet(0, DEFAULT_PATTERNS)
+    return _default_pattern_set
+
+
+def mask_expression(expr: pl.Expr, pattern_set: CompiledPatternSet) -> pl.Expr:
+    """문자열 컬럼 표현식에 마스킹 규칙을 레지스트리 순서대로 연결"""
+    for _, pattern, replacement in pattern_set.masks:
+        if supports_polars(pattern.pattern):
+            expr = expr.str.replace_all(pattern.pattern, replacement)
+        else:
+            python_replacement = to_python_replacement(replacement)
+            expr = expr.map_elements(
+                lambda value, p=pattern, r=python_replacement: p.sub(r, value),
+                return_dtype=pl.Utf8,
+                skip_nulls=True
+            )
+    return expr
+
+
+def mask_dataframe(df: pl.DataFrame, pattern_set: Optional[CompiledPatternSet] = None,
+                   columns: Optional[List[str]] = None) -> pl.DataFrame:
+    """
+    DataFrame 컬럼 전체를 한 번에 마스킹 (대상 컬럼은 문자열로 변환)
+
+    Args:
+        df: 원본 DataFrame
+        pattern_set: 탐지에 사용하는 컴파일된 패턴 집합 (기본값: 기본 패턴)
+        columns: 마스킹할 컬럼 (기본값: 전체)
+    """
+    pattern_set = pattern_set or default_pattern_set()
+    columns = columns or df.columns
+
+    return df.with_columns([
+        mask_expression(pl.col(column).cast(pl.Utf8, strict=False), pattern_set).alias(column)
+        for column in columns
+    ])
+
+
+def mask_values(values: List[str], pattern_set: Optional[CompiledPatternSet] = None) -> List[str]:
+    """값 목록 마스킹"""
+    if not values:
+        return []
+    series = pl.Series('value', values, dtype=pl.Utf8)
+    return mask_dataframe(series.to_frame(), pattern_set)['value'].to_list()
+
+
+def mask_text(text, pattern_set: Optional[CompiledPatternSet] = None):
+    """단일 값 마스킹 (문자열이 아니면 그대로 반환)"""
+    if not isinstance(text, str):
+        return text
+
+    pattern_set = pattern_set or default_pattern_set()
+    for _, pattern, replacement in pattern_set.masks:
+        text = pattern.sub(to_python_replacement(replacement), text)
+    return text
@@ -3,6 +3,7 @@ import polars as pl
 import pandas as pd
 import re
 import json
+import time
 from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime
 import warnings
@@ -15,8 +16,22 @@ import seaborn as sns
 import os
 from dotenv import load_dotenv
 
+from pattern_registry import PatternRegistry
+from pattern_safety import MAX_VALUE_LENGTH
+from regex_pushdown import MYSQL, build_pushdown_query, parse_pushdown_row, plan_pushdown
+from sample_cache import SampleCache, make_source_id
+from scan_calibration import ScanCalibration
+from sampling import derive_table_seed
+from scan_pipeline import TRUNCATION_SEPARATOR, PrivacyScanPipeline
+
 warnings.filterwarnings('ignore')
 
+# 작은 테이블 일괄 조회 (통계 행 수가 이 이하인 테이블을 UNION ALL 쿼리 하나로 묶음)
+SMALL_TABLE_MAX_ROWS = 1000
+SMALL_TABLE_BATCH_SIZE = 100
+# JSON_OBJECT 로 묶어도 값/타입이 그대로 유지되는 비문자열 타입
+BATCH_NUMERIC_TYPES = {'tinyint', 'smallint', 'mediumint', 'int', 'integer', 'bigint'}
+
 
 class PrivacyScannerLogger:
     def __init__(self, log_level: str = "INFO"):
@@ -31,10 +46,19 @@ class PrivacyScannerLogger:
         self.logger = logging.getLogger(__name__)
 
 
-class PolarsPrivacyScanner:
-    def __init__(self, host: str, user: str, password: str = None, database: str = None, sample_size: int = 100, port: int = 3306):
+class PolarsPrivacyScanner(PrivacyScanPipeline):
+    source_name = 'MySQL'
+
+    def __init__(self, host: str, user: str, password: str = None, database: str = None, sample_size: int = 100, port: int = 3306,
+                 pattern_registry: Optional[PatternRegistry] = None, sample_cache: Optional[SampleCache] = None,
+                 parallel_columns: bool = True, projection_pushdown: bool = True,
+                 max_value_length: int = MAX_VALUE_LENGTH, tail_length: int = 0,
+                 sample_seed: Optional[int] = None, partition_sampling: bool = True,
+                 partition_workers: int = 4, batch_small_tables: bool = True,
+                 prefetch_tables: int = 2, regexp_pushdown: bool = False,
+                 calibration: Optional[ScanCalibration] = None):
         """
-        Polars 기반 개인정보 스캐너
+        Polars 기반 개인정보 스캐너 (MySQL 소스 어댑터, 탐지/점수/리포트는 PrivacyScanPipeline)
 
         Args:
             host: MySQL 서버 호스트
@@ -43,14 +67,33 @@ class PolarsPrivacyScanner:
             database: 데이터베이스명
             sample_size: 샘플링할 행 수
             port: MySQL 포트 (기본값: 3306)
+            pattern_registry: 개인정보 패턴 레지스트리 (기본값: 공유 레지스트리)
+            sample_cache: 샘플 캐시 (지정 시 스캔한 샘플을 저장해 재평가에 사용)
+            parallel_columns: 테이블 내 문자열 컬럼을 Polars 표현식으로 병렬 스캔 (False 이면 컬럼별 순차 스캔)
+            projection_pushdown: 문자열 타입 / 의심스러운 이름의 컬럼만 조회 (False 이면 SELECT *)
+            max_value_length: 값당 최대 조회 길이 (문자 수, SQL 에서 잘라서 전송 / 0 이면 제한 없음)
+            tail_length: 잘린 값에서 앞부분 대신 끝부분으로 채울 길이 (0 이면 앞부분만)
+            sample_seed: 스캔 시드 (같은 시드로 다시 스캔하면 변경되지 않은 테이블은 같은 표본, 기본값: 무작위)
+            partition_sampling: 파티션 테이블은 파티션별로 행 수에 비례해 샘플링 (최근 파티션 누락 방지)
+            partition_workers: 파티션 동시 조회 연결 수 (1 이면 기존 연결로 순차 조회)
+            batch_small_tables: 행 수가 적은 테이블은 여러 개를 한 번의 쿼리로 조회 (테이블별 왕복 제거)
+            prefetch_tables: 분석 중에 미리 조회해 둘 테이블 샘플 수 (0 이면 조회와 분석을 순차 실행)
+            regexp_pushdown: 변환 가능한 패턴은 DB 에서 전체 테이블 일치 행 수를 집계 (MySQL 8.0+, 나머지 패턴은 샘플만)
+            calibration: 스캔 보정 (지정 시 테이블별 단계 소요 시간을 기록하고 시간 예측에 사용)
         """
+        super().__init__(
+            sample_size=sample_size, pattern_registry=pattern_registry, sample_cache=sample_cache,
+            cache_source=make_source_id('mysql', host, port),
+            parallel_columns=parallel_columns, projection_pushdown=projection_pushdown,
+            max_value_length=max_value_length, tail_length=tail_length, sample_seed=sample_seed,
+            partition_sampling=partition_sampling, partition_workers=partition_workers,
+            prefetch_tables=prefetch_tables, regexp_pushdown=regexp_pushdown, calibration=calibration
+        )
         self.host = host
         self.user = user
         self.password = password
         self.database = database
         self.port = port
-        self.connection = None
-        self.sample_size = sample_size
 
         # 시스템 스키마 제외 목록 (포괄적)
         self.system_schemas = {
@@ -64,21 +107,16 @@ class PolarsPrivacyScanner:
             'ndbinfo',
         }
 
-        # 개인정보 패턴 정의 - 한국 형식으로 업데이트
-        self.privacy_patterns = {
-            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'phone': r'\b0\d{1,2}-\d{3,4}-\d{4}\b', # 0으로 시작하는 전화번호 형식 (오탐 방지)
-            'ssn': r'\d{6}-[1-4]\d{6}',  # 한국 주민등록번호 형식
-            'card_number': r'\b(?:\d{4}-){3}\d{4}\b',  # 일반적인 16자리 카드번호 형식
-            'account_number': r'\b\d{2,6}-\d{2,6}-\d{2,6}\b',  # 일반적인 계좌번호 형식
+        # 작은 테이블이 수천 개인 스키마는 테이블별 USE/COUNT/DESCRIBE/샘플 쿼리 왕복이 대부분을 차지
+        self.batch_small_tables = batch_small_tables
+
+        # 패턴 스캔 대상 컬럼 타입 (DESCRIBE 기준, 나머지 타입은 이름이 의심스러운 경우만 조회)
+        self.scannable_types = {
+            'char', 'varchar', 'tinytext', 'text', 'mediumtext', 'longtext', 'json', 'enum', 'set'
         }
 
-        # 개인정보 관련 컬럼명 키워드
-        self.privacy_keywords = [
-            'name', 'email', 'phone', 'mobile', 'tel', 'address', 'addr',
-            'ssn', 'social', 'birth', 'birthday', 'card', 'account',
-            'user_id', 'customer', '고객', 'personal', '개인'
-        ]
+        # 서버에서 잘라서 조회할 긴 텍스트 타입
+        self.truncatable_types = {'varchar', 'tinytext', 'text', 'mediumtext', 'longtext', 'json'}
 
         print(f"🚀 Polars 기반 개인정보 스캐너 초기화 (샘플: {sample_size}건)")
 
@@ -171,6 +209,29 @@ class PolarsPrivacyScanner:
             
             return False
 
+    def connection_params(self, database: Optional[str] = None) -> Dict[str, Any]:
+        """연결 파라미터 구성 (파티션 병렬 샘플링용 추가 연결에도 사용)"""
+        connection_params = {
+            'host': self.host,
+            'port': self.port,
+            'user': self.user,
+            'charset': 'utf8mb4',
+            'autocommit': True,
+            'connect_timeout': 30,
+            'read_timeout': 60,
+            'write_timeout': 60
+        }
+
+        # 비밀번호가 있는 경우에만 추가
+        if self.password:
+            connection_params['password'] = self.password
+
+        # 데이터베이스가 지정된 경우 추가
+        if database:
+            connection_params['database'] = database
+
+        return connection_params
+
     def connect(self):
         """MySQL 연결"""
         # 설정 검증
@@ -184,27 +245,7 @@ class PolarsPrivacyScanner:
         try:
             print(f"🔗 MySQL에 연결 중... ({self.host}:{self.port})")
             
-            # 연결 파라미터 구성
-            connection_params = {
-                'host': self.host,
-                'port': self.port,
-                'user': self.user,
-                'charset': 'utf8mb4',
-                'autocommit': True,
-                'connect_timeout': 30,
-                'read_timeout': 60,
-                'write_timeout': 60
-            }
-            
-            # 비밀번호가 있는 경우에만 추가
-            if self.password:
-                connection_params['password'] = self.password
-            
-            # 데이터베이스가 지정된 경우 추가
-            if self.database:
-                connection_params['database'] = self.database
-            
-            self.connection = mysql.connector.connect(**connection_params)
+            self.connection = mysql.connector.connect(**self.connection_params(self.database))
             
             if self.connection.is_connected():
                 print(f"✅ MySQL 연결 성공: {self.host}:{self.port}")
@@ -265,6 +306,21 @@ class PolarsPrivacyScanner:
         cursor.close()
         return tables
 
+    def get_changed_tables(self, database: str, since: datetime) -> List[str]:
+        """since 이후 생성/변경된 테이블 목록 조회 (증분 스캔용)"""
+        cursor = self.connection.cursor()
+        # UPDATE_TIME이 NULL이면 변경 여부를 알 수 없으므로 스캔 대상에 포함
+        cursor.execute("""
+            SELECT TABLE_NAME
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = %s
+              AND TABLE_TYPE = 'BASE TABLE'
+              AND (UPDATE_TIME IS NULL OR UPDATE_TIME >= %s OR CREATE_TIME >= %s)
+        """, (database, since, since))
+        tables = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        return tables
+
     def get_table_info(self, database: str, table: str) -> Dict:
         """테이블 정보 조회 (행 수, 컬럼 정보)"""
         cursor = self.connection.cursor()
@@ -293,84 +349,29 @@ class PolarsPrivacyScanner:
             'columns': columns
         }
 
-    def estimate_dataframe_size(self, columns: List[Dict], sample_rows: int) -> Dict:
-        """DataFrame 예상 크기 계산"""
-        size_estimates = {
-            'int': 8, 'bigint': 8, 'smallint': 4, 'tinyint': 1,
-            'float': 8, 'double': 8, 'decimal': 16,
-            'varchar': 50, 'text': 200, 'longtext': 1000,
-            'char': 20, 'date': 8, 'datetime': 8, 'timestamp': 8,
-            'json': 100, 'blob': 500, 'binary': 50
-        }
-
-        total_bytes_per_row = 0
-        text_columns = 0
-        numeric_columns = 0
-        date_columns = 0
-
-        for col in columns:
-            col_type = col['type'].lower()
-            col_size = 8
-
-            for type_key, size in size_estimates.items():
-                if type_key in col_type:
-                    col_size = size
-                    break
-
-            if 'varchar' in col_type or 'char' in col_type:
-                import re
-                match = re.search(r'\((\d+)\)', col_type)
-                if match:
-                    declared_length = int(match.group(1))
-                    col_size = min(declared_length, 255)
-                text_columns += 1
-            elif any(t in col_type for t in ['text', 'blob', 'json']):
-                text_columns += 1
-            elif any(t in col_type for t in ['int', 'float', 'double', 'decimal']):
-                numeric_columns += 1
-            elif any(t in col_type for t in ['date', 'time', 'timestamp']):
-                date_columns += 1
-
-            total_bytes_per_row += col_size
-
-        overhead_factor = 1.3
-        estimated_size_bytes = total_bytes_per_row * sample_rows * overhead_factor
-
-        return {
-            'total_columns': len(columns),
-            'text_columns': text_columns,
-            'numeric_columns': numeric_columns,
-            'date_columns': date_columns,
-            'estimated_bytes_per_row': int(total_bytes_per_row),
-            'estimated_total_bytes': int(estimated_size_bytes),
-            'estimated_mb': round(estimated_size_bytes / (1024 * 1024), 2),
-            'sample_rows': sample_rows
-        }
-
-    def estimate_scan_time(self, total_rows: int, columns: int, text_columns: int,
-                           estimated_mb: float, sample_rows: int) -> Dict:
-        """스캔 시간 예측 (Polars 기준)"""
-        base_speed_rows_per_sec = 50000
-        regex_speed_factor = 0.3
-        text_factor = 1 + (text_columns * 0.1)
-
-        effective_speed = base_speed_rows_per_sec * regex_speed_factor / text_factor
-
-        db_query_time = max(0.1, total_rows / 1000000)
-        dataframe_creation_time = max(0.05, estimated_mb / 100)
-        pattern_scan_time = sample_rows / effective_speed
-
-        total_estimated_seconds = db_query_time + dataframe_creation_time + pattern_scan_time
-
-        return {
-            'engine': 'Polars',
-            'db_query_time_sec': round(db_query_time, 2),
-            'dataframe_creation_time_sec': round(dataframe_creation_time, 2),
-            'pattern_scan_time_sec': round(pattern_scan_time, 2),
-            'total_estimated_sec': round(total_estimated_seconds, 2),
-            'estimated_rows_per_sec': int(effective_speed),
-            'text_columns_factor': round(text_factor, 2)
-        }
+    def get_partitions(self, database: str, table: str) -> List[Dict]:
+        """파티션 목록 (파티션 순서, 행 수는 통계 기준 추정치 / 파티션되지 않은 테이블이면 빈 목록)"""
+        cursor = self.connection.cursor()
+        try:
+            # 서브파티션은 상위 파티션 단위로 합산
+            cursor.execute("""
+                SELECT PARTITION_NAME, SUM(TABLE_ROWS)
+                FROM information_schema.PARTITIONS
+                WHERE TABLE_SCHEMA = %s
+                  AND TABLE_NAME = %s
+                  AND PARTITION_NAME IS NOT NULL
+                GROUP BY PARTITION_NAME, PARTITION_ORDINAL_POSITION
+                ORDER BY PARTITION_ORDINAL_POSITION
+            """, (database, table))
+            return [
+                {'name': row[0], 'rows': int(row[1]) if row[1] is not None else None}
+                for row in cursor.fetchall()
+            ]
+        except mysql.connector.Error as err:
+            print(f"    ⚠️  파티션 조회 실패: {err}")
+            return []
+        finally:
+            cursor.close()
 
     def load_table_sample(self, database: str, table: str) -> Tuple[Optional[pl.DataFrame], Dict]:
         """테이블에서 샘플 데이터를 Polars DataFrame으로 로드"""
@@ -384,32 +385,67 @@ class PolarsPrivacyScanner:
             print(f"    ⚠️  빈 테이블")
             return None, {'method': 'empty', 'total_rows': 0, 'sampled_rows': 0}
 
-        if total_rows <= self.sample_size:
-            query = f"SELECT * FROM {table}"
-            sample_method = "전체 데이터"
-        else:
-            query = f"SELECT * FROM {table} ORDER BY RAND() LIMIT {self.sample_size}"
-            sample_method = f"랜덤 샘플링"
+        selected, skipped_columns = table_info['columns'], []
+        if self.projection_pushdown:
+            selected, skipped_columns = self.select_scan_columns(table_info['columns'])
+            if not selected:
+                print(f"    ⏭️  스캔 대상 컬럼 없음 (문자열 타입/의심 컬럼명 없음)")
+                return None, {'method': 'no_scannable_columns', 'total_rows': total_rows, 'sampled_rows': 0,
+                              'skipped_columns': skipped_columns}
+
+        # 긴 텍스트는 서버에서 잘라서 전송 (앞부분 + 선택적으로 뒷부분)
+        expressions = [(col['name'], self.column_expression(col)) for col in selected]
+        select_list = ', '.join(expr for _, expr in expressions) or '*'
+        truncated_columns = [name for name, expr in expressions if expr != self.quote_identifier(name)]
+
+        # 같은 시드 + 변경되지 않은 테이블이면 RAND(N) 순서가 같아 같은 표본
+        table_seed = derive_table_seed(self.sample_seed, database, table)
+        partitions = []
+        if self.partition_sampling and total_rows > self.sample_size:
+            partitions = self.get_partitions(database, table)
 
         try:
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
+            partition_details = None
+            if len(partitions) > 1:
+                rows, columns, partition_details = self._sample_partitions(database, table, select_list, partitions)
+                sample_method = f"파티션 랜덤 샘플링 ({len(partition_details)}개 파티션)"
+            else:
+                if total_rows <= self.sample_size:
+                    query = f"SELECT {select_list} FROM {table}"
+                    sample_method = "전체 데이터"
+                else:
+                    query = f"SELECT {select_list} FROM {table} ORDER BY RAND({table_seed}) LIMIT {self.sample_size}"
+                    sample_method = f"랜덤 샘플링"
+
+                cursor.execute(query)
+                rows = self.fetch_rows(cursor)
+                columns = [desc[0] for desc in cursor.description]
 
             if not rows:
                 return None, {'method': 'no_data', 'total_rows': total_rows, 'sampled_rows': 0}
 
-            df = pl.DataFrame(rows, schema=columns)
+            with self.stage('frame'):
+                df = pl.DataFrame(rows, schema=columns)
 
             sampling_info = {
                 'method': sample_method,
                 'total_rows': total_rows,
                 'sampled_rows': len(rows),
-                'sampling_ratio': len(rows) / total_rows if total_rows > 0 else 0
+                'sampling_ratio': len(rows) / total_rows if total_rows > 0 else 0,
+                'skipped_columns': skipped_columns,
+                'truncated_columns': truncated_columns,
+                'max_value_length': self.max_value_length,
+                'sample_seed': self.sample_seed,
+                'table_seed': table_seed
             }
+            if partition_details:
+                sampling_info['partitions'] = partition_details
 
             print(f"    📊 {total_rows:,}행 → {len(rows)}행 샘플링 ({sample_method})")
 
+            if self.regexp_pushdown:
+                sampling_info['pushdown'] = self.count_patterns_in_db(database, table, selected)
+
             return df, sampling_info
 
         except Exception as e:
@@ -418,381 +454,272 @@ class PolarsPrivacyScanner:
         finally:
             cursor.close()
 
-    def is_privacy_column(self, column_name: str) -> bool:
-        """컬럼명이 개인정보 관련 컬럼인지 확인"""
-        column_lower = column_name.lower()
-        return any(keyword in column_lower for keyword in self.privacy_keywords)
-
-    def scan_column_patterns(self, df: pl.DataFrame, column: str) -> Dict:
-        """Polars DataFrame 컬럼에서 개인정보 패턴 스캔"""
-        if df is None:
-            return {'error': 'DataFrame is None'}
-
-        try:
-            if column not in df.columns:
-                return {'error': f'Column {column} not found'}
-
-            col_data = df.select(pl.col(column).filter(pl.col(column).is_not_null())).to_series()
-            values = [str(val) for val in col_data.to_list()]
-
-            if not values:
-                return {'privacy_matches': {}, 'total_values': 0, 'privacy_count': 0, 'privacy_ratio': 0}
-
-            privacy_matches = {}
-            privacy_rows = set()
-
-            for idx, value in enumerate(values):
-                for pattern_name, pattern in self.privacy_patterns.items():
-                    matches = re.findall(pattern, value)
-                    if matches:
-                        if pattern_name not in privacy_matches:
-                            privacy_matches[pattern_name] = 0
-                        privacy_matches[pattern_name] += len(matches)
-                        privacy_rows.add(idx)
-
-            total_values = len(values)
-            privacy_count = len(privacy_rows)
-            privacy_ratio = privacy_count / total_values if total_values > 0 else 0
-
-            return {
-                'privacy_matches': privacy_matches,
-                'total_values': total_values,
-                'privacy_count': privacy_count,
-                'privacy_ratio': privacy_ratio,
-                'sample_values': self.mask_sample_data(values[:5])
-            }
-
-        except Exception as e:
-            return {'error': str(e)}
-
-    def mask_sample_data(self, values: List[str]) -> List[str]:
-        """샘플 데이터 마스킹"""
-        masked = []
-        for value in values:
-            value = re.sub(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-                           lambda m: f"{m.group(1)[:2]}***@{m.group(2)}", value)
-            value = re.sub(r'(\d{2,3})-(\d{3,4})-(\d{4})', r'\1-***-\3', value)
-            value = re.sub(r'(\d{6})-([1-4])(\d{6})', r'\1-\2******', value)
-            value = re.sub(r'(\d{4})-(\d{4})-(\d{4})-(\d{4})', r'\1-****-****-\4', value)
-
-            masked.append(value[:50] + "..." if len(value) > 50 else value)
-
-        return masked
-
-    def analyze_dataframe(self, df: pl.DataFrame, table_name: str, sampling_info: Dict) -> Dict:
-        """Polars DataFrame 전체 분석"""
-        if df is None:
-            return {
-                'table': table_name,
-                'sampling_info': sampling_info,
-                'columns': {},
-                'privacy_score': 0,
-                'risk_level': 'EMPTY' if sampling_info.get('total_rows', 0) == 0 else 'ERROR'
-            }
-
-        print(f"    🔍 DataFrame 분석 중... (Polars)")
-
-        result = {
-            'table': table_name,
-            'sampling_info': sampling_info,
-            'columns': {},
-            'privacy_score': 0,
-            'risk_level': 'LOW'
-        }
-
-        for column in df.columns:
-            column_name = str(column)
-            col_type = str(df[column].dtype)
-            is_suspicious = self.is_privacy_column(column_name)
-
-            column_result = {
-                'type': col_type,
-                'suspicious_name': is_suspicious,
-                'pattern_scan': None
-            }
-
-            if any(t in col_type.lower() for t in ['string', 'utf8', 'str']):
-                pattern_result = self.scan_column_patterns(df, column_name)
-                column_result['pattern_scan'] = pattern_result
-
-                if 'privacy_matches' in pattern_result and pattern_result['privacy_matches']:
-                    pattern_score = len(pattern_result['privacy_matches']) * 3
-                    ratio_score = int(pattern_result.get('privacy_ratio', 0) * 10)
-                    column_score = pattern_score + ratio_score
-                    result['privacy_score'] += column_score
-
-                    print(f"      🚨 {column_name}: {list(pattern_result['privacy_matches'].keys())} "
-                          f"(비율: {pattern_result.get('privacy_ratio', 0):.1%})")
-
-                elif is_suspicious:
-                    result['privacy_score'] += 1
-                    print(f"      ⚠️  {column_name}: 의심스러운 컬럼명")
-
-            result['columns'][column_name] = column_result
-
-        if result['privacy_score'] >= 15:
-            result['risk_level'] = 'HIGH'
-        elif result['privacy_score'] >= 5:
-            result['risk_level'] = 'MEDIUM'
-
-        return result
-
-    def scan_table(self, database: str, table: str) -> Dict:
-        """테이블 스캔 (Polars 기반)"""
-        print(f"  📋 테이블 스캔: {table}")
-
-        df, sampling_info = self.load_table_sample(database, table)
-        result = self.analyze_dataframe(df, table, sampling_info)
-
-        print(f"    ✅ 완료 (위험도: {result['risk_level']}, 점수: {result['privacy_score']})")
-
-        return result
+    def count_patterns_in_db(self, database: str, table: str, columns: List[Dict]) -> Dict:
+        """
+        전체 테이블 패턴 집계 (REGEXP_LIKE 를 서버에서 실행해 집계 행 하나로 반환)
 
-    def analyze_database_structure(self, database: str) -> Dict:
-        """데이터베이스 구조 분석 및 처리 비용 예측"""
-        print(f"🔍 데이터베이스 구조 분석 중: {database}")
-
-        analysis = {
-            'database': database,
-            'analysis_time': datetime.now().isoformat(),
-            'engine': 'Polars',
-            'sample_size': self.sample_size,
-            'tables': {},
-            'summary': {
-                'total_tables': 0,
-                'total_rows': 0,
-                'total_columns': 0,
-                'total_text_columns': 0,
-                'estimated_total_mb': 0,
-                'estimated_total_scan_time_sec': 0,
-                'scannable_tables': 0,
-                'empty_tables': 0,
-                'large_tables': 0
-            }
+        패턴별 개수는 일치한 행 수입니다 (MySQL 에는 REGEXP_COUNT 가 없음).
+        DB 정규식으로 변환할 수 없는 패턴은 fallback_patterns 에 사유와 함께 기록하고 샘플 스캔 결과만 사용합니다.
+        """
+        pattern_set = self.pattern_registry.compiled()
+        translated, fallback = plan_pushdown(pattern_set, MYSQL)
+        string_columns = [col['name'] for col in columns if self.is_scannable_type(col)]
+        summary = {
+            'pattern_version': pattern_set.version,
+            'patterns': [key for key, _ in translated],
+            'fallback_patterns': fallback,
+            'count_unit': 'rows',
+            'columns': {}
         }
+        if not translated or not string_columns:
+            return summary
 
-        try:
-            tables = self.get_tables(database)
-            analysis['summary']['total_tables'] = len(tables)
-
-            print(f"  📊 발견된 테이블: {len(tables)}개")
-
-            for table in tables:
-                print(f"    📋 분석 중: {table}")
-
-                try:
-                    table_info = self.get_table_info(database, table)
-                    total_rows = table_info['total_rows']
-                    columns = table_info['columns']
-
-                    sample_rows = min(total_rows, self.sample_size) if total_rows > 0 else 0
-                    size_estimate = self.estimate_dataframe_size(columns, sample_rows)
-                    time_estimate = self.estimate_scan_time(
-                        total_rows,
-                        len(columns),
-                        size_estimate['text_columns'],
-                        size_estimate['estimated_mb'],
-                        sample_rows
-                    )
-
-                    table_analysis = {
-                        'total_rows': total_rows,
-                        'total_columns': len(columns),
-                        'columns': columns,
-                        'size_estimate': size_estimate,
-                        'time_estimate': time_estimate,
-                        'status': 'scannable' if total_rows > 0 else 'empty'
-                    }
-
-                    analysis['tables'][table] = table_analysis
-
-                    analysis['summary']['total_rows'] += total_rows
-                    analysis['summary']['total_columns'] += len(columns)
-                    analysis['summary']['total_text_columns'] += size_estimate['text_columns']
-                    analysis['summary']['estimated_total_mb'] += size_estimate['estimated_mb']
-                    analysis['summary']['estimated_total_scan_time_sec'] += time_estimate['total_estimated_sec']
-
-                    if total_rows == 0:
-                        analysis['summary']['empty_tables'] += 1
-                    else:
-                        analysis['summary']['scannable_tables'] += 1
-
-                    if total_rows >= 1000000:
-                        analysis['summary']['large_tables'] += 1
-
-                    print(f"      ✅ {total_rows:,}행, {len(columns)}컬럼, "
-                          f"~{size_estimate['estimated_mb']}MB, "
-                          f"~{time_estimate['total_estimated_sec']}초")
-
-                except Exception as e:
-                    analysis['tables'][table] = {
-                        'error': str(e),
-                        'status': 'error'
-                    }
-                    print(f"      ❌ 분석 오류: {str(e)}")
-
-        except Exception as e:
-            analysis['error'] = str(e)
-            print(f"❌ 데이터베이스 분석 오류: {str(e)}")
-
-        return analysis
-
-    def scan_database(self, database: str) -> Dict:
-        """데이터베이스 전체 스캔"""
-        print(f"🔍 데이터베이스 스캔 시작: {database} (Polars 엔진)")
-
-        scan_results = {
-            'database': database,
-            'scan_time': datetime.now().isoformat(),
-            'engine': 'Polars',
-            'sample_size': self.sample_size,
-            'tables': {},
-            'summary': {
-                'total_tables': 0,
-                'scanned_tables': 0,
-                'high_risk_tables': 0,
-                'medium_risk_tables': 0,
-                'low_risk_tables': 0,
-                'total_privacy_score': 0,
-                'total_data_rows': 0,
-                'total_sampled_rows': 0
-            }
-        }
+        source = f"{self.quote_identifier(database)}.{self.quote_identifier(table)}"
+        query, params = build_pushdown_query(
+            MYSQL, source, [self.quote_identifier(name) for name in string_columns], translated
+        )
 
+        started = time.perf_counter()
+        cursor = self.connection.cursor()
         try:
-            tables = self.get_tables(database)
-            scan_results['summary']['total_tables'] = len(tables)
-
-            for table in tables:
-                table_result = self.scan_table(database, table)
-                scan_results['tables'][table] = table_result
-
-                risk_level = table_result.get('risk_level', 'LOW')
-                privacy_score = table_result.get('privacy_score', 0)
-                sampling_info = table_result.get('sampling_info', {})
-
-                if risk_level == 'HIGH':
-                    scan_results['summary']['high_risk_tables'] += 1
-                elif risk_level == 'MEDIUM':
-                    scan_results['summary']['medium_risk_tables'] += 1
-                elif risk_level == 'LOW':
-                    scan_results['summary']['low_risk_tables'] += 1
-
-                scan_results['summary']['scanned_tables'] += 1
-                scan_results['summary']['total_privacy_score'] += privacy_score
-                scan_results['summary']['total_data_rows'] += sampling_info.get('total_rows', 0)
-                scan_results['summary']['total_sampled_rows'] += sampling_info.get('sampled_rows', 0)
-
-        except Exception as e:
-            scan_results['error'] = str(e)
-            print(f"❌ 데이터베이스 스캔 오류: {str(e)}")
-
-        return scan_results
-
-    def generate_structure_report(self, analysis: Dict) -> str:
-        """데이터베이스 구조 분석 리포트 생성"""
-        report = []
-        report.append("=" * 80)
-        report.append("🏗️  데이터베이스 구조 분석 및 처리 비용 예측 (Polars)")
-        report.append("=" * 80)
-        report.append(f"데이터베이스: {analysis['database']}")
-        report.append(f"분석 시간: {analysis['analysis_time']}")
-        report.append(f"처리 엔진: Polars")
-        report.append(f"샘플 크기: {analysis.get('sample_size', 'Unknown')}건")
-        report.append("")
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+        except mysql.connector.Error as err:
+            print(f"    ⚠️  전체 테이블 집계 실패 (샘플 결과만 사용): {err}")
+            summary['error'] = str(err)
+            return summary
+        finally:
+            cursor.close()
 
-        summary = analysis.get('summary', {})
+        summary['elapsed_sec'] = round(time.perf_counter() - started, 3)
+        summary['columns'] = parse_pushdown_row(MYSQL, row, string_columns, translated)
+        print(f"    🧮 전체 테이블 집계: {len(string_columns)}개 컬럼 × {len(translated)}개 패턴 "
+              f"({summary['elapsed_sec']:.2f}s)")
+        return summary
 
-        report.append("📊 전체 요약:")
-        report.append(f"  • 총 테이블 수: {summary.get('total_tables', 0):,}개")
-        report.append(f"  • 스캔 가능한 테이블: {summary.get('scannable_tables', 0):,}개")
-        report.append(f"  • 빈 테이블: {summary.get('empty_tables', 0):,}개")
-        report.append(f"  • 대용량 테이블 (100만행+): {summary.get('large_tables', 0):,}개")
-        report.append(f"  • 총 데이터 행 수: {summary.get('total_rows', 0):,}행")
-        report.append(f"  • 총 컬럼 수: {summary.get('total_columns', 0):,}개")
-        report.append(f"  • 텍스트 컬럼 수: {summary.get('total_text_columns', 0):,}개")
-        report.append("")
+    def partition_seed(self, database: str, table: str, partition: Dict) -> int:
+        """파티션별 RAND(N) 시드 (같은 스캔 시드면 같은 표본)"""
+        return derive_table_seed(self.sample_seed, database, table, salt=f"partition:{partition['name']}")
 
-        estimated_mb = summary.get('estimated_total_mb', 0)
-        estimated_time = summary.get('estimated_total_scan_time_sec', 0)
+    def partition_detail(self, database: str, table: str, partition: Dict) -> Dict:
+        return {'seed': self.partition_seed(database, table, partition)}
 
-        report.append("💾 예상 처리 비용 (Polars 엔진):")
-        report.append(f"  • 예상 DataFrame 크기: {estimated_mb:.1f} MB")
-        if estimated_mb < 10:
-            report.append(f"    → 메모리 사용량: 🟢 낮음")
-        elif estimated_mb < 100:
-            report.append(f"    → 메모리 사용량: 🟡 보통")
-        else:
-            report.append(f"    → 메모리 사용량: 🔴 높음")
+    def _sample_partition(self, database: str, table: str, select_list: str, partition: Dict,
+                          limit: int) -> Tuple[List[tuple], List[str], Optional[Dict]]:
+        """파티션 하나에서 샘플 조회 (병렬 조회 시 작업마다 별도 연결 사용)"""
+        seed = self.partition_seed(database, table, partition)
+        query = (f"SELECT {select_list} FROM {table} PARTITION ({self.quote_identifier(partition['name'])}) "
+                 f"ORDER BY RAND({seed}) LIMIT {limit}")
 
-        report.append(f"  • 예상 스캔 시간: {estimated_time:.1f}초")
-        if estimated_time < 30:
-            report.append(f"    → 처리 시간: 🟢 빠름")
-        elif estimated_time < 300:
-            report.append(f"    → 처리 시간: 🟡 보통")
+        if self.partition_workers > 1:
+            connection = mysql.connector.connect(**self.connection_params(database))
         else:
-            report.append(f"    → 처리 시간: 🔴 오래 걸림")
-
-        if estimated_time > 60:
-            minutes = int(estimated_time // 60)
-            seconds = int(estimated_time % 60)
-            report.append(f"    → 예상 시간: {minutes}분 {seconds}초")
-
-        report.append("")
+            connection = self.connection
+        try:
+            cursor = connection.cursor()
+            cursor.execute(query)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            cursor.close()
+            return rows, columns, None
+        finally:
+            if connection is not self.connection:
+                connection.close()
+
+    def is_scannable_type(self, col: Dict) -> bool:
+        return col['type'].split('(')[0].strip().lower() in self.scannable_types
+
+    @staticmethod
+    def quote_identifier(name: str) -> str:
+        return "`" + name.replace("`", "``") + "`"
+
+    def value_expression(self, col: Dict) -> str:
+        """컬럼 값 표현식 (긴 텍스트 컬럼은 LEFT/RIGHT 로 서버에서 잘라서 조회)"""
+        name = self.quote_identifier(col['name'])
+        base_type = col['type'].split('(')[0].strip().lower()
+        cap = self.max_value_length
+
+        if not cap or base_type not in self.truncatable_types:
+            return name
+        if base_type == 'varchar':
+            match = re.search(r'\((\d+)\)', col['type'])
+            if match and int(match.group(1)) <= cap:
+                return name
+
+        if self.tail_length:
+            head = cap - self.tail_length
+            return (f"CASE WHEN CHAR_LENGTH({name}) > {cap} "
+                    f"THEN CONCAT(LEFT({name}, {head}), '{TRUNCATION_SEPARATOR}', RIGHT({name}, {self.tail_length})) "
+                    f"ELSE {name} END")
+        return f"LEFT({name}, {cap})"
+
+    def get_table_catalog(self, database: str) -> Dict[str, Dict]:
+        """스키마 전체 테이블의 통계 행 수와 컬럼 정보 (테이블별 DESCRIBE 대신 두 번의 쿼리로 조회)"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT TABLE_NAME, TABLE_ROWS
+                FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = %s
+                  AND TABLE_TYPE = 'BASE TABLE'
+            """, (database,))
+            catalog = {row[0]: {'rows_estimate': row[1], 'columns': []} for row in cursor.fetchall()}
+
+            # DESCRIBE 와 같은 형식 (name, type, null, key, default, extra)
+            cursor.execute("""
+                SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = %s
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """, (database,))
+            for row in cursor.fetchall():
+                if row[0] in catalog:
+                    catalog[row[0]]['columns'].append({
+                        'name': row[1],
+                        'type': row[2],
+                        'null': row[3],
+                        'key': row[4],
+                        'default': row[5],
+                        'extra': row[6]
+                    })
+            return catalog
+        finally:
+            cursor.close()
 
-        large_tables = []
-        for table_name, table_data in analysis.get('tables', {}).items():
-            if table_data.get('total_rows', 0) >= 100000:
-                large_tables.append({
-                    'name': table_name,
-                    'rows': table_data.get('total_rows', 0),
-                    'columns': table_data.get('total_columns', 0),
-                    'mb': table_data.get('size_estimate', {}).get('estimated_mb', 0),
-                    'time': table_data.get('time_estimate', {}).get('total_estimated_sec', 0)
-                })
-
-        large_tables.sort(key=lambda x: x['rows'], reverse=True)
-
-        if large_tables:
-            report.append("📈 대용량 테이블 상위 10개:")
-            for i, table in enumerate(large_tables[:10], 1):
-                report.append(f"  {i:2d}. {table['name']}")
-                report.append(f"      • 행 수: {table['rows']:,}")
-                report.append(f"      • 컬럼 수: {table['columns']}")
-                report.append(f"      • 예상 크기: {table['mb']:.1f} MB")
-                report.append(f"      • 예상 시간: {table['time']:.1f}초")
-
-            if len(large_tables) > 10:
-                report.append(f"  ... 외 {len(large_tables) - 10}개")
-            report.append("")
+    def _batch_columns(self, columns: List[Dict]) -> Optional[Tuple[List[Dict], List[str]]]:
+        """일괄 조회할 컬럼과 제외 컬럼 (JSON 으로 바꾸면 타입이 달라지는 컬럼이 있으면 None)"""
+        selected, skipped = columns, []
+        if self.projection_pushdown:
+            selected, skipped = self.select_scan_columns(columns)
 
-        report.append("💡 권장사항:")
+        for col in selected:
+            base_type = col['type'].split('(')[0].strip().lower()
+            if base_type not in self.scannable_types and base_type not in BATCH_NUMERIC_TYPES:
+                return None
+        return selected, skipped
 
-        if estimated_mb > 500:
-            report.append("  • 메모리 사용량이 높습니다. 샘플 크기를 줄이는 것을 고려하세요.")
+    def plan_table_batches(self, database: str, tables: List[str]) -> Tuple[List[List[str]], Dict[str, Dict]]:
+        """통계 행 수가 적은 테이블을 일괄 조회 단위로 묶음 (테이블 순서 유지)"""
+        # 전체 테이블 집계 모드는 테이블별 조회 경로에서만 실행
+        if not self.batch_small_tables or self.regexp_pushdown or not tables:
+            return [], {}
 
-        if estimated_time > 600:
-            report.append("  • 처리 시간이 깁니다. 특정 테이블만 선택적으로 스캔하는 것을 고려하세요.")
+        try:
+            catalog = self.get_table_catalog(database)
+        except mysql.connector.Error as err:
+            print(f"  ⚠️  테이블 카탈로그 조회 실패, 테이블별 조회: {err}")
+            return [], {}
+
+        small_tables = [
+            table for table in tables
+            if table in catalog
+            and catalog[table]['columns']
+            and (catalog[table]['rows_estimate'] or 0) <= SMALL_TABLE_MAX_ROWS
+            and self._batch_columns(catalog[table]['columns']) is not None
+        ]
+        batches = [
+            small_tables[i:i + SMALL_TABLE_BATCH_SIZE]
+            for i in range(0, len(small_tables), SMALL_TABLE_BATCH_SIZE)
+        ]
+        # 한 개짜리 묶음은 이득이 없으므로 테이블별 조회
+        batches = [batch for batch in batches if len(batch) > 1]
+        if batches:
+            print(f"  📦 작은 테이블 일괄 조회: {sum(len(b) for b in batches)}개 테이블 → {len(batches)}개 쿼리")
+        return batches, catalog
+
+    def load_table_batch(self, database: str, tables: List[str],
+                         catalog: Dict[str, Dict]) -> Dict[str, Tuple[Optional[pl.DataFrame], Dict]]:
+        """
+        작은 테이블 여러 개의 샘플을 한 번의 쿼리로 조회해 테이블별 DataFrame 으로 분리
 
-        if summary.get('large_tables', 0) > 10:
-            report.append("  • 대용량 테이블이 많습니다. 배치 처리를 고려하세요.")
+        테이블마다 (테이블명, 전체 행 수, JSON_OBJECT 행) 을 UNION ALL 로 이어 붙입니다.
+        전체 행 수는 COUNT(*) OVER () 로 LIMIT 전에 계산되므로 별도 COUNT 쿼리가 필요 없습니다 (MySQL 8.0+).
+        """
+        branches, params = [], []
+        plans = {}
+        for table in tables:
+            selected, skipped = self._batch_columns(catalog[table]['columns'])
+            # %s 파라미터를 사용하므로 식별자 안의 % 는 이스케이프
+            source = f"{self.quote_identifier(database)}.{self.quote_identifier(table)}".replace('%', '%%')
+            table_seed = derive_table_seed(self.sample_seed, database, table)
+            plans[table] = (selected, skipped, table_seed)
+
+            params.append(table)
+            if selected:
+                pairs = []
+                for col in selected:
+                    pairs.append(f"%s, {self.value_expression(col).replace('%', '%%')}")
+                    params.append(col['name'])
+                branches.append(
+                    f"(SELECT %s AS tbl, COUNT(*) OVER () AS total, JSON_OBJECT({', '.join(pairs)}) AS row_json "
+                    f"FROM {source} ORDER BY RAND({table_seed}) LIMIT {self.sample_size})"
+                )
+            else:
+                branches.append(f"(SELECT %s AS tbl, COUNT(*) AS total, NULL AS row_json FROM {source})")
 
-        if summary.get('total_text_columns', 0) > summary.get('total_columns', 1) * 0.7:
-            report.append("  • 텍스트 컬럼 비율이 높습니다. 정규식 처리로 인해 시간이 더 걸릴 수 있습니다.")
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(' UNION ALL '.join(branches), tuple(params))
+            fetched = cursor.fetchall()
+        finally:
+            cursor.close()
 
-        report.append("  • Polars 엔진으로 최적화된 고성능 처리가 진행됩니다.")
+        totals: Dict[str, int] = {}
+        records: Dict[str, List[Dict]] = {table: [] for table in tables}
+        for table, total, row_json in fetched:
+            totals[table] = int(total)
+            if row_json is not None:
+                if isinstance(row_json, (bytes, bytearray)):
+                    row_json = row_json.decode('utf-8')
+                records[table].append(json.loads(row_json))
+
+        loaded = {}
+        for table in tables:
+            selected, skipped, table_seed = plans[table]
+            total_rows = totals.get(table, 0)
+
+            if total_rows == 0:
+                loaded[table] = (None, {'method': 'empty', 'total_rows': 0, 'sampled_rows': 0, 'batched': True})
+                continue
+            if not selected:
+                loaded[table] = (None, {'method': 'no_scannable_columns', 'total_rows': total_rows, 'sampled_rows': 0,
+                                        'skipped_columns': skipped, 'batched': True})
+                continue
+
+            rows = records[table]
+            names = [col['name'] for col in selected]
+            # JSON 컬럼을 자르지 않은 경우 객체/배열로 오므로 문자열로 되돌림
+            df = pl.DataFrame({
+                name: [
+                    json.dumps(rec.get(name), ensure_ascii=False) if isinstance(rec.get(name), (dict, list))
+                    else rec.get(name)
+                    for rec in rows
+                ]
+                for name in names
+            }, strict=False)
+
+            loaded[table] = (df, {
+                'method': "전체 데이터" if total_rows <= self.sample_size else "랜덤 샘플링",
+                'total_rows': total_rows,
+                'sampled_rows': len(rows),
+                'sampling_ratio': len(rows) / total_rows,
+                'skipped_columns': skipped,
+                'truncated_columns': [col['name'] for col in selected
+                                      if self.value_expression(col) != self.quote_identifier(col['name'])],
+                'max_value_length': self.max_value_length,
+                'sample_seed': self.sample_seed,
+                'table_seed': table_seed,
+                'batched': True
+            })
+        return loaded
 
-        return "\n".join(report)
+    def analyze_database_structure(self, database: str) -> Dict:
+        """데이터베이스 구조 분석 및 처리 비용 예측"""
+        return self.analyze_structure(database)
 
-    def generate_scan_report(self, scan_results: Dict) -> str:
-        """스캔 결과 리포트 생성"""
-        report = []
-        report.append("=" * 80)
-        report.append("📊 MySQL 개인정보 스캔 리포트 (Polars 엔진)")
-        report.append("=" * 80)
-        report.append(f"데이터베이스: {scan_results['database']}")
-        report.append(f"스캔 시간: {scan_results['scan_time']}")
-        report.append(f"처리 엔진: Polars")
+    def scan_database(self, database: str, changed_since: Optional[datetime] = None) -> Dict:
+        """데이터베이스 전체 스캔 (changed_since 지정 시 이후 변경된 테이블만)"""
+        return self.scan_namespace(database, changed_since)
 
     def generate_privacy_summary_report(self, scan_results: List[Dict]) -> str:
         """개인정보 스캔 결과 요약 리포트 생성"""
@@ -1107,7 +1034,7 @@ class PolarsPrivacyScanner:
     def is_system_schema(self, database_name: str) -> bool:
         """시스템 스키마인지 확인"""
         # 정확한 매칭
-        if database_name.lower() in self.system_schemas:
+        if super().is_system_schema(database_name):
             return True
         
         # 패턴 매칭 (시스템 관련 접두사/접미사)
@@ -1133,101 +1060,18 @@ class PolarsPrivacyScanner:
 
     def get_user_databases(self) -> List[str]:
         """사용자 데이터베이스 목록 조회 (시스템 스키마 제외)"""
-        all_databases = self.get_databases()
-        user_databases = []
-        system_databases = []
-        
-        for db in all_databases:
-            if self.is_system_schema(db):
-                system_databases.append(db)
-            else:
-                user_databases.append(db)
-        
-        # 제외된 시스템 스키마 정보 출력
-        if system_databases:
-            print(f"🔒 시스템 스키마 제외됨 ({len(system_databases)}개):")
-            for i, sys_db in enumerate(sorted(system_databases), 1):
-                print(f"   {i:2d}. {sys_db}")
-            print("")
-        
-        return user_databases
+        return self.user_namespaces(self.get_databases())
+
+    def list_namespaces(self) -> List[str]:
+        return self.get_user_databases()
 
     def preview_all_databases(self) -> List[Dict]:
         """모든 데이터베이스 구조 분석 및 처리 비용 예측"""
-        if not self.connect():
-            return []
-
-        try:
-            user_databases = self.get_user_databases()
-
-            print(f"🎯 발견된 사용자 데이터베이스: {len(user_databases)}개")
-            print(f"⚡ 분석 엔진: Polars")
-            print(f"📊 샘플링 설정: 테이블당 최대 {self.sample_size}건")
-            print("=" * 60)
-
-            all_analyses = []
-            total_start_time = datetime.now()
-
-            for i, database in enumerate(user_databases, 1):
-                print(f"\n[{i}/{len(user_databases)}] 데이터베이스 구조 분석 중...")
-
-                analysis_start_time = datetime.now()
-                analysis = self.analyze_database_structure(database)
-                analysis_end_time = datetime.now()
-
-                analysis['analysis_duration'] = str(analysis_end_time - analysis_start_time)
-                all_analyses.append(analysis)
-
-                print(self.generate_structure_report(analysis))
-                print(f"⏱️  분석 시간: {analysis_end_time - analysis_start_time}")
-                print("\n" + "=" * 80 + "\n")
-
-            total_end_time = datetime.now()
-            self.generate_total_preview_summary(all_analyses, total_end_time - total_start_time)
-
-            return all_analyses
-
-        finally:
-            self.disconnect()
+        return self.preview_all()
 
-    def scan_all_databases(self) -> List[Dict]:
+    def scan_all_databases(self, changed_since: Optional[datetime] = None) -> List[Dict]:
         """모든 데이터베이스 스캔 (실제 개인정보 탐지)"""
-        if not self.connect():
-            return []
-
-        try:
-            user_databases = self.get_user_databases()
-
-            print(f"🎯 발견된 사용자 데이터베이스: {len(user_databases)}개")
-            print(f"⚡ 처리 엔진: Polars")
-            print(f"📊 샘플링: 테이블당 최대 {self.sample_size}건")
-            print("=" * 60)
-
-            all_results = []
-            total_start_time = datetime.now()
-
-            for i, database in enumerate(user_databases, 1):
-                print(f"\n[{i}/{len(user_databases)}] 데이터베이스 처리 중...")
-
-                db_start_time = datetime.now()
-                result = self.scan_database(database)
-                db_end_time = datetime.now()
-
-                result['processing_time'] = str(db_end_time - db_start_time)
-                all_results.append(result)
-
-                print(self.generate_scan_report(result))
-                print(f"⏱️  처리 시간: {db_end_time - db_start_time}")
-                print("\n" + "=" * 80 + "\n")
-
-            total_end_time = datetime.now()
-            print(f"🎉 전체 스캔 완료! (Polars 엔진)")
-            print(f"⏱️  총 처리 시간: {total_end_time - total_start_time}")
-
-            return all_results
-
-        finally:
-            self.disconnect()
+        return self.scan_all(changed_since)
 
     def scan_all_databases_with_progress(self):
         """진행률 표시와 함께 모든 데이터베이스 스캔"""
@@ -1249,75 +1093,6 @@ class PolarsPrivacyScanner:
         finally:
             self.disconnect()
 
-    def generate_total_preview_summary(self, all_analyses: List[Dict], total_time) -> None:
-        """전체 데이터베이스 예측 요약"""
-        print("🎯 전체 데이터베이스 처리 비용 예측 요약 (Polars)")
-        print("=" * 60)
-
-        total_tables = sum(a.get('summary', {}).get('total_tables', 0) for a in all_analyses)
-        total_rows = sum(a.get('summary', {}).get('total_rows', 0) for a in all_analyses)
-        total_columns = sum(a.get('summary', {}).get('total_columns', 0) for a in all_analyses)
-        total_mb = sum(a.get('summary', {}).get('estimated_total_mb', 0) for a in all_analyses)
-        total_scan_time = sum(a.get('summary', {}).get('estimated_total_scan_time_sec', 0) for a in all_analyses)
-        scannable_tables = sum(a.get('summary', {}).get('scannable_tables', 0) for a in all_analyses)
-        large_tables = sum(a.get('summary', {}).get('large_tables', 0) for a in all_analyses)
-
-        print(f"📊 전체 규모:")
-        print(f"  • 데이터베이스 수: {len(all_analyses)}개")
-        print(f"  • 총 테이블 수: {total_tables:,}개")
-        print(f"  • 스캔 가능한 테이블: {scannable_tables:,}개")
-        print(f"  • 대용량 테이블 (100만행+): {large_tables:,}개")
-        print(f"  • 총 데이터 행 수: {total_rows:,}행")
-        print(f"  • 총 컬럼 수: {total_columns:,}개")
-
-        print(f"\n💾 예상 처리 비용 (Polars 엔진):")
-        print(f"  • 예상 총 메모리 사용량: {total_mb:.1f} MB")
-        print(f"  • 예상 총 스캔 시간: {total_scan_time:.1f}초")
-
-        if total_scan_time > 60:
-            minutes = int(total_scan_time // 60)
-            seconds = int(total_scan_time % 60)
-            print(f"    → {minutes}분 {seconds}초")
-
-        print(f"\n🚦 처리 위험도 평가:")
-
-        memory_risk = "🟢 낮음" if total_mb < 100 else "🟡 보통" if total_mb < 500 else "🔴 높음"
-        time_risk = "🟢 빠름" if total_scan_time < 60 else "🟡 보통" if total_scan_time < 600 else "🔴 오래 걸림"
-
-        print(f"  • 메모리 위험도: {memory_risk} ({total_mb:.1f} MB)")
-        print(f"  • 시간 위험도: {time_risk} ({total_scan_time:.1f}초)")
-
-        if large_tables > 20:
-            print(f"  • 대용량 테이블 위험도: 🔴 높음 ({large_tables}개)")
-        elif large_tables > 5:
-            print(f"  • 대용량 테이블 위험도: 🟡 보통 ({large_tables}개)")
-        else:
-            print(f"  • 대용량 테이블 위험도: 🟢 낮음 ({large_tables}개)")
-
-        print(f"\n⏱️  전체 분석 시간: {total_time}")
-        print(f"🚀 Polars 엔진으로 최적화된 처리 준비 완료!")
-
-        print(f"\n💡 스캔 실행 권장사항:")
-
-        if total_mb > 1000:
-            print(f"  ⚠️  메모리 사용량이 높습니다 ({total_mb:.1f}MB)")
-            print(f"     → 샘플 크기를 50으로 줄이거나 데이터베이스별로 분할 실행하세요")
-
-        if total_scan_time > 1800:
-            print(f"  ⚠️  예상 처리 시간이 깁니다 ({total_scan_time / 60:.1f}분)")
-            print(f"     → 대용량 테이블을 제외하거나 배치로 나누어 실행하세요")
-
-        if large_tables > 50:
-            print(f"  ⚠️  대용량 테이블이 많습니다 ({large_tables}개)")
-            print(f"     → 우선순위가 높은 테이블부터 선별적으로 스캔하세요")
-
-        if total_tables > 1000:
-            print(f"  ⚠️  테이블 수가 많습니다 ({total_tables:,}개)")
-            print(f"     → 중요한 데이터베이스부터 단계적으로 스캔하세요")
-
-        print(f"\n✅ 구조 분석 완료! 이제 실제 스캔을 실행할 수 있습니다.")
-        print("=" * 60)
-
 
 # 사용 예시
 if __name__ == "__main__":
@@ -1369,7 +1144,6 @@ if __name__ == "__main__":
 
         # 2단계: 사용자 확인 (자동 진행)
         print("\n⏳ 3초 후 개인정보 스캔을 자동으로 시작합니다...")
-        import time
         time.sleep(3)
 
         # 3단계: 개인정보 스캔 실행
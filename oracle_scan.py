@@ -1,19 +1,73 @@
 import cx_Oracle
 import polars as pl
-import re
 import json
-from typing import Dict, List, Tuple, Any, Optional
+import time
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import warnings
 
+from pattern_registry import PatternRegistry
+from pattern_safety import MAX_VALUE_LENGTH
+from binary_sniff import decode_binary_columns
+from regex_pushdown import ORACLE, build_pushdown_query, parse_pushdown_row, plan_pushdown
+from sample_cache import SampleCache, make_source_id
+from scan_calibration import ScanCalibration
+from sampling import derive_table_seed, select_sample_rows
+from scan_pipeline import TRUNCATION_SEPARATOR, PrivacyScanPipeline
+
 warnings.filterwarnings('ignore')
 
+# SQL 에서 VARCHAR2 는 4000 bytes 까지 - AL32UTF8 최악의 경우(4 bytes/문자) 기준 문자 수
+ORACLE_SQL_MAX_CHARS = 1000
+ORACLE_SQL_MAX_RAW_BYTES = 2000
+
+# 샘플링 설정 (블록 수가 이 이상이면 SAMPLE BLOCK 으로 일부 블록만 읽음)
+ORACLE_BLOCK_SAMPLE_MIN_BLOCKS = 10000
+ORACLE_SAMPLE_OVERSAMPLE = 1.25
+ORACLE_MIN_SAMPLE_PERCENT = 0.000001
+ORACLE_MAX_SAMPLE_PERCENT = 99.999999
+ORACLE_SAMPLE_TOP_UP_PASSES = 2
+# 조회당 최대 행 수 (목표 행 수 배수) - 통계가 실제보다 작아도 한 번에 너무 많이 가져오지 않도록 제한
+ORACLE_SAMPLE_FETCH_FACTOR = 4
+ORACLE_ROWID_ALIAS = '__PII_SCAN_ROWID'
+
+# 사용자 스키마 목록 (시스템 계정 제외)
+USER_SCHEMAS_SQL = """
+                   SELECT DISTINCT OWNER
+                   FROM ALL_TABLES
+                   WHERE OWNER NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DBSNMP', 'APPQOSSYS',
+                                       'WMSYS', 'EXFSYS', 'CTXSYS', 'XDB', 'ANONYMOUS',
+                                       'OLAPSYS', 'MDSYS', 'ORDSYS', 'FLOWS_FILES',
+                                       'APEX_030200', 'APEX_PUBLIC_USER', 'SPATIAL_CSW_ADMIN_USR',
+                                       'SPATIAL_WFS_ADMIN_USR', 'PUBLIC')
+                   ORDER BY OWNER
+                   """
+
+
+class OraclePrivacyScanner(PrivacyScanPipeline):
+    source_name = 'Oracle'
+    engine_name = 'Oracle + Polars'
+    namespace_key = 'schema'
+    namespace_label = '스키마'
+
+    # Oracle 은 MySQL 보다 조회가 약간 느림
+    scan_speed = {
+        'base_rows_per_sec': 45000,
+        'query_rows_per_sec': 800000,
+        'query_min_sec': 0.2,
+        'frame_mb_per_sec': 80
+    }
 
-class OraclePrivacyScanner:
     def __init__(self, host: str, port: int, service_name: str, user: str, password: str,
-                 sample_size: int = 100):
+                 sample_size: int = 100, pattern_registry: Optional[PatternRegistry] = None,
+                 sample_cache: Optional[SampleCache] = None,
+                 parallel_columns: bool = True, projection_pushdown: bool = True,
+                 max_value_length: int = MAX_VALUE_LENGTH, tail_length: int = 0,
+                 sample_seed: Optional[int] = None, partition_sampling: bool = True,
+                 partition_workers: int = 4, prefetch_tables: int = 2, regexp_pushdown: bool = False,
+                 calibration: Optional[ScanCalibration] = None):
         """
-        Oracle 기반 개인정보 스캐너
+        Oracle 기반 개인정보 스캐너 (Oracle 소스 어댑터, 탐지/점수/리포트는 PrivacyScanPipeline)
 
         Args:
             host: Oracle 서버 호스트
@@ -22,29 +76,37 @@ class OraclePrivacyScanner:
             user: 사용자명
             password: 비밀번호
             sample_size: 샘플링할 행 수
+            pattern_registry: 개인정보 패턴 레지스트리 (기본값: 공유 레지스트리)
+            sample_cache: 샘플 캐시 (지정 시 스캔한 샘플을 저장해 재평가에 사용)
+            parallel_columns: 테이블 내 문자열 컬럼을 Polars 표현식으로 병렬 스캔 (False 이면 컬럼별 순차 스캔)
+            projection_pushdown: 문자열 타입 / 의심스러운 이름의 컬럼만 조회 (False 이면 SELECT *)
+            max_value_length: 값당 최대 조회 길이 (문자 수, SQL 에서 잘라서 전송 / 0 이면 제한 없음)
+            tail_length: 잘린 값에서 앞부분 대신 끝부분으로 채울 길이 (0 이면 앞부분만)
+            sample_seed: 스캔 시드 (같은 시드로 다시 스캔하면 변경되지 않은 테이블은 같은 표본, 기본값: 무작위)
+            partition_sampling: 파티션 테이블은 파티션별로 행 수에 비례해 샘플링 (최근 파티션 누락 방지)
+            partition_workers: 파티션 동시 조회 연결 수 (1 이면 기존 연결로 순차 조회)
+            prefetch_tables: 분석 중에 미리 조회해 둘 테이블 샘플 수 (0 이면 조회와 분석을 순차 실행)
+            regexp_pushdown: 변환 가능한 패턴은 DB 에서 전체 테이블 일치 횟수를 집계 (REGEXP_COUNT, 나머지 패턴은 샘플만)
+            calibration: 스캔 보정 (지정 시 테이블별 단계 소요 시간을 기록하고 시간 예측에 사용)
         """
+        super().__init__(
+            sample_size=sample_size, pattern_registry=pattern_registry, sample_cache=sample_cache,
+            cache_source=make_source_id('oracle', host, port, service_name),
+            parallel_columns=parallel_columns, projection_pushdown=projection_pushdown,
+            max_value_length=max_value_length, tail_length=tail_length, sample_seed=sample_seed,
+            partition_sampling=partition_sampling, partition_workers=partition_workers,
+            prefetch_tables=prefetch_tables, regexp_pushdown=regexp_pushdown, calibration=calibration
+        )
         self.host = host
         self.port = port
         self.service_name = service_name
         self.user = user
         self.password = password
-        self.connection = None
-        self.sample_size = sample_size
 
         # Oracle 연결 문자열 생성
         self.dsn = cx_Oracle.makedsn(host, port, service_name=service_name)
 
-        # 개인정보 패턴 정의 - 한국 형식으로 업데이트
-        self.privacy_patterns = {
-            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'phone': r'(\d{2,3}-\d{3,4}-\d{4}|\d{10,11})',
-            'ssn': r'\d{6}-[1-4]\d{6}',  # 한국 주민등록번호 형식
-            'card_number': r'5327-\d{4}-\d{4}-\d{4}',  # 5327로 시작하는 16자리 카드번호
-            'account_number': r'1000-\d{8}',  # 1000으로 시작하는 12자리 계좌번호
-            'ip_address': r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b',
-        }
-
-        # 개인정보 관련 컬럼명 키워드
+        # 개인정보 관련 컬럼명 키워드 (한글 컬럼명, 사번 추가)
         self.privacy_keywords = [
             'name', 'email', 'phone', 'mobile', 'tel', 'address', 'addr',
             'ssn', 'social', 'birth', 'birthday', 'card', 'account',
@@ -52,21 +114,30 @@ class OraclePrivacyScanner:
             'user_id', 'customer', '고객', 'personal', '개인', 'emp_id', 'employee'
         ]
 
+        # 패턴 스캔 대상 컬럼 타입 (ALL_TAB_COLUMNS 기준, 나머지 타입은 이름이 의심스러운 경우만 조회)
+        self.scannable_types = {
+            'CHAR', 'NCHAR', 'VARCHAR', 'VARCHAR2', 'NVARCHAR2', 'CLOB', 'NCLOB', 'LONG', 'JSON'
+        }
+
         print(f"🔮 Oracle 기반 개인정보 스캐너 초기화")
         print(f"   Host: {host}:{port}")
         print(f"   Service: {service_name}")
         print(f"   User: {user}")
         print(f"   샘플 크기: {sample_size}건")
 
+    def open_connection(self):
+        """새 Oracle 연결 (파티션 병렬 샘플링용 추가 연결에도 사용)"""
+        return cx_Oracle.connect(
+            user=self.user,
+            password=self.password,
+            dsn=self.dsn,
+            encoding="UTF-8"
+        )
+
     def connect(self):
         """Oracle 연결"""
         try:
-            self.connection = cx_Oracle.connect(
-                user=self.user,
-                password=self.password,
-                dsn=self.dsn,
-                encoding="UTF-8"
-            )
+            self.connection = self.open_connection()
             print(f"✅ Oracle 연결 성공: {self.host}:{self.port}/{self.service_name}")
             return True
         except cx_Oracle.Error as err:
@@ -84,16 +155,7 @@ class OraclePrivacyScanner:
         cursor = self.connection.cursor()
 
         # 현재 사용자가 접근 가능한 스키마 조회
-        cursor.execute("""
-                       SELECT DISTINCT OWNER
-                       FROM ALL_TABLES
-                       WHERE OWNER NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DBSNMP', 'APPQOSSYS',
-                                           'WMSYS', 'EXFSYS', 'CTXSYS', 'XDB', 'ANONYMOUS',
-                                           'OLAPSYS', 'MDSYS', 'ORDSYS', 'FLOWS_FILES',
-                                           'APEX_030200', 'APEX_PUBLIC_USER', 'SPATIAL_CSW_ADMIN_USR',
-                                           'SPATIAL_WFS_ADMIN_USR', 'PUBLIC')
-                       ORDER BY OWNER
-                       """)
+        cursor.execute(USER_SCHEMAS_SQL)
 
         schemas = [row[0] for row in cursor.fetchall()]
         cursor.close()
@@ -114,6 +176,32 @@ class OraclePrivacyScanner:
         cursor.close()
         return tables
 
+    def get_changed_tables(self, schema: str, since: datetime) -> List[str]:
+        """since 이후 변경된 테이블 목록 조회 (증분 스캔용)"""
+        cursor = self.connection.cursor()
+
+        # DML 변경(ALL_TAB_MODIFICATIONS), DDL 변경(LAST_DDL_TIME), 통계 수집 이후 변경 여부를 함께 확인
+        # 통계가 한 번도 수집되지 않은 테이블은 변경 여부를 알 수 없으므로 포함
+        cursor.execute("""
+                       SELECT t.TABLE_NAME
+                       FROM ALL_TABLES t
+                                JOIN ALL_OBJECTS o
+                                     ON o.OWNER = t.OWNER AND o.OBJECT_NAME = t.TABLE_NAME
+                                         AND o.OBJECT_TYPE = 'TABLE'
+                                LEFT JOIN ALL_TAB_MODIFICATIONS m
+                                          ON m.TABLE_OWNER = t.OWNER AND m.TABLE_NAME = t.TABLE_NAME
+                                              AND m.PARTITION_NAME IS NULL
+                       WHERE t.OWNER = :schema
+                         AND (m.TIMESTAMP >= :since
+                           OR o.LAST_DDL_TIME >= :since
+                           OR t.LAST_ANALYZED IS NULL
+                           OR t.LAST_ANALYZED >= :since)
+                       """, schema=schema, since=since)
+
+        tables = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        return tables
+
     def get_table_info(self, schema: str, table: str) -> Dict:
         """테이블 정보 조회 (행 수, 컬럼 정보)"""
         cursor = self.connection.cursor()
@@ -203,32 +291,6 @@ class OraclePrivacyScanner:
             'sample_rows': sample_rows
         }
 
-    def estimate_scan_time(self, total_rows: int, columns: int, text_columns: int,
-                           estimated_mb: float, sample_rows: int) -> Dict:
-        """스캔 시간 예측 (Oracle + Polars 기준)"""
-        base_speed_rows_per_sec = 45000  # Oracle은 MySQL보다 약간 느림
-        regex_speed_factor = 0.3
-        text_factor = 1 + (text_columns * 0.1)
-
-        effective_speed = base_speed_rows_per_sec * regex_speed_factor / text_factor
-
-        # Oracle 쿼리는 MySQL보다 약간 느림
-        db_query_time = max(0.2, total_rows / 800000)
-        dataframe_creation_time = max(0.05, estimated_mb / 80)
-        pattern_scan_time = sample_rows / effective_speed
-
-        total_estimated_seconds = db_query_time + dataframe_creation_time + pattern_scan_time
-
-        return {
-            'engine': 'Oracle + Polars',
-            'db_query_time_sec': round(db_query_time, 2),
-            'dataframe_creation_time_sec': round(dataframe_creation_time, 2),
-            'pattern_scan_time_sec': round(pattern_scan_time, 2),
-            'total_estimated_sec': round(total_estimated_seconds, 2),
-            'estimated_rows_per_sec': int(effective_speed),
-            'text_columns_factor': round(text_factor, 2)
-        }
-
     def load_table_sample(self, schema: str, table: str) -> Tuple[Optional[pl.DataFrame], Dict]:
         """테이블에서 샘플 데이터를 Polars DataFrame으로 로드"""
         cursor = self.connection.cursor()
@@ -240,58 +302,64 @@ class OraclePrivacyScanner:
             print(f"    ⚠️  빈 테이블")
             return None, {'method': 'empty', 'total_rows': 0, 'sampled_rows': 0}
 
-        # Oracle 샘플링 쿼리
-        if total_rows <= self.sample_size:
-            query = f"SELECT * FROM {schema}.{table}"
-            sample_method = "전체 데이터"
-        else:
-            # Oracle의 SAMPLE 사용 (더 효율적)
-            sample_percent = min(50, (self.sample_size / total_rows) * 100 * 2)  # 약간 여유있게
-            query = f"""
-                SELECT * FROM (
-                    SELECT * FROM {schema}.{table} SAMPLE({sample_percent:.2f})
-                    ORDER BY DBMS_RANDOM.VALUE
-                ) WHERE ROWNUM <= {self.sample_size}
-            """
-            sample_method = f"Oracle SAMPLE ({sample_percent:.1f}%)"
+        selected, skipped_columns = table_info['columns'], []
+        if self.projection_pushdown:
+            selected, skipped_columns = self.select_scan_columns(table_info['columns'])
+            if not selected:
+                print(f"    ⏭️  스캔 대상 컬럼 없음 (문자열 타입/의심 컬럼명 없음)")
+                return None, {'method': 'no_scannable_columns', 'total_rows': total_rows, 'sampled_rows': 0,
+                              'skipped_columns': skipped_columns}
+
+        # 긴 텍스트는 서버에서 잘라서 전송 (앞부분 + 선택적으로 뒷부분)
+        expressions = [(col['name'], self.column_expression(col)) for col in selected]
+        select_list = ', '.join(expr for _, expr in expressions) or '*'
+        truncated_columns = [name for name, expr in expressions if expr != self.quote_identifier(name)]
+
+        self._prepare_cursor(cursor)
+
+        partitions = []
+        if self.partition_sampling and total_rows > self.sample_size:
+            partitions = self.get_partitions(schema, table)
 
         try:
-            cursor.execute(query)
-            rows = cursor.fetchall()
+            partition_details = None
+            if len(partitions) > 1:
+                rows, columns, partition_details = self._sample_partitions(schema, table, select_list, partitions)
+                sample_method = f"Oracle 파티션 샘플링 ({len(partition_details)}개 파티션)"
+                sample_details = None
+            else:
+                rows, columns, sample_method, sample_details = self._fetch_sample(
+                    cursor, schema, table, select_list, total_rows
+                )
 
             if not rows:
                 return None, {'method': 'no_data', 'total_rows': total_rows, 'sampled_rows': 0}
 
-            # 컬럼명 추출
-            columns = [desc[0] for desc in cursor.description]
-
-            # Oracle의 None을 처리하여 Polars DataFrame 생성
-            processed_rows = []
-            for row in rows:
-                processed_row = []
-                for value in row:
-                    if value is None:
-                        processed_row.append(None)
-                    elif isinstance(value, cx_Oracle.LOB):
-                        # CLOB/BLOB 처리
-                        try:
-                            processed_row.append(value.read())
-                        except:
-                            processed_row.append(str(value))
-                    else:
-                        processed_row.append(value)
-                processed_rows.append(processed_row)
-
-            df = pl.DataFrame(processed_rows, schema=columns)
+            with self.stage('frame'):
+                df, binary_columns = self.build_sample_frame(rows, columns, truncated_columns)
 
             sampling_info = {
                 'method': sample_method,
                 'total_rows': total_rows,
-                'sampled_rows': len(processed_rows),
-                'sampling_ratio': len(processed_rows) / total_rows if total_rows > 0 else 0
+                'sampled_rows': len(rows),
+                'sampling_ratio': len(rows) / total_rows if total_rows > 0 else 0,
+                'skipped_columns': skipped_columns,
+                'truncated_columns': truncated_columns,
+                'max_value_length': self.max_value_length,
+                'sample_seed': self.sample_seed,
+                'table_seed': derive_table_seed(self.sample_seed, schema, table)
             }
+            if sample_details:
+                sampling_info['sample_details'] = sample_details
+            if partition_details:
+                sampling_info['partitions'] = partition_details
+            if binary_columns:
+                sampling_info['binary_columns'] = binary_columns
 
-            print(f"    📊 {total_rows:,}행 → {len(processed_rows)}행 샘플링 ({sample_method})")
+            print(f"    📊 {total_rows:,}행 → {len(rows)}행 샘플링 ({sample_method})")
+
+            if self.regexp_pushdown:
+                sampling_info['pushdown'] = self.count_patterns_in_db(schema, table, selected)
 
             return df, sampling_info
 
@@ -301,279 +369,275 @@ class OraclePrivacyScanner:
         finally:
             cursor.close()
 
-    def is_privacy_column(self, column_name: str) -> bool:
-        """컬럼명이 개인정보 관련 컬럼인지 확인"""
-        column_lower = column_name.lower()
-        return any(keyword in column_lower for keyword in self.privacy_keywords)
+    def build_sample_frame(self, rows: List[tuple], columns: List[str],
+                           truncated_columns: List[str]) -> Tuple[pl.DataFrame, Dict[str, Dict[str, int]]]:
+        """조회한 행으로 샘플 DataFrame 생성 (BLOB 디코딩 + 최대 길이 적용)"""
+        # LOB 은 출력 타입 핸들러로 이미 문자열/바이트로 받았으므로 셀 단위 변환 없이 생성
+        df = pl.DataFrame(rows, schema=columns, orient='row', infer_schema_length=None)
 
-    def scan_column_patterns(self, df: pl.DataFrame, column: str) -> Dict:
-        """Polars DataFrame 컬럼에서 개인정보 패턴 스캔"""
-        if df is None:
-            return {'error': 'DataFrame is None'}
+        # BLOB 앞부분: 파일 형식이면 제외, 텍스트로 보이면 디코딩
+        df, binary_columns = decode_binary_columns(df)
 
-        try:
-            if column not in df.columns:
-                return {'error': f'Column {column} not found'}
-
-            # null이 아닌 데이터만 추출하고 문자열로 변환
-            col_data = df.select(pl.col(column).filter(pl.col(column).is_not_null())).to_series()
-            values = [str(val) for val in col_data.to_list() if val is not None]
-
-            if not values:
-                return {'privacy_matches': {}, 'total_values': 0, 'privacy_count': 0, 'privacy_ratio': 0}
-
-            privacy_matches = {}
-            privacy_rows = set()
-
-            for idx, value in enumerate(values):
-                for pattern_name, pattern in self.privacy_patterns.items():
-                    matches = re.findall(pattern, value)
-                    if matches:
-                        if pattern_name not in privacy_matches:
-                            privacy_matches[pattern_name] = 0
-                        privacy_matches[pattern_name] += len(matches)
-                        privacy_rows.add(idx)
-
-            total_values = len(values)
-            privacy_count = len(privacy_rows)
-            privacy_ratio = privacy_count / total_values if total_values > 0 else 0
-
-            return {
-                'privacy_matches': privacy_matches,
-                'total_values': total_values,
-                'privacy_count': privacy_count,
-                'privacy_ratio': privacy_ratio,
-                'sample_values': self.mask_sample_data(values[:5])
-            }
+        # SQL 에서 자르지 못한 값(LONG 등)도 최대 길이로 제한
+        if self.max_value_length:
+            uncapped = [name for name, dtype in df.schema.items()
+                        if dtype == pl.Utf8 and name not in truncated_columns]
+            df = df.with_columns([pl.col(name).str.slice(0, self.max_value_length) for name in uncapped])
 
-        except Exception as e:
-            return {'error': str(e)}
-
-    def mask_sample_data(self, values: List[str]) -> List[str]:
-        """샘플 데이터 마스킹"""
-        masked = []
-        for value in values:
-            value = re.sub(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-                           lambda m: f"{m.group(1)[:2]}***@{m.group(2)}", value)
-            value = re.sub(r'(\d{2,3})-(\d{3,4})-(\d{4})', r'\1-***-\3', value)
-            value = re.sub(r'(\d{6})-([1-4])(\d{6})', r'\1-\2******', value)
-            value = re.sub(r'(\d{4})-(\d{4})-(\d{4})-(\d{4})', r'\1-****-****-\4', value)
-
-            masked.append(value[:50] + "..." if len(value) > 50 else value)
-
-        return masked
-
-    def analyze_dataframe(self, df: pl.DataFrame, schema: str, table_name: str, sampling_info: Dict) -> Dict:
-        """Polars DataFrame 전체 분석"""
-        if df is None:
-            return {
-                'schema': schema,
-                'table': table_name,
-                'sampling_info': sampling_info,
-                'columns': {},
-                'privacy_score': 0,
-                'risk_level': 'EMPTY' if sampling_info.get('total_rows', 0) == 0 else 'ERROR'
-            }
-
-        print(f"    🔍 DataFrame 분석 중... (Polars)")
-
-        result = {
-            'schema': schema,
-            'table': table_name,
-            'sampling_info': sampling_info,
-            'columns': {},
-            'privacy_score': 0,
-            'risk_level': 'LOW'
-        }
-
-        for column in df.columns:
-            column_name = str(column)
-            col_type = str(df[column].dtype)
-            is_suspicious = self.is_privacy_column(column_name)
-
-            column_result = {
-                'type': col_type,
-                'suspicious_name': is_suspicious,
-                'pattern_scan': None
-            }
+        return df, binary_columns
 
-            if any(t in col_type.lower() for t in ['string', 'utf8', 'str']):
-                pattern_result = self.scan_column_patterns(df, column_name)
-                column_result['pattern_scan'] = pattern_result
+    def is_scannable_type(self, col: Dict) -> bool:
+        return col['type'].split('(')[0].strip().upper() in self.scannable_types
 
-                if 'privacy_matches' in pattern_result and pattern_result['privacy_matches']:
-                    pattern_score = len(pattern_result['privacy_matches']) * 3
-                    ratio_score = int(pattern_result.get('privacy_ratio', 0) * 10)
-                    column_score = pattern_score + ratio_score
-                    result['privacy_score'] += column_score
+    @staticmethod
+    def quote_identifier(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
 
-                    print(f"      🚨 {column_name}: {list(pattern_result['privacy_matches'].keys())} "
-                          f"(비율: {pattern_result.get('privacy_ratio', 0):.1%})")
-
-                elif is_suspicious:
-                    result['privacy_score'] += 1
-                    print(f"      ⚠️  {column_name}: 의심스러운 컬럼명")
-
-            result['columns'][column_name] = column_result
+    def get_table_stats(self, schema: str, table: str) -> Dict:
+        """옵티마이저 통계 (NUM_ROWS, BLOCKS) - 수집되지 않았으면 None"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                           SELECT NUM_ROWS, BLOCKS
+                           FROM ALL_TABLES
+                           WHERE OWNER = :schema
+                             AND TABLE_NAME = :table
+                           """, schema=schema, table=table)
+            row = cursor.fetchone()
+        except Exception as e:
+            print(f"    ⚠️  테이블 통계 조회 실패: {str(e)}")
+            row = None
+        finally:
+            cursor.close()
 
-        if result['privacy_score'] >= 15:
-            result['risk_level'] = 'HIGH'
-        elif result['privacy_score'] >= 5:
-            result['risk_level'] = 'MEDIUM'
+        return {
+            'num_rows': row[0] if row else None,
+            'blocks': row[1] if row else None
+        }
 
-        return result
+    def _fetch_sample(self, cursor, schema: str, table: str, select_list: str, total_rows: int,
+                      partition: Optional[Dict] = None,
+                      target: Optional[int] = None) -> Tuple[List[tuple], List[str], str, Optional[Dict]]:
+        """
+        샘플 행 조회 (정렬 없이 SAMPLE ... SEED)
 
-    def scan_table(self, schema: str, table: str) -> Dict:
-        """테이블 스캔 (Oracle + Polars 기반)"""
-        print(f"  📋 테이블 스캔: {schema}.{table}")
+        큰 세그먼트는 SAMPLE BLOCK 으로 일부 블록만 읽고, 나머지는 행 단위 SAMPLE 을 사용합니다.
+        비율은 넉넉하게 잡고, 목표를 넘은 행은 FETCH FIRST 대신 시드 기반으로 골라 냅니다.
+        (FETCH FIRST 로 자르면 물리적으로 뒤쪽 블록 - 보통 최근 행 - 이 빠짐)
+        목표 행 수에 못 미치면 비율을 늘려 다른 SEED 로 추가 조회하고 ROWID 로 중복을 제거합니다.
+        partition 을 지정하면 PARTITION 절로 해당 파티션만 읽고 파티션 통계로 비율을 계산합니다.
+        """
+        target = target or self.sample_size
+        if partition is None and total_rows <= target:
+            cursor.execute(f"SELECT {select_list} FROM {schema}.{table}")
+            rows = self.fetch_rows(cursor)
+            return rows, [desc[0] for desc in cursor.description], "전체 데이터", None
+
+        if partition is None:
+            stats = self.get_table_stats(schema, table)
+            source = f"{schema}.{table}"
+        else:
+            stats = {'num_rows': partition['rows'], 'blocks': partition['blocks']}
+            source = f"{schema}.{table} PARTITION ({self.quote_identifier(partition['name'])})"
+        use_block, percent = self.sample_plan(stats, total_rows, target)
+        sample_clause = 'SAMPLE BLOCK' if use_block else 'SAMPLE'
+
+        projection = 't.*' if select_list == '*' else select_list
+        sampled: Dict[str, tuple] = {}
+        seeds = []
+        columns: List[str] = []
+
+        for attempt in range(1 + ORACLE_SAMPLE_TOP_UP_PASSES):
+            # 첫 조회는 테이블 시드, 보충 조회는 회차별 파생 시드 (재실행해도 같은 순서)
+            salts = [] if partition is None else [f"partition:{partition['name']}"]
+            if attempt:
+                salts.append(str(attempt))
+            seed = derive_table_seed(self.sample_seed, schema, table, salt=':'.join(salts) or None)
+            seeds.append(seed)
+
+            cursor.execute(f"""
+                SELECT ROWIDTOCHAR(t.ROWID) AS "{ORACLE_ROWID_ALIAS}", {projection}
+                FROM {source} {sample_clause} ({percent:.6f}) SEED ({seed}) t
+                FETCH FIRST {target * ORACLE_SAMPLE_FETCH_FACTOR} ROWS ONLY
+            """)
+            for row in self.fetch_rows(cursor):
+                sampled.setdefault(row[0], row[1:])
+            columns = [desc[0] for desc in cursor.description][1:]
+
+            if len(sampled) >= target or percent >= ORACLE_MAX_SAMPLE_PERCENT:
+                break
+
+            # 목표에 못 미치면 비율을 늘려 추가 조회
+            label = f" {partition['name']}" if partition is not None else ""
+            print(f"    🔁 샘플 부족{label} ({len(sampled)}/{target}행) - 추가 조회")
+            percent = min(ORACLE_MAX_SAMPLE_PERCENT, percent * 2)
+
+        sample_details = {
+            'strategy': 'block' if use_block else 'row',
+            'percent': round(percent, 6),
+            'seeds': seeds,
+            'passes': len(seeds),
+            'num_rows_stat': stats['num_rows'],
+            'blocks_stat': stats['blocks']
+        }
+        sample_method = f"Oracle {sample_clause} ({percent:.4g}%)"
+        rows = select_sample_rows(list(sampled.values()), target, seeds[0])
+        return rows, columns, sample_method, sample_details
+
+    @staticmethod
+    def sample_plan(stats: Dict, total_rows: int, target: int) -> Tuple[bool, float]:
+        """SAMPLE BLOCK 사용 여부와 첫 조회 샘플 비율(%) - 통계가 없으면 COUNT 결과 기준"""
+        num_rows = stats['num_rows'] or total_rows
+        use_block = (stats['blocks'] or 0) >= ORACLE_BLOCK_SAMPLE_MIN_BLOCKS
+        percent = target / max(num_rows, 1) * 100 * ORACLE_SAMPLE_OVERSAMPLE
+        return use_block, min(ORACLE_MAX_SAMPLE_PERCENT, max(ORACLE_MIN_SAMPLE_PERCENT, percent))
+
+    def _prepare_cursor(self, cursor):
+        """LOB 을 행마다 따로 읽지 않도록 문자열/바이트로 한 번에 가져오고, 샘플 전체를 적은 왕복으로 fetch"""
+        cursor.outputtypehandler = self._output_type_handler
+        cursor.arraysize = min(max(self.sample_size, 100), 5000)
+        cursor.prefetchrows = cursor.arraysize + 1
+
+    def count_patterns_in_db(self, schema: str, table: str, columns: List[Dict]) -> Dict:
+        """
+        전체 테이블 패턴 집계 (REGEXP_COUNT / REGEXP_LIKE 를 서버에서 실행해 집계 행 하나로 반환)
 
-        df, sampling_info = self.load_table_sample(schema, table)
-        result = self.analyze_dataframe(df, schema, table, sampling_info)
+        패턴별 개수는 일치 횟수입니다. \\b, 전후방 탐색 등 Oracle 정규식으로 변환할 수 없는 패턴은
+        fallback_patterns 에 사유와 함께 기록하고 샘플 스캔 결과만 사용합니다. (LONG/JSON 컬럼은 제외)
+        """
+        pattern_set = self.pattern_registry.compiled()
+        translated, fallback = plan_pushdown(pattern_set, ORACLE)
+        string_columns = [
+            col['name'] for col in columns
+            if self.is_scannable_type(col) and col['type'].split('(')[0].strip().upper() not in ('LONG', 'JSON')
+        ]
+        summary = {
+            'pattern_version': pattern_set.version,
+            'patterns': [key for key, _ in translated],
+            'fallback_patterns': fallback,
+            'count_unit': 'matches',
+            'columns': {}
+        }
+        if not translated or not string_columns:
+            return summary
 
-        print(f"    ✅ 완료 (위험도: {result['risk_level']}, 점수: {result['privacy_score']})")
+        query, params = build_pushdown_query(
+            ORACLE, f"{schema}.{table}", [self.quote_identifier(name) for name in string_columns], translated
+        )
 
-        return result
+        started = time.perf_counter()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+        except cx_Oracle.Error as err:
+            print(f"    ⚠️  전체 테이블 집계 실패 (샘플 결과만 사용): {err}")
+            summary['error'] = str(err)
+            return summary
+        finally:
+            cursor.close()
 
-    def analyze_schema_structure(self, schema: str) -> Dict:
-        """스키마 구조 분석 및 처리 비용 예측"""
-        print(f"🔍 스키마 구조 분석 중: {schema}")
-
-        analysis = {
-            'schema': schema,
-            'analysis_time': datetime.now().isoformat(),
-            'engine': 'Oracle + Polars',
-            'sample_size': self.sample_size,
-            'tables': {},
-            'summary': {
-                'total_tables': 0,
-                'total_rows': 0,
-                'total_columns': 0,
-                'total_text_columns': 0,
-                'estimated_total_mb': 0,
-                'estimated_total_scan_time_sec': 0,
-                'scannable_tables': 0,
-                'empty_tables': 0,
-                'large_tables': 0
-            }
-        }
+        summary['elapsed_sec'] = round(time.perf_counter() - started, 3)
+        summary['columns'] = parse_pushdown_row(ORACLE, row, string_columns, translated)
+        print(f"    🧮 전체 테이블 집계: {len(string_columns)}개 컬럼 × {len(translated)}개 패턴 "
+              f"({summary['elapsed_sec']:.2f}s)")
+        return summary
 
+    def get_partitions(self, schema: str, table: str) -> List[Dict]:
+        """파티션 목록 (파티션 순서, NUM_ROWS/BLOCKS 는 통계 - 수집되지 않았으면 None)"""
+        cursor = self.connection.cursor()
         try:
-            tables = self.get_tables(schema)
-            analysis['summary']['total_tables'] = len(tables)
-
-            print(f"  📊 발견된 테이블: {len(tables)}개")
-
-            for table in tables:
-                print(f"    📋 분석 중: {table}")
-
-                try:
-                    table_info = self.get_table_info(schema, table)
-                    total_rows = table_info['total_rows']
-                    columns = table_info['columns']
-
-                    sample_rows = min(total_rows, self.sample_size) if total_rows > 0 else 0
-                    size_estimate = self.estimate_dataframe_size(columns, sample_rows)
-                    time_estimate = self.estimate_scan_time(
-                        total_rows,
-                        len(columns),
-                        size_estimate['text_columns'],
-                        size_estimate['estimated_mb'],
-                        sample_rows
-                    )
-
-                    table_analysis = {
-                        'total_rows': total_rows,
-                        'total_columns': len(columns),
-                        'columns': columns,
-                        'size_estimate': size_estimate,
-                        'time_estimate': time_estimate,
-                        'status': 'scannable' if total_rows > 0 else 'empty'
-                    }
-
-                    analysis['tables'][table] = table_analysis
-
-                    analysis['summary']['total_rows'] += total_rows
-                    analysis['summary']['total_columns'] += len(columns)
-                    analysis['summary']['total_text_columns'] += size_estimate['text_columns']
-                    analysis['summary']['estimated_total_mb'] += size_estimate['estimated_mb']
-                    analysis['summary']['estimated_total_scan_time_sec'] += time_estimate['total_estimated_sec']
-
-                    if total_rows == 0:
-                        analysis['summary']['empty_tables'] += 1
-                    else:
-                        analysis['summary']['scannable_tables'] += 1
-
-                    if total_rows >= 1000000:
-                        analysis['summary']['large_tables'] += 1
-
-                    print(f"      ✅ {total_rows:,}행, {len(columns)}컬럼, "
-                          f"~{size_estimate['estimated_mb']}MB, "
-                          f"~{time_estimate['total_estimated_sec']}초")
-
-                except Exception as e:
-                    analysis['tables'][table] = {
-                        'error': str(e),
-                        'status': 'error'
-                    }
-                    print(f"      ❌ 분석 오류: {str(e)}")
-
+            cursor.execute("""
+                           SELECT PARTITION_NAME, NUM_ROWS, BLOCKS
+                           FROM ALL_TAB_PARTITIONS
+                           WHERE TABLE_OWNER = :schema
+                             AND TABLE_NAME = :table
+                           ORDER BY PARTITION_POSITION
+                           """, schema=schema, table=table)
+            return [{'name': row[0], 'rows': row[1], 'blocks': row[2]} for row in cursor.fetchall()]
         except Exception as e:
-            analysis['error'] = str(e)
-            print(f"❌ 스키마 분석 오류: {str(e)}")
-
-        return analysis
-
-    def scan_schema(self, schema: str) -> Dict:
-        """스키마 전체 스캔"""
-        print(f"🔍 스키마 스캔 시작: {schema} (Oracle + Polars 엔진)")
-
-        scan_results = {
-            'schema': schema,
-            'scan_time': datetime.now().isoformat(),
-            'engine': 'Oracle + Polars',
-            'sample_size': self.sample_size,
-            'tables': {},
-            'summary': {
-                'total_tables': 0,
-                'scanned_tables': 0,
-                'high_risk_tables': 0,
-                'medium_risk_tables': 0,
-                'low_risk_tables': 0,
-                'total_privacy_score': 0,
-                'total_data_rows': 0,
-                'total_sampled_rows': 0
-            }
-        }
+            print(f"    ⚠️  파티션 조회 실패: {str(e)}")
+            return []
+        finally:
+            cursor.close()
 
+    def _sample_partition(self, schema: str, table: str, select_list: str, partition: Dict,
+                          target: int) -> Tuple[List[tuple], List[str], Optional[Dict]]:
+        """파티션 하나에서 샘플 조회 (병렬 조회 시 작업마다 별도 연결 사용)"""
+        connection = self.open_connection() if self.partition_workers > 1 else self.connection
         try:
-            tables = self.get_tables(schema)
-            scan_results['summary']['total_tables'] = len(tables)
-
-            for table in tables:
-                table_result = self.scan_table(schema, table)
-                scan_results['tables'][table] = table_result
-
-                risk_level = table_result.get('risk_level', 'LOW')
-                privacy_score = table_result.get('privacy_score', 0)
-                sampling_info = table_result.get('sampling_info', {})
+            cursor = connection.cursor()
+            self._prepare_cursor(cursor)
+            try:
+                rows, columns, _, sample_details = self._fetch_sample(
+                    cursor, schema, table, select_list, partition['rows'] or 0, partition=partition, target=target
+                )
+            finally:
+                cursor.close()
+            return rows, columns, sample_details
+        finally:
+            if connection is not self.connection:
+                connection.close()
+
+    def partition_detail(self, schema: str, table: str, partition: Dict) -> Dict:
+        return {'blocks_stat': partition['blocks']}
+
+    @staticmethod
+    def _output_type_handler(cursor, name, default_type, size, precision, scale):
+        """CLOB/NCLOB 은 문자열, BLOB 은 바이트로 인라인 fetch (LOB 로케이터별 왕복 제거)"""
+        if default_type in (cx_Oracle.DB_TYPE_CLOB, cx_Oracle.DB_TYPE_NCLOB):
+            return cursor.var(cx_Oracle.DB_TYPE_LONG, arraysize=cursor.arraysize)
+        if default_type == cx_Oracle.DB_TYPE_BLOB:
+            return cursor.var(cx_Oracle.DB_TYPE_LONG_RAW, arraysize=cursor.arraysize)
+
+    def column_expression(self, col: Dict) -> str:
+        """샘플 쿼리의 컬럼 표현식 (CLOB 은 DBMS_LOB.SUBSTR, 긴 VARCHAR2 는 SUBSTR 로 서버에서 잘라서 조회)"""
+        name = self.quote_identifier(col['name'])
+        base_type = col['type'].split('(')[0].strip().upper()
+        if base_type == 'BLOB':
+            # BLOB 은 형식 판별/텍스트 여부 확인용 앞부분만 (SQL 에서 RAW 는 2000 bytes 까지)
+            return f"DBMS_LOB.SUBSTR({name}, {ORACLE_SQL_MAX_RAW_BYTES}, 1) AS {name}"
+        if not self.max_value_length:
+            return name
+
+        if base_type in ('CLOB', 'NCLOB'):
+            # SQL 에서 DBMS_LOB.SUBSTR 결과는 VARCHAR2(4000 bytes) 이하여야 함
+            cap = min(self.max_value_length, ORACLE_SQL_MAX_CHARS)
+            tail = min(self.tail_length, cap // 2)
+            if tail:
+                expr = (f"CASE WHEN DBMS_LOB.GETLENGTH({name}) > {cap} "
+                        f"THEN DBMS_LOB.SUBSTR({name}, {cap - tail}, 1) || '{TRUNCATION_SEPARATOR}' || "
+                        f"DBMS_LOB.SUBSTR({name}, {tail}, DBMS_LOB.GETLENGTH({name}) - {tail - 1}) "
+                        f"ELSE DBMS_LOB.SUBSTR({name}, {cap}, 1) END")
+            else:
+                expr = f"DBMS_LOB.SUBSTR({name}, {cap}, 1)"
+        elif base_type in ('VARCHAR', 'VARCHAR2', 'NVARCHAR2') and (col.get('length') or 0) > self.max_value_length:
+            cap = self.max_value_length
+            if self.tail_length:
+                expr = (f"CASE WHEN LENGTH({name}) > {cap} "
+                        f"THEN SUBSTR({name}, 1, {cap - self.tail_length}) || '{TRUNCATION_SEPARATOR}' || "
+                        f"SUBSTR({name}, -{self.tail_length}) "
+                        f"ELSE {name} END")
+            else:
+                expr = f"SUBSTR({name}, 1, {cap})"
+        else:
+            return name
+        return f"{expr} AS {name}"
 
-                if risk_level == 'HIGH':
-                    scan_results['summary']['high_risk_tables'] += 1
-                elif risk_level == 'MEDIUM':
-                    scan_results['summary']['medium_risk_tables'] += 1
-                elif risk_level == 'LOW':
-                    scan_results['summary']['low_risk_tables'] += 1
+    def analyze_table(self, schema: str, table: str, df: Optional[pl.DataFrame], sampling_info: Dict) -> Dict:
+        """테이블 결과 생성 (결과 맨 앞에 스키마명 기록)"""
+        return {'schema': schema, **self.analyze_dataframe(df, table, sampling_info)}
 
-                scan_results['summary']['scanned_tables'] += 1
-                scan_results['summary']['total_privacy_score'] += privacy_score
-                scan_results['summary']['total_data_rows'] += sampling_info.get('total_rows', 0)
-                scan_results['summary']['total_sampled_rows'] += sampling_info.get('sampled_rows', 0)
+    def table_label(self, schema: str, table: str) -> str:
+        return f"{schema}.{table}"
 
-        except Exception as e:
-            scan_results['error'] = str(e)
-            print(f"❌ 스키마 스캔 오류: {str(e)}")
+    def analyze_schema_structure(self, schema: str) -> Dict:
+        """스키마 구조 분석 및 처리 비용 예측"""
+        return self.analyze_structure(schema)
 
-        return scan_results
+    def scan_schema(self, schema: str, changed_since: Optional[datetime] = None) -> Dict:
+        """스키마 전체 스캔 (changed_since 지정 시 이후 변경된 테이블만)"""
+        return self.scan_namespace(schema, changed_since)
 
     def generate_structure_report(self, analysis: Dict) -> str:
         """스키마 구조 분석 리포트 생성"""
@@ -632,123 +696,22 @@ class OraclePrivacyScanner:
 
         return "\n".join(report)
 
-    def generate_scan_report(self, scan_results: Dict) -> str:
-        """스캔 결과 리포트 생성"""
-        report = []
-        report.append("=" * 80)
-        report.append("📊 Oracle 개인정보 스캔 리포트")
-        report.append("=" * 80)
-        report.append(f"스키마: {scan_results['schema']}")
-        report.append(f"스캔 시간: {scan_results['scan_time']}")
-        report.append(f"처리 엔진: Oracle + Polars")
-        report.append(f"샘플 사이즈: {scan_results.get('sample_size', 'Unknown')}건")
-        report.append("")
-
-        summary = scan_results.get('summary', {})
-        total_data_rows = summary.get('total_data_rows', 0)
-        total_sampled_rows = summary.get('total_sampled_rows', 0)
-
-        report.append("📋 스캔 요약:")
-        report.append(f"  • 총 테이블 수: {summary.get('total_tables', 0)}")
-        report.append(f"  • 스캔된 테이블 수: {summary.get('scanned_tables', 0)}")
-        report.append(f"  • 고위험 테이블: {summary.get('high_risk_tables', 0)}개")
-        report.append(f"  • 중간위험 테이블: {summary.get('medium_risk_tables', 0)}개")
-        report.append(f"  • 저위험 테이블: {summary.get('low_risk_tables', 0)}개")
-        report.append(f"  • 총 개인정보 위험도 점수: {summary.get('total_privacy_score', 0)}")
-        report.append(f"  • 전체 데이터 행 수: {total_data_rows:,}")
-        report.append(f"  • 샘플링된 행 수: {total_sampled_rows:,}")
-
-        if total_data_rows > 0:
-            sampling_efficiency = total_sampled_rows / total_data_rows
-            report.append(f"  • 샘플링 효율: {sampling_efficiency:.1%}")
-
-        report.append("")
-
-        # 고위험 테이블 상세 정보
-        high_risk_tables = []
-        for table_name, table_data in scan_results.get('tables', {}).items():
-            if table_data.get('risk_level') == 'HIGH':
-                high_risk_tables.append({
-                    'name': table_name,
-                    'score': table_data.get('privacy_score', 0),
-                    'data': table_data
-                })
-
-        high_risk_tables.sort(key=lambda x: x['score'], reverse=True)
-
-        if high_risk_tables:
-            report.append("🚨 고위험 테이블 상세:")
-            for table_info in high_risk_tables:
-                table_name = table_info['name']
-                table_data = table_info['data']
-                sampling_info = table_data.get('sampling_info', {})
-                schema = table_data.get('schema', 'Unknown')
-
-                report.append(f"  • {schema}.{table_name} (점수: {table_info['score']})")
-                report.append(f"    - 총 행수: {sampling_info.get('total_rows', 0):,}")
-                report.append(f"    - 샘플링: {sampling_info.get('method', 'Unknown')}")
-
-                privacy_columns = []
-                for col_name, col_data in table_data.get('columns', {}).items():
-                    pattern_scan = col_data.get('pattern_scan', {})
-                    if pattern_scan and 'privacy_matches' in pattern_scan and pattern_scan['privacy_matches']:
-                        matches = pattern_scan['privacy_matches']
-                        ratio = pattern_scan.get('privacy_ratio', 0)
-                        match_details = [f"{k}({v})" for k, v in matches.items()]
-                        privacy_columns.append(f"      - {col_name}: {', '.join(match_details)} [비율: {ratio:.1%}]")
-                    elif col_data.get('suspicious_name'):
-                        privacy_columns.append(f"      - {col_name}: 의심스러운 컬럼명")
-
-                if privacy_columns:
-                    report.extend(privacy_columns)
-                report.append("")
-
-        # Oracle 특화 성능 정보
-        report.append("⚡ Oracle 특화 성능 정보:")
-        report.append("  • Oracle SAMPLE 기반 고속 샘플링")
-        report.append("  • CLOB/BLOB 데이터 자동 처리")
-        report.append("  • Polars 벡터화 분석 엔진")
-        report.append("  • 스키마별 독립적 처리")
+    def report_notes(self) -> List[str]:
+        """Oracle 특화 성능 정보"""
+        return [
+            "⚡ Oracle 특화 성능 정보:",
+            "  • Oracle SAMPLE 기반 고속 샘플링",
+            "  • CLOB/BLOB 데이터 자동 처리",
+            "  • Polars 벡터화 분석 엔진",
+            "  • 스키마별 독립적 처리"
+        ]
 
-        return "\n".join(report)
+    def list_namespaces(self) -> List[str]:
+        return self.get_schemas()
 
     def preview_all_schemas(self) -> List[Dict]:
         """모든 스키마 구조 분석 및 처리 비용 예측"""
-        if not self.connect():
-            return []
-
-        try:
-            schemas = self.get_schemas()
-
-            print(f"🎯 발견된 사용자 스키마: {len(schemas)}개")
-            print(f"⚡ 분석 엔진: Oracle + Polars")
-            print(f"📊 샘플링 설정: 테이블당 최대 {self.sample_size}건")
-            print("=" * 60)
-
-            all_analyses = []
-            total_start_time = datetime.now()
-
-            for i, schema in enumerate(schemas, 1):
-                print(f"\n[{i}/{len(schemas)}] 스키마 구조 분석 중...")
-
-                analysis_start_time = datetime.now()
-                analysis = self.analyze_schema_structure(schema)
-                analysis_end_time = datetime.now()
-
-                analysis['analysis_duration'] = str(analysis_end_time - analysis_start_time)
-                all_analyses.append(analysis)
-
-                print(self.generate_structure_report(analysis))
-                print(f"⏱️  분석 시간: {analysis_end_time - analysis_start_time}")
-                print("\n" + "=" * 80 + "\n")
-
-            total_end_time = datetime.now()
-            self.generate_total_preview_summary(all_analyses, total_end_time - total_start_time)
-
-            return all_analyses
-
-        finally:
-            self.disconnect()
+        return self.preview_all()
 
     def generate_total_preview_summary(self, all_analyses: List[Dict], total_time) -> None:
         """전체 스키마 예측 요약"""
@@ -807,45 +770,9 @@ class OraclePrivacyScanner:
         print(f"\n✅ 구조 분석 완료! 이제 실제 스캔을 실행할 수 있습니다.")
         print("=" * 60)
 
-    def scan_all_schemas(self) -> List[Dict]:
+    def scan_all_schemas(self, changed_since: Optional[datetime] = None) -> List[Dict]:
         """모든 스키마 스캔 (실제 개인정보 탐지)"""
-        if not self.connect():
-            return []
-
-        try:
-            schemas = self.get_schemas()
-
-            print(f"🎯 발견된 사용자 스키마: {len(schemas)}개")
-            print(f"⚡ 처리 엔진: Oracle + Polars")
-            print(f"📊 샘플링: 테이블당 최대 {self.sample_size}건")
-            print("=" * 60)
-
-            all_results = []
-            total_start_time = datetime.now()
-
-            for i, schema in enumerate(schemas, 1):
-                print(f"\n[{i}/{len(schemas)}] 스키마 처리 중...")
-
-                schema_start_time = datetime.now()
-                result = self.scan_schema(schema)
-                schema_end_time = datetime.now()
-
-                result['processing_time'] = str(schema_end_time - schema_start_time)
-                all_results.append(result)
-
-                print(self.generate_scan_report(result))
-                print(f"⏱️  처리 시간: {schema_end_time - schema_start_time}")
-                print("\n" + "=" * 80 + "\n")
-
-            total_end_time = datetime.now()
-            print(f"🎉 전체 스캔 완료! (Oracle + Polars 엔진)")
-            print(f"⏱️  총 처리 시간: {total_end_time - total_start_time}")
-
-            return all_results
-
-        finally:
-            self.disconnect()
-
+        return self.scan_all(changed_since)
 
 # 사용 예시
 if __name__ == "__main__":
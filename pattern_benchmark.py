@@ -0,0 +1,172 @@
+import random
+import re
+import string
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from dummy_data_generator import DummyDataGenerator
+from pattern_registry import DEFAULT_PATTERNS
+from pattern_safety import MAX_VALUE_LENGTH, build_stress_corpus
+
+# 더미 데이터 필드 중 개인정보가 아닌 필드 (노이즈와 함께 오탐 계산용 음성 표본)
+NON_PII_FIELDS = ['id', 'created_at']
+
+
+def generate_noise_values(count: int) -> List[str]:
+    """개인정보가 없는 일반 업무 데이터 (주문번호, 금액, 날짜, 코드 등)"""
+    words = ['주문', '배송', '완료', '대기', '취소', '상품', '결제', '환불', '문의', '메모',
+             'order', 'status', 'pending', 'shipped', 'note', 'item', 'sku', 'batch']
+    makers = [
+        lambda: f"ORD-{random.randint(2020, 2025)}-{random.randint(0, 999999):06d}",
+        lambda: f"{random.randint(1, 9999):,}원",
+        lambda: f"{random.randint(1, 999999):,}.{random.randint(0, 99):02d}",
+        lambda: (datetime(2020, 1, 1) + timedelta(minutes=random.randint(0, 3000000))).strftime('%Y-%m-%d %H:%M:%S'),
+        lambda: f"v{random.randint(0, 9)}.{random.randint(0, 20)}.{random.randint(0, 99)}",
+        lambda: str(uuid.uuid4()),
+        lambda: ''.join(random.choices(string.ascii_uppercase + string.digits, k=random.randint(6, 12))),
+        lambda: ' '.join(random.choices(words, k=random.randint(2, 8))),
+        lambda: f"{random.choice(words)}_{random.randint(1, 500)}",
+        lambda: str(random.randint(0, 10 ** random.randint(1, 9))),
+        lambda: f"SKU-{random.randint(100, 999)}-{random.randint(10, 99)}",
+        lambda: f"{random.randint(1, 300)}x{random.randint(1, 300)}",
+    ]
+    return [random.choice(makers)() for _ in range(count)]
+
+
+def build_benchmark_corpus(record_count: int = 1000, noise_count: int = 1000,
+                           stress_pattern: Optional[str] = None) -> List[Tuple[str, str, Optional[bool]]]:
+    """
+    (값, 출처, 개인정보 여부) 목록
+
+    출처는 더미 데이터 필드명 / noise / stress 이며, 스트레스 코퍼스는 정확도 계산에서 제외(None)합니다.
+    """
+    generator = DummyDataGenerator()
+    corpus = []
+
+    for record in generator.generate_batch(record_count):
+        for field, value in record.items():
+            corpus.append((str(value), field, field not in NON_PII_FIELDS))
+
+    corpus.extend((value, 'noise', False) for value in generate_noise_values(noise_count))
+
+    if stress_pattern is not None:
+        corpus.extend((value, 'stress', None) for value in build_stress_corpus(stress_pattern))
+
+    return corpus
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def benchmark_pattern_on_corpus(pattern: str, corpus: List[Tuple[str, str, Optional[bool]]],
+                                reference_patterns: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    패턴 성능 및 정확도 측정
+
+    오탐률은 개인정보가 아닌 값(노이즈, id/created_at 필드) 중 일치한 비율이며,
+    같은 코퍼스에서 계산한 기본 패턴들의 오탐률을 비교 기준으로 함께 반환합니다.
+
+    Args:
+        pattern: 측정할 정규식
+        corpus: build_benchmark_corpus 결과
+        reference_patterns: 비교 기준 패턴 (기본값: 기본 패턴)
+    """
+    compiled = re.compile(pattern)
+    references = {p['key']: re.compile(p['pattern']) for p in (reference_patterns or DEFAULT_PATTERNS)}
+
+    latencies = []
+    matched_values = 0
+    positives = negatives = 0
+    true_positives = false_positives = 0
+    reference_false_positives = {key: 0 for key in references}
+    overlap = {key: {'reference_matches': 0, 'also_matched': 0} for key in references}
+    by_source: Dict[str, Dict[str, int]] = {}
+
+    for value, source, is_pii in corpus:
+        value = value[:MAX_VALUE_LENGTH]
+
+        # 스캐너와 같은 방식(findall)으로 측정
+        started = time.perf_counter()
+        matched = bool(compiled.findall(value))
+        latencies.append(time.perf_counter() - started)
+
+        source_stats = by_source.setdefault(source, {'values': 0, 'matches': 0})
+        source_stats['values'] += 1
+        if matched:
+            matched_values += 1
+            source_stats['matches'] += 1
+
+        if is_pii is None:
+            continue
+
+        for key, ref in references.items():
+            if ref.search(value):
+                overlap[key]['reference_matches'] += 1
+                if matched:
+                    overlap[key]['also_matched'] += 1
+                if not is_pii:
+                    reference_false_positives[key] += 1
+
+        if is_pii:
+            positives += 1
+            if matched:
+                true_positives += 1
+        else:
+            negatives += 1
+            if matched:
+                false_positives += 1
+
+    total_sec = sum(latencies)
+    latencies.sort()
+    total_values = len(corpus)
+
+    return {
+        'values': total_values,
+        'total_ms': round(total_sec * 1000, 3),
+        'throughput_values_per_sec': round(total_values / total_sec, 1) if total_sec > 0 else None,
+        'latency_us': {
+            'p50': round(_percentile(latencies, 50) * 1e6, 2),
+            'p99': round(_percentile(latencies, 99) * 1e6, 2),
+            'max': round(latencies[-1] * 1e6, 2) if latencies else 0.0,
+        },
+        'match_rate': round(matched_values / total_values, 4) if total_values else 0.0,
+        'pii_match_rate': round(true_positives / positives, 4) if positives else 0.0,
+        'false_positive_rate': round(false_positives / negatives, 4) if negatives else 0.0,
+        'default_false_positive_rates': {
+            key: round(count / negatives, 4) if negatives else 0.0
+            for key, count in reference_false_positives.items()
+        },
+        'overlap_with_defaults': {
+            key: {
+                **stats,
+                'ratio': round(stats['also_matched'] / stats['reference_matches'], 4) if stats['reference_matches'] else 0.0
+            }
+            for key, stats in overlap.items()
+        },
+        'by_source': by_source,
+    }
+
+
+def run_pattern_benchmark(pattern: str, record_count: int = 1000, noise_count: int = 1000,
+                          include_stress: bool = False,
+                          reference_patterns: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """코퍼스 생성 후 벤치마크 실행 (스레드 풀에서 호출)"""
+    started = time.monotonic()
+    corpus = build_benchmark_corpus(record_count, noise_count, pattern if include_stress else None)
+    corpus_sec = time.monotonic() - started
+
+    result = benchmark_pattern_on_corpus(pattern, corpus, reference_patterns)
+    result['corpus'] = {
+        'record_count': record_count,
+        'noise_count': noise_count,
+        'include_stress': include_stress,
+        'generation_sec': round(corpus_sec, 3),
+    }
+    result['benchmarked_at'] = datetime.now().isoformat()
+    return result
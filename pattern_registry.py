@@ -0,0 +1,375 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pattern_safety import analyze_pattern
+
+logger = logging.getLogger(__name__)
+
+# 레지스트리 파일 경로 (API 서버와 스캐너가 같은 파일을 공유)
+DEFAULT_REGISTRY_PATH = os.environ.get('PII_PATTERN_REGISTRY', 'privacy_patterns.json')
+
+# 기본 개인정보 패턴 - 한국 형식
+# mask_pattern / mask_replacement: 마스킹 규칙 (치환 문자열은 Polars 형식 ${1}, 미지정 시 일치 부분 전체를 *** 로 대체)
+DEFAULT_PATTERNS = [
+    {
+        'key': 'email',
+        'name': '이메일 주소',
+        'category': '연락처',
+        'pattern': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+        'risk_level': 'MEDIUM',
+        'description': '일반적인 이메일 주소 형식을 감지합니다',
+        'examples': ['user@example.com', 'test.email@domain.co.kr'],
+        'mask_pattern': r'([A-Za-z0-9._%+-]{1,2})[A-Za-z0-9._%+-]*@([A-Za-z0-9.-]+\.[A-Za-z]{2,})',
+        'mask_replacement': '${1}***@${2}',
+    },
+    {
+        'key': 'phone',
+        'name': '전화번호',
+        'category': '연락처',
+        'pattern': r'\b0\d{1,2}-\d{3,4}-\d{4}\b',  # 0으로 시작하는 전화번호 형식 (오탐 방지)
+        'risk_level': 'MEDIUM',
+        'description': '한국 전화번호 형식을 감지합니다',
+        'examples': ['010-1234-5678', '02-123-4567'],
+        'mask_pattern': r'\b(0\d{1,2})-\d{3,4}-(\d{4})\b',
+        'mask_replacement': '${1}-****-${2}',
+    },
+    {
+        'key': 'ssn',
+        'name': '주민등록번호',
+        'category': '신원정보',
+        'pattern': r'\d{6}-[1-4]\d{6}',
+        'risk_level': 'HIGH',
+        'description': '한국 주민등록번호 형식을 감지합니다',
+        'examples': ['123456-1234567', '123456-2345678'],
+        'mask_pattern': r'(\d{6})-([1-4])\d{6}',
+        'mask_replacement': '${1}-${2}******',
+    },
+    {
+        'key': 'card_number',
+        'name': '신용카드번호',
+        'category': '금융정보',
+        'pattern': r'\b(?:\d{4}-){3}\d{4}\b',  # 일반적인 16자리 카드번호 형식
+        'risk_level': 'HIGH',
+        'description': '하이픈으로 구분된 16자리 카드번호를 감지합니다',
+        'examples': ['5327-1234-5678-9012', '4111-1111-1111-1111'],
+        'mask_pattern': r'\b(\d{4})-\d{4}-\d{4}-(\d{4})\b',
+        'mask_replacement': '${1}-****-****-${2}',
+    },
+    {
+        'key': 'account_number',
+        'name': '계좌번호',
+        'category': '금융정보',
+        'pattern': r'\b\d{2,6}-\d{2,6}-\d{2,6}\b',  # 일반적인 계좌번호 형식
+        'risk_level': 'MEDIUM',
+        'description': '하이픈으로 구분된 은행 계좌번호 형식을 감지합니다',
+        'examples': ['123-456789-01', '1002-123-456789'],
+        'mask_pattern': r'\b(\d{2,6})-\d{2,6}-(\d{2,6})\b',
+        'mask_replacement': '${1}-****-${2}',
+    },
+    {
+        'key': 'ip_address',
+        'name': 'IP 주소',
+        'category': '접속정보',
+        'pattern': r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b',
+        'risk_level': 'LOW',
+        'description': 'IPv4 주소 형식을 감지합니다',
+        'examples': ['192.168.0.1', '10.0.0.254'],
+        'mask_pattern': r'\b(\d{1,3})\.(\d{1,3})\.\d{1,3}\.\d{1,3}\b',
+        'mask_replacement': '${1}.${2}.***.***',
+    },
+]
+
+# 마스킹 규칙이 없는 기존 레지스트리 항목은 같은 키의 기본 규칙 사용
+DEFAULT_MASK_RULES = {p['key']: (p['mask_pattern'], p['mask_replacement']) for p in DEFAULT_PATTERNS}
+FULL_MASK_REPLACEMENT = '***'
+
+
+class CompiledPatternSet:
+    def __init__(self, version: int, entries: List[Dict[str, Any]]):
+        """
+        특정 레지스트리 버전의 활성 패턴을 미리 컴파일한 집합
+
+        Args:
+            version: 레지스트리 버전
+            entries: 레지스트리 패턴 항목 목록
+        """
+        self.version = version
+        self.patterns: Dict[str, re.Pattern] = {}
+        self.sources: Dict[str, str] = {}
+        self.invalid: Dict[str, str] = {}
+        self.unsafe: Dict[str, List[str]] = {}
+        # (패턴 키, 마스킹 정규식, 치환 문자열) - 레지스트리 순서대로 적용
+        self.masks: List[Tuple[str, re.Pattern, str]] = []
+
+        for entry in entries:
+            if not entry.get('is_active', True):
+                continue
+
+            key = entry['key']
+            try:
+                compiled = re.compile(entry['pattern'])
+                safety = analyze_pattern(entry['pattern'])
+            except re.error as e:
+                # 잘못된 패턴 하나 때문에 스캔 전체가 실패하지 않도록 제외
+                self.invalid[key] = str(e)
+                logger.warning(f"패턴 컴파일 실패로 제외: {key} ({e})")
+                continue
+
+            # 파일을 직접 수정해 등록 시 검사를 거치지 않은 위험한 패턴도 제외
+            if not safety['safe']:
+                self.unsafe[key] = [issue['message'] for issue in safety['issues'] if issue['severity'] == 'danger']
+                logger.warning(f"역추적 위험으로 패턴 제외: {key} ({'; '.join(self.unsafe[key])})")
+                continue
+
+            self.patterns[key] = compiled
+            self.sources[key] = entry['pattern']
+            self.masks.append((key, *self._compile_mask(entry, compiled)))
+
+    @staticmethod
+    def _compile_mask(entry: Dict[str, Any], compiled: re.Pattern) -> Tuple[re.Pattern, str]:
+        """항목의 마스킹 규칙 (없거나 잘못되었으면 탐지 패턴 일치 부분 전체를 마스킹)"""
+        mask_pattern = entry.get('mask_pattern')
+        replacement = entry.get('mask_replacement')
+        if not mask_pattern and entry['key'] in DEFAULT_MASK_RULES:
+            mask_pattern, replacement = DEFAULT_MASK_RULES[entry['key']]
+
+        if mask_pattern:
+            try:
+                if analyze_pattern(mask_pattern)['safe']:
+                    return re.compile(mask_pattern), replacement or FULL_MASK_REPLACEMENT
+                logger.warning(f"역추적 위험으로 마스킹 규칙 제외: {entry['key']}")
+            except re.error as e:
+                logger.warning(f"마스킹 규칙 컴파일 실패: {entry['key']} ({e})")
+
+        return compiled, FULL_MASK_REPLACEMENT
+
+    def items(self):
+        return self.patterns.items()
+
+    def as_dict(self) -> Dict[str, str]:
+        """패턴 키 → 정규식 문자열"""
+        return dict(self.sources)
+
+    def __len__(self):
+        return len(self.patterns)
+
+
+class PatternRegistry:
+    def __init__(self, path: str = DEFAULT_REGISTRY_PATH, reload_interval_sec: float = 2.0,
+                 compiled_cache_size: int = 4):
+        """
+        버전 관리되는 개인정보 패턴 레지스트리 (JSON 파일에 저장)
+
+        Args:
+            path: 레지스트리 JSON 파일 경로
+            reload_interval_sec: 다른 프로세스의 변경 여부(파일 mtime) 확인 주기
+            compiled_cache_size: 버전별로 보관할 컴파일된 패턴 집합 수
+        """
+        self.path = path
+        self.reload_interval_sec = reload_interval_sec
+        self.compiled_cache_size = compiled_cache_size
+
+        self._lock = threading.RLock()
+        self._version = 0
+        self._next_id = 1
+        self._entries: List[Dict[str, Any]] = []
+        self._loaded_mtime: Optional[float] = None
+        self._last_check = 0.0
+        self._compiled: 'OrderedDict[int, CompiledPatternSet]' = OrderedDict()
+
+        self._load()
+
+    # 저장소 입출력
+    def _load(self):
+        with self._lock:
+            if not os.path.exists(self.path):
+                self._seed_defaults()
+                return
+
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"패턴 레지스트리 로드 실패: {self.path} ({e})")
+                if not self._entries:
+                    self._seed_defaults(persist=False)
+                return
+
+            self._version = data.get('version', 0)
+            self._next_id = data.get('next_id', 1)
+            self._entries = data.get('patterns', [])
+            self._loaded_mtime = os.path.getmtime(self.path)
+
+    def _save(self):
+        data = {
+            'version': self._version,
+            'next_id': self._next_id,
+            'updated_at': datetime.now().isoformat(),
+            'patterns': self._entries,
+        }
+
+        # 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._loaded_mtime = os.path.getmtime(self.path)
+
+    def _seed_defaults(self, persist: bool = True):
+        now = datetime.now().isoformat()
+        self._entries = []
+        for i, pattern in enumerate(DEFAULT_PATTERNS, 1):
+            self._entries.append({
+                'id': i,
+                **pattern,
+                'is_active': True,
+                'created_at': now,
+                'updated_at': now,
+            })
+        self._next_id = len(self._entries) + 1
+        self._version = 1
+        if persist:
+            self._save()
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """다른 프로세스가 레지스트리 파일을 변경했으면 다시 로드"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.reload_interval_sec:
+            return False
+        self._last_check = now
+
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return False
+
+        with self._lock:
+            if mtime == self._loaded_mtime:
+                return False
+            previous = self._version
+            self._load()
+            if self._version != previous:
+                logger.info(f"패턴 레지스트리 갱신: v{previous} → v{self._version}")
+            return True
+
+    # 조회
+    @property
+    def version(self) -> int:
+        self.reload_if_changed()
+        return self._version
+
+    def list(self) -> List[Dict[str, Any]]:
+        self.reload_if_changed()
+        with self._lock:
+            return [dict(entry) for entry in self._entries]
+
+    def get(self, pattern_id: int) -> Optional[Dict[str, Any]]:
+        self.reload_if_changed()
+        with self._lock:
+            for entry in self._entries:
+                if entry['id'] == pattern_id:
+                    return dict(entry)
+        return None
+
+    def compiled(self) -> CompiledPatternSet:
+        """현재 버전의 컴파일된 패턴 집합 (버전이 같으면 재컴파일하지 않음)"""
+        self.reload_if_changed()
+        with self._lock:
+            pattern_set = self._compiled.get(self._version)
+            if pattern_set is None:
+                pattern_set = CompiledPatternSet(self._version, self._entries)
+                self._compiled[self._version] = pattern_set
+                while len(self._compiled) > self.compiled_cache_size:
+                    self._compiled.popitem(last=False)
+            else:
+                self._compiled.move_to_end(self._version)
+            return pattern_set
+
+    # 변경 (변경할 때마다 버전 증가 후 저장)
+    def _unique_key(self, key: Optional[str], pattern_id: int) -> str:
+        key = key or f"pattern_{pattern_id}"
+        taken = {e['key'] for e in self._entries if e['id'] != pattern_id}
+        if key in taken:
+            key = f"{key}_{pattern_id}"
+        return key
+
+    @staticmethod
+    def _validate(entry: Dict[str, Any]):
+        # 잘못된 정규식은 re.error 발생
+        re.compile(entry['pattern'])
+        if entry.get('mask_pattern'):
+            re.compile(entry['mask_pattern'])
+
+    def create(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate(entry)
+
+        with self._lock:
+            self.reload_if_changed(force=True)
+            pattern_id = self._next_id
+            now = datetime.now().isoformat()
+            stored = {
+                **{k: v for k, v in entry.items() if k not in ('id', 'created_at', 'updated_at')},
+                'id': pattern_id,
+                'key': self._unique_key(entry.get('key'), pattern_id),
+                'is_active': entry.get('is_active', True),
+                'created_at': now,
+                'updated_at': now,
+            }
+            self._entries.append(stored)
+            self._next_id += 1
+            self._version += 1
+            self._save()
+            return dict(stored)
+
+    def update(self, pattern_id: int, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        self._validate(entry)
+
+        with self._lock:
+            self.reload_if_changed(force=True)
+            for i, existing in enumerate(self._entries):
+                if existing['id'] != pattern_id:
+                    continue
+
+                stored = {
+                    **{k: v for k, v in entry.items() if k not in ('id', 'created_at', 'updated_at')},
+                    'id': pattern_id,
+                    'key': self._unique_key(entry.get('key') or existing['key'], pattern_id),
+                    'created_at': existing.get('created_at'),
+                    'updated_at': datetime.now().isoformat(),
+                }
+                self._entries[i] = stored
+                self._version += 1
+                self._save()
+                return dict(stored)
+        return None
+
+    def delete(self, pattern_id: int) -> bool:
+        with self._lock:
+            self.reload_if_changed(force=True)
+            remaining = [e for e in self._entries if e['id'] != pattern_id]
+            if len(remaining) == len(self._entries):
+                return False
+            self._entries = remaining
+            self._version += 1
+            self._save()
+            return True
+
+
+# 경로별 공유 레지스트리 (같은 프로세스의 API/스캐너가 같은 인스턴스 사용)
+_registries: Dict[str, PatternRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(path: Optional[str] = None) -> PatternRegistry:
+    path = os.path.abspath(path or DEFAULT_REGISTRY_PATH)
+    with _registries_lock:
+        if path not in _registries:
+            _registries[path] = PatternRegistry(path)
+        return _registries[path]
@@ -0,0 +1,432 @@
+import json
+import logging
+import string
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python 3.10 이하
+    import sre_constants
+    import sre_parse
+
+logger = logging.getLogger(__name__)
+
+# 스캔 시 값 하나에 대해 검사하는 최대 길이 (긴 CLOB 값의 역추적 비용 제한)
+MAX_VALUE_LENGTH = 10000
+
+# 등록 시 스트레스 코퍼스 벤치마크 기준
+BENCHMARK_TIMEOUT_SEC = 5.0
+BENCHMARK_MAX_VALUE_MS = 100.0
+
+# 이 값보다 큰 반복 상한은 무제한 반복으로 취급
+UNBOUNDED_REPEAT = 32
+
+# 문자 집합 비교에 사용하는 대표 문자
+PROBE_CHARS = frozenset(string.ascii_letters + string.digits + string.punctuation + ' \t\n' + '가힣')
+
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, 'POSSESSIVE_REPEAT'):
+    _REPEATS.add(sre_constants.POSSESSIVE_REPEAT)
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+_POSSESSIVE_REPEAT = getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+
+
+def _category_match(category, ch: str) -> bool:
+    if category == sre_constants.CATEGORY_DIGIT:
+        return ch.isdigit()
+    if category == sre_constants.CATEGORY_NOT_DIGIT:
+        return not ch.isdigit()
+    if category == sre_constants.CATEGORY_SPACE:
+        return ch.isspace()
+    if category == sre_constants.CATEGORY_NOT_SPACE:
+        return not ch.isspace()
+    if category == sre_constants.CATEGORY_WORD:
+        return ch.isalnum() or ch == '_'
+    if category == sre_constants.CATEGORY_NOT_WORD:
+        return not (ch.isalnum() or ch == '_')
+    return True
+
+
+def _in_match(items, ch: str) -> bool:
+    """문자 클래스([...])가 ch 와 일치하는지"""
+    negate = False
+    matched = False
+    for op, av in items:
+        if op == sre_constants.NEGATE:
+            negate = True
+        elif op == sre_constants.LITERAL:
+            matched = matched or ch == chr(av)
+        elif op == sre_constants.RANGE:
+            matched = matched or av[0] <= ord(ch) <= av[1]
+        elif op == sre_constants.CATEGORY:
+            matched = matched or _category_match(av, ch)
+    return matched != negate
+
+
+class _PatternAnalyzer:
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.parsed = sre_parse.parse(pattern)
+        self.universe: Set[str] = set(PROBE_CHARS)
+        self._collect_literals(self.parsed)
+        self.issues: List[Dict[str, str]] = []
+        # 스트레스 코퍼스 생성용 (무제한 반복이 소비하는 문자 집합)
+        self.pump_sets: List[Set[str]] = []
+
+    def _collect_literals(self, items):
+        for op, av in items:
+            if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+                self.universe.add(chr(av))
+            elif op == sre_constants.IN:
+                self._collect_literals(av)
+            for sub in self._children(op, av):
+                self._collect_literals(sub)
+
+    @staticmethod
+    def _children(op, av) -> List[Any]:
+        if op in _REPEATS:
+            return [av[2]]
+        if op == sre_constants.SUBPATTERN:
+            return [av[-1]]
+        if op == sre_constants.BRANCH:
+            return list(av[1])
+        if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            return [av[1]]
+        if op == _ATOMIC_GROUP:
+            return [av]
+        if op == sre_constants.GROUPREF_EXISTS:
+            return [sub for sub in av[1:] if sub is not None]
+        return []
+
+    # 첫 글자 집합 / 빈 문자열 일치 여부
+    def first(self, items) -> Tuple[Set[str], bool]:
+        chars: Set[str] = set()
+        for op, av in items:
+            item_chars, nullable = self.first_item(op, av)
+            chars |= item_chars
+            if not nullable:
+                return chars, False
+        return chars, True
+
+    def first_item(self, op, av) -> Tuple[Set[str], bool]:
+        if op == sre_constants.LITERAL:
+            return {chr(av)}, False
+        if op == sre_constants.NOT_LITERAL:
+            return self.universe - {chr(av)}, False
+        if op == sre_constants.ANY:
+            return self.universe - {'\n'}, False
+        if op == sre_constants.IN:
+            return {ch for ch in self.universe if _in_match(av, ch)}, False
+        if op in _REPEATS:
+            chars, nullable = self.first(av[2])
+            return chars, av[0] == 0 or nullable
+        if op == sre_constants.SUBPATTERN:
+            return self.first(av[-1])
+        if op == _ATOMIC_GROUP:
+            return self.first(av)
+        if op == sre_constants.BRANCH:
+            chars, nullable = set(), False
+            for branch in av[1]:
+                branch_chars, branch_nullable = self.first(branch)
+                chars |= branch_chars
+                nullable = nullable or branch_nullable
+            return chars, nullable
+        if op == sre_constants.GROUPREF_EXISTS:
+            chars, nullable = self.first(av[1])
+            if av[2] is None:
+                return chars, True
+            no_chars, no_nullable = self.first(av[2])
+            return chars | no_chars, nullable or no_nullable
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            return set(), True
+        # 역참조 등 알 수 없는 요소는 보수적으로 처리
+        return set(self.universe), True
+
+    @staticmethod
+    def _unbounded(av) -> bool:
+        return av[1] == sre_constants.MAXREPEAT or av[1] > UNBOUNDED_REPEAT
+
+    def _single_char(self, op) -> bool:
+        return op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY, sre_constants.IN)
+
+    def _pumpable(self, items) -> bool:
+        """나머지 요소 없이도 반복될 수 있는 무제한 반복을 포함하는지 ((a+)+, (\\w+\\s?)+ 형태)"""
+        for i, (op, av) in enumerate(items):
+            if op in _REPEATS and op != _POSSESSIVE_REPEAT and self._unbounded(av):
+                inner_chars, _ = self.first(av[2])
+                others_ok = True
+                for j, (other_op, other_av) in enumerate(items):
+                    if j == i:
+                        continue
+                    other_chars, other_nullable = self.first_item(other_op, other_av)
+                    if other_nullable:
+                        continue
+                    # (a+a)+, (x+x+)+ 처럼 다른 요소가 같은 문자만 소비하는 경우도 위험
+                    if self._single_char(other_op) and other_chars and other_chars <= inner_chars:
+                        continue
+                    if (other_op in _REPEATS and len(other_av[2]) == 1 and self._single_char(other_av[2][0][0])
+                            and other_chars <= inner_chars):
+                        continue
+                    others_ok = False
+                    break
+                if others_ok:
+                    return True
+            elif all(self.first_item(o, a)[1] for j, (o, a) in enumerate(items) if j != i):
+                if op in _REPEATS and self._pumpable(av[2]):
+                    return True
+                if op == sre_constants.SUBPATTERN and self._pumpable(av[-1]):
+                    return True
+                if op == sre_constants.BRANCH and any(self._pumpable(b) for b in av[1]):
+                    return True
+        return False
+
+    def _add_issue(self, severity: str, issue_type: str, message: str):
+        issue = {'severity': severity, 'type': issue_type, 'message': message}
+        if issue not in self.issues:
+            self.issues.append(issue)
+
+    def analyze(self) -> List[Dict[str, str]]:
+        self._walk(self.parsed, in_repeat=False)
+        return self.issues
+
+    def _walk(self, items, in_repeat: bool):
+        items = list(items)
+        for i, (op, av) in enumerate(items):
+            if op in _REPEATS:
+                unbounded = self._unbounded(av)
+                # 소유 수량자는 역추적하지 않음
+                backtracks = op != _POSSESSIVE_REPEAT
+                if unbounded:
+                    self.pump_sets.append(self.first(av[2])[0])
+                    if backtracks and self._pumpable(av[2]):
+                        self._add_issue('danger', 'nested_quantifier',
+                                        '중첩된 반복 수량자로 인해 지수 시간 역추적이 발생할 수 있습니다')
+                    if backtracks:
+                        self._check_adjacent(items, i)
+                self._walk(av[2], in_repeat or (unbounded and backtracks))
+            elif op == sre_constants.BRANCH:
+                if in_repeat:
+                    self._check_alternation(av[1])
+                for branch in av[1]:
+                    self._walk(branch, in_repeat)
+            elif op == _ATOMIC_GROUP:
+                self._walk(av, in_repeat=False)
+            elif op == sre_constants.GROUPREF:
+                self._add_issue('warning', 'backreference', '역참조는 역추적 비용이 커질 수 있습니다')
+            else:
+                for sub in self._children(op, av):
+                    self._walk(sub, in_repeat)
+
+    def _check_alternation(self, branches):
+        """반복 안의 분기들이 같은 문자로 시작할 수 있으면 일치 경로가 여러 개가 됨"""
+        firsts = [self.first(branch) for branch in branches]
+        for i in range(len(firsts)):
+            for j in range(i + 1, len(firsts)):
+                if firsts[i][0] & firsts[j][0] or firsts[i][1] or firsts[j][1]:
+                    self._add_issue('danger', 'overlapping_alternation',
+                                    '반복 안의 분기가 서로 겹쳐 지수 시간 역추적이 발생할 수 있습니다')
+                    return
+
+    def _check_adjacent(self, items, index: int):
+        """\\d+\\d+ 처럼 겹치는 무제한 반복이 연속되면 다항 시간 역추적 발생"""
+        chars, _ = self.first(items[index][1][2])
+        for op, av in items[index + 1:]:
+            if op in _REPEATS and self._unbounded(av):
+                if chars & self.first(av[2])[0]:
+                    self._add_issue('warning', 'adjacent_quantifiers',
+                                    '연속된 반복 수량자가 같은 문자를 소비해 다항 시간 역추적이 발생할 수 있습니다')
+                return
+            if not self.first_item(op, av)[1]:
+                return
+
+
+def analyze_pattern(pattern: str) -> Dict[str, Any]:
+    """정규식 정적 분석 (잘못된 정규식은 re.error 발생)"""
+    analyzer = _PatternAnalyzer(pattern)
+    issues = analyzer.analyze()
+    return {
+        'pattern': pattern,
+        'safe': not any(issue['severity'] == 'danger' for issue in issues),
+        'issues': issues,
+    }
+
+
+def can_match_empty(pattern: str) -> bool:
+    """빈 문자열과 일치할 수 있는 정규식인지 (앵커/전후방 탐색만으로 일치하는 경우 포함)"""
+    analyzer = _PatternAnalyzer(pattern)
+    return analyzer.first(analyzer.parsed)[1]
+
+
+def build_stress_corpus(pattern: str, lengths: Tuple[int, ...] = (32, 256, 2048)) -> List[str]:
+    """역추적을 유발하는 입력 모음 (반복 문자열 + 일치 실패 문자)"""
+    analyzer = _PatternAnalyzer(pattern)
+    analyzer.analyze()
+
+    pump_chars: List[str] = []
+    for chars in analyzer.pump_sets:
+        # 영숫자를 우선 사용하고 반복마다 최대 3개 문자
+        ordered = sorted(chars, key=lambda c: (not c.isalnum(), c))
+        for ch in ordered[:3]:
+            if ch not in pump_chars:
+                pump_chars.append(ch)
+    for ch in 'a1 -.@':
+        if ch not in pump_chars:
+            pump_chars.append(ch)
+
+    # 어떤 반복에도 속하지 않는 문자로 끝내 전체 일치를 실패시킴
+    used = set().union(*analyzer.pump_sets) if analyzer.pump_sets else set()
+    terminators = [ch for ch in '!\x00#~' if ch not in used] or ['\x00']
+
+    corpus = []
+    for length in lengths:
+        for ch in pump_chars:
+            corpus.append(ch * length + terminators[0])
+        # 한국 개인정보 형식이 섞인 일반 텍스트
+        corpus.append(('홍길동 010-1234-5678 user@example.com 123456-1234567 ' * (length // 50 + 1))[:length])
+        corpus.append(('a.' * length)[:length] + terminators[0])
+        corpus.append(('1-' * length)[:length] + terminators[0])
+
+    return [value[:MAX_VALUE_LENGTH] for value in corpus]
+
+
+_BENCHMARK_SCRIPT = r'''
+import json, re, sys, time
+data = json.load(sys.stdin)
+pattern = re.compile(data['pattern'])
+total = 0.0
+worst = 0.0
+for value in data['corpus']:
+    started = time.perf_counter()
+    pattern.findall(value)
+    elapsed = time.perf_counter() - started
+    total += elapsed
+    worst = max(worst, elapsed)
+print(json.dumps({'values': len(data['corpus']), 'total_sec': total, 'max_value_sec': worst}))
+'''
+
+
+def benchmark_pattern(pattern: str, corpus: Optional[List[str]] = None,
+                      timeout_sec: float = BENCHMARK_TIMEOUT_SEC) -> Dict[str, Any]:
+    """
+    별도 프로세스에서 스트레스 코퍼스 벤치마크 실행
+
+    정규식 매칭은 중간에 중단할 수 없으므로 시간 제한을 넘기면 프로세스를 종료합니다.
+    """
+    if corpus is None:
+        corpus = build_stress_corpus(pattern)
+
+    started = time.monotonic()
+    try:
+        completed = subprocess.run(
+            [sys.executable, '-c', _BENCHMARK_SCRIPT],
+            input=json.dumps({'pattern': pattern, 'corpus': corpus}),
+            capture_output=True,
+            text=True,
+            timeout=timeout_sec
+        )
+    except subprocess.TimeoutExpired:
+        return {
+            'timed_out': True,
+            'values': len(corpus),
+            'elapsed_sec': round(time.monotonic() - started, 3),
+        }
+
+    if completed.returncode != 0:
+        return {
+            'timed_out': False,
+            'values': len(corpus),
+            'error': completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else 'unknown error',
+        }
+
+    result = json.loads(completed.stdout)
+    return {
+        'timed_out': False,
+        'values': result['values'],
+        'total_ms': round(result['total_sec'] * 1000, 3),
+        'max_value_ms': round(result['max_value_sec'] * 1000, 3),
+        'elapsed_sec': round(time.monotonic() - started, 3),
+    }
+
+
+def check_pattern_safety(pattern: str, timeout_sec: float = BENCHMARK_TIMEOUT_SEC,
+                         max_value_ms: float = BENCHMARK_MAX_VALUE_MS) -> Dict[str, Any]:
+    """등록 전 안전성 검사 (정적 분석 + 스트레스 코퍼스 벤치마크)"""
+    report = analyze_pattern(pattern)
+    report['benchmark'] = None
+    reasons = [issue['message'] for issue in report['issues'] if issue['severity'] == 'danger']
+
+    # 정적 분석에서 위험으로 판정되면 벤치마크 생략
+    if report['safe']:
+        benchmark = benchmark_pattern(pattern, timeout_sec=timeout_sec)
+        report['benchmark'] = benchmark
+
+        if benchmark['timed_out']:
+            reasons.append(f"스트레스 코퍼스 벤치마크가 {timeout_sec}초 안에 끝나지 않았습니다")
+        elif 'error' in benchmark:
+            reasons.append(f"벤치마크 실행 실패: {benchmark['error']}")
+        elif benchmark['max_value_ms'] > max_value_ms:
+            reasons.append(f"값 하나당 최대 {benchmark['max_value_ms']}ms 소요 (허용: {max_value_ms}ms)")
+
+    report['safe'] = not reasons
+    report['reasons'] = reasons
+    return report
+
+
+class PatternTimeBudget:
+    def __init__(self, per_value_ms: float = 200.0, total_sec_per_pattern: float = 120.0,
+                 max_value_length: int = MAX_VALUE_LENGTH):
+        """
+        스캔 중 패턴별 시간 예산
+
+        값 하나에 per_value_ms 이상 걸리거나 누적 시간이 total_sec_per_pattern 을 넘은 패턴은
+        스캔이 끝날 때까지 비활성화하고 보고합니다. 끝나지 않는 패턴은 등록 시 검사와
+        레지스트리 컴파일 단계의 정적 분석에서 걸러집니다.
+
+        Args:
+            per_value_ms: 값 하나당 허용 시간 (밀리초)
+            total_sec_per_pattern: 패턴별 누적 허용 시간 (초)
+            max_value_length: 검사할 값의 최대 길이
+        """
+        self.per_value_sec = per_value_ms / 1000
+        self.total_sec_per_pattern = total_sec_per_pattern
+        self.max_value_length = max_value_length
+        self.elapsed: Dict[str, float] = {}
+        self.disabled: Dict[str, Dict[str, Any]] = {}
+
+    def truncate(self, value: str) -> str:
+        return value[:self.max_value_length]
+
+    def is_disabled(self, pattern_name: str) -> bool:
+        return pattern_name in self.disabled
+
+    def record(self, pattern_name: str, elapsed_sec: float, value_length: int, column: Optional[str] = None) -> bool:
+        """실행 시간 기록 (이번 기록으로 비활성화되면 True)"""
+        total = self.elapsed.get(pattern_name, 0.0) + elapsed_sec
+        self.elapsed[pattern_name] = total
+
+        reason = None
+        if elapsed_sec > self.per_value_sec:
+            reason = 'per_value_budget_exceeded'
+        elif total > self.total_sec_per_pattern:
+            reason = 'total_budget_exceeded'
+
+        if reason is None:
+            return False
+
+        self.disabled[pattern_name] = {
+            'reason': reason,
+            'value_ms': round(elapsed_sec * 1000, 3),
+            'value_length': value_length,
+            'total_sec': round(total, 3),
+            'column': column,
+            'disabled_at': datetime.now().isoformat(),
+        }
+        logger.warning(f"시간 예산 초과로 패턴 비활성화: {pattern_name} ({reason}, {elapsed_sec * 1000:.1f}ms)")
+        return True
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        return dict(self.disabled)
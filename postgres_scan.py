@@ -0,0 +1,758 @@
+import io
+import random
+import re
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple, Any, Optional
+
+import polars as pl
+import psycopg2
+
+from column_scan import scan_columns
+from pattern_registry import PatternRegistry
+from pattern_safety import MAX_VALUE_LENGTH
+from sample_cache import SampleCache, make_source_id
+from scan_calibration import ScanCalibration
+from sampling import derive_table_seed
+from scan_pipeline import TRUNCATION_SEPARATOR, PrivacyScanPipeline
+
+# 샘플링 설정 (페이지 수가 이 이상이면 TABLESAMPLE SYSTEM 으로 일부 페이지만 읽음)
+PG_SYSTEM_SAMPLE_MIN_PAGES = 10000
+PG_SAMPLE_OVERSAMPLE = 1.25
+PG_MIN_SAMPLE_PERCENT = 0.000001
+PG_MAX_SAMPLE_PERCENT = 100.0
+PG_SAMPLE_TOP_UP_PASSES = 2
+# 조회당 최대 행 수 (목표 행 수 배수) - 통계가 실제보다 작아도 한 번에 너무 많이 가져오지 않도록 제한
+PG_SAMPLE_FETCH_FACTOR = 4
+PG_ROW_KEY_ALIAS = '__pii_scan_row'
+
+# 통계가 수집되지 않은 테이블의 행 수 확인 상한 (전체 COUNT 대신 LIMIT 으로 제한)
+PG_COUNT_PROBE_LIMIT = 100000
+
+# COPY 전체 스캔 배치 크기 (바이트, 행 경계에서 잘라 DataFrame 으로 변환)
+PG_COPY_BATCH_BYTES = 8 * 1024 * 1024
+
+# psycopg2 가 문자열로 반환하는 타입 / Polars 가 그대로 받을 수 있는 타입 (나머지는 ::text 로 조회)
+PG_TEXT_TYPES = {'character varying', 'varchar', 'character', 'char', 'bpchar', 'text', 'citext', 'name', 'xml'}
+PG_NATIVE_TYPES = {'smallint', 'integer', 'bigint', 'numeric', 'real', 'double precision', 'boolean', 'date'}
+
+
+class _CopyBatchWriter:
+    """COPY ... TO STDOUT (CSV) 출력을 모아 행 경계에서 잘라 DataFrame 배치로 전달하는 파일 객체"""
+
+    def __init__(self, columns: List[str], batch_bytes: int, on_batch: Callable[[pl.DataFrame], None]):
+        self.schema = {name: pl.Utf8 for name in columns}
+        self.batch_bytes = batch_bytes
+        self.on_batch = on_batch
+        self.buffer = bytearray()
+        self.rows = 0
+        self.batches = 0
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        if len(self.buffer) >= self.batch_bytes:
+            end = self._row_boundary()
+            if end:
+                self._emit(bytes(self.buffer[:end]))
+                del self.buffer[:end]
+        return len(data)
+
+    def flush(self):
+        if self.buffer:
+            self._emit(bytes(self.buffer))
+            self.buffer.clear()
+
+    def _row_boundary(self) -> int:
+        """마지막 완전한 행의 끝 위치 (따옴표 안의 줄바꿈은 행 경계가 아님, 버퍼는 항상 행 시작에서 시작)"""
+        end = len(self.buffer)
+        while True:
+            end = self.buffer.rfind(b'\n', 0, end)
+            if end < 0:
+                return 0
+            # 값 안의 따옴표는 "" 로 이스케이프되므로 짝수 개면 따옴표 밖
+            if self.buffer.count(b'"', 0, end) % 2 == 0:
+                return end + 1
+
+    def _emit(self, chunk: bytes):
+        # CSV 에서 NULL 은 빈 필드, 빈 문자열은 "" 로 구분됨
+        df = pl.read_csv(io.BytesIO(chunk), has_header=False, schema=self.schema)
+        self.rows += df.height
+        self.batches += 1
+        self.on_batch(df)
+
+
+class PostgresPrivacyScanner(PrivacyScanPipeline):
+    source_name = 'PostgreSQL'
+    namespace_label = '스키마'
+
+    def __init__(self, host: str, user: str, password: str = None, database: str = 'postgres',
+                 sample_size: int = 100, port: int = 5432,
+                 pattern_registry: Optional[PatternRegistry] = None, sample_cache: Optional[SampleCache] = None,
+                 parallel_columns: bool = True, projection_pushdown: bool = True,
+                 max_value_length: int = MAX_VALUE_LENGTH, tail_length: int = 0,
+                 sample_seed: Optional[int] = None, partition_sampling: bool = True,
+                 partition_workers: int = 4, prefetch_tables: int = 2,
+                 full_scan: bool = False, copy_batch_bytes: int = PG_COPY_BATCH_BYTES,
+                 calibration: Optional[ScanCalibration] = None):
+        """
+        PostgreSQL 기반 개인정보 스캐너 (PostgreSQL 12+, 탐지/점수/리포트는 PrivacyScanPipeline)
+
+        연결한 데이터베이스의 스키마를 MySQL 의 데이터베이스처럼 다룹니다 (scan_database(schema) 등).
+        행 수는 COUNT(*) 대신 pg_class.reltuples 추정치를 사용하고, 큰 테이블은 TABLESAMPLE 로 일부만 읽습니다.
+
+        Args:
+            host: PostgreSQL 서버 호스트
+            user: 사용자명
+            password: 비밀번호 (선택사항 - trust/peer 인증이면 생략)
+            database: 접속할 데이터베이스명
+            sample_size: 샘플링할 행 수
+            port: PostgreSQL 포트 (기본값: 5432)
+            pattern_registry: 개인정보 패턴 레지스트리 (기본값: 공유 레지스트리)
+            sample_cache: 샘플 캐시 (지정 시 스캔한 샘플을 저장해 재평가에 사용)
+            parallel_columns: 테이블 내 문자열 컬럼을 Polars 표현식으로 병렬 스캔 (False 이면 컬럼별 순차 스캔)
+            projection_pushdown: 문자열 타입 / 의심스러운 이름의 컬럼만 조회 (False 이면 SELECT *)
+            max_value_length: 값당 최대 조회 길이 (문자 수, SQL 에서 잘라서 전송 / 0 이면 제한 없음)
+            tail_length: 잘린 값에서 앞부분 대신 끝부분으로 채울 길이 (0 이면 앞부분만)
+            sample_seed: 스캔 시드 (같은 시드로 다시 스캔하면 변경되지 않은 테이블은 같은 표본, 기본값: 무작위)
+            partition_sampling: 파티션 테이블은 리프 파티션별로 행 수에 비례해 샘플링 (최근 파티션 누락 방지)
+            partition_workers: 파티션 동시 조회 연결 수 (1 이면 기존 연결로 순차 조회)
+            prefetch_tables: 분석 중에 미리 조회해 둘 테이블 샘플 수 (0 이면 조회와 분석을 순차 실행)
+            full_scan: 샘플링 대신 COPY ... TO STDOUT 으로 전체 행을 배치 단위로 스트리밍해 스캔
+            copy_batch_bytes: 전체 스캔 배치 크기 (바이트, 테이블 크기와 관계없이 메모리 사용량의 상한)
+            calibration: 스캔 보정 (지정 시 테이블별 단계 소요 시간을 기록하고 시간 예측에 사용)
+        """
+        super().__init__(
+            sample_size=sample_size, pattern_registry=pattern_registry, sample_cache=sample_cache,
+            cache_source=make_source_id('postgresql', host, port, database),
+            parallel_columns=parallel_columns, projection_pushdown=projection_pushdown,
+            max_value_length=max_value_length, tail_length=tail_length, sample_seed=sample_seed,
+            partition_sampling=partition_sampling, partition_workers=partition_workers,
+            prefetch_tables=prefetch_tables, calibration=calibration
+        )
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+        self.port = port
+
+        # 전체 스캔 (감사용, 샘플 대신 모든 행을 스트리밍)
+        self.full_scan = full_scan
+        self.copy_batch_bytes = copy_batch_bytes
+
+        # 시스템 스키마 (pg_ 로 시작하는 스키마는 is_system_schema 에서 제외)
+        self.system_schemas = {'information_schema', 'pg_catalog', 'pg_toast'}
+
+        # 패턴 스캔 대상 컬럼 타입 (format_type 기준, 나머지 타입은 이름이 의심스러운 경우만 조회)
+        self.scannable_types = PG_TEXT_TYPES | {'json', 'jsonb'}
+
+        # 서버에서 잘라서 조회할 긴 텍스트 타입
+        self.truncatable_types = {'character varying', 'varchar', 'text', 'citext', 'xml', 'json', 'jsonb'}
+
+        print(f"🐘 PostgreSQL 스캐너 ({host}:{port}/{database}, {'COPY 전체 스캔' if full_scan else 'TABLESAMPLE'})")
+
+    def validate_config(self) -> bool:
+        """설정 유효성 검사"""
+        issues = []
+
+        if not self.host:
+            issues.append("호스트가 설정되지 않았습니다")
+
+        if not self.user:
+            issues.append("사용자명이 설정되지 않았습니다")
+
+        if self.sample_size <= 0:
+            issues.append("샘플 크기는 0보다 커야 합니다")
+
+        if self.port <= 0 or self.port > 65535:
+            issues.append("포트 번호가 유효하지 않습니다")
+
+        if issues:
+            print("❌ 설정 오류:")
+            for issue in issues:
+                print(f"   • {issue}")
+            return False
+
+        return True
+
+    def test_connection(self) -> bool:
+        """연결 테스트"""
+        print(f"🔍 PostgreSQL 연결 테스트 중... ({self.host}:{self.port}/{self.database})")
+        try:
+            connection = self.open_connection()
+            connection.close()
+            print(f"✅ PostgreSQL 연결 테스트 성공")
+            return True
+        except psycopg2.Error as err:
+            print(f"❌ PostgreSQL 연결 테스트 실패: {err}")
+            return False
+
+    def connection_params(self, database: Optional[str] = None) -> Dict[str, Any]:
+        """연결 파라미터 구성 (파티션 병렬 샘플링용 추가 연결에도 사용)"""
+        connection_params = {
+            'host': self.host,
+            'port': self.port,
+            'user': self.user,
+            'dbname': database or self.database,
+            'connect_timeout': 30,
+            'application_name': 'pii_scan'
+        }
+
+        # 비밀번호가 있는 경우에만 추가
+        if self.password:
+            connection_params['password'] = self.password
+
+        return connection_params
+
+    def open_connection(self):
+        """새 PostgreSQL 연결 (읽기 전용 세션, 파티션 병렬 샘플링용 추가 연결에도 사용)"""
+        connection = psycopg2.connect(**self.connection_params())
+        connection.set_session(readonly=True, autocommit=True)
+        return connection
+
+    def connect(self):
+        """PostgreSQL 연결"""
+        if not self.validate_config():
+            return False
+
+        try:
+            print(f"🔗 PostgreSQL에 연결 중... ({self.host}:{self.port}/{self.database})")
+            self.connection = self.open_connection()
+
+            cursor = self.connection.cursor()
+            cursor.execute("SHOW server_version")
+            version = cursor.fetchone()[0]
+            cursor.close()
+
+            print(f"✅ PostgreSQL 연결 성공: {self.host}:{self.port}/{self.database}")
+            print(f"   • 서버 버전: {version}")
+            return True
+        except psycopg2.Error as err:
+            print(f"❌ PostgreSQL 연결 실패: {err}")
+            return False
+
+    def disconnect(self):
+        """PostgreSQL 연결 해제"""
+        if self.connection is not None and not self.connection.closed:
+            self.connection.close()
+            print("🔐 PostgreSQL 연결 해제")
+        else:
+            print("ℹ️  이미 연결이 해제되었습니다")
+
+    def get_databases(self) -> List[str]:
+        """연결한 데이터베이스의 스키마 목록 (MySQL 의 데이터베이스 목록에 해당)"""
+        if self.connection is None or self.connection.closed:
+            print("❌ PostgreSQL 연결이 없습니다")
+            return []
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT nspname FROM pg_namespace ORDER BY nspname")
+            schemas = [row[0] for row in cursor.fetchall()]
+            cursor.close()
+            return schemas
+        except psycopg2.Error as err:
+            print(f"❌ 스키마 목록 조회 실패: {err}")
+            return []
+
+    def is_system_schema(self, database_name: str) -> bool:
+        """시스템 스키마인지 확인 (pg_temp_N, pg_toast_temp_N 등 세션별 임시 스키마 포함)"""
+        if database_name.lower().startswith('pg_'):
+            return True
+        return super().is_system_schema(database_name)
+
+    def list_namespaces(self) -> List[str]:
+        return self.user_namespaces(self.get_databases())
+
+    def get_tables(self, schema: str) -> List[str]:
+        """특정 스키마의 테이블 목록 조회 (파티션 테이블은 상위 테이블만)"""
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT c.relname
+            FROM pg_class c
+                     JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+              AND c.relkind IN ('r', 'p')
+              AND NOT c.relispartition
+            ORDER BY c.relname
+        """, (schema,))
+        tables = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        return tables
+
+    def get_changed_tables(self, schema: str, since: datetime) -> List[str]:
+        """since 이후 변경되었을 수 있는 테이블 목록 조회 (증분 스캔용)"""
+        cursor = self.connection.cursor()
+        # PostgreSQL 에는 테이블 변경 시각이 없으므로 마지막 ANALYZE 이후 변경 행 수와 ANALYZE 시각으로 판단
+        # 통계가 없는 테이블(파티션 상위 테이블, ANALYZE 전)은 변경 여부를 알 수 없으므로 포함
+        cursor.execute("""
+            SELECT c.relname
+            FROM pg_class c
+                     JOIN pg_namespace n ON n.oid = c.relnamespace
+                     LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+            WHERE n.nspname = %s
+              AND c.relkind IN ('r', 'p')
+              AND NOT c.relispartition
+              AND (s.relid IS NULL
+                OR s.n_mod_since_analyze > 0
+                OR COALESCE(GREATEST(s.last_analyze, s.last_autoanalyze), %s) >= %s)
+        """, (schema, since, since))
+        tables = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        return tables
+
+    def get_table_stats(self, source: str, cursor=None) -> Dict:
+        """
+        reltuples / relpages 통계 (파티션 테이블은 리프 파티션 합계)
+
+        ANALYZE/VACUUM 전이라 reltuples 가 -1 인 파티션은 합계에서 빼고, 모두 없으면 rows 는 None 입니다.
+        source 는 regclass 로 해석되는 테이블 이름입니다 (예: "public"."users").
+        """
+        own_cursor = cursor is None
+        if own_cursor:
+            cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT SUM(c.reltuples) FILTER (WHERE c.reltuples >= 0), SUM(c.relpages)
+                FROM pg_partition_tree(%s::regclass) t
+                         JOIN pg_class c ON c.oid = t.relid
+                WHERE t.isleaf
+            """, (source,))
+            row = cursor.fetchone()
+        finally:
+            if own_cursor:
+                cursor.close()
+
+        return {
+            'rows': int(row[0]) if row and row[0] is not None else None,
+            'pages': int(row[1]) if row and row[1] is not None else 0
+        }
+
+    def get_table_info(self, schema: str, table: str) -> Dict:
+        """테이블 정보 조회 (통계 기준 추정 행 수, 컬럼 정보)"""
+        source = self.table_source(schema, table)
+        stats = self.get_table_stats(source)
+
+        cursor = self.connection.cursor()
+        try:
+            total_rows = stats['rows']
+            row_count_source = 'reltuples'
+            if total_rows is None:
+                # 통계가 없으면 상한을 두고 직접 확인 (큰 테이블 전체 COUNT 방지)
+                cursor.execute(f"SELECT COUNT(*) FROM (SELECT 1 FROM {source} LIMIT {PG_COUNT_PROBE_LIMIT}) t")
+                total_rows = cursor.fetchone()[0]
+                row_count_source = 'count' if total_rows < PG_COUNT_PROBE_LIMIT else 'count_capped'
+
+            cursor.execute("""
+                SELECT a.attname, format_type(a.atttypid, a.atttypmod), a.attnotnull, pg_get_expr(d.adbin, d.adrelid)
+                FROM pg_attribute a
+                         LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+                WHERE a.attrelid = %s::regclass
+                  AND a.attnum > 0
+                  AND NOT a.attisdropped
+                ORDER BY a.attnum
+            """, (source,))
+            columns = []
+            for row in cursor.fetchall():
+                columns.append({
+                    'name': row[0],
+                    'type': row[1],
+                    'null': 'NO' if row[2] else 'YES',
+                    'default': row[3]
+                })
+        finally:
+            cursor.close()
+
+        return {
+            'total_rows': total_rows,
+            'row_count_source': row_count_source,
+            'pages': stats['pages'],
+            'columns': columns
+        }
+
+    def get_partitions(self, schema: str, table: str) -> List[Dict]:
+        """
+        리프 파티션 목록 (하위 파티션까지 펼침, 파티션되지 않은 테이블이면 자기 자신 하나)
+
+        name 은 regclass 텍스트라 필요한 경우 스키마/따옴표가 붙어 있어 그대로 FROM 절에 사용할 수 있습니다.
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT t.relid::regclass::text, c.reltuples, c.relpages
+                FROM pg_partition_tree(%s::regclass) t
+                         JOIN pg_class c ON c.oid = t.relid
+                WHERE t.isleaf
+                ORDER BY t.relid::regclass::text
+            """, (self.table_source(schema, table),))
+            return [
+                {'name': row[0], 'rows': int(row[1]) if row[1] >= 0 else None, 'pages': row[2]}
+                for row in cursor.fetchall()
+            ]
+        except psycopg2.Error as err:
+            print(f"    ⚠️  파티션 조회 실패: {err}")
+            return []
+        finally:
+            cursor.close()
+
+    def load_table_sample(self, schema: str, table: str) -> Tuple[Optional[pl.DataFrame], Dict]:
+        """테이블에서 샘플 데이터를 Polars DataFrame으로 로드 (TABLESAMPLE)"""
+        table_info = self.get_table_info(schema, table)
+        total_rows = table_info['total_rows']
+        source = self.table_source(schema, table)
+
+        selected, skipped_columns = table_info['columns'], []
+        if self.projection_pushdown:
+            selected, skipped_columns = self.select_scan_columns(table_info['columns'])
+            if not selected:
+                print(f"    ⏭️  스캔 대상 컬럼 없음 (문자열 타입/의심 컬럼명 없음)")
+                return None, {'method': 'no_scannable_columns', 'total_rows': total_rows, 'sampled_rows': 0,
+                              'skipped_columns': skipped_columns}
+
+        # 긴 텍스트는 서버에서 잘라서 전송 (앞부분 + 선택적으로 뒷부분), JSON 등은 텍스트로 변환
+        select_list = ', '.join(self.column_expression(col) for col in selected) or '*'
+        truncated_columns = [col['name'] for col in selected if self.value_expression(col) != self.text_expression(col)]
+
+        partitions = []
+        if self.partition_sampling and total_rows > self.sample_size:
+            partitions = self.get_partitions(schema, table)
+
+        cursor = self.connection.cursor()
+        try:
+            partition_details = None
+            sample_details = None
+            if len(partitions) > 1:
+                rows, columns, partition_details = self._sample_partitions(schema, table, select_list, partitions)
+                sample_method = f"PostgreSQL 파티션 샘플링 ({len(partition_details)}개 파티션)"
+            elif total_rows <= self.sample_size:
+                # 통계상 작은 테이블은 그대로 조회 (통계가 0 이어도 실제 행이 있는지 확인)
+                cursor.execute(f"SELECT {select_list} FROM {source} LIMIT {self.sample_size + 1}")
+                rows = self.fetch_rows(cursor)
+                columns = [desc[0] for desc in cursor.description]
+                sample_method = "전체 데이터"
+                if len(rows) > self.sample_size:
+                    print(f"    ⚠️  통계 행 수({total_rows:,})가 실제보다 적음 - ANALYZE 필요, 앞부분 {self.sample_size}행만 사용")
+                    rows = rows[:self.sample_size]
+                    sample_method = "앞부분 조회 (통계 부족)"
+                total_rows = max(total_rows, len(rows))
+            else:
+                stats = {'rows': total_rows, 'pages': table_info['pages']}
+                rows, columns, sample_method, sample_details = self._fetch_sample(
+                    cursor, schema, table, source, select_list, stats
+                )
+
+            if not rows:
+                if total_rows == 0:
+                    print(f"    ⚠️  빈 테이블")
+                    return None, {'method': 'empty', 'total_rows': 0, 'sampled_rows': 0}
+                return None, {'method': 'no_data', 'total_rows': total_rows, 'sampled_rows': 0}
+
+            with self.stage('frame'):
+                df = pl.DataFrame(rows, schema=columns, orient='row', infer_schema_length=None)
+
+            sampling_info = {
+                'method': sample_method,
+                'total_rows': total_rows,
+                'row_count_source': table_info['row_count_source'],
+                'sampled_rows': len(rows),
+                'sampling_ratio': min(1.0, len(rows) / total_rows) if total_rows > 0 else 0,
+                'skipped_columns': skipped_columns,
+                'truncated_columns': truncated_columns,
+                'max_value_length': self.max_value_length,
+                'sample_seed': self.sample_seed,
+                'table_seed': derive_table_seed(self.sample_seed, schema, table)
+            }
+            if sample_details:
+                sampling_info['sample_details'] = sample_details
+            if partition_details:
+                sampling_info['partitions'] = partition_details
+
+            print(f"    📊 ~{total_rows:,}행 → {len(rows)}행 샘플링 ({sample_method})")
+            return df, sampling_info
+
+        except Exception as e:
+            print(f"    ❌ 데이터 로드 오류: {str(e)}")
+            return None, {'method': 'error', 'error': str(e)}
+        finally:
+            cursor.close()
+
+    def _fetch_sample(self, cursor, schema: str, table: str, source: str, select_list: str, stats: Dict,
+                      target: Optional[int] = None,
+                      salt: Optional[str] = None) -> Tuple[List[tuple], List[str], str, Dict]:
+        """
+        샘플 행 조회 (TABLESAMPLE ... REPEATABLE, 정렬 없음)
+
+        큰 테이블은 SYSTEM 으로 일부 페이지만 읽고, 나머지는 행 단위 BERNOULLI 를 사용합니다.
+        비율은 추정 행 수보다 조금 넉넉하게 잡고, 목표를 넘은 행은 LIMIT 대신 시드 기반으로 골라 냅니다.
+        (LIMIT 으로 자르면 물리적으로 뒤쪽 페이지 - 보통 최근 행 - 가 빠짐)
+        목표에 못 미치면 비율을 늘려 다른 시드로 추가 조회하고 (tableoid, ctid) 로 중복을 제거합니다.
+        """
+        target = target or self.sample_size
+        use_system, percent = self.sample_plan(stats, target)
+        sample_clause = 'SYSTEM' if use_system else 'BERNOULLI'
+
+        projection = 't.*' if select_list == '*' else select_list
+        sampled: Dict[str, tuple] = {}
+        seeds = []
+        columns: List[str] = []
+
+        for attempt in range(1 + PG_SAMPLE_TOP_UP_PASSES):
+            # 첫 조회는 테이블(파티션) 시드, 보충 조회는 회차별 파생 시드 (재실행해도 같은 표본)
+            salts = [] if salt is None else [salt]
+            if attempt:
+                salts.append(str(attempt))
+            seed = derive_table_seed(self.sample_seed, schema, table, salt=':'.join(salts) or None)
+            seeds.append(seed)
+
+            cursor.execute(f"""
+                SELECT t.tableoid::text || ':' || t.ctid::text AS "{PG_ROW_KEY_ALIAS}", {projection}
+                FROM {source} t TABLESAMPLE {sample_clause} ({percent:.6f}) REPEATABLE ({seed})
+                LIMIT {target * PG_SAMPLE_FETCH_FACTOR}
+            """)
+            for row in self.fetch_rows(cursor):
+                sampled.setdefault(row[0], row[1:])
+            columns = [desc[0] for desc in cursor.description][1:]
+
+            if len(sampled) >= target or percent >= PG_MAX_SAMPLE_PERCENT:
+                break
+
+            label = f" {salt}" if salt else ""
+            print(f"    🔁 샘플 부족{label} ({len(sampled)}/{target}행) - 추가 조회")
+            percent = min(PG_MAX_SAMPLE_PERCENT, percent * 2)
+
+        rows = list(sampled.values())
+        if len(rows) > target:
+            # 조회 순서(물리 순서)는 유지하고 시드 기반으로 목표 행 수만 선택
+            keep = sorted(random.Random(seeds[0]).sample(range(len(rows)), target))
+            rows = [rows[i] for i in keep]
+
+        sample_details = {
+            'strategy': sample_clause.lower(),
+            'percent': round(percent, 6),
+            'seeds': seeds,
+            'passes': len(seeds),
+            'reltuples': stats['rows'],
+            'relpages': stats['pages']
+        }
+        sample_method = f"TABLESAMPLE {sample_clause} ({percent:.4g}%)"
+        return rows, columns, sample_method, sample_details
+
+    @staticmethod
+    def sample_plan(stats: Dict, target: int) -> Tuple[bool, float]:
+        """TABLESAMPLE SYSTEM 사용 여부와 첫 조회 샘플 비율(%)"""
+        use_system = (stats['pages'] or 0) >= PG_SYSTEM_SAMPLE_MIN_PAGES
+        percent = target / max(stats['rows'] or 0, 1) * 100 * PG_SAMPLE_OVERSAMPLE
+        return use_system, min(PG_MAX_SAMPLE_PERCENT, max(PG_MIN_SAMPLE_PERCENT, percent))
+
+    def partition_detail(self, schema: str, table: str, partition: Dict) -> Dict:
+        return {'seed': derive_table_seed(self.sample_seed, schema, table, salt=f"partition:{partition['name']}")}
+
+    def _sample_partition(self, schema: str, table: str, select_list: str, partition: Dict,
+                          limit: int) -> Tuple[List[tuple], List[str], Optional[Dict]]:
+        """
+        리프 파티션 하나에서 샘플 조회 (병렬 조회 시 작업마다 별도 연결 사용)
+
+        파티션도 일반 테이블처럼 TABLESAMPLE 로 읽습니다. 첫 조회 시드는 파티션 상세의 seed 와 같습니다 (salt partition:이름).
+        """
+        connection = self.open_connection() if self.partition_workers > 1 else self.connection
+        try:
+            cursor = connection.cursor()
+            try:
+                stats = self.get_table_stats(partition['name'], cursor)
+                rows, columns, _, _ = self._fetch_sample(
+                    cursor, schema, table, partition['name'], select_list, stats, target=limit,
+                    salt=f"partition:{partition['name']}"
+                )
+            finally:
+                cursor.close()
+            return rows, columns, None
+        finally:
+            if connection is not self.connection:
+                connection.close()
+
+    @staticmethod
+    def quote_identifier(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    def table_source(self, schema: str, table: str) -> str:
+        return f"{self.quote_identifier(schema)}.{self.quote_identifier(table)}"
+
+    @staticmethod
+    def base_type(col: Dict) -> str:
+        """format_type 결과에서 길이/스키마를 뺀 타입명 (예: character varying(100) → character varying)"""
+        return col['type'].split('(')[0].strip().lower().split('.')[-1].strip('"')
+
+    def is_scannable_type(self, col: Dict) -> bool:
+        return self.base_type(col) in self.scannable_types
+
+    def text_expression(self, col: Dict) -> str:
+        """컬럼 조회 표현식 (JSON/UUID/배열 등 DataFrame 에 그대로 넣기 어려운 타입은 ::text 로 변환)"""
+        name = self.quote_identifier(col['name'])
+        base_type = self.base_type(col)
+        if base_type in PG_TEXT_TYPES or base_type in PG_NATIVE_TYPES:
+            return name
+        return f"{name}::text"
+
+    def value_expression(self, col: Dict) -> str:
+        """컬럼 값 표현식 (긴 텍스트 컬럼은 LEFT/RIGHT 로 서버에서 잘라서 조회)"""
+        expr = self.text_expression(col)
+        base_type = self.base_type(col)
+        cap = self.max_value_length
+
+        if not cap or base_type not in self.truncatable_types:
+            return expr
+        if base_type in ('character varying', 'varchar'):
+            match = re.search(r'\((\d+)\)', col['type'])
+            if match and int(match.group(1)) <= cap:
+                return expr
+
+        if self.tail_length:
+            head = cap - self.tail_length
+            return (f"CASE WHEN CHAR_LENGTH({expr}) > {cap} "
+                    f"THEN LEFT({expr}, {head}) || '{TRUNCATION_SEPARATOR}' || RIGHT({expr}, {self.tail_length}) "
+                    f"ELSE {expr} END")
+        return f"LEFT({expr}, {cap})"
+
+    def copy_table_batches(self, schema: str, table: str, columns: List[Dict],
+                           on_batch: Callable[[pl.DataFrame], None]) -> _CopyBatchWriter:
+        """
+        COPY (SELECT ...) TO STDOUT 으로 전체 행을 스트리밍해 배치 단위 DataFrame 으로 전달
+
+        서버가 보내는 CSV 를 copy_batch_bytes 만큼 모아 행 경계에서 잘라 Polars 로 파싱하므로
+        테이블 크기와 관계없이 메모리 사용량은 배치 크기 수준입니다. 모든 컬럼은 문자열로 전달됩니다.
+        """
+        select_list = ', '.join(self.column_expression(col) for col in columns)
+        writer = _CopyBatchWriter([col['name'] for col in columns], self.copy_batch_bytes, on_batch)
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY (SELECT {select_list} FROM {self.table_source(schema, table)}) TO STDOUT WITH (FORMAT csv)",
+                writer
+            )
+        finally:
+            cursor.close()
+        writer.flush()
+        return writer
+
+    def scan_table_full(self, schema: str, table: str) -> Dict:
+        """
+        COPY 스트리밍 전체 스캔 (샘플링 없이 모든 행, 결과 구조는 샘플 스캔과 같음)
+
+        배치마다 문자열 컬럼을 스캔해 개수를 합산하고, 점수 계산과 마스킹 예시는 첫 배치 앞부분으로 만듭니다.
+        문자열 타입 컬럼만 조회하며 결과는 샘플 캐시에 저장하지 않습니다.
+        """
+        table_info = self.get_table_info(schema, table)
+        columns = [col for col in table_info['columns'] if self.is_scannable_type(col)]
+        skipped_columns = [col['name'] for col in table_info['columns'] if not self.is_scannable_type(col)]
+        if not columns:
+            print(f"    ⏭️  스캔 대상 컬럼 없음 (문자열 타입 없음)")
+            return self.analyze_dataframe(None, table, {
+                'method': 'no_scannable_columns', 'total_rows': table_info['total_rows'], 'sampled_rows': 0,
+                'skipped_columns': skipped_columns
+            })
+
+        pattern_set = self.pattern_registry.compiled()
+        names = [col['name'] for col in columns]
+        merged = {name: {'privacy_matches': {}, 'total_values': 0, 'privacy_count': 0} for name in names}
+        preview: List[pl.DataFrame] = []
+
+        def on_batch(df: pl.DataFrame):
+            if not preview:
+                preview.append(df.head(self.sample_size))
+            for column, result in scan_columns(df, names, pattern_set, self.pattern_budget).items():
+                totals = merged[column]
+                for pattern_name, count in result['privacy_matches'].items():
+                    totals['privacy_matches'][pattern_name] = totals['privacy_matches'].get(pattern_name, 0) + count
+                totals['total_values'] += result['total_values']
+                totals['privacy_count'] += result['privacy_count']
+
+        started = time.perf_counter()
+        try:
+            writer = self.copy_table_batches(schema, table, columns, on_batch)
+        except psycopg2.Error as err:
+            print(f"    ❌ 전체 스캔 오류: {err}")
+            return self.analyze_dataframe(None, table, {'method': 'error', 'error': str(err)})
+        elapsed = time.perf_counter() - started
+
+        if not preview:
+            print(f"    ⚠️  빈 테이블")
+            return self.analyze_dataframe(None, table, {'method': 'empty', 'total_rows': 0, 'sampled_rows': 0})
+
+        column_scans = {}
+        for column, totals in merged.items():
+            values = [str(val) for val in preview[0][column].drop_nulls().head(5).to_list()]
+            column_scans[column] = {
+                **totals,
+                'privacy_ratio': totals['privacy_count'] / totals['total_values'] if totals['total_values'] else 0,
+                'sample_values': self.mask_sample_data(values, pattern_set)
+            }
+
+        sampling_info = {
+            'method': 'COPY 전체 스캔',
+            'total_rows': writer.rows,
+            'sampled_rows': writer.rows,
+            'sampling_ratio': 1.0,
+            'skipped_columns': skipped_columns,
+            'truncated_columns': [col['name'] for col in columns
+                                  if self.value_expression(col) != self.text_expression(col)],
+            'max_value_length': self.max_value_length,
+            'copy_batches': writer.batches,
+            'elapsed_sec': round(elapsed, 3)
+        }
+        print(f"    📊 {writer.rows:,}행 전체 스캔 (COPY, {writer.batches}개 배치, {elapsed:.2f}s)")
+
+        return self.analyze_dataframe(preview[0], table, sampling_info, column_scans=column_scans)
+
+    def scan_table(self, schema: str, table: str) -> Dict:
+        """테이블 스캔 (full_scan 이면 COPY 전체 스캔)"""
+        if not self.full_scan:
+            return super().scan_table(schema, table)
+
+        print(f"  📋 테이블 전체 스캔: {table}")
+        result = self.scan_table_full(schema, table)
+        print(f"    ✅ 완료 (위험도: {result['risk_level']}, 점수: {result['privacy_score']})")
+        return result
+
+    def scan_namespace(self, schema: str, changed_since: Optional[datetime] = None) -> Dict:
+        """스키마 전체 스캔 (full_scan 이면 테이블을 하나씩 스트리밍 - 미리 조회하지 않음)"""
+        if not self.full_scan:
+            return super().scan_namespace(schema, changed_since)
+
+        print(f"🔍 스키마 전체 스캔 시작: {schema} (COPY 스트리밍)")
+        scan_results = self._new_scan_results(schema)
+        scan_results['full_scan'] = True
+
+        try:
+            tables = self.get_tables(schema)
+            scan_results['summary']['total_tables'] = len(tables)
+
+            if changed_since is not None:
+                tables = self._select_changed_tables(schema, tables, changed_since, scan_results)
+
+            for table in tables:
+                self._add_table_result(scan_results, table, self.scan_table(schema, table))
+
+        except Exception as e:
+            scan_results['error'] = str(e)
+            print(f"❌ 스키마 스캔 오류: {str(e)}")
+
+        if self.pattern_budget.disabled:
+            scan_results['disabled_patterns'] = self.pattern_budget.report()
+
+        return scan_results
+
+    def analyze_database_structure(self, schema: str) -> Dict:
+        """스키마 구조 분석 및 처리 비용 예측"""
+        return self.analyze_structure(schema)
+
+    def scan_database(self, schema: str, changed_since: Optional[datetime] = None) -> Dict:
+        """스키마 전체 스캔 (changed_since 지정 시 이후 변경된 테이블만)"""
+        return self.scan_namespace(schema, changed_since)
+
+    def preview_all_databases(self) -> List[Dict]:
+        """모든 스키마 구조 분석 및 처리 비용 예측"""
+        return self.preview_all()
+
+    def scan_all_databases(self, changed_since: Optional[datetime] = None) -> List[Dict]:
+        """모든 스키마 스캔 (실제 개인정보 탐지)"""
+        return self.scan_all(changed_since)
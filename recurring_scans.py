@@ -0,0 +1,274 @@
+import asyncio
+import logging
+import sqlite3
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# cron 매크로
+CRON_ALIASES = {
+    '@yearly': '0 0 1 1 *',
+    '@annually': '0 0 1 1 *',
+    '@monthly': '0 0 1 * *',
+    '@weekly': '0 0 * * 0',
+    '@daily': '0 0 * * *',
+    '@nightly': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@hourly': '0 * * * *',
+}
+
+
+class CronExpression:
+    # (필드명, 최소값, 최대값)
+    FIELDS = [
+        ('minute', 0, 59),
+        ('hour', 0, 23),
+        ('day', 1, 31),
+        ('month', 1, 12),
+        ('weekday', 0, 6),
+    ]
+
+    def __init__(self, expression: str):
+        """
+        5필드 cron 표현식 (분 시 일 월 요일)
+
+        지원 문법: *, 숫자, 범위(a-b), 간격(*/n, a-b/n), 목록(a,b,c), @daily 등 매크로
+        요일은 0(일요일)~6(토요일), 7도 일요일로 취급합니다.
+        """
+        self.expression = expression.strip()
+        fields = CRON_ALIASES.get(self.expression.lower(), self.expression).split()
+
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드가 필요합니다: '{expression}'")
+
+        self.values: Dict[str, Set[int]] = {}
+        for text, (name, low, high) in zip(fields, self.FIELDS):
+            # 요일 7 = 일요일
+            field_high = 7 if name == 'weekday' else high
+            values = self._parse_field(text, low, field_high, name)
+            if name == 'weekday':
+                values = {v % 7 for v in values}
+            self.values[name] = values
+
+        # 일/요일이 모두 제한된 경우 둘 중 하나만 맞아도 실행 (표준 cron 동작)
+        # Vixie cron 과 같이 '*' 로 시작하는 필드(*/2 등)는 제한하지 않은 것으로 봄
+        self.day_restricted = not fields[2].startswith('*')
+        self.weekday_restricted = not fields[4].startswith('*')
+
+    @staticmethod
+    def _parse_field(text: str, low: int, high: int, name: str) -> Set[int]:
+        values = set()
+        for part in text.split(','):
+            step = 1
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                if not step_text.isdigit() or int(step_text) <= 0:
+                    raise ValueError(f"잘못된 간격 값 ({name}): '{step_text}'")
+                step = int(step_text)
+
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start_text, end_text = part.split('-', 1)
+                if not (start_text.isdigit() and end_text.isdigit()):
+                    raise ValueError(f"잘못된 범위 ({name}): '{part}'")
+                start, end = int(start_text), int(end_text)
+            elif part.isdigit():
+                start = end = int(part)
+                if step != 1:
+                    end = high
+            else:
+                raise ValueError(f"잘못된 값 ({name}): '{part}'")
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"허용 범위({low}-{high})를 벗어난 값 ({name}): '{part}'")
+
+            values.update(range(start, end + 1, step))
+
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        # datetime.weekday(): 월=0 → cron: 일=0
+        cron_weekday = (dt.weekday() + 1) % 7
+        day_ok = dt.day in self.values['day']
+        weekday_ok = cron_weekday in self.values['weekday']
+
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """after 이후(미포함) 처음으로 일치하는 시각"""
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * 5)
+
+        while dt <= limit:
+            if dt.month not in self.values['month']:
+                # 다음 달 1일 0시로 이동
+                dt = (dt.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if dt.hour not in self.values['hour']:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+                continue
+            if dt.minute not in self.values['minute']:
+                dt += timedelta(minutes=1)
+                continue
+            return dt
+
+        raise ValueError(f"일치하는 실행 시각이 없습니다: '{self.expression}'")
+
+    def interval_hint(self, at: datetime) -> timedelta:
+        """at 이후 연속된 두 실행 사이의 간격 (지터 상한 계산용)"""
+        first = self.next_after(at)
+        return self.next_after(first) - first
+
+
+def host_jitter_seconds(host: str, window_sec: int) -> int:
+    """호스트별로 고정된 지터 (프로세스가 바뀌어도 동일한 값)"""
+    if window_sec <= 0:
+        return 0
+    return zlib.crc32(host.encode('utf-8')) % window_sec
+
+
+def compute_next_run(cron: CronExpression, host: str, after: datetime, jitter_window_sec: int) -> datetime:
+    """다음 실행 시각 (cron 시각 + 호스트별 지터)"""
+    base = cron.next_after(after)
+    # 지터가 실행 간격의 절반을 넘으면 다음 실행을 건너뛸 수 있으므로 제한
+    max_jitter = int(min(jitter_window_sec, cron.interval_hint(after).total_seconds() / 2))
+    return base + timedelta(seconds=host_jitter_seconds(host, max_jitter))
+
+
+class RecurringScanRunner:
+    def __init__(self, db_path: str,
+                 launch_scan: Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[str]],
+                 get_job_status: Callable[[str], Optional[str]],
+                 poll_interval_sec: int = 30,
+                 jitter_window_sec: int = 900):
+        """
+        저장된 DB 설정에 연결된 정기 스캔 실행기
+
+        Args:
+            db_path: scan_schedules / database_configs 테이블이 있는 SQLite 경로
+            launch_scan: (설정 행, 스케줄 행) → job_id 를 반환하는 코루틴 함수
+            get_job_status: job_id → 'pending' / 'running' / 'completed' / 'failed' / None
+            poll_interval_sec: 실행 대상 확인 주기
+            jitter_window_sec: 호스트별 시작 시각 분산 범위
+        """
+        self.db_path = db_path
+        self.launch_scan = launch_scan
+        self.get_job_status = get_job_status
+        self.poll_interval_sec = poll_interval_sec
+        self.jitter_window_sec = jitter_window_sec
+        self._task: Optional[asyncio.Task] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def next_run_for(self, cron_text: str, host: str, after: Optional[datetime] = None) -> datetime:
+        return compute_next_run(CronExpression(cron_text), host, after or datetime.now(), self.jitter_window_sec)
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"정기 스캔 실행기 시작 (확인 주기: {self.poll_interval_sec}초)")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.run_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"정기 스캔 확인 중 오류: {e}")
+            await asyncio.sleep(self.poll_interval_sec)
+
+    async def run_due(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """실행 시각이 지난 스케줄을 시작하고 처리 결과 목록을 반환"""
+        now = now or datetime.now()
+        outcomes = []
+
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT s.*, c.host AS config_host, c.port AS config_port
+                FROM scan_schedules s
+                JOIN database_configs c ON c.id = s.config_id
+                WHERE s.enabled = 1
+                ORDER BY s.next_run_at
+            ''')
+            schedules = [dict(row) for row in cursor.fetchall()]
+
+            for schedule in schedules:
+                self._record_last_result(cursor, schedule)
+
+                next_run_at = datetime.fromisoformat(schedule['next_run_at']) if schedule['next_run_at'] else None
+                if next_run_at is not None and next_run_at > now:
+                    continue
+
+                host = f"{schedule['config_host']}:{schedule['config_port']}"
+                following = self.next_run_for(schedule['cron'], host, now)
+
+                # 같은 설정의 이전 실행이 끝나지 않았으면 겹치지 않도록 건너뜀
+                last_status = self.get_job_status(schedule['last_job_id']) if schedule['last_job_id'] else None
+                if last_status in ('pending', 'running'):
+                    logger.warning(f"정기 스캔 건너뜀 (이전 실행 진행 중): schedule={schedule['id']}, "
+                                   f"job={schedule['last_job_id']}")
+                    cursor.execute('UPDATE scan_schedules SET next_run_at = ? WHERE id = ?',
+                                   (following.isoformat(), schedule['id']))
+                    outcomes.append({'schedule_id': schedule['id'], 'action': 'skipped_overlap'})
+                    continue
+
+                cursor.execute('SELECT * FROM database_configs WHERE id = ?', (schedule['config_id'],))
+                config_row = cursor.fetchone()
+                if config_row is None:
+                    continue
+
+                try:
+                    job_id = await self.launch_scan(dict(config_row), schedule)
+                except Exception as e:
+                    logger.error(f"정기 스캔 시작 실패: schedule={schedule['id']}, 오류: {e}")
+                    cursor.execute('UPDATE scan_schedules SET next_run_at = ? WHERE id = ?',
+                                   (following.isoformat(), schedule['id']))
+                    outcomes.append({'schedule_id': schedule['id'], 'action': 'failed', 'error': str(e)})
+                    continue
+
+                cursor.execute('''
+                    UPDATE scan_schedules
+                    SET last_run_at = ?, last_job_id = ?, next_run_at = ?
+                    WHERE id = ?
+                ''', (now.isoformat(), job_id, following.isoformat(), schedule['id']))
+                outcomes.append({'schedule_id': schedule['id'], 'action': 'started', 'job_id': job_id})
+                logger.info(f"정기 스캔 시작: schedule={schedule['id']}, job={job_id}, "
+                            f"다음 실행: {following.isoformat()}")
+
+            conn.commit()
+        finally:
+            conn.close()
+
+        return outcomes
+
+    def _record_last_result(self, cursor: sqlite3.Cursor, schedule: Dict[str, Any]):
+        """직전 실행이 성공했으면 증분 스캔 기준 시각(last_success_at) 갱신"""
+        if not schedule['last_job_id'] or not schedule['last_run_at']:
+            return
+        if schedule['last_success_at'] and schedule['last_success_at'] >= schedule['last_run_at']:
+            return
+
+        if self.get_job_status(schedule['last_job_id']) == 'completed':
+            cursor.execute('UPDATE scan_schedules SET last_success_at = ? WHERE id = ?',
+                           (schedule['last_run_at'], schedule['id']))
+            schedule['last_success_at'] = schedule['last_run_at']
@@ -0,0 +1,272 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+from pattern_registry import CompiledPatternSet
+from pattern_safety import can_match_empty, sre_constants, sre_parse
+
+MYSQL = 'mysql'
+ORACLE = 'oracle'
+
+# 문자 클래스 밖에서 이스케이프가 필요한 문자
+_SPECIAL_CHARS = set('\\.^$|?*+()[]{}')
+
+# \d \s \w 와 부정형 (클래스 밖 / MySQL 클래스 안)
+_CATEGORY_ESCAPES = {
+    sre_constants.CATEGORY_DIGIT: r'\d',
+    sre_constants.CATEGORY_NOT_DIGIT: r'\D',
+    sre_constants.CATEGORY_SPACE: r'\s',
+    sre_constants.CATEGORY_NOT_SPACE: r'\S',
+    sre_constants.CATEGORY_WORD: r'\w',
+    sre_constants.CATEGORY_NOT_WORD: r'\W',
+}
+
+# Oracle 대괄호 안에서는 백슬래시가 일반 문자이므로 POSIX 문자 클래스로 표현
+_ORACLE_CLASS_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: '[:digit:]',
+    sre_constants.CATEGORY_SPACE: '[:space:]',
+    sre_constants.CATEGORY_WORD: '[:alnum:]_',
+}
+
+
+# 그대로 수량자를 붙일 수 있는 노드 (a+ 에 + 를 붙이면 소유 수량자가 되므로 반복은 제외)
+_ATOMS = {
+    sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY, sre_constants.IN,
+    sre_constants.SUBPATTERN, sre_constants.BRANCH,
+}
+
+
+class Untranslatable(Exception):
+    """DB 정규식으로 같은 의미를 표현할 수 없는 패턴"""
+
+
+class _Translator:
+    def __init__(self, dialect: str):
+        self.dialect = dialect
+
+    def sequence(self, items) -> str:
+        return ''.join(self.node(op, av) for op, av in items)
+
+    def atom(self, items) -> str:
+        """수량자를 붙일 수 있는 단위 (여러 요소 / 중첩 수량자면 그룹으로 감쌈)"""
+        text = self.sequence(items)
+        if len(items) == 1 and items[0][0] in _ATOMS:
+            return text
+        return f"({text})"
+
+    def literal(self, code: int) -> str:
+        ch = chr(code)
+        if code < 0x20 or code == 0x7f:
+            raise Untranslatable(f"제어 문자 {code:#x}")
+        return '\\' + ch if ch in _SPECIAL_CHARS else ch
+
+    def char_class(self, items) -> str:
+        negate = False
+        chars: List[str] = []
+        ranges: List[Tuple[int, int]] = []
+        categories: List[str] = []
+
+        for op, av in items:
+            if op == sre_constants.NEGATE:
+                negate = True
+            elif op == sre_constants.LITERAL:
+                if av < 0x20 or av == 0x7f:
+                    raise Untranslatable(f"제어 문자 {av:#x}")
+                chars.append(chr(av))
+            elif op == sre_constants.RANGE:
+                ranges.append(av)
+            elif op == sre_constants.CATEGORY:
+                if self.dialect == ORACLE:
+                    if av not in _ORACLE_CLASS_CATEGORIES:
+                        raise Untranslatable("Oracle 문자 클래스 안의 부정 범주")
+                    categories.append(_ORACLE_CLASS_CATEGORIES[av])
+                else:
+                    categories.append(_CATEGORY_ESCAPES[av])
+            else:
+                raise Untranslatable(f"문자 클래스 요소 {op}")
+
+        # 단일 범주(\d 등)는 클래스 없이 표현
+        if not negate and not chars and not ranges and len(items) == 1 and items[0][0] == sre_constants.CATEGORY:
+            return _CATEGORY_ESCAPES[items[0][1]]
+
+        if self.dialect == MYSQL:
+            def escape(ch: str) -> str:
+                return '\\' + ch if ch in '\\]-^[&' else ch
+
+            body = ''.join(escape(ch) for ch in chars)
+            body += ''.join(f"{escape(chr(lo))}-{escape(chr(hi))}" for lo, hi in ranges)
+            body += ''.join(categories)
+            return f"[{'^' if negate else ''}{body}]"
+
+        # POSIX 대괄호 (백슬래시 이스케이프 없음): ']' 는 맨 앞, '^' 는 맨 앞이 아닌 곳, '-' 는 맨 뒤,
+        # '[' 는 '[:' 등으로 해석되지 않도록 문자 목록의 끝에 배치
+        for lo, hi in ranges:
+            if any(chr(c) in '[]-^:.=' for c in (lo, hi)):
+                raise Untranslatable("Oracle 범위 경계의 특수 문자")
+        if chars == ['^'] and not negate:
+            return '\\^'
+
+        ordered = [ch for ch in chars if ch == ']']
+        ordered += [ch for ch in chars if ch not in ']^-[']
+        ordered += [ch for ch in chars if ch == '[']
+        body = ''.join(ordered)
+        body += ''.join(f"{chr(lo)}-{chr(hi)}" for lo, hi in ranges)
+        body += ''.join(categories)
+        if '^' in chars:
+            body = body + '^' if body else '-^' if '-' in chars else '^'
+        if '-' in chars and not body.startswith('-'):
+            body += '-'
+        return f"[{'^' if negate else ''}{body}]"
+
+    def repeat(self, op, av) -> str:
+        low, high, item = av
+        text = self.atom(item)
+        maximum = sre_constants.MAXREPEAT
+        if low == 0 and high == maximum:
+            quantifier = '*'
+        elif low == 1 and high == maximum:
+            quantifier = '+'
+        elif low == 0 and high == 1:
+            quantifier = '?'
+        elif high == maximum:
+            quantifier = f"{{{low},}}"
+        elif low == high:
+            quantifier = f"{{{low}}}"
+        else:
+            quantifier = f"{{{low},{high}}}"
+        if op == sre_constants.MIN_REPEAT:
+            quantifier += '?'
+        return text + quantifier
+
+    def node(self, op, av) -> str:
+        if op == sre_constants.LITERAL:
+            return self.literal(av)
+        if op == sre_constants.NOT_LITERAL:
+            return self.char_class([(sre_constants.NEGATE, None), (sre_constants.LITERAL, av)])
+        if op == sre_constants.ANY:
+            return '.'
+        if op == sre_constants.IN:
+            return self.char_class(av)
+        if op == sre_constants.BRANCH:
+            return '(' + '|'.join(self.sequence(branch) for branch in av[1]) + ')'
+        if op == sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, items = av
+            if add_flags or del_flags:
+                raise Untranslatable("인라인 플래그")
+            # 개수만 세므로 캡처 여부는 무관 (Oracle 은 (?:) 미지원)
+            return f"({self.sequence(items)})"
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            return self.repeat(op, av)
+        if op == sre_constants.AT:
+            return self.anchor(av)
+        if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if self.dialect != MYSQL:
+                raise Untranslatable("Oracle 전후방 탐색")
+            direction, items = av
+            prefix = {(sre_constants.ASSERT, 1): '(?=', (sre_constants.ASSERT, -1): '(?<=',
+                      (sre_constants.ASSERT_NOT, 1): '(?!', (sre_constants.ASSERT_NOT, -1): '(?<!'}[(op, direction)]
+            return prefix + self.sequence(items) + ')'
+        raise Untranslatable(f"지원하지 않는 구문 {op}")
+
+    def anchor(self, at) -> str:
+        anchors = {
+            sre_constants.AT_BEGINNING: '^',
+            sre_constants.AT_END: '$',
+            sre_constants.AT_BEGINNING_STRING: r'\A',
+            sre_constants.AT_END_STRING: r'\z',
+        }
+        if self.dialect == MYSQL:
+            anchors[sre_constants.AT_BOUNDARY] = r'\b'
+            anchors[sre_constants.AT_NON_BOUNDARY] = r'\B'
+        if at not in anchors:
+            raise Untranslatable(f"지원하지 않는 위치 지정자 {at}")
+        return anchors[at]
+
+
+def translate_pattern(pattern: str, dialect: str, flags: int = 0) -> str:
+    """
+    Python 정규식을 DB 정규식으로 변환 (같은 의미로 표현할 수 없으면 Untranslatable)
+
+    MySQL 8 (ICU) 은 \\b, 전후방 탐색까지 지원하고, Oracle 은 POSIX ERE + \\d/\\w/\\s, 게으른 수량자만 지원합니다.
+    빈 문자열과 일치할 수 있는 패턴은 DB 와 Python 의 일치 개수가 달라 변환하지 않습니다.
+    """
+    if dialect not in (MYSQL, ORACLE):
+        raise ValueError(f"지원하지 않는 DB 종류: {dialect}")
+    # 기본 플래그(UNICODE) 외의 플래그는 의미가 달라짐
+    if flags & ~(sre_constants.SRE_FLAG_UNICODE):
+        raise Untranslatable("정규식 플래그")
+    if can_match_empty(pattern):
+        raise Untranslatable("빈 문자열 일치")
+
+    parsed = sre_parse.parse(pattern)
+    # 패턴 앞의 전역 인라인 플래그 ((?i) 등)
+    if parsed.state.flags & ~(sre_constants.SRE_FLAG_UNICODE):
+        raise Untranslatable("인라인 플래그")
+    return _Translator(dialect).sequence(parsed)
+
+
+def plan_pushdown(pattern_set: CompiledPatternSet, dialect: str) -> Tuple[List[Tuple[str, str]], Dict[str, str]]:
+    """변환 가능한 패턴 (키, DB 정규식) 목록과 클라이언트 스캔으로 처리할 패턴별 사유"""
+    translated, fallback = [], {}
+    for key, compiled in pattern_set.items():
+        try:
+            translated.append((key, translate_pattern(compiled.pattern, dialect, compiled.flags)))
+        except (Untranslatable, KeyError) as e:
+            fallback[key] = str(e) or type(e).__name__
+    return translated, fallback
+
+
+def build_pushdown_query(dialect: str, source: str, columns: Sequence[str],
+                         translated: Sequence[Tuple[str, str]]) -> Tuple[str, Any]:
+    """
+    컬럼 × 패턴 집계를 한 행으로 반환하는 쿼리와 바인드 파라미터
+
+    컬럼마다 (값 개수, 패턴별 개수..., 하나라도 일치한 행 수) 순서로 select 합니다.
+    MySQL 은 REGEXP_COUNT 가 없어 패턴별 개수가 일치한 행 수이고, Oracle 은 REGEXP_COUNT 로 일치 횟수입니다.
+    대소문자 구분('c')은 Python 정규식과 같게 컬럼 collation 과 관계없이 지정합니다.
+
+    Args:
+        dialect: 'mysql' / 'oracle'
+        source: FROM 절 (인용된 테이블명)
+        columns: 인용된 컬럼명 목록
+        translated: plan_pushdown 의 (패턴 키, DB 정규식) 목록
+    """
+    select = []
+    if dialect == MYSQL:
+        params: Any = []
+        source = source.replace('%', '%%')
+        for column in columns:
+            # %s 파라미터를 사용하므로 식별자 안의 % 는 이스케이프
+            column = column.replace('%', '%%')
+            select.append(f"COUNT({column})")
+            for _, regex in translated:
+                select.append(f"SUM(REGEXP_LIKE({column}, %s, 'c'))")
+                params.append(regex)
+            select.append("SUM(" + ' OR '.join(f"REGEXP_LIKE({column}, %s, 'c')" for _ in translated) + ")")
+            params.extend(regex for _, regex in translated)
+        return f"SELECT {', '.join(select)} FROM {source}", tuple(params)
+
+    params = {f"p{i}": regex for i, (_, regex) in enumerate(translated)}
+    for column in columns:
+        select.append(f"COUNT({column})")
+        for i in range(len(translated)):
+            select.append(f"SUM(REGEXP_COUNT({column}, :p{i}, 1, 'c'))")
+        any_match = ' OR '.join(f"REGEXP_LIKE({column}, :p{i}, 'c')" for i in range(len(translated)))
+        select.append(f"SUM(CASE WHEN {any_match} THEN 1 ELSE 0 END)")
+    return f"SELECT {', '.join(select)} FROM {source}", params
+
+
+def parse_pushdown_row(dialect: str, row: Sequence[Any], column_names: Sequence[str],
+                       translated: Sequence[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+    """build_pushdown_query 결과 행 → 컬럼별 집계 (scan_column_patterns 와 같은 키 + 개수 단위)"""
+    results = {}
+    width = len(translated) + 2
+    for i, column in enumerate(column_names):
+        values = [int(value or 0) for value in row[i * width:(i + 1) * width]]
+        total_values, counts, privacy_count = values[0], values[1:-1], values[-1]
+        results[column] = {
+            'privacy_matches': {key: count for (key, _), count in zip(translated, counts) if count},
+            'total_values': total_values,
+            'privacy_count': privacy_count,
+            'privacy_ratio': privacy_count / total_values if total_values else 0,
+            'count_unit': 'rows' if dialect == MYSQL else 'matches',
+        }
+    return results
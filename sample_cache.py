@@ -0,0 +1,306 @@
+import glob
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import polars as pl
+from cryptography.fernet import Fernet, InvalidToken
+
+logger = logging.getLogger(__name__)
+
+# 캐시 위치 및 암호화 키 (키가 없으면 캐시 디렉토리에 생성)
+DEFAULT_CACHE_DIR = os.environ.get('PII_SAMPLE_CACHE_DIR', 'sample_cache')
+CACHE_KEY_ENV = 'PII_SAMPLE_CACHE_KEY'
+KEY_FILE_NAME = '.cache_key'
+
+ENCRYPTED_EXT = '.arrow.enc'
+PLAIN_EXT = '.arrow'
+
+
+def make_source_id(db_type: str, host: str, port: int, service_name: Optional[str] = None) -> str:
+    """샘플 출처 식별자 (예: mysql://db01:3306, oracle://db02:1521/ORCL)"""
+    source = f"{db_type}://{host}:{port}"
+    if service_name:
+        source += f"/{service_name}"
+    return source
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def schema_hash(df: pl.DataFrame) -> str:
+    """컬럼명/타입 기반 스키마 해시 (테이블 구조가 바뀌면 다른 캐시 키가 됨)"""
+    columns = [[name, str(dtype)] for name, dtype in df.schema.items()]
+    return _digest(json.dumps(columns, ensure_ascii=False))[:12]
+
+
+class SampleCache:
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, retention_days: int = 7,
+                 key: Optional[bytes] = None, encrypt: bool = True,
+                 max_bytes: int = 1024 * 1024 * 1024):
+        """
+        샘플 DataFrame 디스크 캐시 (Arrow IPC)
+
+        스캔 시 수집한 샘플을 보관해 두었다가 패턴이 바뀌었을 때 원본 DB에 다시 질의하지 않고
+        재평가할 수 있게 합니다. 메타데이터 파일에는 값 없이 테이블/컬럼 정보만 저장합니다.
+
+        encrypt=True 이면 zstd 압축 후 Fernet 으로 암호화하고, False 이면 비압축 IPC 로 저장해
+        memory_map 으로 읽습니다 (여러 프로세스가 같은 페이지 캐시를 복사 없이 공유).
+        평문 모드는 디스크 암호화가 적용된 로컬 볼륨에서만 사용하세요.
+
+        Args:
+            cache_dir: 캐시 디렉토리
+            retention_days: 보관 기간 (지나면 조회되지 않고 정리 대상)
+            key: Fernet 키 (기본값: 환경 변수 PII_SAMPLE_CACHE_KEY 또는 키 파일)
+            encrypt: 암호화 저장 여부
+            max_bytes: 캐시 전체 용량 상한 (넘으면 가장 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.cache_dir = cache_dir
+        self.retention_days = retention_days
+        self.encrypt = encrypt
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._fernet = Fernet(key or self._load_key()) if encrypt else None
+
+    def _load_key(self) -> bytes:
+        env_key = os.environ.get(CACHE_KEY_ENV)
+        if env_key:
+            return env_key.encode('ascii')
+
+        key_path = os.path.join(self.cache_dir, KEY_FILE_NAME)
+        if os.path.exists(key_path):
+            with open(key_path, 'rb') as f:
+                return f.read().strip()
+
+        # 운영 환경에서는 환경 변수로 키를 주입하는 것을 권장
+        key = Fernet.generate_key()
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        logger.warning(f"샘플 캐시 암호화 키를 새로 생성했습니다: {key_path} ({CACHE_KEY_ENV} 사용 권장)")
+        return key
+
+    def _table_prefix(self, source: str, schema: str, table: str) -> str:
+        return os.path.join(self.cache_dir, _digest(source), _digest(f"{schema}.{table}"))
+
+    def _find(self, source: str, schema: str, table: str,
+              table_schema_hash: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """(데이터 파일, 메타 파일) 조회 - 스키마 해시 미지정 시 가장 최근 항목"""
+        prefix = self._table_prefix(source, schema, table)
+        pattern = f"{prefix}-{table_schema_hash or '*'}.json"
+        candidates = sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True)
+
+        for meta_path in candidates:
+            base = meta_path[:-len('.json')]
+            for ext in (ENCRYPTED_EXT, PLAIN_EXT):
+                if os.path.exists(base + ext):
+                    return base + ext, meta_path
+        return None
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _is_expired(self, meta: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+        cached_at = datetime.fromisoformat(meta['cached_at'])
+        return cached_at + timedelta(days=self.retention_days) < (now or datetime.now())
+
+    def put(self, source: str, schema: str, table: str, df: pl.DataFrame,
+            sampling_info: Dict[str, Any]) -> Dict[str, Any]:
+        """샘플 저장 (같은 테이블의 이전 샘플은 스키마와 관계없이 교체)"""
+        table_schema_hash = schema_hash(df)
+        prefix = self._table_prefix(source, schema, table)
+        base = f"{prefix}-{table_schema_hash}"
+
+        buffer = io.BytesIO()
+        if self.encrypt:
+            df.write_ipc(buffer, compression='zstd')
+            payload = self._fernet.encrypt(buffer.getvalue())
+            data_path = base + ENCRYPTED_EXT
+        else:
+            # memory_map 으로 복사 없이 읽으려면 비압축이어야 함
+            df.write_ipc(buffer, compression='uncompressed')
+            payload = buffer.getvalue()
+            data_path = base + PLAIN_EXT
+        meta_path = base + '.json'
+
+        meta = {
+            'source': source,
+            'schema': schema,
+            'table': table,
+            'schema_hash': table_schema_hash,
+            'encrypted': self.encrypt,
+            'cached_at': datetime.now().isoformat(),
+            'rows': df.height,
+            'columns': {name: str(dtype) for name, dtype in df.schema.items()},
+            'bytes': len(payload),
+            'sampling_info': sampling_info,
+        }
+
+        with self._lock:
+            os.makedirs(os.path.dirname(data_path), exist_ok=True)
+            # 이전 샘플(다른 스키마 해시 / 다른 저장 방식) 삭제
+            for old_path in glob.glob(f"{prefix}-*"):
+                if old_path not in (data_path, meta_path):
+                    self._remove(old_path)
+
+            self._write_atomic(data_path, payload)
+            self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False, default=str).encode('utf-8'))
+
+        self.evict()
+        return meta
+
+    def get(self, source: str, schema: str, table: str,
+            table_schema_hash: Optional[str] = None) -> Optional[Tuple[pl.DataFrame, Dict[str, Any]]]:
+        """캐시된 샘플 조회 (없거나 만료되었으면 None, 스키마 해시 지정 시 일치하는 항목만)"""
+        found = self._find(source, schema, table, table_schema_hash)
+        if found is None:
+            return None
+        data_path, meta_path = found
+
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if self._is_expired(meta):
+            self._remove(data_path, meta_path)
+            return None
+
+        # LRU 기준 시각 갱신 (다른 프로세스와도 공유되도록 파일 mtime 사용)
+        try:
+            os.utime(data_path)
+        except OSError:
+            pass
+
+        if data_path.endswith(PLAIN_EXT):
+            return pl.read_ipc(data_path, memory_map=True), meta
+
+        if self._fernet is None:
+            logger.error(f"암호화된 샘플을 읽을 키가 없습니다: {schema}.{table}")
+            return None
+
+        with open(data_path, 'rb') as f:
+            encrypted = f.read()
+        try:
+            payload = self._fernet.decrypt(encrypted)
+        except InvalidToken:
+            logger.error(f"샘플 캐시 복호화 실패 (키 불일치 또는 손상): {schema}.{table}")
+            return None
+
+        return pl.read_ipc(io.BytesIO(payload)), meta
+
+    def entries(self, source: Optional[str] = None, schemas: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """만료되지 않은 캐시 항목의 메타데이터 목록"""
+        if source is not None:
+            directories = [os.path.join(self.cache_dir, _digest(source))]
+        else:
+            directories = [
+                os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                if os.path.isdir(os.path.join(self.cache_dir, name))
+            ]
+
+        now = datetime.now()
+        result = []
+        for directory in directories:
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith('.json'):
+                    continue
+                with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if self._is_expired(meta, now):
+                    continue
+                if schemas and meta['schema'] not in schemas:
+                    continue
+                result.append(meta)
+
+        return sorted(result, key=lambda m: (m['source'], m['schema'], m['table']))
+
+    @staticmethod
+    def _remove(*paths: str):
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _data_files(self) -> List[Tuple[str, str, int, float]]:
+        """(데이터 파일, 메타 파일, 크기, 마지막 사용 시각) 목록"""
+        files = []
+        for data_path in glob.glob(os.path.join(self.cache_dir, '*', '*.arrow*')):
+            if not data_path.endswith((ENCRYPTED_EXT, PLAIN_EXT)):
+                continue
+            base = data_path[:-len(ENCRYPTED_EXT)] if data_path.endswith(ENCRYPTED_EXT) else data_path[:-len(PLAIN_EXT)]
+            try:
+                stat = os.stat(data_path)
+            except FileNotFoundError:
+                continue
+            files.append((data_path, base + '.json', stat.st_size, stat.st_mtime))
+        return files
+
+    def evict(self) -> int:
+        """용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        removed = 0
+        with self._lock:
+            files = self._data_files()
+            total = sum(size for _, _, size, _ in files)
+            if total <= self.max_bytes:
+                return 0
+
+            for data_path, meta_path, size, _ in sorted(files, key=lambda f: f[3]):
+                if total <= self.max_bytes:
+                    break
+                # 다른 프로세스가 memory_map 중이어도 unlink 는 안전 (매핑은 유지됨)
+                self._remove(data_path, meta_path)
+                total -= size
+                removed += 1
+
+        if removed:
+            logger.info(f"샘플 캐시 용량 초과로 {removed}건 삭제 (상한 {self.max_bytes:,} bytes)")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        files = self._data_files()
+        return {
+            'entries': len(files),
+            'total_bytes': sum(size for _, _, size, _ in files),
+            'max_bytes': self.max_bytes,
+            'encrypted': self.encrypt,
+            'retention_days': self.retention_days,
+        }
+
+    def purge(self, expired_only: bool = True, source: Optional[str] = None) -> int:
+        """보관 기간이 지난 항목(또는 전체) 삭제 후 삭제 건수 반환"""
+        removed = 0
+        now = datetime.now()
+        source_dir = _digest(source) if source is not None else None
+
+        with self._lock:
+            for data_path, meta_path, _, _ in self._data_files():
+                if source_dir is not None and os.path.basename(os.path.dirname(data_path)) != source_dir:
+                    continue
+
+                if expired_only:
+                    try:
+                        with open(meta_path, 'r', encoding='utf-8') as f:
+                            if not self._is_expired(json.load(f), now):
+                                continue
+                    except FileNotFoundError:
+                        pass
+
+                self._remove(data_path, meta_path)
+                removed += 1
+
+        if removed:
+            logger.info(f"샘플 캐시 정리: {removed}건 삭제")
+        return removed
@@ -0,0 +1,78 @@
+import random
+import zlib
+from typing import List, Optional, Sequence
+
+# MySQL RAND(N) / Oracle SAMPLE ... SEED(N) 모두 사용할 수 있는 범위
+MAX_SAMPLE_SEED = 4294967295
+
+
+def new_sample_seed() -> int:
+    """스캔 시드 생성 (지정하지 않은 경우에도 결과에 기록해 재현 가능하게 함)"""
+    return random.randint(0, MAX_SAMPLE_SEED)
+
+
+def derive_table_seed(sample_seed: int, schema: str, table: str, salt: Optional[str] = None) -> int:
+    """
+    스캔 시드에서 테이블별 시드 계산
+
+    같은 스캔 시드면 테이블마다 항상 같은 시드가 나오고, 테이블끼리는 서로 다른 표본을 뽑습니다.
+    salt 는 같은 테이블에서 추가 조회(보충 샘플링, 파티션 등)가 필요할 때 구분용으로 사용합니다.
+    """
+    key = f"{sample_seed}:{schema}.{table}"
+    if salt is not None:
+        key += f":{salt}"
+    return zlib.crc32(key.encode('utf-8')) & MAX_SAMPLE_SEED
+
+
+def select_sample_rows(rows: Sequence, target: int, seed: int) -> List:
+    """
+    목표 행 수를 넘은 표본에서 시드 기반으로 target 행 선택 (조회 순서 유지)
+
+    FETCH FIRST / LIMIT 으로 자르면 물리적으로 뒤쪽 블록(보통 최근 행)이 항상 빠지므로 대신 사용합니다.
+    """
+    if len(rows) <= target:
+        return list(rows)
+    keep = sorted(random.Random(seed).sample(range(len(rows)), target))
+    return [rows[i] for i in keep]
+
+
+def allocate_sample_budget(sample_size: int, weights: List[Optional[int]], min_per_part: int = 1) -> List[int]:
+    """
+    샘플 행 수를 가중치(추정 행 수)에 비례해 나눔 (최대 잉여 방식, 합계 = sample_size)
+
+    통계가 없거나 0인 파티션(새로 추가되어 통계가 수집되지 않은 파티션 등)도 건너뛰지 않도록
+    예산이 허용하는 한 min_per_part 행씩 먼저 배정합니다. 가중치가 None 이면 다른 파티션의 평균으로 봅니다.
+    """
+    parts = len(weights)
+    if parts == 0 or sample_size <= 0:
+        return [0] * parts
+
+    known = [w for w in weights if w is not None and w > 0]
+    default_weight = sum(known) / len(known) if known else 1
+    resolved = [default_weight if w is None else max(w, 0) for w in weights]
+    if not any(resolved):
+        resolved = [1] * parts
+
+    # 최소 배정 (예산이 부족하면 추정 행 수가 큰 파티션부터)
+    budgets = [0] * parts
+    order = sorted(range(parts), key=lambda i: (-resolved[i], i))
+    remaining = sample_size
+    for i in order:
+        if remaining < min_per_part:
+            break
+        budgets[i] = min_per_part
+        remaining -= min_per_part
+
+    total = sum(resolved)
+    if remaining <= 0 or total <= 0:
+        return budgets
+
+    shares = [remaining * w / total for w in resolved]
+    floors = [int(share) for share in shares]
+    for i in range(parts):
+        budgets[i] += floors[i]
+
+    leftover = remaining - sum(floors)
+    for i in sorted(range(parts), key=lambda i: (-(shares[i] - floors[i]), i))[:leftover]:
+        budgets[i] += 1
+    return budgets
@@ -0,0 +1,179 @@
+import json
+import logging
+import math
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 측정값 저장 위치 (스캔한 호스트별 단계 소요 시간)
+DEFAULT_CALIBRATION_PATH = os.environ.get('PII_SCAN_CALIBRATION_FILE', 'scan_calibration.json')
+
+# 보관할 최근 측정값 수 (넘으면 오래된 것부터 삭제)
+MAX_OBSERVATIONS = 5000
+
+# 단계별 회귀에 필요한 최소 측정값 수 (호스트별 측정값이 부족하면 전체 측정값 사용)
+MIN_OBSERVATIONS = 10
+
+STAGES = ('query', 'fetch', 'frame', 'detect')
+
+
+def _query_features(obs: Dict[str, Any]) -> List[float]:
+    # 행 수 조회/샘플 쿼리 실행: 테이블 크기에 선형 + 로그 (통계 기반 샘플링은 크기에 거의 무관)
+    rows = obs['total_rows']
+    return [1.0, rows / 1e6, math.log10(rows + 1)]
+
+
+def _fetch_features(obs: Dict[str, Any]) -> List[float]:
+    # 전송량: 문자열 셀과 나머지 셀을 따로 (긴 텍스트/LOB 컬럼이 전송 시간의 대부분)
+    rows, columns, text = obs['sampled_rows'], obs['columns'], obs['text_columns']
+    return [1.0, rows * text / 1000, rows * max(columns - text, 0) / 1000]
+
+
+def _frame_features(obs: Dict[str, Any]) -> List[float]:
+    return [1.0, obs['sampled_rows'] * obs['columns'] / 1000]
+
+
+def _detect_features(obs: Dict[str, Any]) -> List[float]:
+    # 패턴 탐지는 문자열 셀 수에 비례
+    return [1.0, obs['sampled_rows'] * obs['text_columns'] / 1000]
+
+
+STAGE_FEATURES: Dict[str, Callable[[Dict[str, Any]], List[float]]] = {
+    'query': _query_features,
+    'fetch': _fetch_features,
+    'frame': _frame_features,
+    'detect': _detect_features,
+}
+
+
+class ScanCalibration:
+    def __init__(self, path: str = DEFAULT_CALIBRATION_PATH, max_observations: int = MAX_OBSERVATIONS,
+                 min_observations: int = MIN_OBSERVATIONS):
+        """
+        실측 단계별 소요 시간 기반 스캔 시간 예측
+
+        실제 스캔에서 테이블마다 쿼리(행 수/샘플 쿼리 실행), 전송(fetch), DataFrame 생성, 패턴 탐지 시간을
+        기록해 로컬 JSON 파일에 보관합니다. 예측은 단계마다 테이블 크기와 컬럼 구성(문자열/기타 셀 수)에 대한
+        최소제곱 회귀로 계산하며, 호스트(소스)별 측정값이 충분하면 해당 호스트 모델을, 아니면 전체 모델을 사용합니다.
+
+        Args:
+            path: 측정값 파일 경로
+            max_observations: 보관할 최근 측정값 수
+            min_observations: 회귀에 필요한 최소 측정값 수 (부족하면 예측하지 않음)
+        """
+        self.path = path
+        self.max_observations = max_observations
+        self.min_observations = min_observations
+        self._lock = threading.Lock()
+        self._pending: List[Dict[str, Any]] = []
+        self._observations: Optional[List[Dict[str, Any]]] = None
+        self._models: Dict[Optional[str], Optional[Dict[str, Any]]] = {}
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('observations', [])
+        except (OSError, ValueError) as e:
+            logger.warning(f"스캔 보정 파일을 읽지 못했습니다: {self.path}: {e}")
+            return []
+
+    def observations(self) -> List[Dict[str, Any]]:
+        """저장된 측정값 + 아직 저장하지 않은 측정값"""
+        with self._lock:
+            if self._observations is None:
+                self._observations = self._load()
+            return self._observations + self._pending
+
+    def record(self, source: str, total_rows: int, sampled_rows: int, columns: int, text_columns: int,
+               timings: Dict[str, float]):
+        """테이블 하나의 단계별 소요 시간 기록 (save 호출 시 파일에 반영)"""
+        observation = {
+            'source': source,
+            'total_rows': int(total_rows),
+            'sampled_rows': int(sampled_rows),
+            'columns': int(columns),
+            'text_columns': int(text_columns),
+            'recorded_at': datetime.now().isoformat(),
+        }
+        for stage in STAGES:
+            observation[f'{stage}_sec'] = round(float(timings.get(f'{stage}_sec', 0.0)), 6)
+
+        with self._lock:
+            self._pending.append(observation)
+            self._models.clear()
+
+    def save(self):
+        """기록한 측정값을 파일에 추가 (다른 프로세스가 쓴 측정값과 병합, 최근 max_observations 개만 유지)"""
+        with self._lock:
+            if not self._pending:
+                return
+            observations = (self._load() + self._pending)[-self.max_observations:]
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'updated_at': datetime.now().isoformat(), 'observations': observations}, f,
+                          ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+            self._observations = observations
+            self._pending = []
+            self._models.clear()
+
+    def _fit(self, observations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """단계별 최소제곱 계수"""
+        coefficients = {}
+        for stage, features in STAGE_FEATURES.items():
+            x = np.array([features(obs) for obs in observations], dtype=float)
+            y = np.array([obs[f'{stage}_sec'] for obs in observations], dtype=float)
+            coefficients[stage] = np.linalg.lstsq(x, y, rcond=None)[0].tolist()
+        return {'observations': len(observations), 'coefficients': coefficients}
+
+    def model(self, source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """예측 모델 (source 의 측정값이 부족하면 전체 측정값 모델, 그래도 부족하면 None)"""
+        with self._lock:
+            if source in self._models:
+                return self._models[source]
+
+        observations = self.observations()
+        scoped = [obs for obs in observations if obs['source'] == source] if source is not None else []
+
+        if len(scoped) >= self.min_observations:
+            model = {'scope': 'source', **self._fit(scoped)}
+        elif source is not None:
+            model = self.model(None)
+        elif len(observations) >= self.min_observations:
+            model = {'scope': 'all', **self._fit(observations)}
+        else:
+            model = None
+
+        with self._lock:
+            self._models[source] = model
+        return model
+
+    def estimate(self, source: Optional[str], total_rows: int, sampled_rows: int, columns: int,
+                 text_columns: int) -> Optional[Dict[str, Any]]:
+        """단계별 예상 소요 시간 (초, 모델이 없으면 None)"""
+        model = self.model(source)
+        if model is None:
+            return None
+
+        features = {'total_rows': total_rows, 'sampled_rows': sampled_rows,
+                    'columns': columns, 'text_columns': min(text_columns, columns)}
+        estimate = {'scope': model['scope'], 'observations': model['observations']}
+        for stage, stage_features in STAGE_FEATURES.items():
+            # 샘플이 없는 테이블(빈 테이블)은 행 수 조회만 실행
+            if stage != 'query' and sampled_rows == 0:
+                estimate[f'{stage}_sec'] = 0.0
+                continue
+            predicted = float(np.dot(model['coefficients'][stage], stage_features(features)))
+            estimate[f'{stage}_sec'] = max(0.0, predicted)
+        return estimate
@@ -0,0 +1,1243 @@
+import concurrent.futures
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Tuple, Optional
+
+import polars as pl
+
+from column_scan import partition_breakdown, scan_columns
+from fetch_pipeline import run_pipeline
+from masking import mask_dataframe, mask_values
+from pattern_registry import CompiledPatternSet, PatternRegistry, get_registry
+from pattern_safety import MAX_VALUE_LENGTH, PatternTimeBudget
+from sample_cache import SampleCache
+from sampling import allocate_sample_budget, new_sample_seed
+from scan_calibration import STAGES, ScanCalibration
+
+# 앞부분/끝부분을 이어 붙일 때 구분자 (두 부분이 이어져 패턴이 잘못 일치하지 않도록 공백 포함)
+TRUNCATION_SEPARATOR = ' ... '
+
+# 개인정보 관련 컬럼명 키워드 (어댑터에서 DB 별 키워드를 추가할 수 있음)
+PRIVACY_KEYWORDS = [
+    'name', 'email', 'phone', 'mobile', 'tel', 'address', 'addr',
+    'ssn', 'social', 'birth', 'birthday', 'card', 'account',
+    'user_id', 'customer', '고객', 'personal', '개인'
+]
+
+
+class PrivacyScanPipeline:
+    """
+    DB 종류와 관계없는 스캔 파이프라인 (카탈로그 → 계획 → 샘플 → 탐지 → 점수 → 리포트)
+
+    소스 어댑터(MySQL, Oracle 등)는 연결, 카탈로그 조회(list_namespaces, get_tables, get_changed_tables,
+    get_table_info), 샘플 조회(load_table_sample, _sample_partition) 와 SQL 방언만 구현합니다.
+    탐지, 점수 계산, 테이블 스캔 순서(미리 조회 파이프라인, 증분 스캔), 캐시 재평가, 시간 예측, 스캔 리포트는
+    이 클래스를 공유하므로 한 번 고치면 모든 소스에 적용됩니다.
+
+    스캔 단위(MySQL 데이터베이스, Oracle/PostgreSQL 스키마)는 namespace 라고 부르고, 결과에서는
+    namespace_key 로 기록합니다.
+    """
+
+    # 리포트 제목과 결과의 engine 에 표시할 이름
+    source_name = 'DB'
+    engine_name = 'Polars'
+
+    # 스캔 단위의 결과 키와 표시 이름
+    namespace_key = 'database'
+    namespace_label = '데이터베이스'
+
+    # 보정 측정값이 없을 때 사용하는 스캔 시간 예측 상수 (패턴 스캔 행/초, DB 조회 행/초와 최소 시간, DataFrame 생성 MB/초)
+    scan_speed = {
+        'base_rows_per_sec': 50000,
+        'query_rows_per_sec': 1000000,
+        'query_min_sec': 0.1,
+        'frame_mb_per_sec': 100
+    }
+
+    def __init__(self, sample_size: int = 100, pattern_registry: Optional[PatternRegistry] = None,
+                 sample_cache: Optional[SampleCache] = None, cache_source: str = '',
+                 parallel_columns: bool = True, projection_pushdown: bool = True,
+                 max_value_length: int = MAX_VALUE_LENGTH, tail_length: int = 0,
+                 sample_seed: Optional[int] = None, partition_sampling: bool = True,
+                 partition_workers: int = 4, prefetch_tables: int = 2, regexp_pushdown: bool = False,
+                 calibration: Optional[ScanCalibration] = None):
+        """
+        어댑터 공통 설정 (인자 설명은 각 어댑터 참고)
+
+        Args:
+            cache_source: 샘플 캐시 출처 식별자 (make_source_id 결과, 스캔 보정 측정값의 호스트 구분에도 사용)
+            calibration: 스캔 보정 (지정 시 테이블별 단계 소요 시간을 기록하고 시간 예측에 사용)
+        """
+        self.connection = None
+        self.sample_size = sample_size
+
+        # 개인정보 패턴은 공유 레지스트리에서 로드 (버전별로 컴파일된 집합 재사용)
+        self.pattern_registry = pattern_registry or get_registry()
+
+        # 패턴별 시간 예산 (예산을 넘은 패턴은 스캔이 끝날 때까지 비활성화)
+        self.pattern_budget = PatternTimeBudget()
+
+        # 컬럼 수가 많은 테이블이 전체 스캔의 병목이 되지 않도록 컬럼 단위 병렬 스캔
+        self.parallel_columns = parallel_columns
+
+        # BLOB/숫자 등 패턴이 나올 수 없는 컬럼은 조회하지 않음
+        self.projection_pushdown = projection_pushdown
+
+        # 긴 텍스트/CLOB 은 앞부분(+끝부분)만 전송해 샘플당 메모리와 전송량을 제한
+        if tail_length < 0 or (max_value_length and tail_length >= max_value_length):
+            raise ValueError("tail_length 는 0 이상, max_value_length 보다 작아야 합니다")
+        self.max_value_length = max_value_length
+        self.tail_length = tail_length
+
+        # 스캔 전체 시드 (테이블별 시드는 여기서 파생, 결과에 기록해 표본 재현/비교에 사용)
+        self.sample_seed = sample_seed if sample_seed is not None else new_sample_seed()
+
+        # 파티션 테이블은 파티션마다 따로 샘플링
+        self.partition_sampling = partition_sampling
+        self.partition_workers = max(1, partition_workers)
+
+        # 현재 테이블을 분석하는 동안 다음 테이블 샘플을 조회 (DB I/O 와 CPU 를 동시에 사용)
+        self.prefetch_tables = prefetch_tables
+
+        # 감사용 전체 테이블 집계 (정규식을 서버에서 실행해 집계 행 하나만 전송)
+        self.regexp_pushdown = regexp_pushdown
+
+        # 샘플 캐시 (패턴 변경 시 원본 DB 재질의 없이 재평가)
+        self.sample_cache = sample_cache
+        self.cache_source = cache_source
+
+        # 단계별 소요 시간 측정 (샘플 조회는 prefetch 스레드에서 실행되므로 스레드별로 기록)
+        self.calibration = calibration
+        self._stage_timings = threading.local()
+
+        self.privacy_keywords = list(PRIVACY_KEYWORDS)
+
+        # 스캔에서 제외할 시스템 스키마 (어댑터가 지정)
+        self.system_schemas = set()
+
+    # ---- 소스 어댑터가 구현하는 단계 ----
+
+    def connect(self) -> bool:
+        raise NotImplementedError
+
+    def disconnect(self):
+        raise NotImplementedError
+
+    def list_namespaces(self) -> List[str]:
+        """스캔할 데이터베이스/스키마 목록 (시스템 스키마 제외)"""
+        raise NotImplementedError
+
+    def is_system_schema(self, namespace: str) -> bool:
+        """시스템 스키마인지 확인 (기본값: system_schemas 에 있는 이름)"""
+        return namespace.lower() in self.system_schemas
+
+    def get_tables(self, namespace: str) -> List[str]:
+        raise NotImplementedError
+
+    def get_changed_tables(self, namespace: str, since: datetime) -> List[str]:
+        raise NotImplementedError
+
+    def get_table_info(self, namespace: str, table: str) -> Dict:
+        """{'total_rows': 행 수, 'columns': [{'name', 'type', ...}]}"""
+        raise NotImplementedError
+
+    def load_table_sample(self, namespace: str, table: str) -> Tuple[Optional[pl.DataFrame], Dict]:
+        raise NotImplementedError
+
+    def _sample_partition(self, namespace: str, table: str, select_list: str, partition: Dict,
+                          limit: int) -> Tuple[List[tuple], List[str], Optional[Dict]]:
+        """파티션 하나에서 샘플 조회 (행, 컬럼명, 파티션별 샘플링 상세)"""
+        raise NotImplementedError
+
+    def is_scannable_type(self, col: Dict) -> bool:
+        raise NotImplementedError
+
+    @staticmethod
+    def quote_identifier(name: str) -> str:
+        raise NotImplementedError
+
+    def value_expression(self, col: Dict) -> str:
+        """샘플 쿼리에서 컬럼 값을 조회할 표현식 (긴 값은 서버에서 잘라서 조회)"""
+        raise NotImplementedError
+
+    def table_label(self, namespace: str, table: str) -> str:
+        """진행 상황 출력과 리포트에 사용할 테이블 이름"""
+        return table
+
+    def report_notes(self) -> List[str]:
+        """스캔 리포트 끝에 덧붙일 소스별 안내 (줄 목록)"""
+        return []
+
+    # ---- 단계별 소요 시간 ----
+
+    @contextmanager
+    def stage(self, name: str):
+        """샘플 조회 중 단계(fetch, frame) 소요 시간 누적 (load_timed_sample 밖에서는 기록하지 않음)"""
+        timings = getattr(self._stage_timings, 'current', None)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if timings is not None:
+                timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
+
+    def fetch_rows(self, cursor) -> List[tuple]:
+        """cursor.fetchall (전송 시간을 fetch 단계로 기록)"""
+        with self.stage('fetch'):
+            return cursor.fetchall()
+
+    def load_timed_sample(self, namespace: str, table: str) -> Tuple[Optional[pl.DataFrame], Dict]:
+        """
+        load_table_sample + 단계별 소요 시간 (sampling_info['timings'])
+
+        어댑터가 표시한 전송(fetch)과 DataFrame 생성(frame)을 제외한 나머지(행 수 조회, 카탈로그, 쿼리 실행)는
+        query 단계로 기록합니다. 전체 테이블 집계 시간은 제외합니다.
+        """
+        timings: Dict[str, float] = {}
+        self._stage_timings.current = timings
+        started = time.perf_counter()
+        try:
+            df, sampling_info = self.load_table_sample(namespace, table)
+        finally:
+            self._stage_timings.current = None
+        elapsed = time.perf_counter() - started
+
+        if df is not None:
+            pushdown_sec = (sampling_info.get('pushdown') or {}).get('elapsed_sec', 0.0)
+            fetch_sec = timings.get('fetch', 0.0)
+            frame_sec = timings.get('frame', 0.0)
+            sampling_info['timings'] = {
+                'query_sec': round(max(0.0, elapsed - fetch_sec - frame_sec - pushdown_sec), 4),
+                'fetch_sec': round(fetch_sec, 4),
+                'frame_sec': round(frame_sec, 4)
+            }
+        return df, sampling_info
+
+    def record_timings(self, df: Optional[pl.DataFrame], sampling_info: Dict, detect_sec: float):
+        """탐지 시간을 sampling_info['timings'] 에 추가하고 스캔 보정 측정값으로 기록"""
+        timings = sampling_info.get('timings')
+        if df is None or timings is None:
+            return
+
+        timings['detect_sec'] = round(detect_sec, 4)
+        if self.calibration is None:
+            return
+
+        text_columns = sum(1 for dtype in df.schema.values() if dtype == pl.Utf8)
+        self.calibration.record(
+            self.cache_source,
+            total_rows=sampling_info.get('total_rows', 0),
+            sampled_rows=df.height,
+            columns=df.width + len(sampling_info.get('skipped_columns', [])),
+            text_columns=text_columns,
+            timings=timings
+        )
+
+    def save_calibration(self):
+        """기록한 단계별 소요 시간을 보정 파일에 저장 (실패해도 스캔 결과에는 영향 없음)"""
+        if self.calibration is None:
+            return
+        try:
+            self.calibration.save()
+        except Exception as e:
+            print(f"  ⚠️  스캔 보정 측정값 저장 실패: {str(e)}")
+
+    # ---- 계획 ----
+
+    def select_scan_columns(self, columns: List[Dict]) -> Tuple[List[Dict], List[str]]:
+        """샘플 쿼리에서 조회할 컬럼 (스캔 가능한 타입 또는 의심스러운 이름) 과 제외한 컬럼명"""
+        selected, skipped = [], []
+        for col in columns:
+            if self.is_scannable_type(col) or self.is_privacy_column(col['name']):
+                selected.append(col)
+            else:
+                skipped.append(col['name'])
+        return selected, skipped
+
+    def column_expression(self, col: Dict) -> str:
+        """샘플 쿼리의 컬럼 표현식 (값 표현식이 컬럼명과 다르면 원래 컬럼명으로 별칭)"""
+        name = self.quote_identifier(col['name'])
+        expr = self.value_expression(col)
+        return name if expr == name else f"{expr} AS {name}"
+
+    def user_namespaces(self, namespaces: List[str]) -> List[str]:
+        """시스템 스키마를 제외한 스캔 대상 목록 (제외한 스키마는 출력)"""
+        user_namespaces = []
+        system_namespaces = []
+
+        for namespace in namespaces:
+            if self.is_system_schema(namespace):
+                system_namespaces.append(namespace)
+            else:
+                user_namespaces.append(namespace)
+
+        if system_namespaces:
+            print(f"🔒 시스템 스키마 제외됨 ({len(system_namespaces)}개):")
+            for i, name in enumerate(sorted(system_namespaces), 1):
+                print(f"   {i:2d}. {name}")
+            print("")
+
+        return user_namespaces
+
+    def plan_table_batches(self, namespace: str, tables: List[str]) -> Tuple[List[List[str]], Dict[str, Dict]]:
+        """여러 테이블을 한 번에 조회할 묶음 (기본값: 묶지 않음)"""
+        return [], {}
+
+    def load_table_batch(self, namespace: str, tables: List[str],
+                         catalog: Dict[str, Dict]) -> Dict[str, Tuple[Optional[pl.DataFrame], Dict]]:
+        raise NotImplementedError
+
+    def partition_detail(self, namespace: str, table: str, partition: Dict) -> Dict:
+        """파티션 샘플링 결과에 기록할 소스별 정보 (통계, 시드 등)"""
+        return {}
+
+    def _sample_partitions(self, namespace: str, table: str, select_list: str,
+                           partitions: List[Dict]) -> Tuple[List[tuple], List[str], List[Dict]]:
+        """
+        파티션별 병렬 샘플링 후 파티션 순서대로 병합
+
+        샘플 행 수는 파티션 통계 행 수에 비례해 나누고, 통계가 없는 파티션에도 최소 1행을 배정합니다.
+        일부 파티션 조회가 실패하면 해당 파티션만 오류로 기록하고, 모두 실패하면 예외를 발생시킵니다.
+        """
+        budgets = allocate_sample_budget(self.sample_size, [p['rows'] for p in partitions])
+        targets = [(p, budget) for p, budget in zip(partitions, budgets) if budget > 0]
+
+        details = []
+        futures = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.partition_workers, len(targets))) as executor:
+            for partition, budget in targets:
+                details.append({'name': partition['name'], 'rows_stat': partition['rows'],
+                                **self.partition_detail(namespace, table, partition), 'budget': budget})
+                futures.append(executor.submit(
+                    self._sample_partition, namespace, table, select_list, partition, budget
+                ))
+
+        rows: List[tuple] = []
+        columns: List[str] = []
+        errors = []
+        for detail, future in zip(details, futures):
+            detail['offset'] = len(rows)
+            try:
+                part_rows, columns, sample_details = future.result()
+                if sample_details is not None:
+                    detail['sample_details'] = sample_details
+            except Exception as e:
+                print(f"    ⚠️  파티션 샘플링 실패 ({detail['name']}): {str(e)}")
+                detail['error'] = str(e)
+                errors.append(e)
+                part_rows = []
+            detail['sampled_rows'] = len(part_rows)
+            rows.extend(part_rows)
+
+        if len(errors) == len(details):
+            raise errors[0]
+        return rows, columns, details
+
+    # ---- 탐지 ----
+
+    def is_privacy_column(self, column_name: str) -> bool:
+        """컬럼명이 개인정보 관련 컬럼인지 확인"""
+        column_lower = column_name.lower()
+        return any(keyword in column_lower for keyword in self.privacy_keywords)
+
+    @property
+    def privacy_patterns(self) -> Dict[str, str]:
+        """현재 레지스트리 버전의 활성 패턴 (패턴 키 → 정규식)"""
+        return self.pattern_registry.compiled().as_dict()
+
+    def scan_column_patterns(self, df: pl.DataFrame, column: str,
+                             pattern_set: Optional[CompiledPatternSet] = None) -> Dict:
+        """Polars DataFrame 컬럼에서 개인정보 패턴 스캔"""
+        if df is None:
+            return {'error': 'DataFrame is None'}
+
+        try:
+            if column not in df.columns:
+                return {'error': f'Column {column} not found'}
+
+            col_data = df.select(pl.col(column).filter(pl.col(column).is_not_null())).to_series()
+            values = [str(val) for val in col_data.to_list()]
+
+            if not values:
+                return {'privacy_matches': {}, 'total_values': 0, 'privacy_count': 0, 'privacy_ratio': 0}
+
+            if pattern_set is None:
+                pattern_set = self.pattern_registry.compiled()
+
+            privacy_matches = {}
+            privacy_rows = set()
+
+            budget = self.pattern_budget
+            for idx, value in enumerate(values):
+                value = budget.truncate(value)
+                for pattern_name, pattern in pattern_set.items():
+                    if budget.is_disabled(pattern_name):
+                        continue
+
+                    started = time.perf_counter()
+                    matches = pattern.findall(value)
+                    if budget.record(pattern_name, time.perf_counter() - started, len(value), column):
+                        print(f"      ⏱️  패턴 비활성화 (시간 예산 초과): {pattern_name}")
+                    if matches:
+                        if pattern_name not in privacy_matches:
+                            privacy_matches[pattern_name] = 0
+                        privacy_matches[pattern_name] += len(matches)
+                        privacy_rows.add(idx)
+
+            total_values = len(values)
+            privacy_count = len(privacy_rows)
+            privacy_ratio = privacy_count / total_values if total_values > 0 else 0
+
+            return {
+                'privacy_matches': privacy_matches,
+                'total_values': total_values,
+                'privacy_count': privacy_count,
+                'privacy_ratio': privacy_ratio,
+                'sample_values': self.mask_sample_data(values[:5], pattern_set)
+            }
+
+        except Exception as e:
+            return {'error': str(e)}
+
+    def scan_columns_parallel(self, df: pl.DataFrame, columns: List[str],
+                              pattern_set: CompiledPatternSet) -> Dict[str, Dict]:
+        """문자열 컬럼 전체를 한 번에 스캔 (실패 시 빈 결과를 반환해 컬럼별 순차 스캔으로 처리)"""
+        if not columns:
+            return {}
+
+        try:
+            results = scan_columns(df, columns, pattern_set, self.pattern_budget)
+        except Exception as e:
+            print(f"    ⚠️  병렬 컬럼 스캔 실패, 순차 스캔으로 전환: {str(e)}")
+            return {}
+
+        for column, pattern_result in results.items():
+            values = [str(val) for val in df[column].drop_nulls().head(5).to_list()]
+            pattern_result['sample_values'] = self.mask_sample_data(values, pattern_set)
+
+        return results
+
+    def mask_sample_data(self, values: List[str],
+                         pattern_set: Optional[CompiledPatternSet] = None) -> List[str]:
+        """샘플 데이터 마스킹 (탐지와 같은 패턴 집합의 마스킹 규칙 사용)"""
+        masked = mask_values(values, pattern_set or self.pattern_registry.compiled())
+        return [value[:50] + "..." if len(value) > 50 else value for value in masked]
+
+    def export_masked_samples(self, df: pl.DataFrame, limit: Optional[int] = None,
+                              pattern_set: Optional[CompiledPatternSet] = None) -> pl.DataFrame:
+        """검토용 마스킹 샘플 (컬럼 전체를 Polars 표현식으로 일괄 마스킹)"""
+        if limit is not None:
+            df = df.head(limit)
+        return mask_dataframe(df, pattern_set or self.pattern_registry.compiled())
+
+    # ---- 점수 ----
+
+    @staticmethod
+    def _empty_risk_level(sampling_info: Dict) -> str:
+        """샘플이 없는 테이블의 위험도"""
+        if sampling_info.get('method') == 'error':
+            return 'ERROR'
+        if sampling_info.get('total_rows', 0) == 0:
+            return 'EMPTY'
+        if sampling_info.get('method') == 'no_scannable_columns':
+            return 'LOW'
+        return 'ERROR'
+
+    @staticmethod
+    def risk_level(privacy_score: int) -> str:
+        """테이블 점수의 위험도 (15점 이상 HIGH, 5점 이상 MEDIUM)"""
+        if privacy_score >= 15:
+            return 'HIGH'
+        if privacy_score >= 5:
+            return 'MEDIUM'
+        return 'LOW'
+
+    def analyze_dataframe(self, df: pl.DataFrame, table_name: str, sampling_info: Dict,
+                          column_scans: Optional[Dict[str, Dict]] = None) -> Dict:
+        """Polars DataFrame 전체 분석 (column_scans 를 지정하면 해당 컬럼은 다시 스캔하지 않고 그 결과로 점수 계산)"""
+        if df is None:
+            return {
+                'table': table_name,
+                'sampling_info': sampling_info,
+                'columns': {},
+                'privacy_score': 0,
+                'risk_level': self._empty_risk_level(sampling_info)
+            }
+
+        print(f"    🔍 DataFrame 분석 중... (Polars)")
+
+        # 테이블 단위로 레지스트리 버전 확인 (패턴이 바뀌었으면 다음 테이블부터 반영)
+        pattern_set = self.pattern_registry.compiled()
+
+        result = {
+            'table': table_name,
+            'sampling_info': sampling_info,
+            'columns': {},
+            'privacy_score': 0,
+            'risk_level': 'LOW',
+            'pattern_version': pattern_set.version
+        }
+
+        string_columns = [
+            str(column) for column in df.columns
+            if any(t in str(df[column].dtype).lower() for t in ['string', 'utf8', 'str'])
+        ]
+        if column_scans is None:
+            column_scans = self.scan_columns_parallel(df, string_columns, pattern_set) if self.parallel_columns else {}
+
+        for column in df.columns:
+            column_name = str(column)
+            col_type = str(df[column].dtype)
+            is_suspicious = self.is_privacy_column(column_name)
+
+            column_result = {
+                'type': col_type,
+                'suspicious_name': is_suspicious,
+                'pattern_scan': None
+            }
+
+            if any(t in col_type.lower() for t in ['string', 'utf8', 'str']):
+                pattern_result = column_scans.get(column_name) or self.scan_column_patterns(df, column_name, pattern_set)
+                column_result['pattern_scan'] = pattern_result
+
+                if 'privacy_matches' in pattern_result and pattern_result['privacy_matches']:
+                    pattern_score = len(pattern_result['privacy_matches']) * 3
+                    ratio_score = int(pattern_result.get('privacy_ratio', 0) * 10)
+                    column_score = pattern_score + ratio_score
+                    result['privacy_score'] += column_score
+
+                    print(f"      🚨 {column_name}: {list(pattern_result['privacy_matches'].keys())} "
+                          f"(비율: {pattern_result.get('privacy_ratio', 0):.1%})")
+
+                elif is_suspicious:
+                    result['privacy_score'] += 1
+                    print(f"      ⚠️  {column_name}: 의심스러운 컬럼명")
+
+                # 일부 행에만 적용한 패턴 (파일 스캔의 Python 전용 패턴 등) 은 점수에 넣지 않고 표시만
+                if pattern_result.get('sample_only_matches'):
+                    print(f"      🔎 {column_name}: {list(pattern_result['sample_only_matches'].keys())} "
+                          f"(앞부분 {pattern_result['sample_only_values']}개 값 기준, 점수 제외)")
+
+            result['columns'][column_name] = column_result
+
+        if sampling_info.get('partitions'):
+            result['partitions'] = partition_breakdown(
+                df, sampling_info['partitions'], string_columns, pattern_set, self.pattern_budget
+            )
+
+        pushdown = sampling_info.get('pushdown')
+        if pushdown:
+            # 전체 테이블 집계는 참고용 (점수/위험도는 샘플 기준)
+            result['pushdown'] = {key: value for key, value in pushdown.items() if key != 'columns'}
+            for column_name, counts in pushdown.get('columns', {}).items():
+                if column_name in result['columns']:
+                    result['columns'][column_name]['pushdown'] = counts
+
+        if self.pattern_budget.disabled:
+            result['disabled_patterns'] = sorted(self.pattern_budget.disabled)
+
+        result['risk_level'] = self.risk_level(result['privacy_score'])
+        return result
+
+    def analyze_table(self, namespace: str, table: str, df: Optional[pl.DataFrame], sampling_info: Dict) -> Dict:
+        """테이블 결과 생성 (어댑터가 결과에 스키마명 등을 추가할 때 재정의)"""
+        return self.analyze_dataframe(df, table, sampling_info)
+
+    # ---- 스캔 순서 ----
+
+    def cache_sample(self, namespace: str, table: str, df: Optional[pl.DataFrame], sampling_info: Dict):
+        """샘플 캐시에 저장 (캐시 실패는 스캔에 영향을 주지 않음)"""
+        if self.sample_cache is None or df is None:
+            return
+
+        try:
+            self.sample_cache.put(self.cache_source, namespace, table, df, sampling_info)
+        except Exception as e:
+            print(f"    ⚠️  샘플 캐시 저장 실패: {str(e)}")
+
+    def scan_table(self, namespace: str, table: str) -> Dict:
+        """테이블 스캔 (샘플 조회 + 분석)"""
+        print(f"  📋 테이블 스캔: {self.table_label(namespace, table)}")
+
+        df, sampling_info = self.load_timed_sample(namespace, table)
+        return self.scan_loaded_table(namespace, table, df, sampling_info)
+
+    @staticmethod
+    def _print_pipeline_stats(stats: Dict):
+        """조회/분석 단계별 소요 시간과 대기 시간 출력"""
+        print(f"  ⏱️  조회 {stats['fetch_sec']:.2f}s (분석 대기 {stats['fetch_stall_sec']:.2f}s), "
+              f"분석 {stats['analyze_sec']:.2f}s (조회 대기 {stats['analyze_stall_sec']:.2f}s)")
+
+    def scan_loaded_table(self, namespace: str, table: str, df: Optional[pl.DataFrame], sampling_info: Dict) -> Dict:
+        """이미 조회한 샘플로 테이블 스캔 (캐시 저장 + 분석)"""
+        self.cache_sample(namespace, table, df, sampling_info)
+
+        started = time.perf_counter()
+        result = self.analyze_table(namespace, table, df, sampling_info)
+        self.record_timings(df, sampling_info, time.perf_counter() - started)
+
+        print(f"    ✅ 완료 (위험도: {result['risk_level']}, 점수: {result['privacy_score']})")
+
+        return result
+
+    def _new_scan_results(self, namespace: str) -> Dict:
+        """스캔 결과 기본 구조"""
+        return {
+            self.namespace_key: namespace,
+            'scan_time': datetime.now().isoformat(),
+            'engine': self.engine_name,
+            'sample_size': self.sample_size,
+            'sample_seed': self.sample_seed,
+            'tables': {},
+            'summary': {
+                'total_tables': 0,
+                'scanned_tables': 0,
+                'high_risk_tables': 0,
+                'medium_risk_tables': 0,
+                'low_risk_tables': 0,
+                'total_privacy_score': 0,
+                'total_data_rows': 0,
+                'total_sampled_rows': 0
+            }
+        }
+
+    def _add_table_result(self, scan_results: Dict, table: str, table_result: Dict):
+        """테이블 결과를 스캔 결과와 요약에 반영"""
+        scan_results['tables'][table] = table_result
+
+        risk_level = table_result.get('risk_level', 'LOW')
+        privacy_score = table_result.get('privacy_score', 0)
+        sampling_info = table_result.get('sampling_info', {})
+
+        if risk_level == 'HIGH':
+            scan_results['summary']['high_risk_tables'] += 1
+        elif risk_level == 'MEDIUM':
+            scan_results['summary']['medium_risk_tables'] += 1
+        elif risk_level == 'LOW':
+            scan_results['summary']['low_risk_tables'] += 1
+
+        scan_results['summary']['scanned_tables'] += 1
+        scan_results['summary']['total_privacy_score'] += privacy_score
+        scan_results['summary']['total_data_rows'] += sampling_info.get('total_rows', 0)
+        scan_results['summary']['total_sampled_rows'] += sampling_info.get('sampled_rows', 0)
+
+    def _select_changed_tables(self, namespace: str, tables: List[str], changed_since: datetime,
+                               scan_results: Dict) -> List[str]:
+        """증분 스캔 대상 테이블 (건너뛴 테이블 수는 scan_results['incremental'] 에 기록)"""
+        changed = set(self.get_changed_tables(namespace, changed_since))
+        unchanged = [t for t in tables if t not in changed]
+        tables = [t for t in tables if t in changed]
+        scan_results['incremental'] = {
+            'changed_since': changed_since.isoformat(),
+            'changed_tables': len(tables),
+            'skipped_tables': len(unchanged)
+        }
+        print(f"  ♻️  증분 스캔: 변경된 테이블 {len(tables)}개, 건너뜀 {len(unchanged)}개")
+        return tables
+
+    def scan_namespace(self, namespace: str, changed_since: Optional[datetime] = None) -> Dict:
+        """데이터베이스/스키마 전체 스캔 (changed_since 지정 시 이후 변경된 테이블만)"""
+        print(f"🔍 {self.namespace_label} 스캔 시작: {namespace} ({self.engine_name} 엔진)")
+
+        scan_results = self._new_scan_results(namespace)
+
+        try:
+            tables = self.get_tables(namespace)
+            scan_results['summary']['total_tables'] = len(tables)
+
+            if changed_since is not None:
+                tables = self._select_changed_tables(namespace, tables, changed_since, scan_results)
+
+            batches, catalog = self.plan_table_batches(namespace, tables)
+            batch_of = {table: batch for batch in batches for table in batch}
+            loaded: Dict[str, Tuple[Optional[pl.DataFrame], Dict]] = {}
+
+            # 조회 단계 (prefetch 스레드에서 실행, DB 연결은 이 단계에서만 사용)
+            def fetch(table: str) -> Tuple[Optional[pl.DataFrame], Dict]:
+                batch = batch_of.pop(table, None)
+                if batch is not None and table not in loaded:
+                    try:
+                        loaded.update(self.load_table_batch(namespace, batch, catalog))
+                    except Exception as e:
+                        # 실패하면 묶음의 테이블을 모두 테이블별 조회로 처리
+                        print(f"  ⚠️  일괄 조회 실패, 테이블별 조회로 전환: {str(e)}")
+                        for other in batch:
+                            batch_of.pop(other, None)
+
+                if table in loaded:
+                    print(f"  📋 테이블 스캔: {self.table_label(namespace, table)} (일괄 조회)")
+                    return loaded.pop(table)
+                print(f"  📋 테이블 스캔: {self.table_label(namespace, table)}")
+                return self.load_timed_sample(namespace, table)
+
+            # 분석 단계 (호출 스레드에서 실행)
+            def analyze(table: str, sample: Tuple[Optional[pl.DataFrame], Dict]):
+                df, sampling_info = sample
+                table_result = self.scan_loaded_table(namespace, table, df, sampling_info)
+                self._add_table_result(scan_results, table, table_result)
+
+            scan_results['pipeline'] = run_pipeline(tables, fetch, analyze, depth=self.prefetch_tables)
+            self._print_pipeline_stats(scan_results['pipeline'])
+
+        except Exception as e:
+            scan_results['error'] = str(e)
+            print(f"❌ {self.namespace_label} 스캔 오류: {str(e)}")
+
+        self.save_calibration()
+
+        if self.pattern_budget.disabled:
+            scan_results['disabled_patterns'] = self.pattern_budget.report()
+
+        return scan_results
+
+    def scan_all(self, changed_since: Optional[datetime] = None) -> List[Dict]:
+        """모든 데이터베이스/스키마 스캔 (실제 개인정보 탐지)"""
+        if not self.connect():
+            return []
+
+        try:
+            namespaces = self.list_namespaces()
+
+            print(f"🎯 발견된 사용자 {self.namespace_label}: {len(namespaces)}개")
+            print(f"⚡ 처리 엔진: {self.engine_name}")
+            print(f"📊 샘플링: 테이블당 최대 {self.sample_size}건")
+            print("=" * 60)
+
+            all_results = []
+            total_start_time = datetime.now()
+
+            for i, namespace in enumerate(namespaces, 1):
+                print(f"\n[{i}/{len(namespaces)}] {self.namespace_label} 처리 중...")
+
+                start_time = datetime.now()
+                result = self.scan_namespace(namespace, changed_since)
+                end_time = datetime.now()
+
+                result['processing_time'] = str(end_time - start_time)
+                all_results.append(result)
+
+                print(self.generate_scan_report(result))
+                print(f"⏱️  처리 시간: {end_time - start_time}")
+                print("\n" + "=" * 80 + "\n")
+
+            total_end_time = datetime.now()
+            print(f"🎉 전체 스캔 완료! ({self.engine_name} 엔진)")
+            print(f"⏱️  총 처리 시간: {total_end_time - total_start_time}")
+
+            return all_results
+
+        finally:
+            self.disconnect()
+
+    def reevaluate_cached_samples(self, namespaces: Optional[List[str]] = None) -> List[Dict]:
+        """캐시된 샘플에 현재 패턴을 다시 적용 (원본 DB에 접속하지 않음)"""
+        if self.sample_cache is None:
+            raise ValueError("샘플 캐시가 설정되지 않았습니다")
+
+        entries = self.sample_cache.entries(self.cache_source, namespaces)
+        print(f"♻️  캐시된 샘플 재평가: {len(entries)}개 테이블 (패턴 v{self.pattern_registry.version})")
+
+        results: Dict[str, Dict] = {}
+        for meta in entries:
+            scan_results = results.get(meta['schema'])
+            if scan_results is None:
+                scan_results = self._new_scan_results(meta['schema'])
+                scan_results['source'] = 'sample_cache'
+                results[meta['schema']] = scan_results
+
+            scan_results['summary']['total_tables'] += 1
+            cached = self.sample_cache.get(self.cache_source, meta['schema'], meta['table'], meta.get('schema_hash'))
+            if cached is None:
+                continue
+
+            df, table_meta = cached
+            print(f"  📋 재평가: {table_meta['schema']}.{table_meta['table']} (캐시 시각: {table_meta['cached_at']})")
+            table_result = self.analyze_table(table_meta['schema'], table_meta['table'], df,
+                                              table_meta['sampling_info'])
+            table_result['cached_at'] = table_meta['cached_at']
+            self._add_table_result(scan_results, table_meta['table'], table_result)
+
+        for scan_results in results.values():
+            if self.pattern_budget.disabled:
+                scan_results['disabled_patterns'] = self.pattern_budget.report()
+
+        return list(results.values())
+
+    # ---- 비용 예측 ----
+
+    def estimate_dataframe_size(self, columns: List[Dict], sample_rows: int) -> Dict:
+        """DataFrame 예상 크기 계산 (타입명 부분 일치 기준, 소스별 타입이 다르면 어댑터가 재정의)"""
+        size_estimates = {
+            'int': 8, 'bigint': 8, 'smallint': 4, 'tinyint': 1,
+            'float': 8, 'double': 8, 'decimal': 16,
+            'varchar': 50, 'text': 200, 'longtext': 1000,
+            'char': 20, 'date': 8, 'datetime': 8, 'timestamp': 8,
+            'json': 100, 'blob': 500, 'binary': 50
+        }
+
+        total_bytes_per_row = 0
+        text_columns = 0
+        numeric_columns = 0
+        date_columns = 0
+
+        for col in columns:
+            col_type = col['type'].lower()
+            col_size = 8
+
+            for type_key, size in size_estimates.items():
+                if type_key in col_type:
+                    col_size = size
+                    break
+
+            if 'varchar' in col_type or 'char' in col_type:
+                match = re.search(r'\((\d+)\)', col_type)
+                if match:
+                    declared_length = int(match.group(1))
+                    col_size = min(declared_length, 255)
+                text_columns += 1
+            elif any(t in col_type for t in ['text', 'blob', 'json']):
+                text_columns += 1
+            elif any(t in col_type for t in ['int', 'float', 'double', 'decimal']):
+                numeric_columns += 1
+            elif any(t in col_type for t in ['date', 'time', 'timestamp']):
+                date_columns += 1
+
+            total_bytes_per_row += col_size
+
+        overhead_factor = 1.3
+        estimated_size_bytes = total_bytes_per_row * sample_rows * overhead_factor
+
+        return {
+            'total_columns': len(columns),
+            'text_columns': text_columns,
+            'numeric_columns': numeric_columns,
+            'date_columns': date_columns,
+            'estimated_bytes_per_row': int(total_bytes_per_row),
+            'estimated_total_bytes': int(estimated_size_bytes),
+            'estimated_mb': round(estimated_size_bytes / (1024 * 1024), 2),
+            'sample_rows': sample_rows
+        }
+
+    def estimate_scan_time(self, total_rows: int, columns: int, text_columns: int,
+                           estimated_mb: float, sample_rows: int) -> Dict:
+        """스캔 시간 예측 (보정 측정값이 충분하면 단계별 회귀, 아니면 scan_speed 상수 기준)"""
+        if self.calibration is not None:
+            calibrated = self.calibration.estimate(self.cache_source, total_rows, sample_rows, columns, text_columns)
+            if calibrated is not None:
+                return self._calibrated_estimate(calibrated, sample_rows)
+
+        speed = self.scan_speed
+        regex_speed_factor = 0.3
+        text_factor = 1 + (text_columns * 0.1)
+
+        effective_speed = speed['base_rows_per_sec'] * regex_speed_factor / text_factor
+
+        db_query_time = max(speed['query_min_sec'], total_rows / speed['query_rows_per_sec'])
+        dataframe_creation_time = max(0.05, estimated_mb / speed['frame_mb_per_sec'])
+        pattern_scan_time = sample_rows / effective_speed
+
+        total_estimated_seconds = db_query_time + dataframe_creation_time + pattern_scan_time
+
+        return {
+            'engine': self.engine_name,
+            'db_query_time_sec': round(db_query_time, 2),
+            'dataframe_creation_time_sec': round(dataframe_creation_time, 2),
+            'pattern_scan_time_sec': round(pattern_scan_time, 2),
+            'total_estimated_sec': round(total_estimated_seconds, 2),
+            'estimated_rows_per_sec': int(effective_speed),
+            'text_columns_factor': round(text_factor, 2),
+            'calibration': None
+        }
+
+    def _calibrated_estimate(self, calibrated: Dict, sample_rows: int) -> Dict:
+        """보정 모델 예측을 estimate_scan_time 결과 형식으로 변환 (DB 조회 시간 = 쿼리 + 전송)"""
+        detect_sec = calibrated['detect_sec']
+        return {
+            'engine': self.engine_name,
+            'db_query_time_sec': round(calibrated['query_sec'] + calibrated['fetch_sec'], 2),
+            'dataframe_creation_time_sec': round(calibrated['frame_sec'], 2),
+            'pattern_scan_time_sec': round(detect_sec, 2),
+            'total_estimated_sec': round(sum(calibrated[f'{stage}_sec'] for stage in STAGES), 2),
+            'estimated_rows_per_sec': int(sample_rows / detect_sec) if detect_sec > 0 else 0,
+            'calibration': {
+                'scope': calibrated['scope'],
+                'observations': calibrated['observations'],
+                **{f'{stage}_sec': round(calibrated[f'{stage}_sec'], 4) for stage in STAGES}
+            }
+        }
+
+    def analyze_structure(self, namespace: str) -> Dict:
+        """데이터베이스/스키마 구조 분석 및 처리 비용 예측"""
+        print(f"🔍 {self.namespace_label} 구조 분석 중: {namespace}")
+
+        analysis = {
+            self.namespace_key: namespace,
+            'analysis_time': datetime.now().isoformat(),
+            'engine': self.engine_name,
+            'sample_size': self.sample_size,
+            'tables': {},
+            'summary': {
+                'total_tables': 0,
+                'total_rows': 0,
+                'total_columns': 0,
+                'total_text_columns': 0,
+                'estimated_total_mb': 0,
+                'estimated_total_scan_time_sec': 0,
+                'scannable_tables': 0,
+                'empty_tables': 0,
+                'large_tables': 0,
+                'calibrated_tables': 0
+            }
+        }
+
+        try:
+            tables = self.get_tables(namespace)
+            analysis['summary']['total_tables'] = len(tables)
+
+            print(f"  📊 발견된 테이블: {len(tables)}개")
+
+            for table in tables:
+                print(f"    📋 분석 중: {table}")
+
+                try:
+                    table_info = self.get_table_info(namespace, table)
+                    total_rows = table_info['total_rows']
+                    columns = table_info['columns']
+
+                    sample_rows = min(total_rows, self.sample_size) if total_rows > 0 else 0
+                    size_estimate = self.estimate_dataframe_size(columns, sample_rows)
+                    time_estimate = self.estimate_scan_time(
+                        total_rows,
+                        len(columns),
+                        size_estimate['text_columns'],
+                        size_estimate['estimated_mb'],
+                        sample_rows
+                    )
+
+                    table_analysis = {
+                        'total_rows': total_rows,
+                        'total_columns': len(columns),
+                        'columns': columns,
+                        'size_estimate': size_estimate,
+                        'time_estimate': time_estimate,
+                        'status': 'scannable' if total_rows > 0 else 'empty'
+                    }
+
+                    analysis['tables'][table] = table_analysis
+
+                    analysis['summary']['total_rows'] += total_rows
+                    analysis['summary']['total_columns'] += len(columns)
+                    analysis['summary']['total_text_columns'] += size_estimate['text_columns']
+                    analysis['summary']['estimated_total_mb'] += size_estimate['estimated_mb']
+                    analysis['summary']['estimated_total_scan_time_sec'] += time_estimate['total_estimated_sec']
+
+                    if total_rows == 0:
+                        analysis['summary']['empty_tables'] += 1
+                    else:
+                        analysis['summary']['scannable_tables'] += 1
+
+                    if total_rows >= 1000000:
+                        analysis['summary']['large_tables'] += 1
+
+                    if time_estimate.get('calibration'):
+                        analysis['summary']['calibrated_tables'] += 1
+
+                    print(f"      ✅ {total_rows:,}행, {len(columns)}컬럼, "
+                          f"~{size_estimate['estimated_mb']}MB, "
+                          f"~{time_estimate['total_estimated_sec']}초")
+
+                except Exception as e:
+                    analysis['tables'][table] = {
+                        'error': str(e),
+                        'status': 'error'
+                    }
+                    print(f"      ❌ 분석 오류: {str(e)}")
+
+        except Exception as e:
+            analysis['error'] = str(e)
+            print(f"❌ {self.namespace_label} 분석 오류: {str(e)}")
+
+        return analysis
+
+    def preview_all(self) -> List[Dict]:
+        """모든 데이터베이스/스키마 구조 분석 및 처리 비용 예측"""
+        if not self.connect():
+            return []
+
+        try:
+            namespaces = self.list_namespaces()
+
+            print(f"🎯 발견된 사용자 {self.namespace_label}: {len(namespaces)}개")
+            print(f"⚡ 분석 엔진: {self.engine_name}")
+            print(f"📊 샘플링 설정: 테이블당 최대 {self.sample_size}건")
+            print("=" * 60)
+
+            all_analyses = []
+            total_start_time = datetime.now()
+
+            for i, namespace in enumerate(namespaces, 1):
+                print(f"\n[{i}/{len(namespaces)}] {self.namespace_label} 구조 분석 중...")
+
+                analysis_start_time = datetime.now()
+                analysis = self.analyze_structure(namespace)
+                analysis_end_time = datetime.now()
+
+                analysis['analysis_duration'] = str(analysis_end_time - analysis_start_time)
+                all_analyses.append(analysis)
+
+                print(self.generate_structure_report(analysis))
+                print(f"⏱️  분석 시간: {analysis_end_time - analysis_start_time}")
+                print("\n" + "=" * 80 + "\n")
+
+            total_end_time = datetime.now()
+            self.generate_total_preview_summary(all_analyses, total_end_time - total_start_time)
+
+            return all_analyses
+
+        finally:
+            self.disconnect()
+
+    # ---- 리포트 ----
+
+    def generate_structure_report(self, analysis: Dict) -> str:
+        """데이터베이스/스키마 구조 분석 리포트 생성"""
+        report = []
+        report.append("=" * 80)
+        report.append(f"🏗️  {self.namespace_label} 구조 분석 및 처리 비용 예측 ({self.engine_name})")
+        report.append("=" * 80)
+        report.append(f"{self.namespace_label}: {analysis[self.namespace_key]}")
+        report.append(f"분석 시간: {analysis['analysis_time']}")
+        report.append(f"처리 엔진: {self.engine_name}")
+        report.append(f"샘플 크기: {analysis.get('sample_size', 'Unknown')}건")
+        report.append("")
+
+        summary = analysis.get('summary', {})
+
+        report.append("📊 전체 요약:")
+        report.append(f"  • 총 테이블 수: {summary.get('total_tables', 0):,}개")
+        report.append(f"  • 스캔 가능한 테이블: {summary.get('scannable_tables', 0):,}개")
+        report.append(f"  • 빈 테이블: {summary.get('empty_tables', 0):,}개")
+        report.append(f"  • 대용량 테이블 (100만행+): {summary.get('large_tables', 0):,}개")
+        report.append(f"  • 총 데이터 행 수: {summary.get('total_rows', 0):,}행")
+        report.append(f"  • 총 컬럼 수: {summary.get('total_columns', 0):,}개")
+        report.append(f"  • 텍스트 컬럼 수: {summary.get('total_text_columns', 0):,}개")
+        report.append("")
+
+        estimated_mb = summary.get('estimated_total_mb', 0)
+        estimated_time = summary.get('estimated_total_scan_time_sec', 0)
+
+        report.append(f"💾 예상 처리 비용 ({self.engine_name} 엔진):")
+        report.append(f"  • 예상 DataFrame 크기: {estimated_mb:.1f} MB")
+        if estimated_mb < 10:
+            report.append(f"    → 메모리 사용량: 🟢 낮음")
+        elif estimated_mb < 100:
+            report.append(f"    → 메모리 사용량: 🟡 보통")
+        else:
+            report.append(f"    → 메모리 사용량: 🔴 높음")
+
+        report.append(f"  • 예상 스캔 시간: {estimated_time:.1f}초")
+        if estimated_time < 30:
+            report.append(f"    → 처리 시간: 🟢 빠름")
+        elif estimated_time < 300:
+            report.append(f"    → 처리 시간: 🟡 보통")
+        else:
+            report.append(f"    → 처리 시간: 🔴 오래 걸림")
+
+        if estimated_time > 60:
+            minutes = int(estimated_time // 60)
+            seconds = int(estimated_time % 60)
+            report.append(f"    → 예상 시간: {minutes}분 {seconds}초")
+
+        report.append("")
+
+        large_tables = []
+        for table_name, table_data in analysis.get('tables', {}).items():
+            if table_data.get('total_rows', 0) >= 100000:
+                large_tables.append({
+                    'name': table_name,
+                    'rows': table_data.get('total_rows', 0),
+                    'columns': table_data.get('total_columns', 0),
+                    'mb': table_data.get('size_estimate', {}).get('estimated_mb', 0),
+                    'time': table_data.get('time_estimate', {}).get('total_estimated_sec', 0)
+                })
+
+        large_tables.sort(key=lambda x: x['rows'], reverse=True)
+
+        if large_tables:
+            report.append("📈 대용량 테이블 상위 10개:")
+            for i, table in enumerate(large_tables[:10], 1):
+                report.append(f"  {i:2d}. {table['name']}")
+                report.append(f"      • 행 수: {table['rows']:,}")
+                report.append(f"      • 컬럼 수: {table['columns']}")
+                report.append(f"      • 예상 크기: {table['mb']:.1f} MB")
+                report.append(f"      • 예상 시간: {table['time']:.1f}초")
+
+            if len(large_tables) > 10:
+                report.append(f"  ... 외 {len(large_tables) - 10}개")
+            report.append("")
+
+        report.append("💡 권장사항:")
+
+        if estimated_mb > 500:
+            report.append("  • 메모리 사용량이 높습니다. 샘플 크기를 줄이는 것을 고려하세요.")
+
+        if estimated_time > 600:
+            report.append("  • 처리 시간이 깁니다. 특정 테이블만 선택적으로 스캔하는 것을 고려하세요.")
+
+        if summary.get('large_tables', 0) > 10:
+            report.append("  • 대용량 테이블이 많습니다. 배치 처리를 고려하세요.")
+
+        if summary.get('total_text_columns', 0) > summary.get('total_columns', 1) * 0.7:
+            report.append("  • 텍스트 컬럼 비율이 높습니다. 정규식 처리로 인해 시간이 더 걸릴 수 있습니다.")
+
+        report.append(f"  • {self.engine_name} 엔진으로 최적화된 고성능 처리가 진행됩니다.")
+
+        return "\n".join(report)
+
+    def generate_total_preview_summary(self, all_analyses: List[Dict], total_time) -> None:
+        """전체 데이터베이스/스키마 예측 요약"""
+        print(f"🎯 전체 {self.namespace_label} 처리 비용 예측 요약 ({self.engine_name})")
+        print("=" * 60)
+
+        total_tables = sum(a.get('summary', {}).get('total_tables', 0) for a in all_analyses)
+        total_rows = sum(a.get('summary', {}).get('total_rows', 0) for a in all_analyses)
+        total_columns = sum(a.get('summary', {}).get('total_columns', 0) for a in all_analyses)
+        total_mb = sum(a.get('summary', {}).get('estimated_total_mb', 0) for a in all_analyses)
+        total_scan_time = sum(a.get('summary', {}).get('estimated_total_scan_time_sec', 0) for a in all_analyses)
+        scannable_tables = sum(a.get('summary', {}).get('scannable_tables', 0) for a in all_analyses)
+        large_tables = sum(a.get('summary', {}).get('large_tables', 0) for a in all_analyses)
+
+        print(f"📊 전체 규모:")
+        print(f"  • {self.namespace_label} 수: {len(all_analyses)}개")
+        print(f"  • 총 테이블 수: {total_tables:,}개")
+        print(f"  • 스캔 가능한 테이블: {scannable_tables:,}개")
+        print(f"  • 대용량 테이블 (100만행+): {large_tables:,}개")
+        print(f"  • 총 데이터 행 수: {total_rows:,}행")
+        print(f"  • 총 컬럼 수: {total_columns:,}개")
+
+        print(f"\n💾 예상 처리 비용 ({self.engine_name} 엔진):")
+        print(f"  • 예상 총 메모리 사용량: {total_mb:.1f} MB")
+        print(f"  • 예상 총 스캔 시간: {total_scan_time:.1f}초")
+
+        if total_scan_time > 60:
+            minutes = int(total_scan_time // 60)
+            seconds = int(total_scan_time % 60)
+            print(f"    → {minutes}분 {seconds}초")
+
+        print(f"\n🚦 처리 위험도 평가:")
+
+        memory_risk = "🟢 낮음" if total_mb < 100 else "🟡 보통" if total_mb < 500 else "🔴 높음"
+        time_risk = "🟢 빠름" if total_scan_time < 60 else "🟡 보통" if total_scan_time < 600 else "🔴 오래 걸림"
+
+        print(f"  • 메모리 위험도: {memory_risk} ({total_mb:.1f} MB)")
+        print(f"  • 시간 위험도: {time_risk} ({total_scan_time:.1f}초)")
+
+        if large_tables > 20:
+            print(f"  • 대용량 테이블 위험도: 🔴 높음 ({large_tables}개)")
+        elif large_tables > 5:
+            print(f"  • 대용량 테이블 위험도: 🟡 보통 ({large_tables}개)")
+        else:
+            print(f"  • 대용량 테이블 위험도: 🟢 낮음 ({large_tables}개)")
+
+        print(f"\n⏱️  전체 분석 시간: {total_time}")
+        print(f"🚀 {self.engine_name} 엔진으로 최적화된 처리 준비 완료!")
+
+        print(f"\n💡 스캔 실행 권장사항:")
+
+        if total_mb > 1000:
+            print(f"  ⚠️  메모리 사용량이 높습니다 ({total_mb:.1f}MB)")
+            print(f"     → 샘플 크기를 50으로 줄이거나 {self.namespace_label}별로 분할 실행하세요")
+
+        if total_scan_time > 1800:
+            print(f"  ⚠️  예상 처리 시간이 깁니다 ({total_scan_time / 60:.1f}분)")
+            print(f"     → 대용량 테이블을 제외하거나 배치로 나누어 실행하세요")
+
+        if large_tables > 50:
+            print(f"  ⚠️  대용량 테이블이 많습니다 ({large_tables}개)")
+            print(f"     → 우선순위가 높은 테이블부터 선별적으로 스캔하세요")
+
+        if total_tables > 1000:
+            print(f"  ⚠️  테이블 수가 많습니다 ({total_tables:,}개)")
+            print(f"     → 중요한 {self.namespace_label}부터 단계적으로 스캔하세요")
+
+        print(f"\n✅ 구조 분석 완료! 이제 실제 스캔을 실행할 수 있습니다.")
+        print("=" * 60)
+
+    def generate_scan_report(self, scan_results: Dict) -> str:
+        """스캔 결과 리포트 생성"""
+        namespace = scan_results.get(self.namespace_key, 'Unknown')
+
+        report = []
+        report.append("=" * 80)
+        report.append(f"📊 {self.source_name} 개인정보 스캔 리포트 ({self.engine_name} 엔진)")
+        report.append("=" * 80)
+        report.append(f"{self.namespace_label}: {namespace}")
+        report.append(f"스캔 시간: {scan_results['scan_time']}")
+        report.append(f"처리 엔진: {self.engine_name}")
+        report.append(f"샘플 사이즈: {scan_results.get('sample_size', 'Unknown')}건")
+        report.append("")
+
+        summary = scan_results.get('summary', {})
+        total_data_rows = summary.get('total_data_rows', 0)
+        total_sampled_rows = summary.get('total_sampled_rows', 0)
+
+        report.append("📋 스캔 요약:")
+        report.append(f"  • 총 테이블 수: {summary.get('total_tables', 0)}")
+        report.append(f"  • 스캔된 테이블 수: {summary.get('scanned_tables', 0)}")
+        report.append(f"  • 고위험 테이블: {summary.get('high_risk_tables', 0)}개")
+        report.append(f"  • 중간위험 테이블: {summary.get('medium_risk_tables', 0)}개")
+        report.append(f"  • 저위험 테이블: {summary.get('low_risk_tables', 0)}개")
+        report.append(f"  • 총 개인정보 위험도 점수: {summary.get('total_privacy_score', 0)}")
+        report.append(f"  • 전체 데이터 행 수: {total_data_rows:,}")
+        report.append(f"  • 샘플링된 행 수: {total_sampled_rows:,}")
+
+        if total_data_rows > 0:
+            sampling_efficiency = total_sampled_rows / total_data_rows
+            report.append(f"  • 샘플링 효율: {sampling_efficiency:.1%}")
+
+        report.append("")
+
+        # 고위험 테이블 상세 정보
+        high_risk_tables = []
+        for table_name, table_data in scan_results.get('tables', {}).items():
+            if table_data.get('risk_level') == 'HIGH':
+                high_risk_tables.append({
+                    'name': table_name,
+                    'score': table_data.get('privacy_score', 0),
+                    'data': table_data
+                })
+
+        high_risk_tables.sort(key=lambda x: x['score'], reverse=True)
+
+        if high_risk_tables:
+            report.append("🚨 고위험 테이블 상세:")
+            for table_info in high_risk_tables:
+                table_name = table_info['name']
+                table_data = table_info['data']
+                sampling_info = table_data.get('sampling_info', {})
+
+                report.append(f"  • {self.table_label(namespace, table_name)} (점수: {table_info['score']})")
+                report.append(f"    - 총 행수: {sampling_info.get('total_rows', 0):,}")
+                report.append(f"    - 샘플링: {sampling_info.get('method', 'Unknown')}")
+
+                privacy_columns = []
+                for col_name, col_data in table_data.get('columns', {}).items():
+                    pattern_scan = col_data.get('pattern_scan', {})
+                    if pattern_scan and 'privacy_matches' in pattern_scan and pattern_scan['privacy_matches']:
+                        matches = pattern_scan['privacy_matches']
+                        ratio = pattern_scan.get('privacy_ratio', 0)
+                        match_details = [f"{k}({v})" for k, v in matches.items()]
+                        privacy_columns.append(f"      - {col_name}: {', '.join(match_details)} [비율: {ratio:.1%}]")
+                    elif col_data.get('suspicious_name'):
+                        privacy_columns.append(f"      - {col_name}: 의심스러운 컬럼명")
+
+                if privacy_columns:
+                    report.extend(privacy_columns)
+                report.append("")
+
+        report.extend(self.report_notes())
+
+        return "\n".join(report)
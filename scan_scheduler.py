@@ -0,0 +1,310 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 태스크는 인자 없는 코루틴 함수 (예: 테이블 1개 스캔)
+TaskFactory = Callable[[], Awaitable[Any]]
+JobCallback = Callable[['ScheduledJob'], None]
+
+
+class ScanPriority(str, Enum):
+    urgent = "urgent"      # 긴급 컴플라이언스 스캔
+    high = "high"
+    normal = "normal"
+    routine = "routine"    # 야간 정기 스캔
+
+
+# 숫자가 작을수록 먼저 실행
+PRIORITY_ORDER = {
+    ScanPriority.urgent: 0,
+    ScanPriority.high: 1,
+    ScanPriority.normal: 2,
+    ScanPriority.routine: 3,
+}
+
+
+@dataclass(eq=False)
+class ScheduledJob:
+    job_id: str
+    host: str
+    priority: ScanPriority
+    tasks: Deque[TaskFactory]
+    on_start: Optional[JobCallback] = None
+    on_finish: Optional[JobCallback] = None
+    task_count: int = 0
+    completed_tasks: int = 0
+    running: int = 0
+    cancelled: bool = False
+    error: Optional[str] = None
+    submitted_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    _submitted_mono: float = field(default_factory=time.monotonic)
+    _started_mono: Optional[float] = None
+    _finished_mono: Optional[float] = None
+
+    @property
+    def wait_time_sec(self) -> Optional[float]:
+        """큐 대기 시간 (제출 → 첫 태스크 시작)"""
+        if self._started_mono is None:
+            return None
+        return round(self._started_mono - self._submitted_mono, 3)
+
+    @property
+    def run_time_sec(self) -> Optional[float]:
+        """실행 시간 (첫 태스크 시작 → 마지막 태스크 종료)"""
+        if self._started_mono is None or self._finished_mono is None:
+            return None
+        return round(self._finished_mono - self._started_mono, 3)
+
+    def effective_priority(self, now: float, aging_sec: float) -> int:
+        """대기 시간에 따라 우선순위를 올려 기아 상태 방지"""
+        base = PRIORITY_ORDER[self.priority]
+        if aging_sec <= 0:
+            return base
+        boost = int((now - self._submitted_mono) // aging_sec)
+        return max(0, base - boost)
+
+    def to_metrics(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'host': self.host,
+            'priority': self.priority.value,
+            'task_count': self.task_count,
+            'completed_tasks': self.completed_tasks,
+            'cancelled': self.cancelled,
+            'error': self.error,
+            'submitted_at': self.submitted_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'wait_time_sec': self.wait_time_sec,
+            'run_time_sec': self.run_time_sec,
+        }
+
+
+class ScanScheduler:
+    def __init__(self, max_workers: int = 4, max_sessions_per_host: int = 2,
+                 aging_sec: float = 600, history_size: int = 1000):
+        """
+        스캔 작업 스케줄러
+
+        Args:
+            max_workers: 동시에 실행되는 태스크 수 (전체)
+            max_sessions_per_host: DB 호스트당 최대 동시 스캐너 세션 수
+            aging_sec: 이 시간만큼 대기할 때마다 우선순위를 한 단계 올림 (0이면 비활성)
+            history_size: 용량 산정을 위해 보관할 완료 작업 수
+        """
+        self.max_workers = max_workers
+        self.max_sessions_per_host = max_sessions_per_host
+        self.aging_sec = aging_sec
+
+        # 대기 중인 작업 (라운드로빈 순서 유지)
+        self._ready: Deque[ScheduledJob] = deque()
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._host_sessions: Dict[str, int] = {}
+        self._active = 0
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._cond = asyncio.Condition()
+        self._workers: List[asyncio.Task] = []
+
+    async def start(self):
+        """워커 시작 (이벤트 루프 안에서 호출)"""
+        while len(self._workers) < self.max_workers:
+            self._workers.append(asyncio.create_task(self._worker()))
+        logger.info(f"스캔 스케줄러 시작: 워커 {self.max_workers}개, 호스트당 세션 {self.max_sessions_per_host}개")
+
+    async def stop(self):
+        """워커 종료"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def configure(self, max_workers: Optional[int] = None, max_sessions_per_host: Optional[int] = None):
+        """실행 중 동시성 설정 변경"""
+        async with self._cond:
+            if max_sessions_per_host is not None:
+                self.max_sessions_per_host = max_sessions_per_host
+            if max_workers is not None:
+                self.max_workers = max_workers
+            self._cond.notify_all()
+
+        # 워커가 늘어난 경우만 추가 생성 (줄어든 경우 _pick에서 동시 실행 수로 제한)
+        if self._workers:
+            await self.start()
+
+    async def submit(self, job_id: str, host: str, tasks: List[TaskFactory],
+                     priority: ScanPriority = ScanPriority.normal,
+                     on_start: Optional[JobCallback] = None,
+                     on_finish: Optional[JobCallback] = None) -> ScheduledJob:
+        """
+        작업 등록
+
+        작업 안의 태스크는 순서대로 하나씩 실행되고, 서로 다른 작업의 태스크는
+        같은 우선순위 안에서 라운드로빈으로 번갈아 실행됩니다.
+        """
+        job = ScheduledJob(
+            job_id=job_id,
+            host=host,
+            priority=priority,
+            tasks=deque(tasks),
+            on_start=on_start,
+            on_finish=on_finish,
+            task_count=len(tasks),
+        )
+
+        async with self._cond:
+            self._jobs[job_id] = job
+            if job.tasks:
+                self._ready.append(job)
+                self._cond.notify_all()
+            else:
+                self._finish(job)
+
+        return job
+
+    async def cancel(self, job_id: str) -> bool:
+        """대기 중인 태스크 제거 (실행 중인 태스크는 끝까지 실행)"""
+        async with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished_at is not None:
+                return False
+
+            job.cancelled = True
+            job.tasks.clear()
+            if job in self._ready:
+                self._ready.remove(job)
+            if job.running == 0:
+                self._finish(job)
+            return True
+
+    def get_job(self, job_id: str) -> Optional[ScheduledJob]:
+        """대기/실행 중인 작업 (종료된 작업은 stats() 의 recent_jobs 기록만 남음)"""
+        return self._jobs.get(job_id)
+
+    def _pick(self) -> Optional[ScheduledJob]:
+        """다음에 실행할 작업 선택 (우선순위 → 라운드로빈, 호스트 세션 제한 고려)"""
+        if self._active >= self.max_workers:
+            return None
+
+        now = time.monotonic()
+        best = None
+        best_priority = None
+
+        for job in self._ready:
+            if job.running or not job.tasks:
+                continue
+            if self._host_sessions.get(job.host, 0) >= self.max_sessions_per_host:
+                continue
+
+            priority = job.effective_priority(now, self.aging_sec)
+            # 같은 우선순위면 큐 앞쪽(가장 오래 기다린) 작업 선택
+            if best is None or priority < best_priority:
+                best, best_priority = job, priority
+
+        if best is not None:
+            # 태스크를 하나 배정한 작업은 큐 뒤로 보내 다른 작업과 번갈아 실행
+            self._ready.remove(best)
+            self._ready.append(best)
+
+        return best
+
+    def _finish(self, job: ScheduledJob):
+        job.finished_at = datetime.now()
+        job._finished_mono = time.monotonic()
+        if job in self._ready:
+            self._ready.remove(job)
+        self._jobs.pop(job.job_id, None)
+
+        self._history.append(job.to_metrics())
+
+        if job.on_finish:
+            try:
+                job.on_finish(job)
+            except Exception as e:
+                logger.error(f"작업 종료 콜백 오류: {job.job_id}, {e}")
+
+    async def _worker(self):
+        while True:
+            async with self._cond:
+                job = self._pick()
+                while job is None:
+                    await self._cond.wait()
+                    job = self._pick()
+
+                task = job.tasks.popleft()
+                job.running += 1
+                self._active += 1
+                self._host_sessions[job.host] = self._host_sessions.get(job.host, 0) + 1
+
+                if job.started_at is None:
+                    job.started_at = datetime.now()
+                    job._started_mono = time.monotonic()
+                    if job.on_start:
+                        try:
+                            job.on_start(job)
+                        except Exception as e:
+                            logger.error(f"작업 시작 콜백 오류: {job.job_id}, {e}")
+
+            try:
+                await task()
+                job.completed_tasks += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 작업 안의 태스크는 순차 실행이므로 실패 시 남은 태스크는 건너뜀
+                logger.error(f"스캔 태스크 실패: {job.job_id}, 오류: {str(e)}")
+                job.error = str(e)
+                job.tasks.clear()
+            finally:
+                async with self._cond:
+                    job.running -= 1
+                    self._active -= 1
+                    self._host_sessions[job.host] -= 1
+                    if self._host_sessions[job.host] <= 0:
+                        del self._host_sessions[job.host]
+
+                    if not job.tasks and job.running == 0 and job.finished_at is None:
+                        self._finish(job)
+
+                    self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 상태 및 용량 산정용 통계"""
+        queued = {p.value: 0 for p in ScanPriority}
+        for job in self._ready:
+            if job.started_at is None:
+                queued[job.priority.value] += 1
+
+        per_priority = {}
+        for p in ScanPriority:
+            finished = [h for h in self._history if h['priority'] == p.value and h['wait_time_sec'] is not None]
+            if not finished:
+                continue
+            waits = [h['wait_time_sec'] for h in finished]
+            runs = [h['run_time_sec'] for h in finished if h['run_time_sec'] is not None]
+            per_priority[p.value] = {
+                'jobs': len(finished),
+                'avg_wait_time_sec': round(sum(waits) / len(waits), 3),
+                'max_wait_time_sec': max(waits),
+                'avg_run_time_sec': round(sum(runs) / len(runs), 3) if runs else None,
+                'max_run_time_sec': max(runs) if runs else None,
+            }
+
+        return {
+            'max_workers': self.max_workers,
+            'max_sessions_per_host': self.max_sessions_per_host,
+            'active_tasks': self._active,
+            'queued_jobs': queued,
+            'running_jobs': len([j for j in self._ready if j.started_at is not None]),
+            'host_sessions': dict(self._host_sessions),
+            'by_priority': per_priority,
+            'recent_jobs': list(self._history)[-20:],
+        }
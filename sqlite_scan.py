@@ -0,0 +1,538 @@
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple, Optional
+from urllib.parse import quote
+
+import polars as pl
+
+from binary_sniff import decode_binary_columns
+from pattern_registry import PatternRegistry
+from pattern_safety import MAX_VALUE_LENGTH
+from sample_cache import SampleCache
+from scan_calibration import ScanCalibration
+from sampling import derive_table_seed
+from scan_pipeline import TRUNCATION_SEPARATOR, PrivacyScanPipeline
+
+# 읽기 전용 메모리 매핑 크기 (바이트, 0 이면 일반 read() 로 페이지를 읽음)
+SQLITE_MMAP_BYTES = 256 * 1024 * 1024
+
+# rowid 범위가 이 이하인 테이블만 COUNT(*) 로 정확한 행 수 확인
+# (나머지는 ANALYZE 통계(sqlite_stat1), 없으면 rowid 범위를 상한 추정치로 사용)
+SQLITE_COUNT_MAX_ROWS = 1000000
+
+# 샘플이 목표에 못 미칠 때(삭제로 rowid 에 빈 구간이 많은 경우) 다른 시드로 추가 조회하는 횟수
+SQLITE_SAMPLE_TOP_UP_PASSES = 2
+SQLITE_ROW_KEY_ALIAS = '__pii_scan_rowid'
+
+# 컬럼명과 겹치지 않는 rowid 별칭을 찾을 때 확인하는 순서
+SQLITE_ROWID_ALIASES = ('rowid', '_rowid_', 'oid')
+
+
+class SQLitePrivacyScanner(PrivacyScanPipeline):
+    source_name = 'SQLite'
+
+    def __init__(self, path: str, sample_size: int = 100,
+                 pattern_registry: Optional[PatternRegistry] = None, sample_cache: Optional[SampleCache] = None,
+                 parallel_columns: bool = True, projection_pushdown: bool = True,
+                 max_value_length: int = MAX_VALUE_LENGTH, tail_length: int = 0,
+                 sample_seed: Optional[int] = None, prefetch_tables: int = 2,
+                 mmap_size: int = SQLITE_MMAP_BYTES, immutable: bool = False,
+                 calibration: Optional[ScanCalibration] = None):
+        """
+        SQLite 파일 기반 개인정보 스캐너 (탐지/점수/리포트는 PrivacyScanPipeline)
+
+        파일을 읽기 전용(mode=ro)으로 열고 메모리 매핑으로 페이지를 읽습니다. 연결된 데이터베이스(main, ATTACH 한
+        데이터베이스)를 MySQL 의 데이터베이스처럼 다룹니다. 큰 테이블은 rowid 범위를 나눠 구간마다 임의 위치의 행을
+        B-tree 탐색으로 읽으므로 전체 테이블을 정렬하거나 훑지 않습니다.
+
+        Args:
+            path: SQLite 데이터베이스 파일 경로
+            sample_size: 샘플링할 행 수
+            pattern_registry: 개인정보 패턴 레지스트리 (기본값: 공유 레지스트리)
+            sample_cache: 샘플 캐시 (지정 시 스캔한 샘플을 저장해 재평가에 사용)
+            parallel_columns: 테이블 내 문자열 컬럼을 Polars 표현식으로 병렬 스캔 (False 이면 컬럼별 순차 스캔)
+            projection_pushdown: 문자열 타입 / 의심스러운 이름의 컬럼만 조회 (False 이면 모든 컬럼)
+            max_value_length: 값당 최대 조회 길이 (문자 수, SQL 에서 잘라서 조회 / 0 이면 제한 없음)
+            tail_length: 잘린 값에서 앞부분 대신 끝부분으로 채울 길이 (0 이면 앞부분만)
+            sample_seed: 스캔 시드 (같은 시드로 다시 스캔하면 변경되지 않은 테이블은 같은 표본, 기본값: 무작위)
+            prefetch_tables: 분석 중에 미리 조회해 둘 테이블 샘플 수 (0 이면 조회와 분석을 순차 실행)
+            mmap_size: 메모리 매핑 크기 (바이트, 0 이면 사용하지 않음)
+            immutable: 스캔 중 변경되지 않는 파일(복사본, 읽기 전용 매체)이면 잠금과 변경 확인을 생략
+            calibration: 스캔 보정 (지정 시 테이블별 단계 소요 시간을 기록하고 시간 예측에 사용)
+        """
+        # SQLite 에는 파티션이 없음
+        super().__init__(
+            sample_size=sample_size, pattern_registry=pattern_registry, sample_cache=sample_cache,
+            cache_source=f"sqlite://{os.path.abspath(path)}",
+            parallel_columns=parallel_columns, projection_pushdown=projection_pushdown,
+            max_value_length=max_value_length, tail_length=tail_length, sample_seed=sample_seed,
+            partition_sampling=False, partition_workers=1, prefetch_tables=prefetch_tables,
+            calibration=calibration
+        )
+
+        self.path = path
+        self.mmap_size = mmap_size
+        self.immutable = immutable
+
+        # temp 는 연결마다 새로 만들어지는 임시 데이터베이스
+        self.system_schemas = {'temp'}
+
+        print(f"🪶 SQLite 스캐너 ({path}, mmap {mmap_size // (1024 * 1024)}MB)")
+
+    def validate_config(self) -> bool:
+        """설정 유효성 검사"""
+        issues = []
+
+        if not os.path.isfile(self.path):
+            issues.append(f"SQLite 파일이 없습니다: {self.path}")
+
+        if self.sample_size <= 0:
+            issues.append("샘플 크기는 0보다 커야 합니다")
+
+        if issues:
+            print("❌ 설정 오류:")
+            for issue in issues:
+                print(f"   • {issue}")
+            return False
+
+        return True
+
+    def test_connection(self) -> bool:
+        """연결 테스트"""
+        print(f"🔍 SQLite 연결 테스트 중... ({self.path})")
+        try:
+            connection = self.open_connection()
+            connection.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            connection.close()
+            print(f"✅ SQLite 연결 테스트 성공")
+            return True
+        except sqlite3.Error as err:
+            print(f"❌ SQLite 연결 테스트 실패: {err}")
+            return False
+
+    def open_connection(self) -> sqlite3.Connection:
+        """읽기 전용 연결 (쓰기 쿼리는 query_only 로 차단, 미리 조회 스레드에서도 사용)"""
+        uri = f"file:{quote(os.path.abspath(self.path))}?mode=ro"
+        if self.immutable:
+            uri += "&immutable=1"
+
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        # TEXT 컬럼에 잘못된 UTF-8 이 들어 있어도 조회가 실패하지 않도록 대체 문자로 디코딩
+        connection.text_factory = lambda data: data.decode('utf-8', errors='replace')
+        connection.execute("PRAGMA query_only = ON")
+        if self.mmap_size:
+            connection.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        return connection
+
+    def connect(self):
+        """SQLite 파일 열기"""
+        if not self.validate_config():
+            return False
+
+        try:
+            print(f"🔗 SQLite 파일 여는 중... ({self.path})")
+            self.connection = self.open_connection()
+
+            page_count = self.connection.execute("PRAGMA page_count").fetchone()[0]
+            page_size = self.connection.execute("PRAGMA page_size").fetchone()[0]
+
+            print(f"✅ SQLite 연결 성공: {self.path}")
+            print(f"   • SQLite 버전: {sqlite3.sqlite_version}")
+            print(f"   • 파일 크기: {page_count * page_size / (1024 * 1024):.1f} MB ({page_count:,}페이지)")
+            return True
+        except sqlite3.Error as err:
+            print(f"❌ SQLite 연결 실패: {err}")
+            return False
+
+    def disconnect(self):
+        """SQLite 연결 해제"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+            print("🔐 SQLite 연결 해제")
+        else:
+            print("ℹ️  이미 연결이 해제되었습니다")
+
+    def get_databases(self) -> List[str]:
+        """연결된 데이터베이스 목록 (main + ATTACH 한 데이터베이스)"""
+        if self.connection is None:
+            print("❌ SQLite 연결이 없습니다")
+            return []
+
+        try:
+            return [row[1] for row in self.connection.execute("PRAGMA database_list").fetchall()]
+        except sqlite3.Error as err:
+            print(f"❌ 데이터베이스 목록 조회 실패: {err}")
+            return []
+
+    def list_namespaces(self) -> List[str]:
+        return self.user_namespaces(self.get_databases())
+
+    def get_tables(self, database: str) -> List[str]:
+        """특정 데이터베이스의 테이블 목록 조회 (sqlite_master 기준)"""
+        # 내부 테이블(sqlite_sequence, sqlite_stat1 등)과 가상 테이블은 제외
+        # (FTS 등 가상 테이블의 내용은 _content 같은 섀도 테이블로 스캔됨)
+        cursor = self.connection.execute(f"""
+            SELECT name
+            FROM {self.quote_identifier(database)}.sqlite_master
+            WHERE type = 'table'
+              AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'
+              AND sql NOT LIKE 'CREATE VIRTUAL TABLE%'
+            ORDER BY name
+        """)
+        tables = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        return tables
+
+    def get_changed_tables(self, database: str, since: datetime) -> List[str]:
+        """since 이후 변경되었을 수 있는 테이블 목록 조회 (증분 스캔용)"""
+        # SQLite 에는 테이블별 변경 시각이 없으므로 파일(WAL 포함) 수정 시각으로 판단
+        path = self.database_path(database)
+        paths = [candidate for candidate in (path, path + '-wal') if path and os.path.exists(candidate)]
+        if paths and datetime.fromtimestamp(max(os.path.getmtime(p) for p in paths)) < since:
+            return []
+        return self.get_tables(database)
+
+    def database_path(self, database: str) -> str:
+        """연결된 데이터베이스의 파일 경로 (메모리 데이터베이스면 빈 문자열)"""
+        for row in self.connection.execute("PRAGMA database_list").fetchall():
+            if row[1] == database:
+                return row[2] or ''
+        return ''
+
+    def get_table_info(self, database: str, table: str) -> Dict:
+        """
+        테이블 정보 조회 (행 수, 컬럼 정보, rowid 범위)
+
+        rowid 범위는 B-tree 양 끝만 읽습니다. 범위가 작으면 COUNT(*) 로 정확한 행 수를 구하고, 크면 ANALYZE 통계를,
+        통계가 없으면 범위를 행 수 상한 추정치로 사용합니다 (삭제된 행이 있으면 실제보다 큼).
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT name, type, "notnull", dflt_value, pk
+                FROM pragma_table_info(?, ?)
+                ORDER BY cid
+            """, (table, database))
+            columns = []
+            for row in cursor.fetchall():
+                columns.append({
+                    'name': row[0],
+                    'type': row[1] or '',
+                    'null': 'NO' if row[2] else 'YES',
+                    'key': 'PRI' if row[4] else '',
+                    'default': row[3]
+                })
+
+            cursor.execute(f"SELECT sql FROM {self.quote_identifier(database)}.sqlite_master "
+                           f"WHERE type = 'table' AND name = ?", (table,))
+            row = cursor.fetchone()
+            without_rowid = bool(row and row[0] and re.search(r'\bWITHOUT\s+ROWID\b', row[0], re.IGNORECASE))
+
+            source = self.table_source(database, table)
+            rowid = None if without_rowid else self.rowid_name(columns)
+            rowid_range = None
+            if rowid is not None:
+                # MIN 과 MAX 를 한 쿼리에서 구하면 min/max 최적화가 적용되지 않아 전체를 훑으므로 따로 조회
+                cursor.execute(f"SELECT {rowid} FROM {source} ORDER BY {rowid} LIMIT 1")
+                low = cursor.fetchone()
+                if low is not None:
+                    cursor.execute(f"SELECT {rowid} FROM {source} ORDER BY {rowid} DESC LIMIT 1")
+                    rowid_range = (low[0], cursor.fetchone()[0])
+
+            total_rows, row_count_source = None, 'count'
+            if rowid is not None and rowid_range is None:
+                total_rows = 0
+            elif rowid_range is not None and rowid_range[1] - rowid_range[0] + 1 > SQLITE_COUNT_MAX_ROWS:
+                total_rows = self.get_stat_rows(cursor, database, table)
+                row_count_source = 'sqlite_stat1'
+                if total_rows is None:
+                    total_rows, row_count_source = rowid_range[1] - rowid_range[0] + 1, 'rowid_range'
+
+            if total_rows is None:
+                cursor.execute(f"SELECT COUNT(*) FROM {source}")
+                total_rows = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+        return {
+            'total_rows': total_rows,
+            'row_count_source': row_count_source,
+            'rowid': rowid,
+            'rowid_range': rowid_range,
+            'without_rowid': without_rowid,
+            'columns': columns
+        }
+
+    def get_stat_rows(self, cursor, database: str, table: str) -> Optional[int]:
+        """ANALYZE 로 수집된 행 수 (sqlite_stat1 의 stat 첫 번째 값, 통계가 없으면 None)"""
+        schema = self.quote_identifier(database)
+        cursor.execute(f"SELECT 1 FROM {schema}.sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            return None
+
+        cursor.execute(f"SELECT stat FROM {schema}.sqlite_stat1 WHERE tbl = ? LIMIT 1", (table,))
+        row = cursor.fetchone()
+        if row is None or not row[0]:
+            return None
+        try:
+            return int(str(row[0]).split()[0])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def rowid_name(columns: List[Dict]) -> Optional[str]:
+        """컬럼명에 가려지지 않은 rowid 별칭 (모두 컬럼명으로 쓰였으면 None)"""
+        names = {col['name'].lower() for col in columns}
+        for alias in SQLITE_ROWID_ALIASES:
+            if alias not in names:
+                return alias
+        return None
+
+    def load_table_sample(self, database: str, table: str) -> Tuple[Optional[pl.DataFrame], Dict]:
+        """테이블에서 샘플 데이터를 Polars DataFrame으로 로드 (rowid 구간 샘플링)"""
+        table_info = self.get_table_info(database, table)
+        total_rows = table_info['total_rows']
+
+        if total_rows == 0:
+            print(f"    ⚠️  빈 테이블")
+            return None, {'method': 'empty', 'total_rows': 0, 'sampled_rows': 0}
+
+        selected, skipped_columns = table_info['columns'], []
+        if self.projection_pushdown:
+            selected, skipped_columns = self.select_scan_columns(table_info['columns'])
+            if not selected:
+                print(f"    ⏭️  스캔 대상 컬럼 없음 (문자열 타입/의심 컬럼명 없음)")
+                return None, {'method': 'no_scannable_columns', 'total_rows': total_rows, 'sampled_rows': 0,
+                              'skipped_columns': skipped_columns}
+
+        # 동적 타입이라 같은 컬럼에 숫자/문자열이 섞일 수 있으므로 TEXT (BLOB 타입은 BLOB) 로 변환해 조회
+        select_list = ', '.join(self.column_expression(col) for col in selected)
+        truncated_columns = [col['name'] for col in selected if self.value_expression(col) != self.text_expression(col)]
+        source = self.table_source(database, table)
+        table_seed = derive_table_seed(self.sample_seed, database, table)
+
+        cursor = self.connection.cursor()
+        try:
+            sample_details = None
+            if total_rows <= self.sample_size:
+                cursor.execute(f"SELECT {select_list} FROM {source}")
+                rows = self.fetch_rows(cursor)
+                columns = [desc[0] for desc in cursor.description]
+                sample_method = "전체 데이터"
+            elif table_info['rowid_range'] is None:
+                rows, columns = self._reservoir_sample(cursor, source, select_list, table_seed)
+                sample_method = "저수지 샘플링 (WITHOUT ROWID)"
+            else:
+                rows, columns, sample_details = self._fetch_rowid_sample(
+                    cursor, database, table, source, select_list, table_info['rowid'], table_info['rowid_range']
+                )
+                sample_method = f"rowid 구간 샘플링 ({sample_details['passes']}회 조회)"
+
+            if not rows:
+                return None, {'method': 'no_data', 'total_rows': total_rows, 'sampled_rows': 0}
+
+            with self.stage('frame'):
+                df = pl.DataFrame(rows, schema=columns, orient='row', infer_schema_length=None)
+
+                # BLOB: 파일 형식이면 제외, 텍스트로 보이면 디코딩
+                df, binary_columns = decode_binary_columns(df)
+
+            sampling_info = {
+                'method': sample_method,
+                'total_rows': total_rows,
+                'row_count_source': table_info['row_count_source'],
+                'sampled_rows': len(rows),
+                'sampling_ratio': min(1.0, len(rows) / total_rows) if total_rows > 0 else 0,
+                'skipped_columns': skipped_columns,
+                'truncated_columns': truncated_columns,
+                'max_value_length': self.max_value_length,
+                'sample_seed': self.sample_seed,
+                'table_seed': table_seed
+            }
+            if sample_details:
+                sampling_info['sample_details'] = sample_details
+            if binary_columns:
+                sampling_info['binary_columns'] = binary_columns
+
+            approx = '' if table_info['row_count_source'] == 'count' else '~'
+            print(f"    📊 {approx}{total_rows:,}행 → {len(rows)}행 샘플링 ({sample_method})")
+            return df, sampling_info
+
+        except Exception as e:
+            print(f"    ❌ 데이터 로드 오류: {str(e)}")
+            return None, {'method': 'error', 'error': str(e)}
+        finally:
+            cursor.close()
+
+    def _fetch_rowid_sample(self, cursor, database: str, table: str, source: str, select_list: str,
+                            rowid: str, rowid_range: Tuple[int, int]) -> Tuple[List[tuple], List[str], Dict]:
+        """
+        rowid 구간 샘플링 (계층 추출)
+
+        [MIN(rowid), MAX(rowid)] 를 목표 행 수만큼 같은 너비의 구간으로 나누고, 구간마다 시드 기반 임의 위치 이후의
+        첫 행을 읽습니다. 행마다 B-tree 탐색 한 번이라 테이블 크기와 관계없이 조회 비용이 일정하고, 오래된 행과
+        최근 행이 고르게 뽑힙니다. 삭제로 빈 구간이 많아 같은 행이 겹치면 다른 시드로 부족한 만큼 다시 조회합니다.
+        """
+        target = self.sample_size
+        low, high = rowid_range
+        span = high - low + 1
+
+        sampled: Dict[int, tuple] = {}
+        seeds = []
+        columns: List[str] = []
+
+        for attempt in range(1 + SQLITE_SAMPLE_TOP_UP_PASSES):
+            seed = derive_table_seed(self.sample_seed, database, table, salt=str(attempt) if attempt else None)
+            seeds.append(seed)
+
+            rng = random.Random(seed)
+            needed = target - len(sampled)
+            starts = sorted({low + int(span * (i + rng.random()) / needed) for i in range(needed)})
+
+            # 시작 위치는 스캐너가 만든 정수이므로 바인딩 변수 개수 제한을 피해 그대로 넣음
+            cursor.execute(f"""
+                WITH picks(start) AS (VALUES {', '.join(f'({start})' for start in starts)})
+                SELECT {rowid} AS "{SQLITE_ROW_KEY_ALIAS}", {select_list}
+                FROM {source}
+                WHERE {rowid} IN (
+                    SELECT (SELECT {rowid} FROM {source} WHERE {rowid} >= picks.start ORDER BY {rowid} LIMIT 1)
+                    FROM picks
+                )
+            """)
+            for row in self.fetch_rows(cursor):
+                sampled.setdefault(row[0], row[1:])
+            columns = [desc[0] for desc in cursor.description][1:]
+
+            if len(sampled) >= target:
+                break
+            print(f"    🔁 샘플 부족 ({len(sampled)}/{target}행, rowid 빈 구간) - 추가 조회")
+
+        keys = sorted(sampled)
+        if len(keys) > target:
+            keys = sorted(random.Random(seeds[0]).sample(keys, target))
+        rows = [sampled[key] for key in keys]
+
+        sample_details = {
+            'strategy': 'rowid_ranges',
+            'rowid_min': low,
+            'rowid_max': high,
+            'seeds': seeds,
+            'passes': len(seeds)
+        }
+        return rows, columns, sample_details
+
+    def _reservoir_sample(self, cursor, source: str, select_list: str, seed: int) -> Tuple[List[tuple], List[str]]:
+        """rowid 가 없는 테이블은 한 번 훑으면서 시드 기반 저수지 샘플링 (메모리는 목표 행 수만큼만 사용)"""
+        rng = random.Random(seed)
+        reservoir: List[tuple] = []
+        cursor.execute(f"SELECT {select_list} FROM {source}")
+        with self.stage('fetch'):
+            for seen, row in enumerate(cursor):
+                if seen < self.sample_size:
+                    reservoir.append(row)
+                else:
+                    slot = rng.randint(0, seen)
+                    if slot < self.sample_size:
+                        reservoir[slot] = row
+        return reservoir, [desc[0] for desc in cursor.description]
+
+    @staticmethod
+    def quote_identifier(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    def table_source(self, database: str, table: str) -> str:
+        return f"{self.quote_identifier(database)}.{self.quote_identifier(table)}"
+
+    @staticmethod
+    def type_affinity(col: Dict) -> str:
+        """선언 타입의 SQLite 타입 친화성 (SQLite 문서의 결정 규칙과 같은 순서)"""
+        declared = col['type'].upper()
+        if 'INT' in declared:
+            return 'INTEGER'
+        if 'CHAR' in declared or 'CLOB' in declared or 'TEXT' in declared:
+            return 'TEXT'
+        if 'BLOB' in declared or not declared:
+            return 'BLOB'
+        if 'REAL' in declared or 'FLOA' in declared or 'DOUB' in declared:
+            return 'REAL'
+        return 'NUMERIC'
+
+    def is_scannable_type(self, col: Dict) -> bool:
+        # 타입을 선언하지 않은 컬럼은 무엇이든 저장될 수 있고, JSON 은 NUMERIC 친화성이지만 텍스트로 저장됨
+        declared = col['type'].upper()
+        return self.type_affinity(col) == 'TEXT' or not declared or 'JSON' in declared
+
+    def is_blob_type(self, col: Dict) -> bool:
+        return 'BLOB' in col['type'].upper()
+
+    def text_expression(self, col: Dict) -> str:
+        """컬럼 조회 표현식 (BLOB 타입은 바이트, 나머지는 TEXT 로 변환)"""
+        name = self.quote_identifier(col['name'])
+        if self.is_blob_type(col):
+            return f"CAST({name} AS BLOB)"
+        return f"CAST({name} AS TEXT)"
+
+    def value_expression(self, col: Dict) -> str:
+        """컬럼 값 표현식 (긴 값은 substr 로 잘라서 조회, BLOB 은 앞부분만)"""
+        expr = self.text_expression(col)
+        cap = self.max_value_length
+
+        # 숫자 친화성 컬럼은 이름이 의심스러워 조회하는 경우라 값이 짧으므로 자르지 않음
+        if not cap or not (self.is_scannable_type(col) or self.is_blob_type(col)):
+            return expr
+        match = re.search(r'\((\d+)\)', col['type'])
+        if match and int(match.group(1)) <= cap and not self.is_blob_type(col):
+            # SQLite 는 선언 길이를 강제하지 않지만 앱이 지킨다고 보고 자르지 않음
+            return expr
+
+        if self.tail_length and not self.is_blob_type(col):
+            head = cap - self.tail_length
+            return (f"CASE WHEN length({expr}) > {cap} "
+                    f"THEN substr({expr}, 1, {head}) || '{TRUNCATION_SEPARATOR}' || substr({expr}, -{self.tail_length}) "
+                    f"ELSE {expr} END")
+        return f"substr({expr}, 1, {cap})"
+
+    def analyze_database_structure(self, database: str) -> Dict:
+        """데이터베이스 구조 분석 및 처리 비용 예측"""
+        return self.analyze_structure(database)
+
+    def scan_database(self, database: str, changed_since: Optional[datetime] = None) -> Dict:
+        """데이터베이스 전체 스캔 (changed_since 지정 시 이후 변경된 테이블만)"""
+        return self.scan_namespace(database, changed_since)
+
+    def preview_all_databases(self) -> List[Dict]:
+        """모든 데이터베이스 구조 분석 및 처리 비용 예측"""
+        return self.preview_all()
+
+    def scan_all_databases(self, changed_since: Optional[datetime] = None) -> List[Dict]:
+        """모든 데이터베이스 스캔 (실제 개인정보 탐지)"""
+        return self.scan_all(changed_since)
+
+
+def main():
+    """사용법: python sqlite_scan.py <SQLite 파일> (기본값: dummy_data_generator 출력 dummy_data.db)"""
+    path = sys.argv[1] if len(sys.argv) > 1 else 'dummy_data.db'
+    scanner = SQLitePrivacyScanner(path)
+
+    results = scanner.scan_all_databases()
+    if not results:
+        return
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    scan_filename = f"sqlite_privacy_scan_{timestamp}.json"
+    with open(scan_filename, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    for result in results:
+        print(scanner.generate_scan_report(result))
+    print(f"📄 스캔 결과: {scan_filename}")
+
+
+if __name__ == "__main__":
+    main()